@@ -0,0 +1,259 @@
+"""
+Cache for course/level/exercise structure, keyed by a global content version.
+
+Content only changes through the admin and seed endpoints. Every flush or
+bulk statement that writes a Course, Level or Exercise bumps the single
+content_version row in the same transaction (session hooks, like the lexicon
+hooks), so every worker sees the bump once it commits. Raw SQL writes must
+call bump(db) themselves.
+
+Each worker keeps the version in memory and re-reads it at most every
+CONTENT_VERSION_SYNC_SECONDS; its own commits invalidate at once. Cached
+values and serialized responses are dropped when the version changes.
+Read endpoints answer with an ETag derived from the version, and a matching
+If-None-Match gets a 304 without a database round-trip. Async endpoints use
+the a-prefixed variants, which run the same builders on the async engine.
+
+Config (env):
+- CONTENT_VERSION_SYNC_SECONDS: how stale another worker's write may look here (default 5)
+- CONTENT_CACHE_SIZE: max cached values per worker (default 512)
+"""
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import event, update
+from sqlalchemy.orm import Session
+
+from .database import AsyncSessionLocal, SessionLocal
+from . import models
+
+CONTENT_VERSION_SYNC_SECONDS = float(os.getenv("CONTENT_VERSION_SYNC_SECONDS", "5"))
+CONTENT_CACHE_SIZE = int(os.getenv("CONTENT_CACHE_SIZE", "512"))
+
+_CONTENT_MODELS = (models.Course, models.Level, models.Exercise)
+
+
+class _ContentState:
+	def __init__(self):
+		self.version: Optional[int] = None
+		self.checked_at = 0.0
+		self.values: "OrderedDict[str, Any]" = OrderedDict()
+		self.lock = threading.Lock()
+
+
+_state = _ContentState()
+
+
+# ============================================================================
+# VERSION
+# ============================================================================
+
+def bump(db: Session) -> None:
+	"""Increment the content version in db's transaction (call before commit)."""
+	bumped = db.execute(
+		update(models.ContentVersion)
+		.where(models.ContentVersion.id == 1)
+		.values(version=models.ContentVersion.version + 1)
+	).rowcount
+	if not bumped:
+		# First content write on a fresh database; flushed with the rest of the transaction
+		db.add(models.ContentVersion(id=1, version=2))
+	db.info["content_changed"] = True
+
+
+def _read_version(db: Session) -> int:
+	version = db.query(models.ContentVersion.version).filter(models.ContentVersion.id == 1).scalar()
+	return version or 1
+
+
+def _version_fresh() -> bool:
+	return _state.version is not None and time.time() - _state.checked_at < CONTENT_VERSION_SYNC_SECONDS
+
+
+def _set_version(version: int, checked_at: float) -> None:
+	with _state.lock:
+		if version != _state.version:
+			_state.values.clear()
+			_state.version = version
+		_state.checked_at = checked_at
+
+
+def get_version(db: Optional[Session] = None) -> int:
+	"""Current content version; hits the database at most every CONTENT_VERSION_SYNC_SECONDS."""
+	if _version_fresh():
+		return _state.version
+	now = time.time()
+	own = db is None
+	if own:
+		db = SessionLocal()
+	try:
+		version = _read_version(db)
+	finally:
+		if own:
+			db.close()
+	_set_version(version, now)
+	return version
+
+
+async def aget_version() -> int:
+	"""get_version for async endpoints (reads through the async engine)."""
+	if _version_fresh():
+		return _state.version
+	now = time.time()
+	async with AsyncSessionLocal() as db:
+		version = await db.run_sync(_read_version)
+	_set_version(version, now)
+	return version
+
+
+def invalidate() -> None:
+	"""Force a version re-read on the next access (after a commit that bumped it)."""
+	with _state.lock:
+		_state.checked_at = 0.0
+
+
+# ============================================================================
+# CACHED VALUES AND RESPONSES
+# ============================================================================
+
+def _lookup(key: str, version: int) -> Tuple[bool, Any]:
+	with _state.lock:
+		if key in _state.values and _state.version == version:
+			_state.values.move_to_end(key)
+			return True, _state.values[key]
+	return False, None
+
+
+def _store(key: str, version: int, value: Any) -> None:
+	with _state.lock:
+		if _state.version == version:
+			_state.values[key] = value
+			while len(_state.values) > CONTENT_CACHE_SIZE:
+				_state.values.popitem(last=False)
+
+
+def cached(key: str, build: Callable[[Session], Any]) -> Any:
+	"""Value of build(db) for the current content version; db is only opened on a miss."""
+	version = get_version()
+	hit, value = _lookup(key, version)
+	if hit:
+		return value
+	db = SessionLocal()
+	try:
+		value = build(db)
+	finally:
+		db.close()
+	_store(key, version, value)
+	return value
+
+
+async def acached(key: str, build: Callable[[Session], Any]) -> Any:
+	"""cached() for async endpoints: the same sync builder runs on the async engine (run_sync)."""
+	version = await aget_version()
+	hit, value = _lookup(key, version)
+	if hit:
+		return value
+	async with AsyncSessionLocal() as db:
+		value = await db.run_sync(build)
+	_store(key, version, value)
+	return value
+
+
+def _etag(version: int, key: str) -> str:
+	digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+	return f'W/"c{version}-{digest}"'
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+	return etag in [t.strip() for t in request.headers.get("if-none-match", "").split(",")]
+
+
+def _serialize(build: Callable[[Session], Any]) -> Callable[[Session], bytes]:
+	return lambda db: json.dumps(jsonable_encoder(build(db)), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def cached_response(request: Request, key: str, build: Callable[[Session], Any]) -> Response:
+	"""
+	JSON response for build(db), cached per content version, with ETag and
+	If-None-Match handling. build returns anything jsonable_encoder accepts.
+	"""
+	version = get_version()
+	etag = _etag(version, key)
+	headers = {"ETag": etag, "Cache-Control": "no-cache"}
+	if _not_modified(request, etag):
+		return Response(status_code=304, headers=headers)
+	body = cached(f"response:{key}", _serialize(build))
+	return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def acached_response(request: Request, key: str, build: Callable[[Session], Any]) -> Response:
+	"""cached_response() for async endpoints."""
+	version = await aget_version()
+	etag = _etag(version, key)
+	headers = {"ETag": etag, "Cache-Control": "no-cache"}
+	if _not_modified(request, etag):
+		return Response(status_code=304, headers=headers)
+	body = await acached(f"response:{key}", _serialize(build))
+	return Response(content=body, media_type="application/json", headers=headers)
+
+
+# ============================================================================
+# SESSION HOOKS
+# ============================================================================
+
+def _before_flush(session: Session, flush_context, instances) -> None:
+	if session.info.get("content_bumped"):
+		return
+	for objs in (session.new, session.deleted):
+		if any(isinstance(obj, _CONTENT_MODELS) for obj in objs):
+			break
+	else:
+		if not any(isinstance(obj, _CONTENT_MODELS) and session.is_modified(obj) for obj in session.dirty):
+			return
+	bump(session)
+	# One bump per transaction is enough
+	session.info["content_bumped"] = True
+
+
+def _do_orm_execute(state) -> None:
+	"""Bulk ORM updates/deletes (query(Level).filter(...).delete()) don't go through flush."""
+	if not (state.is_update or state.is_delete):
+		return
+	if not any(m.class_ in _CONTENT_MODELS for m in state.all_mappers):
+		return
+	if not state.session.info.get("content_bumped"):
+		bump(state.session)
+		state.session.info["content_bumped"] = True
+
+
+def _after_commit(session: Session) -> None:
+	if session.info.pop("content_changed", False):
+		invalidate()
+	session.info.pop("content_bumped", None)
+
+
+def _after_rollback(session: Session) -> None:
+	session.info.pop("content_changed", None)
+	session.info.pop("content_bumped", None)
+
+
+_HOOKS_INSTALLED = False
+
+
+def install_hooks() -> None:
+	"""Register the session hooks on every Session (idempotent)."""
+	global _HOOKS_INSTALLED
+	if _HOOKS_INSTALLED:
+		return
+	event.listen(Session, "before_flush", _before_flush)
+	event.listen(Session, "do_orm_execute", _do_orm_execute)
+	event.listen(Session, "after_commit", _after_commit)
+	event.listen(Session, "after_rollback", _after_rollback)
+	_HOOKS_INSTALLED = True
@@ -0,0 +1,475 @@
+"""
+Declarative exercise corpus: one JSON file per class in CORPUS_DIR
+(klasa_<n>.json), loaded by the seed endpoints and scripts/seed_corpus.py.
+
+Each file holds the class (a top-level course) with its courses, their
+levels and the levels' exercises:
+
+	{"name": "Klasa 1", "order_index": 1, "category": "vocabulary", "required_score": 0,
+	 "courses": [{"name": "Niveli 1", "order_index": 1, "category": "listen_write",
+	   "levels": [{"name": "Niveli 1", "order_index": 1, "required_score": 0,
+	     "exercises": [{"order_index": 1, "prompt": "...", "data": {...}, "answer": "zogi"}]}]}]}
+
+The class may also have "levels" of its own. An exercise's category defaults
+to its course's, points to 1; enabled defaults to true everywhere. Every file
+is validated before anything is written; the ValueError lists all problems.
+
+Loading is an idempotent upsert by natural keys: the class by name, courses
+by (class, order_index), levels by (course, order_index), exercises by
+(level, order_index). Exercises carry a content_hash (SHA-256 of their
+content columns), so re-seeding an unchanged corpus reads one narrow query
+and writes nothing. New exercises go in as multi-row INSERT ... VALUES
+statements of CORPUS_BATCH_SIZE rows, changed ones in one executemany
+UPDATE. Exercises, levels and courses that are no longer in the corpus are
+disabled rather than deleted, since attempts and progress reference them.
+A level without an "exercises" key is structure only: its exercises (e.g.
+added by /fix-empty-levels) are left alone.
+
+Core statements bypass the session hooks, so the loader bumps the content
+version and applies the lexicon delta itself, in the same transaction.
+ORM edits of a hashed column (admin endpoints) clear content_hash, so the
+next load compares that row by its columns and restores the corpus version.
+
+Config (env):
+- CORPUS_DIR: directory of the klasa_<n>.json files (default app/corpus_data)
+- CORPUS_BATCH_SIZE: rows per INSERT statement (default 1000)
+"""
+import hashlib
+import json
+import os
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import bindparam, event, insert, inspect, select, update
+from sqlalchemy.orm import Session
+
+from . import content_cache, lexicon, models
+
+CORPUS_DIR = os.getenv("CORPUS_DIR", os.path.join(os.path.dirname(__file__), "corpus_data"))
+CORPUS_BATCH_SIZE = int(os.getenv("CORPUS_BATCH_SIZE", "1000"))
+
+_FILE_RE = re.compile(r"^klasa_(\d+)\.json$")
+_CHUNK = 500
+
+_E = models.Exercise.__table__
+_CATEGORIES = {c.value for c in models.CategoryEnum}
+# Columns covered by content_hash
+_HASHED = ("category", "prompt", "data", "answer", "points", "enabled", "rule")
+
+_CLASS_KEYS = {"name", "description", "order_index", "category", "required_score", "enabled", "levels", "courses"}
+_COURSE_KEYS = {"name", "description", "order_index", "category", "required_score", "enabled", "levels"}
+_LEVEL_KEYS = {"name", "description", "order_index", "required_score", "enabled", "exercises"}
+_EXERCISE_KEYS = {"order_index", "category", "prompt", "data", "answer", "points", "enabled", "rule"}
+
+
+# ============================================================================
+# FILES AND VALIDATION
+# ============================================================================
+
+def available_classes() -> List[int]:
+	"""Class numbers with a corpus file, ascending."""
+	numbers = []
+	for name in os.listdir(CORPUS_DIR):
+		m = _FILE_RE.match(name)
+		if m:
+			numbers.append(int(m.group(1)))
+	return sorted(numbers)
+
+
+def read_class(number: int) -> Dict[str, Any]:
+	with open(os.path.join(CORPUS_DIR, f"klasa_{number}.json"), encoding="utf-8") as f:
+		return json.load(f)
+
+
+def _is_int(value: Any) -> bool:
+	return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _check_node(node: Any, path: str, keys: set, required: Tuple[str, ...], errors: List[str]) -> bool:
+	if not isinstance(node, dict):
+		errors.append(f"{path}: expected an object")
+		return False
+	unknown = sorted(set(node) - keys)
+	if unknown:
+		errors.append(f"{path}: unknown keys {unknown}")
+	for key in required:
+		if key not in node:
+			errors.append(f"{path}: missing {key}")
+	if "order_index" in node and not _is_int(node["order_index"]):
+		errors.append(f"{path}: order_index must be an integer")
+	for key in ("name", "prompt", "answer"):
+		if key in node and (not isinstance(node[key], str) or not node[key].strip()):
+			errors.append(f"{path}: {key} must be a non-empty string")
+	if "description" in node and node["description"] is not None and not isinstance(node["description"], str):
+		errors.append(f"{path}: description must be a string")
+	if "category" in node and node["category"] not in _CATEGORIES:
+		errors.append(f"{path}: unknown category {node['category']!r}")
+	if "required_score" in node and not (_is_int(node["required_score"]) and 0 <= node["required_score"] <= 100):
+		errors.append(f"{path}: required_score must be an integer 0-100")
+	if "enabled" in node and not isinstance(node["enabled"], bool):
+		errors.append(f"{path}: enabled must be true or false")
+	return True
+
+
+def _check_children(children: Any, path: str, errors: List[str]) -> List[Tuple[str, Dict[str, Any]]]:
+	"""The list's items with their paths; reports a non-list and duplicate order_index."""
+	if not isinstance(children, list):
+		errors.append(f"{path}: expected a list")
+		return []
+	seen: Dict[Any, int] = {}
+	for i, child in enumerate(children):
+		if isinstance(child, dict) and _is_int(child.get("order_index")):
+			if child["order_index"] in seen:
+				errors.append(f"{path}[{i}]: order_index {child['order_index']} already used by item {seen[child['order_index']]}")
+			else:
+				seen[child["order_index"]] = i
+	return [(f"{path}[{i}]", child) for i, child in enumerate(children)]
+
+
+def _check_levels(levels: Any, path: str, errors: List[str]) -> None:
+	for level_path, level in _check_children(levels, path, errors):
+		if not _check_node(level, level_path, _LEVEL_KEYS, ("name", "order_index"), errors):
+			continue
+		if "exercises" not in level:
+			continue
+		for ex_path, ex in _check_children(level["exercises"], f"{level_path}.exercises", errors):
+			if not _check_node(ex, ex_path, _EXERCISE_KEYS, ("order_index", "prompt", "answer"), errors):
+				continue
+			if "data" in ex and not isinstance(ex["data"], dict):
+				errors.append(f"{ex_path}: data must be an object")
+			if "points" in ex and not (_is_int(ex["points"]) and ex["points"] >= 0):
+				errors.append(f"{ex_path}: points must be a non-negative integer")
+			if "rule" in ex and ex["rule"] is not None and not (isinstance(ex["rule"], str) and len(ex["rule"]) <= 50):
+				errors.append(f"{ex_path}: rule must be a string of at most 50 characters")
+
+
+def validate(doc: Any, source: str) -> List[str]:
+	"""Every problem in one class document, as "<source>: <path>: <message>" lines."""
+	errors: List[str] = []
+	if _check_node(doc, source, _CLASS_KEYS, ("name", "order_index", "category", "courses"), errors):
+		if "levels" in doc:
+			_check_levels(doc["levels"], f"{source}: levels", errors)
+		for course_path, course in _check_children(doc.get("courses", []), f"{source}: courses", errors):
+			if _check_node(course, course_path, _COURSE_KEYS, ("name", "order_index", "category", "levels"), errors):
+				_check_levels(course.get("levels", []), f"{course_path}.levels", errors)
+	return errors
+
+
+def read_corpus(classes: Optional[Iterable[int]] = None) -> Dict[int, Dict[str, Any]]:
+	"""Read and validate the class files (all by default); raises ValueError listing every problem."""
+	numbers = sorted(set(classes)) if classes is not None else available_classes()
+	docs: Dict[int, Dict[str, Any]] = {}
+	errors: List[str] = []
+	for number in numbers:
+		source = f"klasa_{number}.json"
+		try:
+			doc = read_class(number)
+		except FileNotFoundError:
+			errors.append(f"{source}: not found in {CORPUS_DIR}")
+			continue
+		except ValueError as e:
+			errors.append(f"{source}: invalid JSON: {e}")
+			continue
+		errors.extend(validate(doc, source))
+		docs[number] = doc
+	names: Dict[str, int] = {}
+	for number, doc in docs.items():
+		name = doc.get("name") if isinstance(doc, dict) else None
+		if name in names:
+			errors.append(f"klasa_{number}.json: class name {name!r} already used by klasa_{names[name]}.json")
+		elif name:
+			names[name] = number
+	if errors:
+		raise ValueError(f"{len(errors)} corpus error(s):\n" + "\n".join(errors))
+	return docs
+
+
+# ============================================================================
+# HASHING
+# ============================================================================
+
+def content_hash(
+	category: str, prompt: str, data: Optional[str], answer: str,
+	points: int, enabled: Optional[bool], rule: Optional[str],
+) -> str:
+	"""SHA-256 of an exercise's content columns (data as stored, i.e. JSON text)."""
+	payload = json.dumps([category, prompt, data, answer, points, enabled is not False, rule], ensure_ascii=False)
+	return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _row_hash(row) -> str:
+	category = row.category.value if isinstance(row.category, models.CategoryEnum) else row.category
+	return content_hash(category, row.prompt, row.data, row.answer, row.points, row.enabled, row.rule)
+
+
+def _exercise_values(ex: Dict[str, Any], course_category: str) -> Dict[str, Any]:
+	values = {
+		"category": ex.get("category", course_category),
+		"prompt": ex["prompt"],
+		"data": json.dumps(ex["data"]) if ex.get("data") is not None else None,
+		"answer": ex["answer"],
+		"points": ex.get("points", 1),
+		"enabled": ex.get("enabled", True),
+		"rule": ex.get("rule"),
+	}
+	values["content_hash"] = content_hash(**values)
+	values["category"] = models.CategoryEnum(values["category"])
+	return values
+
+
+# ============================================================================
+# LOADING
+# ============================================================================
+
+def _assign(obj, values: Dict[str, Any]) -> bool:
+	changed = False
+	for key, value in values.items():
+		if getattr(obj, key) != value:
+			setattr(obj, key, value)
+			changed = True
+	return changed
+
+
+def _course_values(doc: Dict[str, Any]) -> Dict[str, Any]:
+	return {
+		"name": doc["name"],
+		"description": doc.get("description"),
+		"order_index": doc["order_index"],
+		"category": models.CategoryEnum(doc["category"]),
+		"required_score": doc.get("required_score", 80),
+		"enabled": doc.get("enabled", True),
+	}
+
+
+def _level_values(doc: Dict[str, Any]) -> Dict[str, Any]:
+	return {
+		"name": doc["name"],
+		"description": doc.get("description"),
+		"order_index": doc["order_index"],
+		"required_score": doc.get("required_score", 80),
+		"enabled": doc.get("enabled", True),
+	}
+
+
+class _Load:
+	"""Upserts one class's structure with the ORM and collects its exercise writes."""
+
+	def __init__(self, db: Session):
+		self.db = db
+		self.structure_changes = 0
+		# level id -> (course id, course category, exercise docs) for levels that list exercises
+		self.managed: Dict[int, Tuple[int, str, List[Dict[str, Any]]]] = {}
+
+	def _upsert(self, rows: List[Any], docs: List[Dict[str, Any]], make, values_of) -> List[Tuple[Any, Dict[str, Any]]]:
+		"""Match docs to rows (by id) on order_index; create the missing, disable the rest."""
+		existing: Dict[int, Any] = {}
+		extra = []
+		for row in rows:
+			if row.order_index in existing:
+				extra.append(row)
+			else:
+				existing[row.order_index] = row
+		pairs = []
+		for doc in docs:
+			values = values_of(doc)
+			obj = existing.pop(doc["order_index"], None)
+			if obj is None:
+				obj = make(**values)
+				self.db.add(obj)
+				self.structure_changes += 1
+			elif _assign(obj, values):
+				self.structure_changes += 1
+			pairs.append((obj, doc))
+		for obj in list(existing.values()) + extra:
+			if obj.enabled is not False:
+				obj.enabled = False
+				self.structure_changes += 1
+		return pairs
+
+	def _levels(self, course: models.Course, docs: List[Dict[str, Any]]) -> None:
+		rows = self.db.query(models.Level).filter(models.Level.course_id == course.id).order_by(models.Level.id).all()
+		pairs = self._upsert(rows, docs, lambda **v: models.Level(course_id=course.id, **v), _level_values)
+		self.db.flush()
+		for level, doc in pairs:
+			if "exercises" in doc:
+				self.managed[level.id] = (course.id, course.category.value, doc["exercises"])
+
+	def run(self, doc: Dict[str, Any]) -> models.Course:
+		cls = (
+			self.db.query(models.Course)
+			.filter(models.Course.parent_class_id == None, models.Course.name == doc["name"])
+			.order_by(models.Course.id)
+			.first()
+		)
+		values = _course_values(doc)
+		if cls is None:
+			cls = models.Course(parent_class_id=None, **values)
+			self.db.add(cls)
+			self.structure_changes += 1
+		elif _assign(cls, values):
+			self.structure_changes += 1
+		self.db.flush()
+		if "levels" in doc:
+			self._levels(cls, doc["levels"])
+
+		rows = self.db.query(models.Course).filter(models.Course.parent_class_id == cls.id).order_by(models.Course.id).all()
+		pairs = self._upsert(rows, doc["courses"], lambda **v: models.Course(parent_class_id=cls.id, **v), _course_values)
+		self.db.flush()
+		for course, course_doc in pairs:
+			self._levels(course, course_doc["levels"])
+		return cls
+
+
+def _chunks(items: List[Any], size: int) -> Iterable[List[Any]]:
+	for i in range(0, len(items), size):
+		yield items[i:i + size]
+
+
+def _write_exercises(db: Session, managed: Dict[int, Tuple[int, str, List[Dict[str, Any]]]]) -> Dict[str, int]:
+	"""Insert/update/disable the exercises of the managed levels; returns the counts."""
+	# Narrow pass: position and hash only
+	current: Dict[Tuple[int, int], Any] = {}
+	extra: List[Any] = []
+	level_ids = sorted(managed)
+	for chunk in _chunks(level_ids, _CHUNK):
+		rows = db.execute(
+			select(_E.c.id, _E.c.level_id, _E.c.course_id, _E.c.order_index, _E.c.enabled, _E.c.content_hash)
+			.where(_E.c.level_id.in_(chunk))
+			.order_by(_E.c.id)
+		).all()
+		for row in rows:
+			key = (row.level_id, row.order_index)
+			if key in current:
+				extra.append(row)
+			else:
+				current[key] = row
+
+	inserts: List[Dict[str, Any]] = []
+	candidates: Dict[int, Tuple[int, Dict[str, Any]]] = {}  # row id -> (course id, new values)
+	unchanged = 0
+	for level_id, (course_id, category, docs) in managed.items():
+		for ex in docs:
+			values = _exercise_values(ex, category)
+			row = current.pop((level_id, ex["order_index"]), None)
+			if row is None:
+				inserts.append({"course_id": course_id, "level_id": level_id, "order_index": ex["order_index"], **values})
+			elif row.content_hash == values["content_hash"] and row.course_id == course_id:
+				unchanged += 1
+			else:
+				candidates[row.id] = (course_id, values)
+	disable = [row.id for row in list(current.values()) + extra if row.enabled is not False]
+
+	# Full rows only for what may change: NULL/stale hashes, and the lexicon needs the old text
+	updates: List[Dict[str, Any]] = []
+	removed: List[Tuple[str, str, Optional[bool]]] = []
+	added: List[Tuple[str, str, Optional[bool]]] = []
+	updated = rehashed = 0
+	for chunk in _chunks(sorted(candidates) + disable, _CHUNK):
+		rows = db.execute(
+			select(_E.c.id, _E.c.course_id, _E.c.prompt, _E.c.answer, _E.c.enabled, *[_E.c[c] for c in _HASHED if c not in ("prompt", "answer", "enabled")])
+			.where(_E.c.id.in_(chunk))
+		).all()
+		for row in rows:
+			if row.id not in candidates:
+				updates.append({"_id": row.id, "enabled": False, "content_hash": None})
+				removed.append((row.prompt, row.answer, row.enabled))
+				continue
+			course_id, values = candidates[row.id]
+			if _row_hash(row) == values["content_hash"] and row.course_id == course_id:
+				# Seeded before content_hash existed, or edited back: only record the hash
+				updates.append({"_id": row.id, "content_hash": values["content_hash"]})
+				rehashed += 1
+				continue
+			updates.append({"_id": row.id, "course_id": course_id, **values})
+			updated += 1
+			removed.append((row.prompt, row.answer, row.enabled))
+			added.append((values["prompt"], values["answer"], values["enabled"]))
+	added.extend((r["prompt"], r["answer"], r["enabled"]) for r in inserts)
+
+	for batch in _chunks(inserts, CORPUS_BATCH_SIZE):
+		# executemany of a Core insert: SQLAlchemy sends multi-row INSERT ... VALUES (insertmanyvalues)
+		db.execute(insert(_E), batch)
+	# Group by key set: an executemany needs the same parameters in every row
+	by_keys: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+	for params in updates:
+		by_keys.setdefault(tuple(sorted(params)), []).append(params)
+	for rows in by_keys.values():
+		db.execute(update(_E).where(_E.c.id == bindparam("_id")), rows)
+	lexicon.apply_exercise_changes(db, removed, added)
+
+	return {
+		"inserted": len(inserts),
+		"updated": updated,
+		"disabled": len(disable),
+		"unchanged": unchanged + rehashed,
+	}
+
+
+def load(db: Session, classes: Optional[Iterable[int]] = None, dry_run: bool = False) -> List[Dict[str, Any]]:
+	"""
+	Upsert the given classes (all corpus files by default) in one transaction
+	and commit it (roll back with dry_run). Returns one summary per class.
+	"""
+	docs = read_corpus(classes)
+	results = []
+	changed = False
+	try:
+		for number, doc in docs.items():
+			loader = _Load(db)
+			cls = loader.run(doc)
+			counts = _write_exercises(db, loader.managed)
+			results.append({
+				"class": number,
+				"name": doc["name"],
+				"class_id": cls.id,
+				"courses": len(doc["courses"]),
+				"exercises": sum(len(docs) for _, _, docs in loader.managed.values()),
+				"structure_changes": loader.structure_changes,
+				**counts,
+			})
+			changed = changed or any((loader.structure_changes, counts["inserted"], counts["updated"], counts["disabled"]))
+		if changed and not db.info.get("content_bumped"):
+			content_cache.bump(db)
+			db.info["content_bumped"] = True
+		if dry_run:
+			db.rollback()
+		else:
+			db.commit()
+	except Exception:
+		db.rollback()
+		raise
+	for r in results:
+		print(
+			f"[CORPUS] {'would load' if dry_run else 'loaded'} {r['name']}: {r['inserted']} inserted, {r['updated']} updated, "
+			f"{r['disabled']} disabled, {r['unchanged']} unchanged, {r['structure_changes']} course/level changes"
+		)
+	return results
+
+
+def load_class(db: Session, number: int) -> Dict[str, Any]:
+	return load(db, [number])[0]
+
+
+# ============================================================================
+# SESSION HOOK
+# ============================================================================
+
+def _before_flush(session: Session, flush_context, instances) -> None:
+	"""An ORM edit of a hashed column makes the stored hash stale: clear it."""
+	for obj in session.dirty:
+		if isinstance(obj, models.Exercise) and obj.content_hash is not None:
+			attrs = inspect(obj).attrs
+			if any(attrs[c].history.has_changes() for c in _HASHED):
+				obj.content_hash = None
+
+
+_HOOKS_INSTALLED = False
+
+
+def install_hooks() -> None:
+	"""Register the session hook on every Session (idempotent)."""
+	global _HOOKS_INSTALLED
+	if _HOOKS_INSTALLED:
+		return
+	event.listen(Session, "before_flush", _before_flush)
+	_HOOKS_INSTALLED = True
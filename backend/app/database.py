@@ -1,7 +1,14 @@
 import os
 import logging
+import threading
+import time
+from typing import Any, Dict
 from dotenv import load_dotenv
 from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as SATimeoutError
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from sqlalchemy.orm import sessionmaker, declarative_base
 from sqlalchemy.exc import OperationalError, DisconnectionError, IntegrityError
 from fastapi import HTTPException
@@ -34,39 +41,172 @@ engine_kwargs = {
 	"connect_args": connect_args,
 }
 
+# Pool sizing (PostgreSQL). Each worker process has two pools (the sync engine
+# and the async engine below), so the connection budget for the whole service
+# is split across WEB_CONCURRENCY workers and then between the two engines:
+# a third kept open, the rest as overflow for bursts.
+DB_MAX_CONNECTIONS = int(os.getenv("DB_MAX_CONNECTIONS", "15"))
+WEB_CONCURRENCY = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+_PER_WORKER = max(2, DB_MAX_CONNECTIONS // WEB_CONCURRENCY // 2)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", str(max(1, -(-_PER_WORKER // 3)))))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", str(max(0, _PER_WORKER - DB_POOL_SIZE))))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "300"))
+# Connection health: pre-ping on checkout (one round trip per checkout). With
+# it off, a dropped connection fails its first statement; SQLAlchemy then
+# invalidates the pool and get_db answers 503 so the client retries.
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+
+
+class _PoolWaitStats:
+	def __init__(self):
+		self.checkouts = 0
+		self.timeouts = 0
+		self.wait_seconds_total = 0.0
+		self.wait_seconds_max = 0.0
+		self.lock = threading.Lock()
+
+
+_pool_wait = _PoolWaitStats()
+_async_pool_wait = _PoolWaitStats()
+
+
+class _TimedCheckout:
+	"""Pool mixin that records how long checkouts wait for a connection."""
+	wait_stats: _PoolWaitStats
+
+	def _do_get(self):
+		stats = self.wait_stats
+		start = time.perf_counter()
+		try:
+			return super()._do_get()
+		except SATimeoutError:
+			with stats.lock:
+				stats.timeouts += 1
+			raise
+		finally:
+			waited = time.perf_counter() - start
+			with stats.lock:
+				stats.checkouts += 1
+				stats.wait_seconds_total += waited
+				stats.wait_seconds_max = max(stats.wait_seconds_max, waited)
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+	wait_stats = _pool_wait
+
+
+class TimedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+	wait_stats = _async_pool_wait
+
+
+def _pool_kwargs(poolclass) -> Dict[str, Any]:
+	return {
+		"poolclass": poolclass,
+		"pool_size": DB_POOL_SIZE,
+		"max_overflow": DB_MAX_OVERFLOW,
+		"pool_timeout": DB_POOL_TIMEOUT,
+		"pool_pre_ping": DB_POOL_PRE_PING,
+		"pool_recycle": DB_POOL_RECYCLE,  # Recycle connections after 5 minutes
+		"pool_reset_on_return": "commit",  # Reset connections on return
+	}
+
+
 # Add connection pool settings for PostgreSQL (production)
 if DATABASE_URL.startswith("postgresql"):
-	engine_kwargs.update({
-		"pool_size": 5,
-		"max_overflow": 10,
-		"pool_pre_ping": True,  # Verify connections before using
-		"pool_recycle": 300,  # Recycle connections after 5 minutes
-		"pool_reset_on_return": "commit",  # Reset connections on return
-	})
+	engine_kwargs.update(_pool_kwargs(TimedQueuePool))
+
+# No connection at import: scripts and workers that never touch the database
+# don't pay for it; the app checks it once in its lifespan (check_connection)
+engine = create_engine(DATABASE_URL, **engine_kwargs)
+
+
+def check_connection() -> None:
+	"""One round trip; logs and re-raises so a misconfigured DATABASE_URL fails startup."""
+	try:
+		with engine.connect() as conn:
+			conn.execute(text("SELECT 1"))
+		logger.info("Database connection successful")
+	except Exception as e:
+		logger.error(f"Failed to connect to database: {e}")
+		logger.error(f"DATABASE_URL format: {DATABASE_URL[:20]}...")  # Log first 20 chars only
+		raise
 
-try:
-	engine = create_engine(DATABASE_URL, **engine_kwargs)
-	
-	# Test connection on startup
-	with engine.connect() as conn:
-		conn.execute(text("SELECT 1"))
-	logger.info("Database connection successful")
-except Exception as e:
-	logger.error(f"Failed to connect to database: {e}")
-	logger.error(f"DATABASE_URL format: {DATABASE_URL[:20]}...")  # Log first 20 chars only
-	raise
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+
+# ============================================================================
+# ASYNC ENGINE (asyncpg for PostgreSQL, aiosqlite for dev) for the hot endpoints
+# ============================================================================
+
+def _async_url(url: str):
+	"""Same database through its asyncio driver; libpq's sslmode becomes asyncpg's ssl."""
+	u = make_url(url)
+	args: Dict[str, Any] = {}
+	if u.get_backend_name() == "postgresql":
+		query = dict(u.query)
+		sslmode = query.pop("sslmode", None)
+		if sslmode:
+			args["ssl"] = sslmode
+		u = u.set(drivername="postgresql+asyncpg", query=query)
+	elif u.get_backend_name() == "sqlite":
+		u = u.set(drivername="sqlite+aiosqlite")
+	return u, args
+
+
+_async_database_url, _async_connect_args = _async_url(DATABASE_URL)
+async_engine_kwargs: Dict[str, Any] = {"echo": False, "connect_args": _async_connect_args}
+if DATABASE_URL.startswith("postgresql"):
+	async_engine_kwargs.update(_pool_kwargs(TimedAsyncQueuePool))
+
+async_engine = create_async_engine(_async_database_url, **async_engine_kwargs)
+
+# expire_on_commit=False: attributes stay readable after commit without an implicit (sync) reload
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+def _pool_gauges(pool, wait: _PoolWaitStats) -> Dict[str, Any]:
+	out: Dict[str, Any] = {"pool_class": type(pool).__name__}
+	if isinstance(pool, QueuePool):
+		out.update({
+			"size": pool.size(),
+			"checked_out": pool.checkedout(),
+			"checked_in": pool.checkedin(),
+			"overflow": max(0, pool.overflow()),
+		})
+	if isinstance(pool, _TimedCheckout):
+		out.update({
+			"max_overflow": DB_MAX_OVERFLOW,
+			"timeout_seconds": DB_POOL_TIMEOUT,
+			"pre_ping": DB_POOL_PRE_PING,
+		})
+	with wait.lock:
+		checkouts = wait.checkouts
+		out.update({
+			"checkouts": checkouts,
+			"checkout_timeouts": wait.timeouts,
+			"wait_ms_avg": round(wait.wait_seconds_total * 1000 / checkouts, 3) if checkouts else 0.0,
+			"wait_ms_max": round(wait.wait_seconds_max * 1000, 3),
+		})
+	return out
+
+
+def pool_stats() -> Dict[str, Any]:
+	"""Connection pool gauges and checkout wait times for this worker (sync pool, async pool under "async")."""
+	out = _pool_gauges(engine.pool, _pool_wait)
+	out["async"] = _pool_gauges(async_engine.pool, _async_pool_wait)
+	return out
+
+
 def get_db():
 	from sqlalchemy.orm import Session
 	
+	# No per-request SELECT 1: the session connects lazily on its first query,
+	# and connection health is the pool's job (pre-ping / invalidation on disconnect)
 	db: Session = SessionLocal()
 	try:
-		# Test connection before yielding
-		db.execute(text("SELECT 1"))
 		yield db
 	except (OperationalError, DisconnectionError) as e:
 		logger.error(f"Database connection error: {e}")
@@ -77,12 +217,16 @@ def get_db():
 		)
 	except IntegrityError as e:
 		# Let IntegrityError propagate to the endpoint handler
-		# The endpoint has retry logic for sequence issues
+		# (unique username/email races are reported as 400 there)
 		logger.warning(f"Database integrity error (will be handled by endpoint): {e}")
 		if hasattr(e, 'orig'):
 			logger.warning(f"Original error: {e.orig}")
 		db.rollback()
 		raise  # Re-raise to let endpoint handle it
+	except HTTPException:
+		# Raised by the endpoint itself; nothing database-related to log
+		db.rollback()
+		raise
 	except Exception as e:
 		# Check if it's a psycopg2 UniqueViolation (which should be IntegrityError)
 		error_type = type(e).__name__
@@ -120,3 +264,28 @@ def get_db():
 		db.close()
 
 
+async def get_async_db():
+	"""AsyncSession dependency for async endpoints; same error handling as get_db."""
+	db: AsyncSession = AsyncSessionLocal()
+	try:
+		yield db
+	except (OperationalError, DisconnectionError) as e:
+		logger.error(f"Database connection error: {e}")
+		await db.rollback()
+		raise HTTPException(
+			status_code=503,
+			detail="Database connection error. Please try again in a moment."
+		)
+	except IntegrityError as e:
+		logger.warning(f"Database integrity error (will be handled by endpoint): {e}")
+		await db.rollback()
+		raise
+	except HTTPException:
+		await db.rollback()
+		raise
+	except Exception as e:
+		logger.error(f"Unexpected database error: {e}")
+		await db.rollback()
+		raise
+	finally:
+		await db.close()
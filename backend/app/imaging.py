@@ -0,0 +1,244 @@
+"""
+NumPy-backed image preprocessing for OCR (routers/ocr.py).
+
+- downsample_for_ocr: bring phone photos (often 12 MP) down to OCR resolution
+  before any filtering; small scans are upscaled as before
+- estimate_skew / deskew: projection-profile skew estimation (no tesseract OSD
+  call); also detects pages rotated by 90°
+- contrast_stretch: percentile-based autocontrast
+- median3x3: vectorized 3x3 median (sorting network)
+- sauvola_binarize: adaptive threshold with local mean/std from integral images
+- binarize_for_ocr: the full chain used before tesseract
+
+Config (env):
+- OCR_TARGET_LONG_SIDE: max long side in pixels after downsampling (default 2200, ≈ A4 at 260 DPI)
+- OCR_TARGET_DPI: max DPI when the image carries DPI metadata (default 300)
+"""
+import math
+import os
+from typing import Optional, Tuple
+
+import numpy as np
+from PIL import Image
+
+OCR_TARGET_LONG_SIDE = int(os.getenv("OCR_TARGET_LONG_SIDE", "2200"))
+OCR_TARGET_DPI = int(os.getenv("OCR_TARGET_DPI", "300"))
+# Smaller inputs are upscaled to this long side (tesseract reads small glyphs poorly)
+MIN_LONG_SIDE = 1000
+
+# Skew search: ±MAX_SKEW_DEGREES, coarse then fine around the best coarse angle
+MAX_SKEW_DEGREES = 6.0
+_SKEW_COARSE_STEP = 0.5
+_SKEW_FINE_STEP = 0.1
+_SKEW_WORK_SIDE = 1000  # skew is estimated on a thumbnail of this long side
+_SKEW_MAX_POINTS = 150_000
+
+
+def downsample_for_ocr(img: Image.Image, target_long_side: Optional[int] = None) -> Image.Image:
+	"""
+	Resize to OCR resolution: cap by long side and by DPI metadata, upscale small
+	images to MIN_LONG_SIDE. Idempotent, so it is safe to apply at several stages.
+	"""
+	target_long_side = target_long_side or OCR_TARGET_LONG_SIDE
+	w, h = img.size
+	long_side = max(w, h)
+	if long_side == 0:
+		return img
+
+	# 10% slack so an image that deskew rotation grew slightly is not resampled again
+	scale = 1.0 if long_side <= target_long_side * 1.1 else target_long_side / long_side
+	dpi = img.info.get("dpi")
+	if dpi:
+		try:
+			dpi_x = float(dpi[0])
+			if dpi_x >= 150 and dpi_x > OCR_TARGET_DPI:
+				scale = min(scale, OCR_TARGET_DPI / dpi_x)
+		except (TypeError, ValueError, IndexError):
+			pass
+
+	if scale < 1.0:
+		# Integer box reduction first (cheap, anti-aliased), then an exact Lanczos resize
+		factor = int(1.0 / scale)
+		if factor >= 2:
+			img = img.reduce(factor)
+		size = (max(1, int(round(w * scale))), max(1, int(round(h * scale))))
+		if img.size != size:
+			img = img.resize(size, Image.LANCZOS)
+		return img
+
+	if long_side < MIN_LONG_SIDE:
+		up = MIN_LONG_SIDE / long_side
+		return img.resize((int(round(w * up)), int(round(h * up))), Image.BICUBIC)
+	return img
+
+
+def otsu_threshold(gray: np.ndarray) -> int:
+	"""Global Otsu threshold of a uint8 array."""
+	hist = np.bincount(gray.ravel(), minlength=256).astype(np.float64)
+	total = hist.sum()
+	if total == 0:
+		return 128
+	levels = np.arange(256, dtype=np.float64)
+	weight_bg = np.cumsum(hist)
+	weight_fg = total - weight_bg
+	cum_mean = np.cumsum(hist * levels)
+	mean_bg = cum_mean / np.maximum(weight_bg, 1)
+	mean_fg = (cum_mean[-1] - cum_mean) / np.maximum(weight_fg, 1)
+	between = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+	return int(np.argmax(between))
+
+
+def _profile_score(ys: np.ndarray, xs: np.ndarray, angle_deg: float) -> float:
+	"""Sharpness of the horizontal projection profile after rotating ink points by angle."""
+	rad = math.radians(angle_deg)
+	rows = ys * math.cos(rad) - xs * math.sin(rad)
+	rows = (rows - rows.min()).astype(np.int64)
+	profile = np.bincount(rows)
+	diff = np.diff(profile.astype(np.float64))
+	return float(np.dot(diff, diff))
+
+
+def _profile_contrast(ys: np.ndarray, xs: np.ndarray, angle_deg: float) -> float:
+	"""
+	Coefficient of variation of the smoothed projection profile. Smoothing over ~1% of
+	the extent removes gaps between letters but keeps gaps between lines, so this is
+	comparable across the two orientations (unlike _profile_score).
+	"""
+	rad = math.radians(angle_deg)
+	rows = ys * math.cos(rad) - xs * math.sin(rad)
+	profile = np.bincount((rows - rows.min()).astype(np.int64)).astype(np.float64)
+	width = max(1, len(profile) // 100)
+	profile = np.convolve(profile, np.ones(width) / width, mode="same")
+	mean = profile.mean()
+	return float(profile.std() / mean) if mean > 0 else 0.0
+
+
+def _best_angle(ys: np.ndarray, xs: np.ndarray) -> Tuple[float, float]:
+	"""Angle (degrees) with the sharpest profile, and its score."""
+	coarse = np.arange(-MAX_SKEW_DEGREES, MAX_SKEW_DEGREES + 1e-9, _SKEW_COARSE_STEP)
+	scores = [_profile_score(ys, xs, a) for a in coarse]
+	best = float(coarse[int(np.argmax(scores))])
+	fine = np.arange(best - _SKEW_COARSE_STEP, best + _SKEW_COARSE_STEP + 1e-9, _SKEW_FINE_STEP)
+	fine_scores = [_profile_score(ys, xs, a) for a in fine]
+	i = int(np.argmax(fine_scores))
+	return float(fine[i]), float(fine_scores[i])
+
+
+def estimate_skew(img: Image.Image) -> Tuple[float, int]:
+	"""
+	Estimate page orientation from projection profiles.
+
+	Returns (skew_degrees, quarter_turns): rotating the image by quarter_turns * 90°
+	and then by skew_degrees (PIL rotate, counter-clockwise) makes text lines horizontal.
+	"""
+	gray = img.convert("L")
+	w, h = gray.size
+	if max(w, h) > _SKEW_WORK_SIDE:
+		ratio = _SKEW_WORK_SIDE / max(w, h)
+		gray = gray.resize((max(1, int(w * ratio)), max(1, int(h * ratio))), Image.BILINEAR)
+	arr = np.asarray(gray, dtype=np.uint8)
+	# Local threshold: a global one turns shadows from uneven lighting into "ink"
+	ink = sauvola_binarize(arr) == 0
+	ys, xs = np.nonzero(ink)
+	if len(ys) < 50:
+		return 0.0, 0
+	if len(ys) > _SKEW_MAX_POINTS:
+		pick = np.random.default_rng(0).choice(len(ys), _SKEW_MAX_POINTS, replace=False)
+		ys, xs = ys[pick], xs[pick]
+	ys = ys.astype(np.float64)
+	xs = xs.astype(np.float64)
+
+	angle, _ = _best_angle(ys, xs)
+	# Text lines running vertically → page is rotated by 90°
+	angle_t, _ = _best_angle(xs, ys)
+	if _profile_contrast(xs, ys, angle_t) > 1.5 * _profile_contrast(ys, xs, angle):
+		return -angle_t, 1
+	return angle, 0
+
+
+def deskew(img: Image.Image, min_angle: float = 0.2) -> Tuple[Image.Image, float]:
+	"""Rotate img so text lines are horizontal. Returns (image, total rotation in degrees)."""
+	angle, quarter_turns = estimate_skew(img)
+	total = 0.0
+	fill = 255 if img.mode in ("L", "1") else (255,) * len(img.getbands())
+	if quarter_turns:
+		img = img.transpose(Image.ROTATE_90)
+		total += 90.0
+	if abs(angle) >= min_angle:
+		img = img.rotate(angle, resample=Image.BICUBIC, expand=True, fillcolor=fill)
+		total += angle
+	return img, total
+
+
+def contrast_stretch(gray: np.ndarray, low_pct: float = 1.0, high_pct: float = 99.0) -> np.ndarray:
+	"""Linearly stretch the [low_pct, high_pct] percentile range to 0..255."""
+	lo, hi = np.percentile(gray, (low_pct, high_pct))
+	if hi - lo < 1:
+		return gray
+	out = (gray.astype(np.float32) - lo) * (255.0 / (hi - lo))
+	return np.clip(out, 0, 255).astype(np.uint8)
+
+
+# Paeth's 19-comparison sorting network for the median of 9 values
+_MEDIAN9_NETWORK = (
+	(1, 2), (4, 5), (7, 8), (0, 1), (3, 4), (6, 7), (1, 2), (4, 5), (7, 8), (0, 3),
+	(5, 8), (4, 7), (3, 6), (1, 4), (2, 5), (4, 7), (4, 2), (6, 4), (4, 2),
+)
+
+
+def median3x3(gray: np.ndarray) -> np.ndarray:
+	"""3x3 median filter as whole-array min/max operations (same result as PIL MedianFilter(3))."""
+	h, w = gray.shape
+	padded = np.pad(gray, 1, mode="edge")
+	v = [padded[dy:dy + h, dx:dx + w] for dy in range(3) for dx in range(3)]
+	for i, j in _MEDIAN9_NETWORK:
+		v[i], v[j] = np.minimum(v[i], v[j]), np.maximum(v[i], v[j])
+	return v[4]
+
+
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+	"""Sum over a window x window neighbourhood of every pixel via an integral image."""
+	pad = window // 2
+	padded = np.pad(values, pad, mode="reflect")
+	integral = np.zeros((padded.shape[0] + 1, padded.shape[1] + 1), dtype=np.float64)
+	np.cumsum(np.cumsum(padded, axis=0), axis=1, out=integral[1:, 1:])
+	return (
+		integral[window:, window:]
+		- integral[:-window, window:]
+		- integral[window:, :-window]
+		+ integral[:-window, :-window]
+	)
+
+
+def sauvola_binarize(gray: np.ndarray, window: Optional[int] = None, k: float = 0.2, r: float = 128.0) -> np.ndarray:
+	"""
+	Sauvola adaptive threshold: T = mean * (1 + k * (std / r - 1)) over a local window.
+	Returns a uint8 array with text 0 and background 255.
+	"""
+	h, w = gray.shape
+	if window is None:
+		window = max(15, int(round(min(h, w) / 40)))
+	window = min(window | 1, (min(h, w) // 2) * 2 - 1) if min(h, w) > 2 else 1
+	if window < 3:
+		return np.where(gray > otsu_threshold(gray), 255, 0).astype(np.uint8)
+
+	g = gray.astype(np.float64)
+	n = float(window * window)
+	mean = _window_sums(g, window) / n
+	var = _window_sums(g * g, window) / n - mean * mean
+	std = np.sqrt(np.maximum(var, 0.0))
+	threshold = mean * (1.0 + k * (std / r - 1.0))
+	return np.where(g > threshold, 255, 0).astype(np.uint8)
+
+
+def binarize_for_ocr(img: Image.Image) -> Image.Image:
+	"""
+	Downsample → contrast stretch → median denoise → unsharp mask → Sauvola threshold.
+	The unsharp mask stays in PIL (C implementation), on the downsampled image.
+	"""
+	from PIL import ImageFilter
+
+	gray = downsample_for_ocr(img.convert("L"))
+	arr = median3x3(contrast_stretch(np.asarray(gray)))
+	gray = Image.fromarray(arr).filter(ImageFilter.UnsharpMask(radius=2, percent=150, threshold=3))
+	return Image.fromarray(sauvola_binarize(np.asarray(gray)))
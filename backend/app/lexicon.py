@@ -0,0 +1,466 @@
+"""
+Persisted orthography lexicon for OCR spell-checking (routers/ocr.py).
+
+Words live in the lexicon_words table (word → corpus_count + external_count):
+
+- corpus_count is maintained incrementally from exercise prompts/answers by
+  session hooks (install_hooks): inserts, updates, deletes and ORM bulk
+  deletes of Exercise rows adjust the counts of the words they add/remove.
+  Adjacent word pairs are kept the same way in lexicon_bigrams.
+  Raw SQL and Core writes bypass the hooks; call apply_exercise_changes()
+  (or rebuild_from_corpus()) after them.
+- external_count comes from imported word lists (import_words, see
+  scripts/import_wordlist.py).
+
+Each worker loads the table once into memory (get_lexicon) and afterwards
+only pulls rows changed since its last sync (every LEXICON_SYNC_SECONDS),
+so spell-checking never rescans the exercises table. Rows are not deleted:
+a word whose counts drop to 0 stays as a tombstone and is removed from the
+in-memory index on the next sync.
+
+Changes are numbered by the lexicon_version row (_next_version), whose lock
+is held until the writer commits, so a worker that has seen version N has
+seen every row written with N or less. A published LexiconIndex is never
+modified: sync applies the pulled rows to a copy and get_lexicon swaps it
+in, so requests reading the old one (also from the threadpool) aren't
+affected.
+"""
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, insert, inspect, select, update
+from sqlalchemy.orm import Session
+
+from . import models
+from .spelling import SpellIndex
+
+LEXICON_SYNC_SECONDS = float(os.getenv("LEXICON_SYNC_SECONDS", "30"))
+_CHUNK = 500
+
+_TOKEN_RE = re.compile(r"[A-Za-zËÇëç]+", re.UNICODE)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+	"""Lowercase lexicon words of a text (same rules the OCR analyzer uses)."""
+	norm = unicodedata.normalize("NFKC", text or "").lower()
+	return [w for w in _TOKEN_RE.findall(norm) if len(w) >= 2]
+
+
+def _exercise_counts(prompt: Optional[str], answer: Optional[str], enabled: Optional[bool]) -> Tuple[Counter, Counter]:
+	"""(word counts, word pair counts) contributed by one exercise."""
+	words: Counter = Counter()
+	pairs: Counter = Counter()
+	if enabled is False:
+		return words, pairs
+	for text in (prompt, answer):
+		toks = tokenize(text)
+		words.update(toks)
+		pairs.update(zip(toks, toks[1:]))
+	return words, pairs
+
+
+# ============================================================================
+# PERSISTENCE
+# ============================================================================
+
+def _chunks(items: List[str]) -> Iterable[List[str]]:
+	for i in range(0, len(items), _CHUNK):
+		yield items[i:i + _CHUNK]
+
+
+def _current_version(db: Session) -> int:
+	counter = models.LexiconVersion.__table__
+	return db.execute(select(counter.c.version).where(counter.c.id == 1)).scalar() or 0
+
+
+def _next_version(db: Session) -> int:
+	"""
+	Number for the caller's lexicon writes. The UPDATE locks the counter row
+	until the transaction ends, so versions are committed in order.
+	"""
+	counter = models.LexiconVersion.__table__
+	if db.execute(update(counter).where(counter.c.id == 1).values(version=counter.c.version + 1)).rowcount:
+		return _current_version(db)
+	db.execute(insert(counter).values(id=1, version=1))  # database not migrated by app/migrate.py
+	return 1
+
+
+def apply_corpus_delta(db: Session, delta: Dict[str, int]) -> None:
+	"""
+	Add delta to corpus_count of each word (in the caller's transaction).
+	Existing rows are incremented in SQL (corpus_count = corpus_count + n), so
+	concurrent writers don't lose updates.
+	"""
+	words = [w for w, n in delta.items() if n]
+	if not words:
+		return
+	now = datetime.utcnow()
+	with db.no_autoflush:
+		version = _next_version(db)
+		existing: Dict[str, models.LexiconWord] = {}
+		for chunk in _chunks(words):
+			for row in db.query(models.LexiconWord).filter(models.LexiconWord.word.in_(chunk)).all():
+				existing[row.word] = row
+		for w in words:
+			row = existing.get(w)
+			if row is None:
+				if delta[w] > 0:
+					db.add(models.LexiconWord(word=w, corpus_count=delta[w], external_count=0, source="corpus", updated_at=now, version=version))
+				continue
+			row.corpus_count = models.LexiconWord.corpus_count + delta[w]
+			row.updated_at = now
+			row.version = version
+
+
+def apply_bigram_delta(db: Session, delta: Dict[Tuple[str, str], int]) -> None:
+	"""Add delta to the count of each (first, second) word pair, like apply_corpus_delta."""
+	pairs = [p for p, n in delta.items() if n]
+	if not pairs:
+		return
+	now = datetime.utcnow()
+	with db.no_autoflush:
+		version = _next_version(db)
+		existing: Dict[Tuple[str, str], models.LexiconBigram] = {}
+		for chunk in _chunks(sorted({p[0] for p in pairs})):
+			for row in db.query(models.LexiconBigram).filter(models.LexiconBigram.first.in_(chunk)).all():
+				existing[(row.first, row.second)] = row
+		for pair in pairs:
+			row = existing.get(pair)
+			if row is None:
+				if delta[pair] > 0:
+					db.add(models.LexiconBigram(first=pair[0], second=pair[1], count=delta[pair], updated_at=now, version=version))
+				continue
+			row.count = models.LexiconBigram.count + delta[pair]
+			row.updated_at = now
+			row.version = version
+
+
+def _apply_deltas(db: Session, words: Counter, pairs: Counter) -> None:
+	if words:
+		apply_corpus_delta(db, dict(words))
+	if pairs:
+		apply_bigram_delta(db, dict(pairs))
+
+
+def apply_exercise_changes(
+	db: Session,
+	removed: Iterable[Tuple[Optional[str], Optional[str], Optional[bool]]],
+	added: Iterable[Tuple[Optional[str], Optional[str], Optional[bool]]],
+) -> None:
+	"""
+	Adjust the counts for exercises written with Core statements (bulk
+	inserts/updates the hooks don't see). removed and added are the
+	(prompt, answer, enabled) of the affected rows before and after the write.
+	"""
+	words: Counter = Counter()
+	pairs: Counter = Counter()
+	for prompt, answer, enabled in removed:
+		w, p = _exercise_counts(prompt, answer, enabled)
+		words.subtract(w)
+		pairs.subtract(p)
+	for prompt, answer, enabled in added:
+		w, p = _exercise_counts(prompt, answer, enabled)
+		words.update(w)
+		pairs.update(p)
+	_apply_deltas(db, words, pairs)
+
+
+def rebuild_from_corpus(db: Session) -> int:
+	"""Recount corpus_count and word pairs from all enabled exercises (full scan). Returns the number of corpus words."""
+	counts: Counter = Counter()
+	pair_counts: Counter = Counter()
+	rows = db.query(models.Exercise.prompt, models.Exercise.answer).filter(models.Exercise.enabled == True).all()
+	for prompt, answer in rows:
+		words, pairs = _exercise_counts(prompt, answer, True)
+		counts.update(words)
+		pair_counts.update(pairs)
+
+	now = datetime.utcnow()
+	with db.no_autoflush:
+		version = _next_version(db)
+		existing = {r.word: r for r in db.query(models.LexiconWord).all()}
+		for w, row in existing.items():
+			new_count = counts.get(w, 0)
+			if row.corpus_count != new_count:
+				row.corpus_count = new_count
+				row.updated_at = now
+				row.version = version
+		for w, n in counts.items():
+			if w not in existing:
+				db.add(models.LexiconWord(word=w, corpus_count=n, external_count=0, source="corpus", updated_at=now, version=version))
+
+		existing_pairs = {(r.first, r.second): r for r in db.query(models.LexiconBigram).all()}
+		for pair, row in existing_pairs.items():
+			new_count = pair_counts.get(pair, 0)
+			if row.count != new_count:
+				row.count = new_count
+				row.updated_at = now
+				row.version = version
+		for pair, n in pair_counts.items():
+			if pair not in existing_pairs:
+				db.add(models.LexiconBigram(first=pair[0], second=pair[1], count=n, updated_at=now, version=version))
+	db.commit()
+	return len(counts)
+
+
+def import_words(db: Session, words: Iterable[Tuple[str, int]], source: str) -> Dict[str, int]:
+	"""
+	Add an external word list: external_count += frequency for each (word, frequency).
+	Words are normalized like corpus words; entries that aren't a single word are skipped.
+	"""
+	merged: Counter = Counter()
+	skipped = 0
+	for raw, freq in words:
+		toks = tokenize(raw)
+		if len(toks) != 1 or freq <= 0:
+			skipped += 1
+			continue
+		merged[toks[0]] += freq
+
+	now = datetime.utcnow()
+	added = 0
+	keys = list(merged)
+	for chunk in _chunks(keys):
+		version = _next_version(db)
+		existing = {r.word: r for r in db.query(models.LexiconWord).filter(models.LexiconWord.word.in_(chunk)).all()}
+		for w in chunk:
+			row = existing.get(w)
+			if row is None:
+				db.add(models.LexiconWord(word=w, corpus_count=0, external_count=merged[w], source=source[:50], updated_at=now, version=version))
+				added += 1
+			else:
+				row.external_count = models.LexiconWord.external_count + merged[w]
+				row.updated_at = now
+				row.version = version
+		db.commit()
+	return {"words": len(merged), "added": added, "updated": len(merged) - added, "skipped": skipped}
+
+
+def parse_wordlist(lines: Iterable[str], fmt: str = "auto") -> Iterable[Tuple[str, int]]:
+	"""
+	Parse an external word list into (word, frequency) pairs.
+
+	fmt: "plain" (one word per line), "freq" ("word count" or "count word"),
+	"hunspell" (.dic: entry count on the first line, "word/FLAGS" entries) or
+	"auto" (per line: a number next to the word is its frequency, /FLAGS are dropped).
+	"""
+	for i, line in enumerate(lines):
+		line = line.strip()
+		if not line or line.startswith("#"):
+			continue
+		if i == 0 and line.isdigit() and fmt in ("hunspell", "auto"):
+			continue  # hunspell entry count
+		parts = [p.split("/", 1)[0] for p in line.split()]
+		if fmt in ("plain", "hunspell"):
+			yield parts[0], 1
+			continue
+		nums = [p for p in parts if p.isdigit()]
+		words = [p for p in parts if p and not p.isdigit()]
+		if words:
+			yield words[0], int(nums[0]) if nums else 1
+
+
+# ============================================================================
+# SESSION HOOKS (incremental corpus maintenance)
+# ============================================================================
+
+def _committed(obj, attr: str):
+	"""Value of attr as last loaded from the database."""
+	hist = inspect(obj).attrs[attr].history
+	if hist.deleted:
+		return hist.deleted[0]
+	if hist.unchanged:
+		return hist.unchanged[0]
+	return getattr(obj, attr)
+
+
+def _before_flush(session: Session, flush_context, instances) -> None:
+	words: Counter = Counter()
+	pairs: Counter = Counter()
+
+	def add(counts: Tuple[Counter, Counter], sign: int) -> None:
+		for acc, c in zip((words, pairs), counts):
+			if sign > 0:
+				acc.update(c)
+			else:
+				acc.subtract(c)
+
+	for obj in session.new:
+		if isinstance(obj, models.Exercise):
+			add(_exercise_counts(obj.prompt, obj.answer, obj.enabled), 1)
+	for obj in session.deleted:
+		if isinstance(obj, models.Exercise):
+			add(_exercise_counts(_committed(obj, "prompt"), _committed(obj, "answer"), _committed(obj, "enabled")), -1)
+	for obj in session.dirty:
+		if isinstance(obj, models.Exercise) and session.is_modified(obj):
+			old = _exercise_counts(_committed(obj, "prompt"), _committed(obj, "answer"), _committed(obj, "enabled"))
+			new = _exercise_counts(obj.prompt, obj.answer, obj.enabled)
+			if old != new:
+				add(new, 1)
+				add(old, -1)
+	_apply_deltas(session, words, pairs)
+
+
+def _do_orm_execute(state) -> None:
+	"""Bulk ORM deletes (query(Exercise).filter(...).delete()) don't go through flush."""
+	if not state.is_delete:
+		return
+	if not any(m.class_ is models.Exercise for m in state.all_mappers):
+		return
+	stmt = select(models.Exercise.prompt, models.Exercise.answer, models.Exercise.enabled)
+	where = state.statement.whereclause
+	if where is not None:
+		stmt = stmt.where(where)
+	words: Counter = Counter()
+	pairs: Counter = Counter()
+	for prompt, answer, enabled in state.session.execute(stmt):
+		w, p = _exercise_counts(prompt, answer, enabled)
+		words.subtract(w)
+		pairs.subtract(p)
+	_apply_deltas(state.session, words, pairs)
+
+
+_HOOKS_INSTALLED = False
+
+
+def _keep_history(target, value, oldvalue, initiator):
+	return value
+
+
+def install_hooks() -> None:
+	"""Register the session hooks on every Session (idempotent)."""
+	global _HOOKS_INSTALLED
+	if _HOOKS_INSTALLED:
+		return
+	# Load old values on assignment, so history has them even after commit expired the row
+	for attr in (models.Exercise.prompt, models.Exercise.answer, models.Exercise.enabled):
+		event.listen(attr, "set", _keep_history, active_history=True)
+	event.listen(Session, "before_flush", _before_flush)
+	event.listen(Session, "do_orm_execute", _do_orm_execute)
+	_HOOKS_INSTALLED = True
+
+
+# ============================================================================
+# PER-WORKER INDEX
+# ============================================================================
+
+class LexiconIndex:
+	"""
+	In-memory view: word set, frequencies, the SymSpell index for suggestions
+	(app/spelling.py) and word pair counts for the OCR corrector (app/ocr_correct.py).
+	Read-only once get_lexicon() has returned it; see synced().
+	"""
+
+	def __init__(self):
+		self.words: set = set()
+		self.frequency: Dict[str, int] = {}
+		self.total: int = 0  # sum of frequency
+		self.spelling = SpellIndex(self.frequency)
+		self.bigrams: Dict[Tuple[str, str], int] = {}
+		self.bigram_totals: Dict[str, int] = {}  # first word → sum of its pair counts
+		self.version: Optional[int] = None  # lexicon_version it includes, None until loaded
+
+	def _copy(self) -> "LexiconIndex":
+		other = LexiconIndex()
+		other.words = set(self.words)
+		other.frequency = dict(self.frequency)
+		other.total = self.total
+		other.spelling = self.spelling.copy(other.frequency)
+		other.bigrams = dict(self.bigrams)
+		other.bigram_totals = dict(self.bigram_totals)
+		return other
+
+	def _apply(self, word: str, total: int) -> None:
+		self.total += max(total, 0) - self.frequency.get(word, 0)
+		if total > 0:
+			if word not in self.words:
+				self.words.add(word)
+				self.spelling.add(word)
+			self.frequency[word] = total
+		elif word in self.words:
+			self.words.discard(word)
+			self.frequency.pop(word, None)
+			self.spelling.remove(word)
+
+	def _apply_pair(self, pair: Tuple[str, str], count: int) -> None:
+		count = max(count, 0)
+		old = self.bigrams.get(pair, 0)
+		self.bigram_totals[pair[0]] = self.bigram_totals.get(pair[0], 0) + count - old
+		if count:
+			self.bigrams[pair] = count
+		else:
+			self.bigrams.pop(pair, None)
+
+	def synced(self, db: Session) -> "LexiconIndex":
+		"""
+		This index with the rows written since its version applied (all rows the
+		first time): a new index, or self when nothing changed.
+		"""
+		# Rows up to the committed counter are all visible; later ones wait for the next sync
+		current = _current_version(db)
+		if self.version is not None and current <= self.version:
+			return self
+		query = db.query(
+			models.LexiconWord.word,
+			models.LexiconWord.corpus_count,
+			models.LexiconWord.external_count,
+		).filter(models.LexiconWord.version <= current)
+		pair_query = db.query(
+			models.LexiconBigram.first,
+			models.LexiconBigram.second,
+			models.LexiconBigram.count,
+		).filter(models.LexiconBigram.version <= current)
+		if self.version is not None:
+			query = query.filter(models.LexiconWord.version > self.version)
+			pair_query = pair_query.filter(models.LexiconBigram.version > self.version)
+		index = self._copy()
+		for word, corpus_count, external_count in query.all():
+			index._apply(word, (corpus_count or 0) + (external_count or 0))
+		for first, second, count in pair_query.all():
+			index._apply_pair((first, second), count or 0)
+		index.version = current
+		return index
+
+
+_INDEX = LexiconIndex()
+_INDEX_LOCK = threading.Lock()
+_checked_at = 0.0
+
+
+def _needs_bootstrap(db: Session) -> bool:
+	has_corpus = db.query(models.LexiconWord.id).filter(models.LexiconWord.corpus_count > 0).first() is not None
+	has_pairs = db.query(models.LexiconBigram.id).filter(models.LexiconBigram.count > 0).first() is not None
+	if has_corpus and has_pairs:
+		return False
+	return db.query(models.Exercise.id).filter(models.Exercise.enabled == True).first() is not None
+
+
+def get_lexicon(db: Session) -> LexiconIndex:
+	"""
+	The worker's lexicon, loaded on first use and delta-synced at most every
+	LEXICON_SYNC_SECONDS. On a fresh database the corpus counts are built once.
+	"""
+	global _INDEX, _checked_at
+	index = _INDEX
+	if index.version is not None and (time.time() - _checked_at) < LEXICON_SYNC_SECONDS:
+		return index
+	with _INDEX_LOCK:
+		index = _INDEX
+		if index.version is not None and (time.time() - _checked_at) < LEXICON_SYNC_SECONDS:
+			return index
+		try:
+			if index.version is None and _needs_bootstrap(db):
+				count = rebuild_from_corpus(db)
+				print(f"[LEXICON] Built corpus lexicon: {count} words")
+			index = _INDEX = index.synced(db)
+		except Exception as e:
+			db.rollback()
+			print(f"[LEXICON] Sync failed: {e}")
+		_checked_at = time.time()  # after a failure too: don't retry on every request
+	return index
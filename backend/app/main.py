@@ -1,11 +1,35 @@
-from fastapi import FastAPI
+import secrets
+import time
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from .database import Base, engine
+from .database import engine, check_connection
+from . import lexicon, content_cache, corpus, metrics, migrate, ocr_jobs, providers, stats
 from .routers import exercises, progress, seed, auth, ai, audio, course_progression, database_viewer, leaderboard, admin, ocr, gamification, chatbot, chatbot_advanced
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+	"""
+	Startup work that needs the database runs here, not at import: importing
+	app.main (workers, scripts, tests) opens no connection.
+	"""
+	started = time.perf_counter()
+	check_connection()
+	# Apply pending schema migrations (app/migrations); off when a deploy step runs them
+	if migrate.MIGRATE_ON_STARTUP:
+		migrate.upgrade()
+	ocr.start_job_workers()
+	# Optional providers named in STARTUP_WARMUP load in a background thread
+	providers.warmup(providers.STARTUP_WARMUP)
+	print(f"[STARTUP] ready in {(time.perf_counter() - started) * 1000:.0f}ms")
+	yield
+	await ocr_jobs.stop()
+
+
 def create_app() -> FastAPI:
-	app = FastAPI(title="AlbLingo - Albanian Language Learning Platform", version="1.0.0")
+	app = FastAPI(title="AlbLingo - Albanian Language Learning Platform", version="1.0.0", lifespan=lifespan)
 
 	# CORS configuration
 	import os
@@ -27,10 +51,22 @@ def create_app() -> FastAPI:
 		allow_credentials=True,
 		allow_methods=["*"],
 		allow_headers=["*"],
+		# Browsers only let scripts read ETag (for If-None-Match) when exposed
+		expose_headers=["ETag"],
 	)
+	if metrics.METRICS_ENABLED:
+		# Added last, so outermost: the latency includes CORS and every other middleware
+		app.add_middleware(metrics.MetricsMiddleware)
+		metrics.install_hooks()
 
-	# Create tables if not exist
-	Base.metadata.create_all(bind=engine)
+	# Keep lexicon_words in sync with exercise writes
+	lexicon.install_hooks()
+	# Bump the content version (content cache, ETags) on course/level/exercise writes
+	content_cache.install_hooks()
+	# Keep the dashboard counters (stats_snapshot) current between recounts
+	stats.install_hooks()
+	# Clear exercises.content_hash when an admin edit changes a corpus exercise
+	corpus.install_hooks()
 
 	# Routers
 	app.include_router(exercises.router, prefix="/api", tags=["exercises"])
@@ -64,3 +100,39 @@ def health_check():
 	return {"status": "healthy", "timestamp": "2024-08-21T15:44:00Z"}
 
 
+
+# Database health: one round trip plus this worker's connection pool gauges
+@app.get("/health/db")
+def health_db():
+	from sqlalchemy import text
+	from .database import pool_stats
+	start = time.perf_counter()
+	try:
+		with engine.connect() as conn:
+			conn.execute(text("SELECT 1"))
+	except Exception as e:
+		return JSONResponse(
+			status_code=503,
+			content={"status": "unavailable", "error": type(e).__name__, "pool": pool_stats()},
+		)
+	return {
+		"status": "healthy",
+		"latency_ms": round((time.perf_counter() - start) * 1000, 2),
+		"pool": pool_stats(),
+	}
+
+
+# Optional providers (app/providers.py): which are configured, installed and already loaded in this worker
+@app.get("/health/providers")
+def health_providers():
+	return {"providers": providers.status()}
+
+
+# Prometheus scrape target: this worker's request, query, external call, pool and provider metrics
+@app.get("/metrics", include_in_schema=False)
+def metrics_endpoint(request: Request):
+	if not metrics.METRICS_ENABLED:
+		raise HTTPException(status_code=404, detail="Not Found")
+	if metrics.METRICS_TOKEN and not secrets.compare_digest(request.headers.get("authorization", ""), f"Bearer {metrics.METRICS_TOKEN}"):
+		raise HTTPException(status_code=401, detail="Invalid metrics token")
+	return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
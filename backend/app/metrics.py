@@ -0,0 +1,392 @@
+"""
+Request metrics (Prometheus text format at /metrics) and sampled request logs.
+
+MetricsMiddleware times every request and labels it with its route template
+(/api/levels/{level_id}/exercises, not the raw path), so the number of series
+stays bounded. While a request runs, a RequestStats in a contextvar collects:
+- database statements and their time: cursor hooks on the sync engine and on
+  the async engine (install_hooks)
+- external calls (LLM, TTS, speech recognition, OCR), timed by the call sites:
+
+	with metrics.external("openai"):
+		response = client.ChatCompletion.create(...)
+
+- notes: debug details of the request (answer check, course progress) that
+  used to be printed on every request. note() only keeps them in memory;
+  they are written with the request's log line, if it gets one
+
+A request slower than SLOW_REQUEST_MS gets a [SLOW] log line (a
+SLOW_REQUEST_LOG_SAMPLE fraction of them), and REQUEST_LOG_SAMPLE of all
+requests get a [SAMPLE] line, for debugging without logging everything.
+
+The counters are per worker process: behind one port with WEB_CONCURRENCY > 1,
+each scrape reads whichever worker answers it.
+
+Config (env):
+- METRICS_ENABLED: middleware, query hooks and /metrics (default true)
+- METRICS_TOKEN: if set, /metrics requires "Authorization: Bearer <token>"
+- SLOW_REQUEST_MS: requests slower than this are logged (default 1000)
+- SLOW_REQUEST_LOG_SAMPLE: fraction of slow requests logged (default 1.0)
+- REQUEST_LOG_SAMPLE: fraction of all requests logged with their notes (default 0)
+"""
+import contextvars
+import json
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", "1000"))
+SLOW_REQUEST_LOG_SAMPLE = float(os.getenv("SLOW_REQUEST_LOG_SAMPLE", "1.0"))
+REQUEST_LOG_SAMPLE = float(os.getenv("REQUEST_LOG_SAMPLE", "0"))
+
+_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+_QUERY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0, 5.0)
+_QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 250)
+_EXTERNAL_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 60.0)
+
+# Label of requests that matched no route (404s): raw paths would add a series per URL
+_UNMATCHED = "unmatched"
+
+
+# ============================================================================
+# REGISTRY
+# ============================================================================
+
+class _Metric:
+	def __init__(self, name: str, kind: str, help: str, labels: Sequence[str]):
+		self.name = name
+		self.kind = kind
+		self.help = help
+		self.labels = tuple(labels)
+		self.lock = threading.Lock()
+
+	def _label_str(self, values: Tuple[str, ...], extra: str = "") -> str:
+		pairs = [f'{k}="{_escape(v)}"' for k, v in zip(self.labels, values)]
+		if extra:
+			pairs.append(extra)
+		return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter(_Metric):
+	def __init__(self, name: str, help: str, labels: Sequence[str] = ()):
+		super().__init__(name, "counter", help, labels)
+		self.values: Dict[Tuple[str, ...], float] = {}
+
+	def inc(self, *labels: str, amount: float = 1.0) -> None:
+		with self.lock:
+			self.values[labels] = self.values.get(labels, 0.0) + amount
+
+	def samples(self) -> Iterator[str]:
+		with self.lock:
+			items = sorted(self.values.items())
+		for labels, value in items:
+			yield f"{self.name}{self._label_str(labels)} {_number(value)}"
+
+
+class Histogram(_Metric):
+	def __init__(self, name: str, help: str, labels: Sequence[str] = (), buckets: Sequence[float] = _LATENCY_BUCKETS):
+		super().__init__(name, "histogram", help, labels)
+		self.buckets = tuple(buckets)
+		# labels -> [count per bucket (not cumulative)..., +Inf count, sum]
+		self.values: Dict[Tuple[str, ...], List[float]] = {}
+
+	def observe(self, value: float, *labels: str) -> None:
+		i = 0
+		while i < len(self.buckets) and value > self.buckets[i]:
+			i += 1
+		with self.lock:
+			row = self.values.get(labels)
+			if row is None:
+				row = self.values[labels] = [0.0] * (len(self.buckets) + 2)
+			row[i] += 1
+			row[-1] += value
+
+	def samples(self) -> Iterator[str]:
+		with self.lock:
+			items = sorted((labels, list(row)) for labels, row in self.values.items())
+		for labels, row in items:
+			cumulative = 0.0
+			for bound, count in zip(self.buckets + (float("inf"),), row):
+				cumulative += count
+				le = "+Inf" if bound == float("inf") else _number(bound)
+				bucket = self._label_str(labels, f'le="{le}"')
+				yield f"{self.name}_bucket{bucket} {_number(cumulative)}"
+			yield f"{self.name}_sum{self._label_str(labels)} {_number(row[-1])}"
+			yield f"{self.name}_count{self._label_str(labels)} {_number(cumulative)}"
+
+
+def _escape(value: str) -> str:
+	return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+	return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+REQUESTS = Counter("http_requests_total", "HTTP requests by route template and status", ("method", "route", "status"))
+REQUEST_SECONDS = Histogram("http_request_duration_seconds", "HTTP request latency", ("method", "route"))
+REQUEST_QUERIES = Histogram(
+	"http_request_db_queries", "Database statements per request", ("method", "route"), buckets=_QUERY_COUNT_BUCKETS,
+)
+SLOW_REQUESTS = Counter("http_slow_requests_total", "Requests slower than SLOW_REQUEST_MS", ("method", "route"))
+DB_QUERIES = Counter("db_queries_total", "Database statements by route (\"\" outside requests)", ("route",))
+DB_QUERY_SECONDS = Counter("db_query_seconds_total", "Time spent in database statements by route", ("route",))
+DB_QUERY_LATENCY = Histogram("db_query_duration_seconds", "Database statement latency", buckets=_QUERY_BUCKETS)
+EXTERNAL_SECONDS = Histogram(
+	"external_call_duration_seconds", "LLM/TTS/speech/OCR call latency", ("service",), buckets=_EXTERNAL_BUCKETS,
+)
+EXTERNAL_ERRORS = Counter("external_call_errors_total", "LLM/TTS/speech/OCR calls that raised", ("service",))
+
+_METRICS: List[_Metric] = [
+	REQUESTS, REQUEST_SECONDS, REQUEST_QUERIES, SLOW_REQUESTS,
+	DB_QUERIES, DB_QUERY_SECONDS, DB_QUERY_LATENCY, EXTERNAL_SECONDS, EXTERNAL_ERRORS,
+]
+
+_in_progress = 0
+_in_progress_lock = threading.Lock()
+
+
+def _scraped() -> Iterator[Tuple[str, str, str, Dict[Tuple[Tuple[str, str], ...], float]]]:
+	"""(name, type, help, {labels: value}) read at scrape time: in-flight requests, connection pools, providers."""
+	from .database import pool_stats
+	from . import providers
+
+	yield "http_requests_in_progress", "gauge", "Requests being served by this worker", {(): _in_progress}
+
+	pools = pool_stats()
+	by_engine = {"sync": pools, "async": pools.get("async", {})}
+	for key, name, kind, help in (
+		("checked_out", "db_pool_checked_out", "gauge", "Connections in use"),
+		("checked_in", "db_pool_checked_in", "gauge", "Idle connections in the pool"),
+		("overflow", "db_pool_overflow", "gauge", "Connections open beyond pool_size"),
+		("checkouts", "db_pool_checkouts_total", "counter", "Pool checkouts"),
+		("checkout_timeouts", "db_pool_checkout_timeouts_total", "counter", "Pool checkouts that timed out"),
+	):
+		values = {(("engine", engine),): stats[key] for engine, stats in by_engine.items() if key in stats}
+		if values:
+			yield name, kind, help, values
+
+	status = providers.status()
+	yield "provider_loaded", "gauge", "Optional provider imported/built in this worker", {
+		(("provider", p["name"]),): 1 if p["loaded"] else 0 for p in status
+	}
+	yield "provider_load_seconds", "gauge", "Time the provider took to load", {
+		(("provider", p["name"]),): p["load_ms"] / 1000 for p in status if p["load_ms"] is not None
+	}
+
+
+def render() -> str:
+	"""Every metric of this worker in the Prometheus text exposition format (version 0.0.4)."""
+	lines: List[str] = []
+	for metric in _METRICS:
+		lines.append(f"# HELP {metric.name} {metric.help}")
+		lines.append(f"# TYPE {metric.name} {metric.kind}")
+		lines.extend(metric.samples())
+	for name, kind, help, values in _scraped():
+		lines.append(f"# HELP {name} {help}")
+		lines.append(f"# TYPE {name} {kind}")
+		for labels, value in sorted(values.items()):
+			label_str = "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels) + "}" if labels else ""
+			lines.append(f"{name}{label_str} {_number(value)}")
+	return "\n".join(lines) + "\n"
+
+
+# ============================================================================
+# PER-REQUEST STATS
+# ============================================================================
+
+class RequestStats:
+	"""What one request spent; shared by the threads (threadpool endpoints, OCR passes) working for it."""
+
+	def __init__(self, method: str, path: str):
+		self.method = method
+		self.path = path
+		self.route = _UNMATCHED
+		self.queries = 0
+		self.query_seconds = 0.0
+		self.external: Dict[str, float] = {}
+		self.notes: List[Tuple[str, Any]] = []
+		self.lock = threading.Lock()
+
+	def add_query(self, seconds: float) -> None:
+		with self.lock:
+			self.queries += 1
+			self.query_seconds += seconds
+
+	def add_external(self, service: str, seconds: float) -> None:
+		with self.lock:
+			self.external[service] = self.external.get(service, 0.0) + seconds
+
+
+_current: contextvars.ContextVar[Optional[RequestStats]] = contextvars.ContextVar("request_stats", default=None)
+
+
+def current() -> Optional[RequestStats]:
+	return _current.get()
+
+
+def note(key: str, details: Any) -> None:
+	"""
+	Attach debug details to the current request's log line (if it gets one).
+	details is a dict, or a callable returning one: only called when the line is written.
+	"""
+	stats = _current.get()
+	if stats is not None:
+		with stats.lock:
+			stats.notes.append((key, details))
+
+
+@contextmanager
+def external(service: str) -> Iterator[None]:
+	"""Time a call to an external service or engine (openai, azure_tts, tesseract, ...)."""
+	start = time.perf_counter()
+	try:
+		yield
+	except Exception:
+		EXTERNAL_ERRORS.inc(service)
+		raise
+	finally:
+		seconds = time.perf_counter() - start
+		EXTERNAL_SECONDS.observe(seconds, service)
+		stats = _current.get()
+		if stats is not None:
+			stats.add_external(service, seconds)
+
+
+def _log_line(tag: str, stats: RequestStats, status: int, seconds: float) -> str:
+	parts = [
+		f"[{tag}] {stats.method} {stats.path} ({stats.route}) {status} {seconds * 1000:.0f}ms",
+		f"db={stats.queries}q/{stats.query_seconds * 1000:.0f}ms",
+	]
+	if stats.external:
+		parts.append("ext=" + ",".join(f"{k}:{v * 1000:.0f}ms" for k, v in sorted(stats.external.items())))
+	for key, details in stats.notes:
+		try:
+			value = details() if callable(details) else details
+		except Exception as e:
+			value = f"<{type(e).__name__}>"
+		parts.append(f"{key}={json.dumps(value, ensure_ascii=False, default=str)}")
+	return " ".join(parts)
+
+
+# ============================================================================
+# MIDDLEWARE
+# ============================================================================
+
+class MetricsMiddleware:
+	"""Pure ASGI middleware (no BaseHTTPMiddleware task/stream overhead)."""
+
+	def __init__(self, app):
+		self.app = app
+		self._routes: Dict[Callable, str] = {}
+
+	def _route(self, scope) -> str:
+		endpoint = scope.get("endpoint")
+		if endpoint is None:
+			return _UNMATCHED
+		route = self._routes.get(endpoint)
+		if route is None:
+			# Built on first use: routes are all registered by then
+			self._routes = {r.endpoint: r.path for r in scope["app"].routes if hasattr(r, "endpoint")}
+			route = self._routes.get(endpoint, _UNMATCHED)
+		return route
+
+	async def __call__(self, scope, receive, send):
+		global _in_progress
+		if scope["type"] != "http":
+			await self.app(scope, receive, send)
+			return
+
+		stats = RequestStats(scope["method"], scope["path"])
+		token = _current.set(stats)
+		status = 500
+
+		async def send_with_status(message):
+			nonlocal status
+			if message["type"] == "http.response.start":
+				status = message["status"]
+			await send(message)
+
+		with _in_progress_lock:
+			_in_progress += 1
+		start = time.perf_counter()
+		try:
+			await self.app(scope, receive, send_with_status)
+		finally:
+			seconds = time.perf_counter() - start
+			with _in_progress_lock:
+				_in_progress -= 1
+			_current.reset(token)
+			self._record(scope, stats, status, seconds)
+
+	def _record(self, scope, stats: RequestStats, status: int, seconds: float) -> None:
+		stats.route = self._route(scope)
+		REQUESTS.inc(stats.method, stats.route, str(status))
+		REQUEST_SECONDS.observe(seconds, stats.method, stats.route)
+		REQUEST_QUERIES.observe(stats.queries, stats.method, stats.route)
+		if stats.queries:
+			DB_QUERIES.inc(stats.route, amount=stats.queries)
+			DB_QUERY_SECONDS.inc(stats.route, amount=stats.query_seconds)
+		if seconds * 1000 >= SLOW_REQUEST_MS:
+			SLOW_REQUESTS.inc(stats.method, stats.route)
+			if random.random() < SLOW_REQUEST_LOG_SAMPLE:
+				print(_log_line("SLOW", stats, status, seconds))
+		elif REQUEST_LOG_SAMPLE > 0 and random.random() < REQUEST_LOG_SAMPLE:
+			print(_log_line("SAMPLE", stats, status, seconds))
+
+
+# ============================================================================
+# QUERY HOOKS
+# ============================================================================
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+	conn.info.setdefault("metrics_query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+	starts = conn.info.get("metrics_query_start")
+	if not starts:
+		return
+	_record_query(time.perf_counter() - starts.pop())
+
+
+def _handle_error(exception_context) -> None:
+	# after_cursor_execute doesn't run for a failed statement
+	conn = exception_context.connection
+	starts = conn.info.get("metrics_query_start") if conn is not None else None
+	if starts:
+		_record_query(time.perf_counter() - starts.pop())
+
+
+def _record_query(seconds: float) -> None:
+	DB_QUERY_LATENCY.observe(seconds)
+	stats = _current.get()
+	if stats is not None:
+		# Counted by route when the request finishes: its route template isn't known before
+		stats.add_query(seconds)
+	else:
+		DB_QUERIES.inc("")
+		DB_QUERY_SECONDS.inc("", amount=seconds)
+
+
+_HOOKS_INSTALLED = False
+
+
+def install_hooks() -> None:
+	"""Time every statement on the app's engines (idempotent)."""
+	global _HOOKS_INSTALLED
+	if _HOOKS_INSTALLED:
+		return
+	from .database import async_engine, engine
+	for target in (engine, async_engine.sync_engine):
+		event.listen(target, "before_cursor_execute", _before_cursor_execute)
+		event.listen(target, "after_cursor_execute", _after_cursor_execute)
+		event.listen(target, "handle_error", _handle_error)
+	_HOOKS_INSTALLED = True
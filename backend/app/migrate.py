@@ -0,0 +1,354 @@
+"""
+Versioned schema migrations (app/migrations/mNNNN_<name>.py), replacing
+create_all on startup and the one-off migrate_*.py scripts.
+
+Each migration module has a docstring (first line = description) and an
+upgrade(op) function. Applied versions are recorded in schema_migrations.
+upgrade() runs the pending ones in order; on PostgreSQL under an advisory
+lock, so several workers starting at once apply each migration exactly once.
+
+Migrations are not wrapped in one transaction. Each operation commits on its
+own, so a long backfill or index build never holds locks for the whole
+migration, and every operation is idempotent (skips what already exists), so
+a migration that failed halfway is simply run again. Because m0001 creates
+missing tables from the current models, later migrations must also cope with
+a schema that is already up to date.
+
+Online-safe operations on PostgreSQL:
+- create_index/drop_index use CONCURRENTLY (no write lock; a failed build's
+  invalid index is dropped and rebuilt)
+- backfill/delete_rows work in primary-key batches, committing each batch
+  and sleeping MIGRATION_THROTTLE_SECONDS in between
+- DDL runs with lock_timeout, retried with backoff instead of queueing
+  behind long transactions and blocking every other query on the table
+
+After the migrations, every upgrade() reconciles the id sequences with
+MAX(id), so the insert paths never need to detect and repair a sequence
+that fell behind (duplicate primary key errors).
+
+Config (env):
+- MIGRATE_ON_STARTUP: apply pending migrations in the app lifespan (default true);
+  set false to run `python scripts/migrate.py upgrade` as a deploy step instead
+- MIGRATION_BATCH_SIZE: rows per backfill/delete batch (default 5000)
+- MIGRATION_THROTTLE_SECONDS: pause between batches (default 0.05)
+- MIGRATION_LOCK_TIMEOUT_SECONDS: lock wait per DDL attempt on PostgreSQL (default 5)
+- MIGRATION_LOCK_RETRIES: DDL attempts before giving up (default 5)
+"""
+import importlib
+import os
+import pkgutil
+import re
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from sqlalchemy import Index, inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.schema import CreateIndex, Table
+
+from .database import engine as default_engine
+from . import migrations, models
+
+MIGRATE_ON_STARTUP = os.getenv("MIGRATE_ON_STARTUP", "true").lower() in ("1", "true", "yes")
+MIGRATION_BATCH_SIZE = int(os.getenv("MIGRATION_BATCH_SIZE", "5000"))
+MIGRATION_THROTTLE_SECONDS = float(os.getenv("MIGRATION_THROTTLE_SECONDS", "0.05"))
+MIGRATION_LOCK_TIMEOUT_SECONDS = float(os.getenv("MIGRATION_LOCK_TIMEOUT_SECONDS", "5"))
+MIGRATION_LOCK_RETRIES = int(os.getenv("MIGRATION_LOCK_RETRIES", "5"))
+
+# pg_advisory_lock key shared by every process running migrations
+_ADVISORY_LOCK_KEY = 7342001
+
+_MODULE_RE = re.compile(r"^m(\d{4})_(\w+)$")
+
+
+class Migration(NamedTuple):
+	version: int
+	name: str
+	description: str
+	upgrade: Callable[["Operations"], None]
+
+
+def discover() -> List[Migration]:
+	"""All migrations in app/migrations, ordered by version."""
+	found = []
+	for info in pkgutil.iter_modules(migrations.__path__):
+		m = _MODULE_RE.match(info.name)
+		if not m:
+			continue
+		module = importlib.import_module(f"{migrations.__name__}.{info.name}")
+		doc = (module.__doc__ or "").strip()
+		description = doc.splitlines()[0] if doc else info.name
+		found.append(Migration(int(m.group(1)), m.group(2), description, module.upgrade))
+	found.sort(key=lambda mig: mig.version)
+	versions = [mig.version for mig in found]
+	if len(versions) != len(set(versions)):
+		raise RuntimeError(f"Duplicate migration versions in app/migrations: {versions}")
+	return found
+
+
+# ============================================================================
+# OPERATIONS
+# ============================================================================
+
+def _is_lock_timeout(exc: OperationalError) -> bool:
+	orig = getattr(exc, "orig", None)
+	return getattr(orig, "pgcode", None) == "55P03" or "lock timeout" in str(exc).lower()
+
+
+class Operations:
+	"""Idempotent schema and data operations handed to each migration's upgrade(op)."""
+
+	def __init__(self, engine: Engine):
+		self.engine = engine
+		self.dialect = engine.dialect.name
+		self.is_postgres = self.dialect == "postgresql"
+
+	def log(self, message: str) -> None:
+		print(f"[MIGRATE]   {message}")
+
+	# ---- introspection (fresh each call: earlier operations change the schema) ----
+
+	def has_table(self, table: str) -> bool:
+		return inspect(self.engine).has_table(table)
+
+	def columns(self, table: str) -> Dict[str, Any]:
+		"""Column name -> reflected type ({} when the table doesn't exist)."""
+		if not self.has_table(table):
+			return {}
+		return {c["name"]: c["type"] for c in inspect(self.engine).get_columns(table)}
+
+	def has_column(self, table: str, column: str) -> bool:
+		return column in self.columns(table)
+
+	def has_index(self, table: str, name: str) -> bool:
+		if not self.has_table(table):
+			return False
+		return name in {i["name"] for i in inspect(self.engine).get_indexes(table)}
+
+	# ---- statements ----
+
+	def execute(self, sql: str, **params) -> int:
+		"""Run one statement in its own transaction (DDL with lock_timeout and retries); returns rowcount."""
+		return self.transaction(lambda conn: conn.execute(text(sql), params).rowcount)
+
+	def transaction(self, fn: Callable[[Connection], Any]) -> Any:
+		"""fn(conn) in one transaction; on PostgreSQL with lock_timeout, retried with backoff on lock timeouts."""
+		for attempt in range(1, MIGRATION_LOCK_RETRIES + 1):
+			try:
+				with self.engine.begin() as conn:
+					if self.is_postgres:
+						conn.execute(text(f"SET LOCAL lock_timeout = '{int(MIGRATION_LOCK_TIMEOUT_SECONDS * 1000)}ms'"))
+					return fn(conn)
+			except OperationalError as exc:
+				if not (self.is_postgres and _is_lock_timeout(exc)) or attempt == MIGRATION_LOCK_RETRIES:
+					raise
+				wait = min(30.0, 2.0 ** attempt)
+				self.log(f"lock timeout (attempt {attempt}/{MIGRATION_LOCK_RETRIES}), retrying in {wait:.0f}s")
+				time.sleep(wait)
+
+	def _autocommit(self, sql: str) -> None:
+		# CREATE/DROP INDEX CONCURRENTLY can't run inside a transaction
+		with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+			conn.execute(text(sql))
+
+	# ---- schema ----
+
+	def create_tables(self, *tables: Table) -> None:
+		"""Create the tables that don't exist yet (with their indexes and constraints)."""
+		for table in tables:
+			if not self.has_table(table.name):
+				self.log(f"create table {table.name}")
+				self.transaction(lambda conn, t=table: t.create(conn, checkfirst=True))
+
+	def add_column(self, table: str, column: str, ddl: str) -> None:
+		"""ALTER TABLE ADD COLUMN unless present; ddl is the column type and constraints."""
+		if self.has_table(table) and not self.has_column(table, column):
+			self.log(f"add column {table}.{column}")
+			self.execute(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}")
+
+	def create_index(self, index: Index) -> None:
+		"""Build an index unless present; CONCURRENTLY on PostgreSQL."""
+		table = index.table.name
+		if not self.has_table(table):
+			return
+		if self.is_postgres:
+			valid = self.transaction(lambda conn: conn.execute(text(
+				"SELECT i.indisvalid FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :name"
+			), {"name": index.name}).scalar())
+			if valid:
+				return
+			if valid is False:
+				# Left behind by an interrupted concurrent build
+				self.log(f"drop invalid index {index.name}")
+				self._autocommit(f"DROP INDEX CONCURRENTLY IF EXISTS {index.name}")
+			ddl = str(CreateIndex(index).compile(dialect=self.engine.dialect))
+			ddl = re.sub(r"^CREATE (UNIQUE )?INDEX", r"CREATE \1INDEX CONCURRENTLY", ddl)
+			self.log(f"create index {index.name} (concurrently)")
+			self._autocommit(ddl)
+		elif not self.has_index(table, index.name):
+			self.log(f"create index {index.name}")
+			self.transaction(lambda conn: index.create(conn, checkfirst=True))
+
+	def identity_column(self, table: str, column: str = "id") -> None:
+		"""Turn a SERIAL column into GENERATED ALWAYS AS IDENTITY on PostgreSQL, starting after MAX(column).
+
+		Catalog-only (no rewrite); the table is locked for the few statements of one transaction.
+		"""
+		if not self.is_postgres or not self.has_column(table, column):
+			return
+
+		def convert(conn):
+			kind = conn.execute(text(
+				"SELECT attidentity FROM pg_attribute WHERE attrelid = CAST(:t AS regclass) AND attname = :c"
+			), {"t": table, "c": column}).scalar()
+			if kind == "a":
+				return False
+			if kind == "d":
+				conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} SET GENERATED ALWAYS"))
+				return True
+			conn.execute(text(f"LOCK TABLE {table} IN ACCESS EXCLUSIVE MODE"))
+			seq = conn.execute(text("SELECT pg_get_serial_sequence(:t, :c)"), {"t": table, "c": column}).scalar()
+			start = conn.execute(text(f"SELECT COALESCE(MAX({column}), 0) + 1 FROM {table}")).scalar()
+			conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT"))
+			if seq:
+				conn.execute(text(f"DROP SEQUENCE IF EXISTS {seq}"))
+			conn.execute(text(f"ALTER TABLE {table} ALTER COLUMN {column} ADD GENERATED ALWAYS AS IDENTITY (START WITH {start})"))
+			return True
+
+		if self.transaction(convert):
+			self.log(f"{table}.{column}: identity")
+
+	def reconcile_sequences(self, tables: List[Table]) -> None:
+		"""Move id sequences that are behind MAX(id) (rows inserted with explicit ids, restores) past it."""
+		if not self.is_postgres:
+			return  # SQLite's INTEGER PRIMARY KEY allocates from MAX(rowid), nothing to drift
+
+		def reconcile(conn):
+			moved = []
+			for table in tables:
+				column = table.autoincrement_column
+				if column is None or not inspect(conn).has_table(table.name):
+					continue
+				seq = conn.execute(text("SELECT pg_get_serial_sequence(:t, :c)"), {"t": table.name, "c": column.name}).scalar()
+				if not seq:
+					continue
+				# MAX over the primary key is an index lookup, not a scan
+				max_id = conn.execute(text(f"SELECT MAX({column.name}) FROM {table.name}")).scalar()
+				last_value, is_called = conn.execute(text(f"SELECT last_value, is_called FROM {seq}")).one()
+				next_id = last_value + 1 if is_called else last_value
+				if max_id is not None and max_id >= next_id:
+					conn.execute(text("SELECT setval(:seq, :v, true)"), {"seq": seq, "v": max_id})
+					moved.append(f"{table.name} {next_id} -> {max_id + 1}")
+			return moved
+
+		for entry in self.transaction(reconcile):
+			self.log(f"id sequence behind MAX(id), moved: {entry}")
+
+	def create_model_indexes(self, table: Table) -> None:
+		for index in sorted(table.indexes, key=lambda i: i.name):
+			self.create_index(index)
+
+	def drop_index(self, table: str, name: str) -> None:
+		if not self.has_index(table, name):
+			return
+		self.log(f"drop index {name}")
+		if self.is_postgres:
+			self._autocommit(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+		else:
+			self.execute(f"DROP INDEX IF EXISTS {name}")
+
+	# ---- data ----
+
+	def _batches(self, table: str, sql: str, label: str, **params) -> int:
+		"""Run sql (with :lo/:hi id bounds) over the table in primary-key ranges, one commit each."""
+		bounds = self.transaction(lambda conn: conn.execute(text(f"SELECT MIN(id), MAX(id) FROM {table}")).one())
+		lo, hi = bounds
+		if lo is None:
+			return 0
+		total = 0
+		started = time.time()
+		last_log = started
+		start = lo
+		while start <= hi:
+			end = start + MIGRATION_BATCH_SIZE
+			total += self.execute(sql, lo=start, hi=end, **params)
+			start = end
+			if time.time() - last_log > 10:
+				last_log = time.time()
+				self.log(f"{label} {table}: {total} rows, id {start}/{hi}")
+			if MIGRATION_THROTTLE_SECONDS > 0 and start <= hi:
+				time.sleep(MIGRATION_THROTTLE_SECONDS)
+		if total:
+			self.log(f"{label} {table}: {total} rows in {time.time() - started:.1f}s")
+		return total
+
+	def backfill(self, table: str, assignments: str, where: Optional[str] = None, **params) -> int:
+		"""UPDATE table SET assignments [WHERE where] in id batches; returns rows updated."""
+		cond = f" AND ({where})" if where else ""
+		return self._batches(table, f"UPDATE {table} SET {assignments} WHERE id >= :lo AND id < :hi{cond}", "backfill", **params)
+
+	def delete_rows(self, table: str, where: str, **params) -> int:
+		"""DELETE FROM table WHERE where, in id batches; returns rows deleted."""
+		return self._batches(table, f"DELETE FROM {table} WHERE id >= :lo AND id < :hi AND ({where})", "delete", **params)
+
+
+# ============================================================================
+# RUNNER
+# ============================================================================
+
+def _applied(engine: Engine) -> Dict[int, models.SchemaMigration]:
+	from sqlalchemy.orm import Session
+	with Session(engine) as db:
+		return {row.version: row for row in db.query(models.SchemaMigration).all()}
+
+
+def status(engine: Optional[Engine] = None) -> List[Dict[str, Any]]:
+	"""Every known migration with applied_at (None when pending)."""
+	engine = engine or default_engine
+	models.SchemaMigration.__table__.create(engine, checkfirst=True)
+	applied = _applied(engine)
+	return [
+		{
+			"version": mig.version,
+			"name": mig.name,
+			"description": mig.description,
+			"applied_at": applied[mig.version].applied_at if mig.version in applied else None,
+		}
+		for mig in discover()
+	]
+
+
+def upgrade(engine: Optional[Engine] = None, target: Optional[int] = None) -> List[int]:
+	"""Apply pending migrations up to target (default: all); returns the versions applied."""
+	engine = engine or default_engine
+	models.SchemaMigration.__table__.create(engine, checkfirst=True)
+	lock_conn = None
+	if engine.dialect.name == "postgresql":
+		# Session-level lock on a connection of its own, held until every migration is done
+		lock_conn = engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+		lock_conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": _ADVISORY_LOCK_KEY})
+	try:
+		# Read after taking the lock: another worker may just have applied them
+		applied = _applied(engine)
+		pending = [m for m in discover() if m.version not in applied and (target is None or m.version <= target)]
+		op = Operations(engine)
+		done = []
+		for mig in pending:
+			print(f"[MIGRATE] {mig.version:04d} {mig.name}: {mig.description}")
+			started = time.time()
+			mig.upgrade(op)
+			duration_ms = int((time.time() - started) * 1000)
+			with engine.begin() as conn:
+				conn.execute(models.SchemaMigration.__table__.insert().values(
+					version=mig.version, name=mig.name, applied_at=datetime.utcnow(), duration_ms=duration_ms,
+				))
+			print(f"[MIGRATE] {mig.version:04d} done in {duration_ms}ms")
+			done.append(mig.version)
+		# Every run, not just with pending migrations: cheap, and catches drift from restores/manual inserts
+		op.reconcile_sequences(models.Base.metadata.sorted_tables)
+		return done
+	finally:
+		if lock_conn is not None:
+			lock_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _ADVISORY_LOCK_KEY})
+			lock_conn.close()
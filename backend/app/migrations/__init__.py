@@ -0,0 +1 @@
+"""Schema migrations, applied in order by app/migrate.py (mNNNN_<name>.py, each with upgrade(op))."""
@@ -0,0 +1,22 @@
+"""Create missing tables, add the columns of the old migrate_*.py scripts
+
+Replaces create_all on startup, migrate_user_profile.py,
+migrate_gamification.py, migrate_chatbot_tables.py and the column half of
+add_admin_column_and_list_users.py. Existing databases only get what they
+are missing.
+"""
+from .. import models
+
+
+def upgrade(op) -> None:
+	op.create_tables(*models.Base.metadata.sorted_tables)
+
+	# users columns added after the first deployments
+	op.add_column("users", "date_of_birth", "TIMESTAMP")
+	op.add_column("users", "address", "VARCHAR(255)")
+	op.add_column("users", "phone_number", "VARCHAR(20)")
+	op.add_column("users", "is_admin", "BOOLEAN DEFAULT FALSE NOT NULL")
+	op.add_column("users", "current_streak", "INTEGER DEFAULT 0 NOT NULL")
+	op.add_column("users", "longest_streak", "INTEGER DEFAULT 0 NOT NULL")
+	op.add_column("users", "last_activity_date", "TIMESTAMP")
+	op.add_column("users", "total_achievements", "INTEGER DEFAULT 0 NOT NULL")
@@ -0,0 +1,181 @@
+"""Integer user_id columns, composite indexes on attempts/progress
+
+Converts the string user_id columns (formerly migrate_user_id_types.py) and
+builds the (user_id, exercise_id), (exercise_id), (user_id, level_id) and
+(user_id, course_id) indexes, dropping the single-column user_id indexes
+they cover.
+
+Rows whose user_id isn't a number can't be converted: they are deleted
+(chat sessions become anonymous instead) and counted in the log. The tables
+that get a users foreign key (WITH_FK) also lose the rows of users that no
+longer exist; attempts and progress have no foreign key and keep numeric
+ids of deleted users as they are.
+
+PostgreSQL, attempts and progress (large, written on every answer): online.
+A shadow column user_id_new is kept in sync by a trigger, backfilled in
+batches and indexed concurrently; NOT NULL is proven by a validated CHECK;
+the final swap (drop old column, rename, SET NOT NULL) only touches the
+catalog, so its exclusive lock is held for milliseconds.
+The small gamification/chat tables are converted in place. SQLite (dev)
+rebuilds each table.
+"""
+from sqlalchemy import Column, Index, Integer, MetaData, Table, inspect, text
+
+from .. import models
+
+ONLINE = ("attempts", "progress")
+IN_PLACE = ("user_achievements", "user_daily_progress", "srs_cards", "chat_sessions")
+# Tables whose user_id references users.id
+WITH_FK = ("user_achievements", "user_daily_progress", "srs_cards", "chat_sessions")
+OBSOLETE_INDEXES = {"attempts": "ix_attempts_user_id", "progress": "ix_progress_user_id"}
+
+
+def _as_int(op, col: str) -> str:
+	"""SQL expression: col as an integer, NULL when it isn't a plain number."""
+	if op.is_postgres:
+		return f"(CASE WHEN {col} ~ '^[0-9]{{1,9}}$' THEN {col}::integer END)"
+	return f"(CASE WHEN {col} <> '' AND {col} NOT GLOB '*[^0-9]*' THEN CAST({col} AS INTEGER) END)"
+
+
+def _unmapped(op, table: str) -> str:
+	expr = _as_int(op, "user_id")
+	cond = f"{expr} IS NULL"
+	if table in WITH_FK:
+		cond += f" OR NOT EXISTS (SELECT 1 FROM users WHERE users.id = {expr})"
+	return f"user_id IS NOT NULL AND ({cond})"
+
+
+def _drop_unmapped(op, table: str) -> None:
+	if table == "chat_sessions":
+		count = op.backfill(table, "user_id = NULL", where=_unmapped(op, table))
+		if count:
+			op.log(f"{table}: {count} sessions of unknown users made anonymous")
+	else:
+		count = op.delete_rows(table, _unmapped(op, table))
+		if count:
+			reason = "matches no user" if table in WITH_FK else "isn't a number"
+			op.log(f"{table}: deleted {count} rows whose user_id {reason}")
+
+
+def _needs_conversion(op, table: str) -> bool:
+	col_type = op.columns(table).get("user_id")
+	return col_type is not None and not isinstance(col_type, Integer)
+
+
+# ---- PostgreSQL ----
+
+def _shadow_indexes(table: str):
+	"""The model's user_id indexes, on user_id_new (same names, so they carry over the rename)."""
+	model = models.Base.metadata.tables[table]
+	shadow = Table(table, MetaData(), *[Column(c.name, Integer) for c in model.columns if c.name != "user_id"], Column("user_id_new", Integer))
+	for idx in model.indexes:
+		names = [c.name for c in idx.columns]
+		if "user_id" in names:
+			yield Index(idx.name, *[shadow.c["user_id_new" if n == "user_id" else n] for n in names], unique=idx.unique)
+
+
+def _in_one_transaction(op, *statements: str) -> None:
+	def run(conn):
+		for sql in statements:
+			conn.execute(text(sql))
+	op.transaction(run)
+
+
+def _has_constraint(op, name: str) -> bool:
+	return bool(op.transaction(lambda conn: conn.execute(
+		text("SELECT 1 FROM pg_constraint WHERE conname = :name"), {"name": name}
+	).scalar()))
+
+
+def _convert_online(op, table: str) -> None:
+	sync = f"{table}_user_id_new_sync"
+	check = f"{table}_user_id_new_not_null"
+
+	op.add_column(table, "user_id_new", "INTEGER")
+	# New and updated rows fill user_id_new themselves while the backfill runs
+	_in_one_transaction(
+		op,
+		f"CREATE OR REPLACE FUNCTION {sync}() RETURNS trigger AS $$ "
+		f"BEGIN NEW.user_id_new := {_as_int(op, 'NEW.user_id')}; RETURN NEW; END $$ LANGUAGE plpgsql",
+		f"DROP TRIGGER IF EXISTS {sync} ON {table}",
+		f"CREATE TRIGGER {sync} BEFORE INSERT OR UPDATE OF user_id ON {table} "
+		f"FOR EACH ROW EXECUTE PROCEDURE {sync}()",
+	)
+	op.backfill(table, f"user_id_new = {_as_int(op, 'user_id')}", where="user_id_new IS NULL")
+	count = op.delete_rows(table, "user_id_new IS NULL")
+	if count:
+		op.log(f"{table}: deleted {count} rows whose user_id isn't a number")
+	for index in _shadow_indexes(table):
+		op.create_index(index)
+
+	# NOT NULL without a table scan under the exclusive lock: a validated CHECK proves it
+	if not _has_constraint(op, check):
+		op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {check} CHECK (user_id_new IS NOT NULL) NOT VALID")
+	op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {check}")
+
+	op.log(f"swap {table}.user_id")
+	_in_one_transaction(
+		op,
+		f"DROP TRIGGER IF EXISTS {sync} ON {table}",
+		f"ALTER TABLE {table} DROP COLUMN user_id",
+		f"ALTER TABLE {table} RENAME COLUMN user_id_new TO user_id",
+		f"ALTER TABLE {table} ALTER COLUMN user_id SET NOT NULL",
+		f"ALTER TABLE {table} DROP CONSTRAINT {check}",
+		f"DROP FUNCTION IF EXISTS {sync}()",
+	)
+
+
+def _convert_in_place(op, table: str) -> None:
+	_drop_unmapped(op, table)
+	op.log(f"convert {table}.user_id")
+	op.execute(f"ALTER TABLE {table} ALTER COLUMN user_id TYPE INTEGER USING user_id::integer")
+	fk = f"{table}_user_id_fkey"
+	if not _has_constraint(op, fk):
+		# NOT VALID + VALIDATE: the check of existing rows doesn't block writes
+		op.execute(f"ALTER TABLE {table} ADD CONSTRAINT {fk} FOREIGN KEY (user_id) REFERENCES users(id) NOT VALID")
+		op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {fk}")
+
+
+# ---- SQLite ----
+
+def _rebuild_sqlite(conn, table: str) -> None:
+	"""SQLite can't change a column type: recreate the table from the model and copy the rows."""
+	model_table = models.Base.metadata.tables[table]
+	old_columns = {c["name"] for c in inspect(conn).get_columns(table)}
+	columns = [c.name for c in model_table.columns if c.name in old_columns]
+
+	# New table under a temporary name, without indexes (their names are taken until the old table is dropped)
+	md = MetaData()
+	for fk in model_table.foreign_keys:
+		if fk.column.table.name not in md.tables:
+			fk.column.table.to_metadata(md)
+	tmp = model_table.to_metadata(md, name=f"{table}__new")
+	for idx in list(tmp.indexes):
+		tmp.indexes.discard(idx)
+	tmp.create(conn)
+
+	select_cols = ", ".join("CAST(user_id AS INTEGER)" if c == "user_id" else c for c in columns)
+	conn.execute(text(f"INSERT INTO {table}__new ({', '.join(columns)}) SELECT {select_cols} FROM {table}"))
+	conn.execute(text(f"DROP TABLE {table}"))
+	conn.execute(text(f"ALTER TABLE {table}__new RENAME TO {table}"))
+	for idx in model_table.indexes:
+		idx.create(conn, checkfirst=True)
+
+
+def upgrade(op) -> None:
+	for table in ONLINE + IN_PLACE:
+		if not _needs_conversion(op, table):
+			continue
+		if not op.is_postgres:
+			_drop_unmapped(op, table)
+			op.log(f"rebuild {table}")
+			op.transaction(lambda conn, t=table: _rebuild_sqlite(conn, t))
+		elif table in ONLINE:
+			_convert_online(op, table)
+		else:
+			_convert_in_place(op, table)
+
+	for table, name in OBSOLETE_INDEXES.items():
+		op.drop_index(table, name)
+	for table in ONLINE + IN_PLACE:
+		op.create_model_indexes(models.Base.metadata.tables[table])
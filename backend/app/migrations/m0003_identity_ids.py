@@ -0,0 +1,19 @@
+"""Identity primary keys (GENERATED ALWAYS) instead of SERIAL
+
+SERIAL ids accept explicit values, which is how the sequences fell behind
+MAX(id) (copied/restored rows) and inserts failed with duplicate primary
+keys until a sequence was reset. GENERATED ALWAYS rejects explicit ids
+(pg_dump output uses OVERRIDING SYSTEM VALUE), and each identity starts
+after the table's current MAX(id).
+
+PostgreSQL only: one short catalog-only transaction per table. SQLite's
+INTEGER PRIMARY KEY already allocates from MAX(rowid).
+"""
+from .. import models
+
+
+def upgrade(op) -> None:
+	for table in models.Base.metadata.sorted_tables:
+		column = table.autoincrement_column
+		if column is not None and column.identity is not None and column.identity.always:
+			op.identity_column(table.name, column.name)
@@ -0,0 +1,12 @@
+"""progress.updated_at for incremental dataset exports
+
+scripts/export_dataset.py --incremental exports the progress rows changed
+since its previous run, like course_progress, by updated_at. Existing rows
+keep NULL: the first incremental export includes every row anyway.
+
+No index: exports are rare, and progress is written on every answer.
+"""
+
+
+def upgrade(op) -> None:
+	op.add_column("progress", "updated_at", "TIMESTAMP")
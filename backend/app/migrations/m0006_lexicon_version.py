@@ -0,0 +1,19 @@
+"""lexicon_version change counter and lexicon_words/lexicon_bigrams.version
+
+Workers pulled lexicon changes by updated_at, a Python clock set at flush:
+a transaction that committed later than a newer one's timestamp was missed
+for good. Writers now take the next number from the single lexicon_version
+row (the UPDATE holds its lock until commit, so numbers become visible in
+order) and stamp it on the rows they write. Existing rows keep version 0;
+a worker's first load reads every row anyway.
+"""
+from .. import models
+
+
+def upgrade(op) -> None:
+	op.create_tables(models.Base.metadata.tables["lexicon_version"])
+	op.add_column("lexicon_words", "version", "INTEGER DEFAULT 0 NOT NULL")
+	op.add_column("lexicon_bigrams", "version", "INTEGER DEFAULT 0 NOT NULL")
+	op.create_model_indexes(models.Base.metadata.tables["lexicon_words"])
+	op.create_model_indexes(models.Base.metadata.tables["lexicon_bigrams"])
+	op.execute("INSERT INTO lexicon_version (id, version) SELECT 1, 0 WHERE NOT EXISTS (SELECT 1 FROM lexicon_version WHERE id = 1)")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, Boolean, Enum, UniqueConstraint, DateTime, Float
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, Boolean, Enum, UniqueConstraint, Index, Identity, DateTime, Float, LargeBinary
 from sqlalchemy.orm import relationship, backref
 from .database import Base
 import enum
@@ -28,7 +28,9 @@ class CategoryEnum(str, enum.Enum):
 class Course(Base):
 	__tablename__ = "courses"
 	
-	id = Column(Integer, primary_key=True, index=True)
+	# Identity(always=True), here and on every table below: GENERATED ALWAYS AS IDENTITY on PostgreSQL,
+	# so ids only ever come from the sequence and it can't fall behind MAX(id) (migration m0003)
+	id = Column(Integer, Identity(always=True), primary_key=True, index=True)
 	name = Column(String(100), nullable=False)
 	description = Column(Text, nullable=True)
 	order_index = Column(Integer, default=0, nullable=False)
@@ -46,7 +48,7 @@ class Course(Base):
 class Level(Base):
 	__tablename__ = "levels"
 	
-	id = Column(Integer, primary_key=True, index=True)
+	id = Column(Integer, Identity(always=True), primary_key=True, index=True)
 	course_id = Column(Integer, ForeignKey("courses.id"), nullable=False)
 	name = Column(String(100), nullable=False)
 	description = Column(Text, nullable=True)
@@ -62,7 +64,7 @@ class Level(Base):
 class Exercise(Base):
 	__tablename__ = "exercises"
 
-	id = Column(Integer, primary_key=True, index=True)
+	id = Column(Integer, Identity(always=True), primary_key=True, index=True)
 	category = Column(Enum(CategoryEnum), index=True, nullable=False)
 	course_id = Column(Integer, ForeignKey("courses.id"), nullable=False)
 	level_id = Column(Integer, ForeignKey("levels.id"), nullable=False)
@@ -77,31 +79,44 @@ class Exercise(Base):
 
 	# Rule-specific field (optional): e.g., pass threshold, max_errors
 	rule = Column(String(50), nullable=True)
+	# SHA-256 of the content fields as written by the corpus loader (app/corpus.py), so re-seeding skips unchanged rows
+	content_hash = Column(String(64), nullable=True)
 
 	# Relationships
 	course = relationship("Course", back_populates="exercises")
 	level = relationship("Level", back_populates="exercises")
 	attempts = relationship("Attempt", back_populates="exercise")
 
+	__table_args__ = (
+		Index("ix_exercises_level_order", "level_id", "order_index"),
+	)
+
 
 class Attempt(Base):
 	__tablename__ = "attempts"
 
-	id = Column(Integer, primary_key=True, index=True)
+	id = Column(Integer, Identity(always=True), primary_key=True, index=True)
 	exercise_id = Column(Integer, ForeignKey("exercises.id"), nullable=False)
-	user_id = Column(String(64), index=True, nullable=False)
+	# users.id; no foreign key so answer history outlives a deleted account
+	user_id = Column(Integer, nullable=False)
 	response = Column(Text, nullable=False)
 	is_correct = Column(Boolean, default=False)
 	score_delta = Column(Integer, default=0)
 
 	exercise = relationship("Exercise", back_populates="attempts")
 
+	# (user_id, ...) also serves lookups by user_id alone
+	__table_args__ = (
+		Index("ix_attempts_user_exercise", "user_id", "exercise_id"),
+		Index("ix_attempts_exercise_id", "exercise_id"),
+	)
+
 
 class Progress(Base):
 	__tablename__ = "progress"
 
-	id = Column(Integer, primary_key=True, index=True)
-	user_id = Column(String(64), index=True, nullable=False)
+	id = Column(Integer, Identity(always=True), primary_key=True, index=True)
+	user_id = Column(Integer, nullable=False)  # users.id, as in attempts
 	category = Column(Enum(CategoryEnum), index=True, nullable=False)
 	course_id = Column(Integer, ForeignKey("courses.id"), nullable=False)
 	level_id = Column(Integer, ForeignKey("levels.id"), nullable=False)
@@ -110,16 +125,23 @@ class Progress(Base):
 	errors = Column(Integer, default=0)
 	stars = Column(Integer, default=0)
 	completed = Column(Boolean, default=False)
+	# High-water mark of incremental dataset exports (scripts/export_dataset.py); NULL on rows older than m0005
+	updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 	
 	# Relationships
 	course = relationship("Course")
 	level = relationship("Level")
 
+	__table_args__ = (
+		Index("ix_progress_user_level", "user_id", "level_id"),
+		Index("ix_progress_user_course", "user_id", "course_id"),
+	)
+
 
 class CourseProgress(Base):
 	__tablename__ = "course_progress"
 	
-	id = Column(Integer, primary_key=True, index=True)
+	id = Column(Integer, Identity(always=True), primary_key=True, index=True)
 	user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
 	course_id = Column(Integer, ForeignKey("courses.id"), nullable=False)
 	total_exercises = Column(Integer, default=0)
@@ -137,13 +159,13 @@ class CourseProgress(Base):
 	user = relationship("User")
 	course = relationship("Course")
 	
-	# Unique constraint to prevent duplicate progress records
+	# Unique constraint to prevent duplicate progress records (also the (user_id, course_id) index)
 	__table_args__ = (UniqueConstraint('user_id', 'course_id', name='unique_user_course_progress'),)
 
 
 class User(Base):
 	__tablename__ = "users"
-	id = Column(Integer, primary_key=True, index=True)
+	id = Column(Integer, Identity(always=True), primary_key=True, index=True)
 	username = Column(String(50), unique=True, index=True, nullable=False)
 	email = Column(String(100), unique=True, index=True, nullable=False)
 	age = Column(Integer, nullable=True)
@@ -170,7 +192,7 @@ class Achievement(Base):
 	"""Achievements/Badges that users can earn"""
 	__tablename__ = "achievements"
 	
-	id = Column(Integer, primary_key=True, index=True)
+	id = Column(Integer, Identity(always=True), primary_key=True, index=True)
 	code = Column(String(50), unique=True, index=True, nullable=False)  # e.g., "first_perfect_score", "week_streak"
 	name = Column(String(100), nullable=False)
 	description = Column(Text, nullable=True)
@@ -185,8 +207,8 @@ class UserAchievement(Base):
 	"""Track which achievements users have earned"""
 	__tablename__ = "user_achievements"
 	
-	id = Column(Integer, primary_key=True, index=True)
-	user_id = Column(String(50), ForeignKey("users.id"), nullable=False, index=True)
+	id = Column(Integer, Identity(always=True), primary_key=True, index=True)
+	user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
 	achievement_id = Column(Integer, ForeignKey("achievements.id"), nullable=False)
 	earned_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 	
@@ -201,7 +223,7 @@ class DailyChallenge(Base):
 	"""Daily challenges for users"""
 	__tablename__ = "daily_challenges"
 	
-	id = Column(Integer, primary_key=True, index=True)
+	id = Column(Integer, Identity(always=True), primary_key=True, index=True)
 	date = Column(String(10), nullable=False, index=True)  # YYYY-MM-DD format
 	challenge_type = Column(String(50), nullable=False)  # "complete_n_exercises", "perfect_accuracy", "specific_level"
 	target_value = Column(Integer, nullable=True)  # e.g., 10 for "complete 10 exercises"
@@ -218,8 +240,8 @@ class UserDailyProgress(Base):
 	"""Track user progress on daily challenges"""
 	__tablename__ = "user_daily_progress"
 	
-	id = Column(Integer, primary_key=True, index=True)
-	user_id = Column(String(50), ForeignKey("users.id"), nullable=False, index=True)
+	id = Column(Integer, Identity(always=True), primary_key=True, index=True)
+	user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
 	challenge_id = Column(Integer, ForeignKey("daily_challenges.id"), nullable=False)
 	current_value = Column(Integer, default=0, nullable=False)  # Current progress toward target
 	completed = Column(Boolean, default=False, nullable=False)
@@ -236,8 +258,8 @@ class SpacedRepetitionCard(Base):
 	"""SRS cards for words/exercises the user struggles with"""
 	__tablename__ = "srs_cards"
 	
-	id = Column(Integer, primary_key=True, index=True)
-	user_id = Column(String(50), ForeignKey("users.id"), nullable=False, index=True)
+	id = Column(Integer, Identity(always=True), primary_key=True, index=True)
+	user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
 	exercise_id = Column(Integer, ForeignKey("exercises.id"), nullable=False)
 	word = Column(String(200), nullable=False)  # The word being practiced
 	
@@ -267,8 +289,8 @@ class ChatSession(Base):
 	"""Chat sessions for AI Chatbot"""
 	__tablename__ = "chat_sessions"
 	
-	id = Column(Integer, primary_key=True, index=True)
-	user_id = Column(String(50), ForeignKey("users.id"), nullable=True, index=True)  # Null for anonymous
+	id = Column(Integer, Identity(always=True), primary_key=True, index=True)
+	user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)  # Null for anonymous
 	session_token = Column(String(100), unique=True, nullable=False, index=True)
 	started_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 	last_activity = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
@@ -288,7 +310,7 @@ class ChatMessage(Base):
 	"""Individual messages in chat sessions"""
 	__tablename__ = "chat_messages"
 	
-	id = Column(Integer, primary_key=True, index=True)
+	id = Column(Integer, Identity(always=True), primary_key=True, index=True)
 	session_id = Column(Integer, ForeignKey("chat_sessions.id"), nullable=False, index=True)
 	role = Column(String(20), nullable=False)  # 'user' or 'assistant'
 	content = Column(Text, nullable=False)
@@ -313,3 +335,134 @@ class ChatMessage(Base):
 
 
 
+
+
+class OcrPassStat(Base):
+	"""Per-bucket run/win counts for OCR passes, used by the OCR planner to learn which configurations pay off"""
+	__tablename__ = "ocr_pass_stats"
+	
+	id = Column(Integer, Identity(always=True), primary_key=True, index=True)
+	bucket = Column(String(50), nullable=False, index=True)  # e.g. "block:mid" (layout:confidence band)
+	pass_name = Column(String(50), nullable=False)  # e.g. "psm4_sqi", "paddle", "data_psm6_sqi"
+	runs = Column(Integer, default=0, nullable=False)
+	wins = Column(Integer, default=0, nullable=False)
+	updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+	
+	__table_args__ = (UniqueConstraint('bucket', 'pass_name', name='unique_ocr_pass_bucket'),)
+
+
+class LexiconWord(Base):
+	"""Orthography lexicon for OCR spell-checking: word frequencies from the exercise corpus and imported word lists"""
+	__tablename__ = "lexicon_words"
+	
+	id = Column(Integer, Identity(always=True), primary_key=True, index=True)
+	word = Column(String(100), unique=True, nullable=False, index=True)  # lowercase
+	corpus_count = Column(Integer, default=0, nullable=False)  # occurrences in enabled exercise prompts/answers
+	external_count = Column(Integer, default=0, nullable=False)  # from imported word lists
+	source = Column(String(50), nullable=True)  # "corpus" or the name of the imported list that added it
+	# Rows are never deleted; a word with both counts at 0 is a tombstone so workers can sync the removal
+	updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False, index=True)
+	version = Column(Integer, default=0, nullable=False, index=True)  # lexicon_version.version of the last write
+
+
+class LexiconBigram(Base):
+	"""Word pair counts from the exercise corpus (context for the OCR noisy-channel corrector)"""
+	__tablename__ = "lexicon_bigrams"
+	
+	id = Column(Integer, Identity(always=True), primary_key=True, index=True)
+	first = Column(String(100), nullable=False, index=True)
+	second = Column(String(100), nullable=False)
+	count = Column(Integer, default=0, nullable=False)  # 0 = tombstone, as in lexicon_words
+	updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False, index=True)
+	version = Column(Integer, default=0, nullable=False, index=True)  # as in lexicon_words
+	
+	__table_args__ = (UniqueConstraint('first', 'second', name='unique_lexicon_bigram'),)
+
+
+class LexiconVersion(Base):
+	"""Change counter of lexicon_words/lexicon_bigrams (a single row): the watermark workers sync from"""
+	__tablename__ = "lexicon_version"
+	
+	id = Column(Integer, primary_key=True, autoincrement=False)  # always 1
+	version = Column(Integer, default=0, nullable=False)
+
+
+class OcrConfusion(Base):
+	"""Character confusion counts learned from OCR text vs expected text (intended → observed)"""
+	__tablename__ = "ocr_confusions"
+	
+	id = Column(Integer, Identity(always=True), primary_key=True, index=True)
+	intended = Column(String(4), nullable=False)  # 1–2 chars, "" for an inserted character
+	observed = Column(String(4), nullable=False)  # 1–2 chars, "" for a dropped character; == intended counts correct reads
+	count = Column(Integer, default=0, nullable=False)
+	updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+	
+	__table_args__ = (UniqueConstraint('intended', 'observed', name='unique_ocr_confusion'),)
+
+
+class OcrTextPair(Base):
+	"""Logged OCR output with the expected text, for calibrating the OCR corrector (only with OCR_TEXT_PAIR_DAYS > 0)"""
+	__tablename__ = "ocr_text_pairs"
+	
+	id = Column(Integer, Identity(always=True), primary_key=True, index=True)
+	ocr_text = Column(Text, nullable=False)
+	expected_text = Column(Text, nullable=False)
+	created_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+
+class OcrJob(Base):
+	"""Queued OCR analysis (/api/ocr/jobs), processed by the in-process worker in app/ocr_jobs.py"""
+	__tablename__ = "ocr_jobs"
+	
+	id = Column(String(32), primary_key=True)  # uuid4 hex, returned to the client
+	status = Column(String(20), nullable=False, default="queued", index=True)  # queued, running, done, failed
+	input_key = Column(String(64), nullable=False, index=True)  # SHA-256 of image + parameters, for reuse
+	image = Column(LargeBinary, nullable=True)  # dropped once the job finishes
+	expected_text = Column(Text, nullable=True)
+	use_llm = Column(Boolean, default=True, nullable=False)
+	result = Column(Text, nullable=True)  # JSON-encoded OCRAnalysisOut
+	error = Column(Text, nullable=True)
+	status_code = Column(Integer, nullable=True)  # HTTP status the synchronous endpoint would have returned on failure
+	attempts = Column(Integer, default=0, nullable=False)
+	created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+	started_at = Column(DateTime, nullable=True)
+	finished_at = Column(DateTime, nullable=True)
+
+
+class ContentVersion(Base):
+	"""Single-row counter bumped on every course/level/exercise write; keys the content cache (app/content_cache.py)"""
+	__tablename__ = "content_version"
+	
+	id = Column(Integer, primary_key=True)  # always 1
+	version = Column(Integer, default=1, nullable=False)
+	updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+
+class StatsSnapshot(Base):
+	"""Single-row dashboard counters (app/stats.py): recounted on content changes and periodically, users/attempts/progress kept current in between"""
+	__tablename__ = "stats_snapshot"
+	
+	id = Column(Integer, primary_key=True)  # always 1
+	total_users = Column(Integer, default=0, nullable=False)
+	total_classes = Column(Integer, default=0, nullable=False)
+	total_courses = Column(Integer, default=0, nullable=False)
+	total_levels = Column(Integer, default=0, nullable=False)
+	total_exercises = Column(Integer, default=0, nullable=False)
+	total_categories = Column(Integer, default=0, nullable=False)
+	total_attempts = Column(Integer, default=0, nullable=False)
+	correct_attempts = Column(Integer, default=0, nullable=False)
+	total_progress = Column(Integer, default=0, nullable=False)
+	completed_progress = Column(Integer, default=0, nullable=False)
+	classes = Column(Text, nullable=True)  # JSON: [{"id", "name", "order", "courses", "exercises"}]
+	content_version = Column(Integer, nullable=True)  # content version the content counts were taken at
+	refreshed_at = Column(DateTime, nullable=True)  # last full recount; NULL forces one
+
+
+class SchemaMigration(Base):
+	"""Applied schema migrations (app/migrate.py, one row per app/migrations/mNNNN_*.py)"""
+	__tablename__ = "schema_migrations"
+	
+	version = Column(Integer, primary_key=True, autoincrement=False)
+	name = Column(String(100), nullable=False)
+	applied_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+	duration_ms = Column(Integer, nullable=True)
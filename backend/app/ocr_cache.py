@@ -0,0 +1,98 @@
+"""
+In-process result cache for OCR analysis (routers/ocr.py).
+
+Re-uploads of the same dictation photo (to retry with another expected_text
+or use_llm setting) skip preprocessing, tesseract and the GPT-4 call:
+
+- OCR stage: keyed by the SHA-256 of the uploaded bytes, so only the
+  identical file hits. There is no perceptual near-duplicate matching: a
+  small image hash can't tell dictation sheets of the same text apart, and
+  a false hit would hand one student's OCR text to another's upload.
+- LLM stage: keyed by the SHA-256 of the OCR text being refined, so it is
+  shared by every upload that produced the same text.
+
+Only the orthography comparison is recomputed on a hit. Like the lexicon
+cache this is per process; entries expire after OCR_CACHE_TTL_SECONDS.
+"""
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+OCR_CACHE_SIZE = int(os.getenv("OCR_CACHE_SIZE", "256"))
+OCR_CACHE_TTL_SECONDS = float(os.getenv("OCR_CACHE_TTL_SECONDS", "3600"))
+
+
+class _LRUCache:
+	"""Thread-safe LRU with per-entry expiry."""
+
+	def __init__(self, max_entries: int, ttl_seconds: float):
+		self.max_entries = max_entries
+		self.ttl_seconds = ttl_seconds
+		self._data: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+		self._lock = threading.Lock()
+		self.hits = 0
+		self.misses = 0
+
+	def get(self, key: str) -> Optional[Any]:
+		with self._lock:
+			item = self._data.get(key)
+			if item is None or (time.time() - item[0]) > self.ttl_seconds:
+				if item is not None:
+					del self._data[key]
+				self.misses += 1
+				return None
+			self._data.move_to_end(key)
+			self.hits += 1
+			return item[1]
+
+	def put(self, key: str, value: Any) -> None:
+		if self.max_entries <= 0:
+			return
+		with self._lock:
+			self._data[key] = (time.time(), value)
+			self._data.move_to_end(key)
+			while len(self._data) > self.max_entries:
+				self._data.popitem(last=False)
+
+	def items(self):
+		with self._lock:
+			now = time.time()
+			return [(k, v) for k, (at, v) in self._data.items() if (now - at) <= self.ttl_seconds]
+
+	def clear(self) -> None:
+		with self._lock:
+			self._data.clear()
+
+
+_OCR_RESULTS = _LRUCache(OCR_CACHE_SIZE, OCR_CACHE_TTL_SECONDS)
+_LLM_RESULTS = _LRUCache(OCR_CACHE_SIZE, OCR_CACHE_TTL_SECONDS)
+
+
+def content_key(content: bytes) -> str:
+	return hashlib.sha256(content).hexdigest()
+
+
+def get_ocr(key: str) -> Optional[Dict[str, Any]]:
+	return _OCR_RESULTS.get(key)
+
+
+def put_ocr(key: str, entry: Dict[str, Any]) -> None:
+	_OCR_RESULTS.put(key, entry)
+
+
+def get_llm(text: str) -> Optional[Dict[str, Any]]:
+	return _LLM_RESULTS.get(content_key(text.encode("utf-8")))
+
+
+def put_llm(text: str, result: Dict[str, Any]) -> None:
+	_LLM_RESULTS.put(content_key(text.encode("utf-8")), result)
+
+
+def stats() -> Dict[str, Any]:
+	return {
+		"ocr": {"entries": len(_OCR_RESULTS.items()), "hits": _OCR_RESULTS.hits, "misses": _OCR_RESULTS.misses},
+		"llm": {"entries": len(_LLM_RESULTS.items()), "hits": _LLM_RESULTS.hits, "misses": _LLM_RESULTS.misses},
+	}
@@ -0,0 +1,387 @@
+"""
+Noisy-channel OCR text corrector for Albanian (routers/ocr.py, refinement stage).
+
+For every OCR token w the corrector scores candidate words c with
+
+	log P(w | c) + log P(c | previous word)
+
+- Channel P(w | c): character confusions intended → observed, segments of up
+  to 2 characters (rn→m, cl→d, ë→e, ll→l, ...). Counts are learned from OCR
+  output together with the expected text (record_pair → ocr_confusions)
+  on top of built-in priors. The texts themselves are only kept (ocr_text_pairs,
+  for scripts/calibrate_ocr_corrector.py) when OCR_TEXT_PAIR_DAYS is set. The most likely segmentation is found with a
+  small Viterbi DP.
+- Language model: lexicon word frequencies and corpus word pairs
+  (app/lexicon.py), a unigram/bigram interpolation.
+
+Candidates are the token itself, SymSpell suggestions and rewrites that undo
+learned multi-character confusions. Scores become posteriors with a softmax
+at OCR_CORRECT_TEMPERATURE (fit it with scripts/calibrate_ocr_corrector.py).
+A token is rewritten when another word's posterior reaches
+OCR_CORRECT_MIN_PROB. A text is "confident" when every token's top posterior
+reaches OCR_CORRECT_CONFIDENCE; only texts that aren't confident are worth
+sending to the LLM.
+
+Config (env):
+- OCR_CORRECT_TEMPERATURE: softmax temperature (default 1.0)
+- OCR_CORRECT_MIN_PROB: posterior needed to replace a token (default 0.5)
+- OCR_CORRECT_CONFIDENCE: min top posterior per token for the text to skip the LLM (default 0.9)
+- OCR_CONFUSION_SYNC_SECONDS: how often a worker reloads confusion counts (default 300)
+- OCR_TEXT_PAIR_DAYS: keep OCR/expected text pairs this many days for calibration; 0 = don't store them (default 0)
+"""
+import math
+import os
+import re
+import threading
+import time
+import unicodedata
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from . import models
+from .lexicon import LexiconIndex
+from .similarity import align
+
+TEMPERATURE = float(os.getenv("OCR_CORRECT_TEMPERATURE", "1.0"))
+MIN_PROB = float(os.getenv("OCR_CORRECT_MIN_PROB", "0.5"))
+CONFIDENCE = float(os.getenv("OCR_CORRECT_CONFIDENCE", "0.9"))
+CONFUSION_SYNC_SECONDS = float(os.getenv("OCR_CONFUSION_SYNC_SECONDS", "300"))
+TEXT_PAIR_DAYS = float(os.getenv("OCR_TEXT_PAIR_DAYS", "0"))
+# Expired text pairs are deleted at most this often per worker
+_PAIR_PRUNE_SECONDS = 3600
+_last_pair_prune = 0.0
+
+# Pseudo-counts (intended, observed) for confusions common in Albanian handwriting/print OCR
+PRIOR_CONFUSIONS: Dict[Tuple[str, str], float] = {
+	("ë", "e"): 20.0, ("ç", "c"): 10.0, ("e", "ë"): 3.0, ("c", "ç"): 2.0,
+	("m", "rn"): 3.0, ("d", "cl"): 2.0, ("w", "vv"): 1.0, ("u", "ii"): 1.0, ("h", "li"): 1.0,
+	("i", "l"): 3.0, ("l", "i"): 3.0, ("l", "1"): 3.0, ("i", "1"): 1.0, ("o", "0"): 3.0,
+	("ll", "l"): 4.0, ("rr", "r"): 4.0, ("l", "ll"): 1.0, ("r", "rr"): 1.0,
+	("ë", ""): 4.0, ("n", "u"): 1.0, ("u", "n"): 1.0, ("a", "o"): 1.0, ("e", "c"): 1.0,
+}
+# Pseudo-count for reading a character correctly
+IDENTITY_PRIOR = 200.0
+# Probability of any confusion never seen (per character)
+UNSEEN_PROB = 1e-4
+# Language model: add-k smoothing, bigram weight, prior of a word the lexicon doesn't know
+_ADD_K = 0.5
+_BIGRAM_WEIGHT = 0.4
+OOV_PROB = 1e-6
+# Candidate generation
+_MAX_CANDIDATES = 8
+_MAX_SEGMENT = 2
+
+_TOKEN_RE = re.compile(r"[A-Za-zËÇëç0-9]+", re.UNICODE)
+
+
+# ============================================================================
+# CONFUSION MODEL
+# ============================================================================
+
+def _segments(intended: str, observed: str) -> List[Tuple[str, str]]:
+	"""
+	Character-level alignment of intended → observed as segments: matches are
+	(c, c); adjacent edits are merged while both sides stay within 2 chars
+	(m → rn is one segment, not substitute + insert).
+	"""
+	out: List[Tuple[str, str]] = []
+	run_a, run_b = "", ""
+
+	def flush():
+		nonlocal run_a, run_b
+		if run_a or run_b:
+			out.append((run_a, run_b))
+		run_a, run_b = "", ""
+
+	for op in align(intended, observed):
+		if op["op"] == "equal":
+			flush()
+			out.append((op["a"], op["b"]))
+			continue
+		a, b = op["a"] or "", op["b"] or ""
+		if len(run_a + a) > _MAX_SEGMENT or len(run_b + b) > _MAX_SEGMENT:
+			flush()
+		run_a += a
+		run_b += b
+	flush()
+	return out
+
+
+def _norm_words(text: str) -> List[str]:
+	return _TOKEN_RE.findall(unicodedata.normalize("NFKC", text or "").lower())
+
+
+def confusions_from_pair(ocr_text: str, expected_text: str) -> Counter:
+	"""
+	Confusion counts (intended, observed) from one OCR output and its expected text.
+	Words are aligned first; only substituted pairs that are plausibly the same
+	word (≤ 3 segment edits) contribute edits, matched words contribute correct reads.
+	"""
+	counts: Counter = Counter()
+	for op in align(_norm_words(expected_text), _norm_words(ocr_text)):
+		if op["op"] == "equal":
+			for ch in op["a"]:
+				counts[(ch, ch)] += 1
+		elif op["op"] == "substitute":
+			segs = _segments(op["a"], op["b"])
+			if sum(1 for a, b in segs if a != b) > 3:
+				continue
+			for seg in segs:
+				counts[seg] += 1
+	return counts
+
+
+class ConfusionModel:
+	"""Smoothed P(observed | intended) for 1–2 character segments."""
+
+	def __init__(self, counts: Optional[Dict[Tuple[str, str], float]] = None):
+		self.counts: Dict[Tuple[str, str], float] = dict(PRIOR_CONFUSIONS)
+		for key, n in (counts or {}).items():
+			self.counts[key] = self.counts.get(key, 0.0) + n
+		# Denominators per first intended character ("" = insertions, relative to all reads)
+		self._totals: Dict[str, float] = {}
+		for (intended, _), n in self.counts.items():
+			first = intended[:1]
+			self._totals[first] = self._totals.get(first, 0.0) + n
+		reads = sum(n for (i, o), n in self.counts.items() if i == o)
+		self._totals[""] = max(reads, 1000.0)
+		# Multi-character confusions, for candidate generation (observed → intended)
+		self.rewrites = sorted(
+			((o, i) for (i, o), n in self.counts.items() if i != o and o and n >= 1.0),
+			key=lambda r: -self.counts[(r[1], r[0])],
+		)
+		self.loaded_at = time.time()
+
+	def logprob(self, intended: str, observed: str) -> Optional[float]:
+		"""log P(observed | intended); None for 2-char segments never seen."""
+		n = self.counts.get((intended, observed), 0.0)
+		if intended == observed and len(intended) == 1:
+			n += IDENTITY_PRIOR
+		elif n == 0.0:
+			if len(intended) > 1 or len(observed) > 1:
+				return None
+			return math.log(UNSEEN_PROB)
+		total = self._totals.get(intended[:1], 0.0) + IDENTITY_PRIOR
+		return math.log(max(n / total, UNSEEN_PROB))
+
+	def channel(self, observed: str, intended: str) -> float:
+		"""Viterbi log P(observed | intended) over segmentations into ≤ 2-char segments."""
+		li, lo = len(intended), len(observed)
+		neg = float("-inf")
+		best = [[neg] * (lo + 1) for _ in range(li + 1)]
+		best[0][0] = 0.0
+		for i in range(li + 1):
+			row = best[i]
+			for j in range(lo + 1):
+				if i == 0 and j == 0:
+					continue
+				top = neg
+				for di in range(0, min(_MAX_SEGMENT, i) + 1):
+					prev_row = best[i - di]
+					for dj in range(0, min(_MAX_SEGMENT, j) + 1):
+						if di == 0 and dj == 0:
+							continue
+						base = prev_row[j - dj]
+						if base == neg:
+							continue
+						lp = self.logprob(intended[i - di:i], observed[j - dj:j])
+						if lp is not None and base + lp > top:
+							top = base + lp
+				row[j] = top
+		return best[li][lo]
+
+
+def _store_pair(db: Session, ocr_text: str, expected_text: str) -> None:
+	global _last_pair_prune
+	db.add(models.OcrTextPair(ocr_text=ocr_text, expected_text=expected_text))
+	if time.time() - _last_pair_prune > _PAIR_PRUNE_SECONDS:
+		_last_pair_prune = time.time()
+		cutoff = datetime.utcnow() - timedelta(days=TEXT_PAIR_DAYS)
+		db.query(models.OcrTextPair).filter(models.OcrTextPair.created_at < cutoff).delete(synchronize_session=False)
+
+
+def record_pair(db: Session, ocr_text: str, expected_text: str) -> None:
+	"""
+	Add the confusions of an OCR output vs its expected text to ocr_confusions.
+	The texts are kept in ocr_text_pairs only when OCR_TEXT_PAIR_DAYS > 0, and
+	deleted after that many days.
+	"""
+	if not (ocr_text or "").strip() or not (expected_text or "").strip():
+		return
+	try:
+		counts = confusions_from_pair(ocr_text, expected_text)
+		if TEXT_PAIR_DAYS > 0:
+			_store_pair(db, ocr_text, expected_text)
+		if counts:
+			existing = {
+				(r.intended, r.observed): r
+				for r in db.query(models.OcrConfusion).filter(
+					models.OcrConfusion.intended.in_({i for i, _ in counts})
+				).all()
+			}
+			now = datetime.utcnow()
+			for (intended, observed), n in counts.items():
+				row = existing.get((intended, observed))
+				if row is None:
+					db.add(models.OcrConfusion(intended=intended, observed=observed, count=n, updated_at=now))
+				else:
+					row.count = models.OcrConfusion.count + n
+					row.updated_at = now
+		db.commit()
+	except Exception as e:
+		db.rollback()
+		print(f"[OCR CORRECT] Could not record text pair: {e}")
+
+
+_MODEL: Optional[ConfusionModel] = None
+_MODEL_LOCK = threading.Lock()
+
+
+def get_model(db: Session) -> ConfusionModel:
+	"""The worker's confusion model, reloaded from ocr_confusions every OCR_CONFUSION_SYNC_SECONDS."""
+	global _MODEL
+	model = _MODEL
+	if model is not None and time.time() - model.loaded_at < CONFUSION_SYNC_SECONDS:
+		return model
+	with _MODEL_LOCK:
+		if _MODEL is not None and time.time() - _MODEL.loaded_at < CONFUSION_SYNC_SECONDS:
+			return _MODEL
+		try:
+			rows = db.query(models.OcrConfusion.intended, models.OcrConfusion.observed, models.OcrConfusion.count).all()
+			_MODEL = ConfusionModel({(i, o): float(n) for i, o, n in rows if n})
+		except Exception as e:
+			db.rollback()
+			print(f"[OCR CORRECT] Could not load confusions: {e}")
+			_MODEL = _MODEL or ConfusionModel()
+			_MODEL.loaded_at = time.time()
+	return _MODEL
+
+
+# ============================================================================
+# CORRECTION
+# ============================================================================
+
+def _lm_logprob(index: LexiconIndex, word: str, prev: Optional[str]) -> float:
+	freq = index.frequency.get(word, 0)
+	if not freq:
+		return math.log(OOV_PROB)
+	unigram = (freq + _ADD_K) / (index.total + _ADD_K * max(len(index.frequency), 1))
+	prev_total = index.bigram_totals.get(prev, 0) if prev else 0
+	if not prev_total:
+		return math.log(unigram)
+	bigram = index.bigrams.get((prev, word), 0) / prev_total
+	return math.log(_BIGRAM_WEIGHT * bigram + (1.0 - _BIGRAM_WEIGHT) * unigram)
+
+
+def _candidates(word: str, index: LexiconIndex, model: ConfusionModel) -> List[str]:
+	out = [word]
+	for cand, _, _ in index.spelling.lookup(word, max_suggestions=_MAX_CANDIDATES):
+		if cand not in out:
+			out.append(cand)
+	# Undo learned multi-character confusions (rn → m, 1 → l, ...) the edit-distance index may miss
+	for observed, intended in model.rewrites:
+		start = word.find(observed)
+		while start != -1:
+			cand = word[:start] + intended + word[start + len(observed):]
+			if cand in index.words and cand not in out:
+				out.append(cand)
+			start = word.find(observed, start + 1)
+	return out
+
+
+def _match_case(original: str, word: str) -> str:
+	if original.isupper() and len(original) > 1:
+		return word.upper()
+	if original[:1].isupper():
+		return word[:1].upper() + word[1:]
+	return word
+
+
+def score_token(
+	word: str,
+	prev: Optional[str],
+	index: LexiconIndex,
+	model: ConfusionModel,
+) -> List[Tuple[str, float]]:
+	"""Unnormalized log scores (candidate, log P(word | c) + log P(c | prev)), best first."""
+	scored = []
+	for cand in _candidates(word, index, model):
+		scored.append((cand, model.channel(word, cand) + _lm_logprob(index, cand, prev)))
+	scored.sort(key=lambda s: -s[1])
+	return scored
+
+
+def posteriors(scored: List[Tuple[str, float]], temperature: Optional[float] = None) -> List[Tuple[str, float]]:
+	t = temperature or TEMPERATURE
+	if not scored:
+		return []
+	top = max(s for _, s in scored)
+	weights = [(c, math.exp((s - top) / t)) for c, s in scored]
+	z = sum(w for _, w in weights)
+	return [(c, w / z) for c, w in weights]
+
+
+def correct_text(
+	text: str,
+	index: LexiconIndex,
+	model: ConfusionModel,
+	temperature: Optional[float] = None,
+) -> Dict[str, Any]:
+	"""
+	Correct OCR text token by token (spacing and punctuation are kept).
+
+	Returns:
+		{"text": str, "corrections": [{"original", "corrected", "probability", "alternatives"}],
+		 "min_confidence": float, "uncertain": int, "confident": bool}
+	"""
+	pieces: List[str] = []
+	corrections: List[Dict[str, Any]] = []
+	min_conf = 1.0
+	uncertain = 0
+	prev: Optional[str] = None
+	last = 0
+	norm = unicodedata.normalize("NFKC", text or "")
+	for m in _TOKEN_RE.finditer(norm):
+		pieces.append(norm[last:m.start()])
+		last = m.end()
+		token = m.group()
+		word = token.lower()
+		if len(word) < 2 or word.isdigit():
+			pieces.append(token)
+			prev = None
+			continue
+
+		post = posteriors(score_token(word, prev, index, model), temperature)
+		best, p_best = post[0]
+		if best != word and p_best < MIN_PROB:
+			best = word
+			p_best = dict(post).get(word, 0.0)
+		top_p = post[0][1]
+		min_conf = min(min_conf, top_p)
+		if top_p < CONFIDENCE:
+			uncertain += 1
+
+		if best != word:
+			corrected = _match_case(token, best)
+			pieces.append(corrected)
+			corrections.append({
+				"original": token,
+				"corrected": corrected,
+				"reason": "noisy_channel",
+				"probability": round(p_best, 3),
+				"alternatives": [{"word": c, "probability": round(p, 3)} for c, p in post[1:4]],
+			})
+		else:
+			pieces.append(token)
+		prev = best if best in index.words else None
+	pieces.append(norm[last:])
+	return {
+		"text": "".join(pieces),
+		"corrections": corrections,
+		"min_confidence": round(min_conf, 3),
+		"uncertain": uncertain,
+		"confident": uncertain == 0,
+	}
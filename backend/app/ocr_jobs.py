@@ -0,0 +1,317 @@
+"""
+Job queue for OCR analyses that outlive an HTTP request (/api/ocr/jobs).
+
+/api/ocr/analyze holds the request open through preprocessing, all OCR
+passes and the GPT-4 call, which can exceed the proxy timeout. A job is
+submitted instead: the image is stored in ocr_jobs and the id returned at
+once. Workers run as tasks on each API process's event loop (no external
+broker), claim queued rows with a conditional UPDATE so several processes
+can share the table, and write the result back. Clients poll the job or
+subscribe to its status as server-sent events.
+
+Reuse: jobs are keyed by the SHA-256 of the image and the parameters. A
+submission matching a queued, running or recently finished job returns that
+job, so client retries don't add work. Failed jobs are not reused.
+
+Recovery: a job left "running" by a process that died is requeued after
+OCR_JOB_STALE_SECONDS, up to OCR_JOB_MAX_ATTEMPTS attempts.
+
+The queue is polled with the sync Session, so every query runs in the
+threadpool (run_in_threadpool), never on the event loop; wakeups and change
+notifications are handed back to the loop with call_soon_threadsafe.
+
+Config (env):
+- OCR_JOB_WORKERS: jobs processed at once per process (default 2)
+- OCR_JOB_POLL_SECONDS: how often idle workers look for jobs submitted to other processes (default 2)
+- OCR_JOB_STALE_SECONDS: running time after which a job is presumed orphaned (default 300)
+- OCR_JOB_MAX_ATTEMPTS: attempts before an orphaned job is marked failed (default 2)
+- OCR_JOB_RESULT_TTL_SECONDS: how long finished jobs are kept and reused (default 86400)
+- OCR_JOB_MAX_IMAGE_BYTES: largest image accepted by /api/ocr/jobs (default 15 MB; stored in the row until done)
+"""
+import asyncio
+import hashlib
+import json
+import os
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from fastapi import HTTPException
+from sqlalchemy import update
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from .database import SessionLocal
+from . import models
+
+OCR_JOB_WORKERS = int(os.getenv("OCR_JOB_WORKERS", "2"))
+OCR_JOB_POLL_SECONDS = float(os.getenv("OCR_JOB_POLL_SECONDS", "2"))
+OCR_JOB_STALE_SECONDS = float(os.getenv("OCR_JOB_STALE_SECONDS", "300"))
+OCR_JOB_MAX_ATTEMPTS = int(os.getenv("OCR_JOB_MAX_ATTEMPTS", "2"))
+OCR_JOB_RESULT_TTL_SECONDS = float(os.getenv("OCR_JOB_RESULT_TTL_SECONDS", "86400"))
+OCR_JOB_MAX_IMAGE_BYTES = int(os.getenv("OCR_JOB_MAX_IMAGE_BYTES", str(15 * 1024 * 1024)))
+
+# Stale-job recovery and purging run at most this often per process
+_MAINTENANCE_SECONDS = 60.0
+
+FINISHED = ("done", "failed")
+
+# handler(db, job) -> JSON-serializable result; raise HTTPException for client errors
+JobHandler = Callable[[Session, models.OcrJob], Awaitable[Dict[str, Any]]]
+
+_workers: List["asyncio.Task"] = []
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_wakeup: Optional[asyncio.Event] = None
+# job id -> event set (and replaced) whenever that job changes in this process
+_changed: Dict[str, asyncio.Event] = {}
+_last_maintenance = 0.0
+
+
+def job_key(content: bytes, expected_text: Optional[str], use_llm: bool) -> str:
+	h = hashlib.sha256(content)
+	h.update(b"\0" + (expected_text or "").encode("utf-8"))
+	h.update(b"\0" + (b"1" if use_llm else b"0"))
+	return h.hexdigest()
+
+
+def submit(db: Session, content: bytes, expected_text: Optional[str], use_llm: bool) -> models.OcrJob:
+	"""Queue an analysis, or return the live/finished job with the same input."""
+	key = job_key(content, expected_text, use_llm)
+	cutoff = datetime.utcnow() - timedelta(seconds=OCR_JOB_RESULT_TTL_SECONDS)
+	existing = (
+		db.query(models.OcrJob)
+		.filter(
+			models.OcrJob.input_key == key,
+			models.OcrJob.status != "failed",
+			models.OcrJob.created_at >= cutoff,
+		)
+		.order_by(models.OcrJob.created_at.desc())
+		.first()
+	)
+	if existing is not None:
+		return existing
+
+	job = models.OcrJob(
+		id=uuid.uuid4().hex,
+		status="queued",
+		input_key=key,
+		image=content,
+		expected_text=expected_text,
+		use_llm=use_llm,
+	)
+	db.add(job)
+	db.commit()
+	db.refresh(job)
+	if _loop is not None:
+		_loop.call_soon_threadsafe(_wakeup.set)
+	return job
+
+
+def get_job(db: Session, job_id: str) -> Optional[models.OcrJob]:
+	return db.query(models.OcrJob).filter(models.OcrJob.id == job_id).first()
+
+
+def job_payload(db: Session, job: models.OcrJob) -> Dict[str, Any]:
+	"""Client view of a job; the result is included once it is done."""
+	payload: Dict[str, Any] = {
+		"job_id": job.id,
+		"status": job.status,
+		"attempts": job.attempts,
+		"created_at": job.created_at.isoformat() if job.created_at else None,
+		"started_at": job.started_at.isoformat() if job.started_at else None,
+		"finished_at": job.finished_at.isoformat() if job.finished_at else None,
+	}
+	if job.status == "queued":
+		payload["queue_position"] = (
+			db.query(models.OcrJob)
+			.filter(models.OcrJob.status == "queued", models.OcrJob.created_at < job.created_at)
+			.count()
+		)
+	elif job.status == "done":
+		payload["result"] = json.loads(job.result) if job.result else None
+	elif job.status == "failed":
+		payload["status_code"] = job.status_code
+		payload["detail"] = job.error
+	return payload
+
+
+async def wait_for_change(job_id: str, timeout: float) -> None:
+	"""Return when this process updates the job, or after timeout (it may be run by another process)."""
+	event = _changed.setdefault(job_id, asyncio.Event())
+	try:
+		await asyncio.wait_for(event.wait(), timeout)
+	except asyncio.TimeoutError:
+		# Don't keep events for jobs this process never touches
+		if _changed.get(job_id) is event:
+			del _changed[job_id]
+
+
+def _notify(job_id: str) -> None:
+	"""Wake this process's subscribers to job_id; safe from any thread."""
+	if _loop is not None:
+		_loop.call_soon_threadsafe(_set_changed, job_id)
+
+
+def _set_changed(job_id: str) -> None:
+	event = _changed.pop(job_id, None)
+	if event is not None:
+		event.set()
+
+
+def poll_payload(job_id: str) -> Optional[Dict[str, Any]]:
+	"""job_payload() in a session of its own (None if the job is gone); for run_in_threadpool."""
+	db = SessionLocal()
+	try:
+		job = get_job(db, job_id)
+		return job_payload(db, job) if job is not None else None
+	finally:
+		db.close()
+
+
+def _claim(db: Session) -> Optional[str]:
+	"""Mark the oldest queued job running; None when the queue is empty."""
+	while True:
+		job_id = (
+			db.query(models.OcrJob.id)
+			.filter(models.OcrJob.status == "queued")
+			.order_by(models.OcrJob.created_at)
+			.limit(1)
+			.scalar()
+		)
+		if job_id is None:
+			return None
+		# Conditional update: only one process wins a job
+		claimed = db.execute(
+			update(models.OcrJob)
+			.where(models.OcrJob.id == job_id, models.OcrJob.status == "queued")
+			.values(status="running", started_at=datetime.utcnow(), attempts=models.OcrJob.attempts + 1)
+		).rowcount
+		db.commit()
+		if claimed:
+			return job_id
+
+
+def _finish(db: Session, job_id: str, result: Optional[Dict[str, Any]] = None, status_code: Optional[int] = None, error: Optional[str] = None) -> None:
+	db.execute(
+		update(models.OcrJob)
+		.where(models.OcrJob.id == job_id)
+		.values(
+			status="done" if error is None else "failed",
+			result=json.dumps(result, ensure_ascii=False, default=str) if result is not None else None,
+			status_code=status_code,
+			error=error,
+			image=None,
+			finished_at=datetime.utcnow(),
+		)
+	)
+	db.commit()
+	_notify(job_id)
+
+
+def _maintenance(db: Session) -> None:
+	"""Requeue or fail orphaned running jobs; purge expired finished ones."""
+	global _last_maintenance
+	if time.time() - _last_maintenance < _MAINTENANCE_SECONDS:
+		return
+	_last_maintenance = time.time()
+	now = datetime.utcnow()
+	stale = now - timedelta(seconds=OCR_JOB_STALE_SECONDS)
+	running = models.OcrJob.status == "running"
+	orphaned = models.OcrJob.started_at < stale
+	failed = db.execute(
+		update(models.OcrJob)
+		.where(running, orphaned, models.OcrJob.attempts >= OCR_JOB_MAX_ATTEMPTS)
+		.values(status="failed", status_code=500, error="OCR job was interrupted", image=None, finished_at=now)
+	).rowcount
+	requeued = db.execute(
+		update(models.OcrJob)
+		.where(running, orphaned)
+		.values(status="queued")
+	).rowcount
+	purged = (
+		db.query(models.OcrJob)
+		.filter(
+			models.OcrJob.status.in_(FINISHED),
+			models.OcrJob.finished_at < now - timedelta(seconds=OCR_JOB_RESULT_TTL_SECONDS),
+		)
+		.delete(synchronize_session=False)
+	)
+	db.commit()
+	if failed or requeued or purged:
+		print(f"[OCR JOBS] maintenance: {requeued} requeued, {failed} failed, {purged} purged")
+
+
+def _claim_next(db: Session) -> Optional[models.OcrJob]:
+	_maintenance(db)
+	job_id = _claim(db)
+	return get_job(db, job_id) if job_id is not None else None
+
+
+def _fail(db: Session, job_id: str, status_code: int, error: str) -> None:
+	db.rollback()
+	_finish(db, job_id, status_code=status_code, error=error)
+
+
+async def _run_one(handler: JobHandler) -> bool:
+	"""Claim and process one job; False when there was nothing to do."""
+	db = SessionLocal()
+	try:
+		job = await run_in_threadpool(_claim_next, db)
+		if job is None:
+			return False
+		job_id = job.id
+		_notify(job_id)
+		started = time.time()
+		try:
+			result = await handler(db, job)
+		except HTTPException as exc:
+			await run_in_threadpool(_fail, db, job_id, exc.status_code, str(exc.detail))
+		except Exception as exc:
+			print(f"[OCR JOBS] job {job_id} failed: {exc}")
+			await run_in_threadpool(_fail, db, job_id, 500, "OCR processing failed")
+		else:
+			await run_in_threadpool(_finish, db, job_id, result)
+			print(f"[OCR JOBS] job {job_id} done in {int((time.time() - started) * 1000)}ms")
+		return True
+	finally:
+		await run_in_threadpool(db.close)
+
+
+async def _worker(handler: JobHandler) -> None:
+	while True:
+		try:
+			busy = await _run_one(handler)
+		except asyncio.CancelledError:
+			raise
+		except Exception as exc:
+			# DB hiccup; keep the worker alive
+			print(f"[OCR JOBS] worker error: {exc}")
+			busy = False
+		if busy:
+			continue
+		_wakeup.clear()
+		try:
+			await asyncio.wait_for(_wakeup.wait(), OCR_JOB_POLL_SECONDS)
+		except asyncio.TimeoutError:
+			pass
+
+
+def start(handler: JobHandler) -> None:
+	"""Start this process's workers on the running event loop (idempotent)."""
+	global _loop, _wakeup
+	_workers[:] = [t for t in _workers if not t.done()]
+	if _workers:
+		return
+	_loop = asyncio.get_running_loop()
+	_wakeup = asyncio.Event()
+	for _ in range(max(1, OCR_JOB_WORKERS)):
+		_workers.append(_loop.create_task(_worker(handler)))
+	print(f"[OCR JOBS] started {len(_workers)} workers")
+
+
+async def stop() -> None:
+	for task in _workers:
+		task.cancel()
+	await asyncio.gather(*_workers, return_exceptions=True)
+	_workers.clear()
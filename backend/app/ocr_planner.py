@@ -0,0 +1,178 @@
+"""
+Adaptive OCR pass selection for the dictation analyzer (routers/ocr.py).
+
+The analyzer always runs one tesseract image_to_data pass (psm 6, sqi) for
+token confidences; its text is also the first OCR candidate. The planner
+looks at that pass (average confidence, line/block layout) and decides which
+extra passes are worth running:
+
+- high confidence: none, unless logged outcomes show another pass often wins
+- mid confidence: the single best pass for the layout
+- low confidence: the two best passes (the upside-down retry is also only tried here)
+
+"Best" starts from a layout-based default ordering (single line → psm 7,
+sparse text → psm 11, block → psm 4) and is replaced by learned win rates
+once a bucket (layout:confidence band) has OCR_PLANNER_MIN_RUNS outcomes.
+Outcomes are logged to ocr_pass_stats after each analysis; the winner is the
+reading closest to the expected text when there is one. Counts are
+incremented in SQL, so concurrent analyses don't lose updates. A small share of
+requests (OCR_PLANNER_EXPLORE_RATE) runs every pass so all configurations
+keep collecting outcomes.
+"""
+import os
+import random
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from . import models
+
+DATA_PASS = "data_psm6_sqi"
+
+HIGH_CONFIDENCE = float(os.getenv("OCR_PLANNER_HIGH_CONF", "80"))
+LOW_CONFIDENCE = float(os.getenv("OCR_PLANNER_LOW_CONF", "50"))
+MIN_RUNS = int(os.getenv("OCR_PLANNER_MIN_RUNS", "20"))
+EXPLORE_RATE = float(os.getenv("OCR_PLANNER_EXPLORE_RATE", "0.05"))
+# In the high band an extra pass is only added if it wins at least this often
+HIGH_BAND_MIN_WIN_RATE = 0.3
+
+_LAYOUT_DEFAULTS = {
+	"single_line": ["psm7_sqi", "psm13_sqi", "paddle", "psm6"],
+	"sparse": ["psm11_sqi", "paddle", "psm4_sqi", "psm6"],
+	"block": ["psm4_sqi", "paddle", "psm6", "psm11_sqi"],
+	"empty": ["psm11_sqi", "paddle", "psm4_sqi", "psm6"],
+}
+
+
+def describe_layout(data: Dict[str, Any]) -> Dict[str, Any]:
+	"""
+	Summarize the layout of an image_to_data result (DICT output):
+		{"layout": "single_line" | "sparse" | "block" | "empty", "lines": int, "blocks": int, "words": int}
+	"""
+	texts = data.get("text", []) if isinstance(data, dict) else []
+	blocks = data.get("block_num", []) or [0] * len(texts)
+	pars = data.get("par_num", []) or [0] * len(texts)
+	lines = data.get("line_num", []) or [0] * len(texts)
+
+	line_keys = set()
+	block_keys = set()
+	words = 0
+	for text, b, p, ln in zip(texts, blocks, pars, lines):
+		if not (text or "").strip():
+			continue
+		words += 1
+		block_keys.add(b)
+		line_keys.add((b, p, ln))
+
+	if words == 0:
+		layout = "empty"
+	elif len(line_keys) == 1:
+		layout = "single_line"
+	elif len(block_keys) > 1 and words / len(line_keys) < 2.5:
+		layout = "sparse"
+	else:
+		layout = "block"
+	return {"layout": layout, "lines": len(line_keys), "blocks": len(block_keys), "words": words}
+
+
+def confidence_band(avg_conf: float) -> str:
+	if avg_conf >= HIGH_CONFIDENCE:
+		return "high"
+	if avg_conf >= LOW_CONFIDENCE:
+		return "mid"
+	return "low"
+
+
+def bucket_for(layout: str, avg_conf: float) -> str:
+	return f"{layout}:{confidence_band(avg_conf)}"
+
+
+def _win_rates(db: Session, bucket: str) -> Dict[str, Dict[str, float]]:
+	rows = db.query(models.OcrPassStat).filter(models.OcrPassStat.bucket == bucket).all()
+	# Laplace-smoothed so a pass with 1/1 wins doesn't outrank 40/50
+	return {r.pass_name: {"runs": r.runs, "rate": (r.wins + 1) / (r.runs + 2)} for r in rows}
+
+
+def plan_passes(db: Session, avg_conf: float, layout: str, available: List[str]) -> Dict[str, Any]:
+	"""
+	Choose which extra passes to run after the image_to_data pass.
+
+	Returns:
+		{"bucket": str, "passes": [pass names], "reason": str, "explore": bool}
+	"""
+	bucket = bucket_for(layout, avg_conf)
+	band = confidence_band(avg_conf)
+
+	if EXPLORE_RATE > 0 and random.random() < EXPLORE_RATE:
+		return {"bucket": bucket, "passes": list(available), "reason": "explore", "explore": True}
+
+	budget = {"high": 0, "mid": 1, "low": 2}[band]
+	ranked = [p for p in _LAYOUT_DEFAULTS.get(layout, _LAYOUT_DEFAULTS["block"]) if p in available]
+	ranked += [p for p in available if p not in ranked]
+	reason = f"{band} confidence, {layout} layout"
+
+	try:
+		stats = _win_rates(db, bucket)
+	except Exception as e:
+		print(f"[OCR PLANNER] Could not load pass stats: {e}")
+		stats = {}
+
+	learned = {name: s for name, s in stats.items() if s["runs"] >= MIN_RUNS}
+	if learned:
+		ranked.sort(key=lambda p: -learned.get(p, {"rate": 0.0})["rate"])
+		reason += ", learned ranking"
+		data_rate = learned.get(DATA_PASS, {}).get("rate")
+		if data_rate is not None and data_rate >= 0.8 and budget > 0:
+			budget -= 1  # the data pass already wins almost always here
+		if band == "high" and ranked and learned.get(ranked[0], {}).get("rate", 0.0) >= HIGH_BAND_MIN_WIN_RATE:
+			budget = 1
+
+	return {"bucket": bucket, "passes": ranked[:budget], "reason": reason, "explore": False}
+
+
+def _ensure_rows(db: Session, bucket: str, names: List[str]) -> None:
+	"""Insert missing (bucket, pass) rows at 0; a row another session inserts first is left alone."""
+	values = [{"bucket": bucket, "pass_name": name, "runs": 0, "wins": 0} for name in names]
+	dialect = db.get_bind().dialect.name
+	if dialect in ("postgresql", "sqlite"):
+		insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+		db.execute(insert(models.OcrPassStat).values(values).on_conflict_do_nothing(index_elements=["bucket", "pass_name"]))
+		return
+	existing = {
+		name for (name,) in db.query(models.OcrPassStat.pass_name).filter(
+			models.OcrPassStat.bucket == bucket,
+			models.OcrPassStat.pass_name.in_(names),
+		)
+	}
+	for row in values:
+		if row["pass_name"] not in existing:
+			db.add(models.OcrPassStat(**row))
+	db.flush()
+
+
+def record_outcome(db: Session, bucket: str, ran: List[str], winner: Optional[str]) -> None:
+	"""Increment run counts for every pass that produced a result and the win count for the selected one."""
+	if not ran:
+		return
+	try:
+		_ensure_rows(db, bucket, ran)
+		stat = models.OcrPassStat
+		now = datetime.utcnow()
+		db.execute(
+			update(stat)
+			.where(stat.bucket == bucket, stat.pass_name.in_(ran))
+			.values(runs=stat.runs + 1, updated_at=now)
+		)
+		if winner in ran:
+			db.execute(
+				update(stat)
+				.where(stat.bucket == bucket, stat.pass_name == winner)
+				.values(wins=stat.wins + 1)
+			)
+		db.commit()
+	except Exception as e:
+		db.rollback()
+		print(f"[OCR PLANNER] Could not record outcome: {e}")
@@ -0,0 +1,148 @@
+"""
+Concurrent OCR pass execution for the dictation analyzer (routers/ocr.py).
+
+Every pass (a tesseract configuration, PaddleOCR) and every preprocessing
+step is submitted to a shared worker pool so none of it runs on the event
+loop thread. Passes run concurrently under one overall deadline; as soon as
+a finished candidate scores at or above the early-exit threshold the
+remaining passes are abandoned (queued ones are cancelled, running
+tesseract processes are bounded by their own timeout).
+
+Tesseract passes are separate tesseract processes, so worker threads only
+wait on subprocess I/O. OMP_THREAD_LIMIT defaults to 1 so concurrent passes
+don't oversubscribe the CPU with OpenMP threads.
+
+Config (env):
+- OCR_WORKERS: pool size (default: CPU count + 2, max 8; workers mostly wait on tesseract)
+- OCR_DEADLINE_SECONDS: overall time budget per image (default 20)
+- OCR_EARLY_EXIT_SCORE: candidate score (0.0-1.0) that stops waiting for other passes (default 0.9)
+"""
+import asyncio
+import contextvars
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+OCR_WORKERS = int(os.getenv("OCR_WORKERS", str(min(8, (os.cpu_count() or 1) + 2))))
+OCR_DEADLINE_SECONDS = float(os.getenv("OCR_DEADLINE_SECONDS", "20"))
+OCR_EARLY_EXIT_SCORE = float(os.getenv("OCR_EARLY_EXIT_SCORE", "0.9"))
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+	"""Process-wide OCR worker pool, created on first use."""
+	global _EXECUTOR
+	if _EXECUTOR is None:
+		with _EXECUTOR_LOCK:
+			if _EXECUTOR is None:
+				_EXECUTOR = ThreadPoolExecutor(max_workers=max(1, OCR_WORKERS), thread_name_prefix="ocr")
+	return _EXECUTOR
+
+
+class OcrPass:
+	"""
+	One OCR attempt. fn(timeout) returns the recognized text; timeout is the
+	number of seconds left in the overall deadline when the pass starts.
+	"""
+
+	def __init__(self, name: str, engine: str, fn: Callable[[float], str]):
+		self.name = name
+		self.engine = engine
+		self.fn = fn
+
+
+async def run_in_pool(fn: Callable, *args) -> Any:
+	"""Run a blocking OCR helper (deskew, preprocessing, image_to_data) on the OCR pool."""
+	loop = asyncio.get_running_loop()
+	# run_in_executor doesn't carry contextvars: copy them, so the request's metrics see the work
+	return await loop.run_in_executor(get_executor(), contextvars.copy_context().run, fn, *args)
+
+
+async def run_passes(
+	passes: List[OcrPass],
+	score: Callable[[str], float],
+	deadline_seconds: Optional[float] = None,
+	early_exit_score: Optional[float] = None,
+) -> Dict[str, Any]:
+	"""
+	Run passes concurrently and collect their candidates.
+
+	Returns:
+		{
+			"candidates": [{"text", "engine", "pass", "score", "elapsed_ms"}],  # completion order
+			"passes_total": int,
+			"passes_completed": int,
+			"completed": [pass names that finished, including empty results],
+			"passes_failed": int,
+			"early_exit": bool,
+			"timed_out": bool,
+			"elapsed_ms": int
+		}
+	"""
+	deadline_seconds = OCR_DEADLINE_SECONDS if deadline_seconds is None else deadline_seconds
+	early_exit_score = OCR_EARLY_EXIT_SCORE if early_exit_score is None else early_exit_score
+	loop = asyncio.get_running_loop()
+	executor = get_executor()
+	started = time.monotonic()
+	deadline = started + deadline_seconds
+
+	def _run(p: OcrPass) -> Dict[str, Any]:
+		t0 = time.monotonic()
+		remaining = deadline - t0
+		if remaining <= 0:
+			raise TimeoutError(f"OCR deadline reached before pass {p.name} started")
+		text = (p.fn(remaining) or "").strip()
+		return {"text": text, "engine": p.engine, "pass": p.name, "elapsed_ms": int((time.monotonic() - t0) * 1000)}
+
+	# One context copy per pass: a Context can't be entered by two threads at once
+	pending = {loop.run_in_executor(executor, contextvars.copy_context().run, _run, p) for p in passes}
+	candidates: List[Dict[str, Any]] = []
+	completed = failed = 0
+	completed_names: List[str] = []
+	early_exit = timed_out = False
+
+	while pending:
+		remaining = deadline - time.monotonic()
+		if remaining <= 0:
+			timed_out = True
+			break
+		done, pending = await asyncio.wait(pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+		if not done:
+			timed_out = True
+			break
+		for fut in done:
+			try:
+				result = fut.result()
+			except Exception:
+				failed += 1
+				continue
+			completed += 1
+			completed_names.append(result["pass"])
+			if not result["text"]:
+				continue
+			result["score"] = score(result["text"])
+			candidates.append(result)
+			if result["score"] >= early_exit_score:
+				early_exit = True
+		if early_exit:
+			break
+
+	for fut in pending:
+		fut.cancel()
+
+	return {
+		"candidates": candidates,
+		"passes_total": len(passes),
+		"passes_completed": completed,
+		"completed": completed_names,
+		"passes_failed": failed,
+		"early_exit": early_exit,
+		"timed_out": timed_out,
+		"elapsed_ms": int((time.monotonic() - started) * 1000),
+	}
@@ -0,0 +1,154 @@
+"""
+Lazily initialized optional providers (LLM clients, OCR and TTS engines).
+
+Importing openai/anthropic/the Azure speech SDK or building a PaddleOCR
+model takes from hundreds of milliseconds to seconds and a lot of memory,
+and most workers never serve the endpoint that needs it. Routers register
+a LazyProvider instead of importing at module level:
+
+	OPENAI = providers.register("openai", _load_openai, requires=("openai",), enabled=bool(OPENAI_API_KEY))
+
+- OPENAI.available: configured and installed, checked without importing
+  (importlib find_spec); what the *_AVAILABLE flags used to mean
+- OPENAI.get(): imports/builds on first call (once, thread-safe) and
+  returns the client, or None if loading failed (logged once, then the
+  provider reports unavailable)
+
+main.py's lifespan calls warmup(STARTUP_WARMUP) after startup: the named
+providers load in a background thread, so the worker answers health checks
+immediately and the first request to a warmed endpoint doesn't pay for it.
+
+Config (env):
+- STARTUP_WARMUP: comma-separated provider names to load in the background
+  after startup, or "all" for every available provider (default: none)
+"""
+import importlib.util
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+STARTUP_WARMUP = [name.strip() for name in os.getenv("STARTUP_WARMUP", "").split(",") if name.strip()]
+
+_MISSING = object()
+
+
+class LazyProvider:
+	"""An optional dependency that is imported and built on first use."""
+
+	def __init__(self, name: str, load: Callable[[], Any], requires: Tuple[str, ...] = (), enabled: bool = True):
+		self.name = name
+		self.requires = requires
+		self.enabled = enabled
+		self.load_seconds: Optional[float] = None
+		self._load = load
+		self._value: Any = _MISSING
+		self._installed: Optional[bool] = None
+		self._failed = False
+		self._lock = threading.Lock()
+
+	@property
+	def installed(self) -> bool:
+		if self._installed is None:
+			self._installed = all(_find_spec(module) for module in self.requires)
+		return self._installed
+
+	@property
+	def available(self) -> bool:
+		return self.enabled and not self._failed and self.installed
+
+	@property
+	def loaded(self) -> bool:
+		return self._value is not _MISSING
+
+	def get(self) -> Any:
+		if self._value is not _MISSING:
+			return self._value
+		if not self.available:
+			return None
+		with self._lock:
+			if self._value is _MISSING and not self._failed:
+				start = time.perf_counter()
+				try:
+					self._value = self._load()
+				except Exception as e:
+					self._failed = True
+					logger.warning(f"Provider {self.name} failed to load: {e}")
+					return None
+				self.load_seconds = time.perf_counter() - start
+				logger.info(f"Provider {self.name} loaded in {self.load_seconds * 1000:.0f}ms")
+		return None if self._value is _MISSING else self._value
+
+
+def _find_spec(module: str) -> bool:
+	try:
+		return importlib.util.find_spec(module) is not None
+	except (ImportError, ValueError):
+		return False
+
+
+_PROVIDERS: Dict[str, LazyProvider] = {}
+
+
+def register(name: str, load: Callable[[], Any], requires: Tuple[str, ...] = (), enabled: bool = True) -> LazyProvider:
+	"""Create (or return the already registered) provider called name."""
+	if name not in _PROVIDERS:
+		_PROVIDERS[name] = LazyProvider(name, load, requires, enabled)
+	return _PROVIDERS[name]
+
+
+def status() -> List[Dict[str, Any]]:
+	return [
+		{
+			"name": p.name,
+			"enabled": p.enabled,
+			"installed": p.installed,
+			"loaded": p.loaded,
+			"load_ms": round(p.load_seconds * 1000, 1) if p.load_seconds is not None else None,
+		}
+		for p in _PROVIDERS.values()
+	]
+
+
+def warmup(names: Iterable[str]) -> Optional[threading.Thread]:
+	"""Load the named providers ("all" = every available one) in a daemon thread; returns it (None if nothing to do)."""
+	names = list(names)
+	if "all" in names:
+		selected = [p for p in _PROVIDERS.values() if p.available]
+	else:
+		unknown = [n for n in names if n not in _PROVIDERS]
+		if unknown:
+			logger.warning(f"STARTUP_WARMUP: unknown providers {unknown} (known: {sorted(_PROVIDERS)})")
+		selected = [_PROVIDERS[n] for n in names if n in _PROVIDERS and _PROVIDERS[n].available]
+	if not selected:
+		return None
+
+	def run():
+		for provider in selected:
+			provider.get()
+
+	thread = threading.Thread(target=run, name="provider-warmup", daemon=True)
+	thread.start()
+	return thread
+
+
+# ============================================================================
+# LLM CLIENTS (shared by the OCR refiner and the advanced chatbot)
+# ============================================================================
+
+def _load_openai():
+	import openai
+	openai.api_key = os.getenv("OPENAI_API_KEY")
+	return openai
+
+
+def _load_anthropic():
+	import anthropic
+	return anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
+
+
+OPENAI = register("openai", _load_openai, requires=("openai",), enabled=bool(os.getenv("OPENAI_API_KEY")))
+ANTHROPIC = register("anthropic", _load_anthropic, requires=("anthropic",), enabled=bool(os.getenv("ANTHROPIC_API_KEY")))
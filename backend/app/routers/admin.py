@@ -1,7 +1,9 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
 from sqlalchemy.orm import Session
 from ..database import get_db
 from .. import models, schemas
+from .. import lexicon
+from .. import stats
 from passlib.context import CryptContext
 from datetime import datetime
 from typing import List, Optional
@@ -448,6 +450,37 @@ def delete_exercise(user_id: int, exercise_id: int, db: Session = Depends(get_db
 	return {"message": "Exercise deleted successfully"}
 
 
+# ============ LEXICON ============
+
+@router.post("/lexicon/rebuild")
+def rebuild_lexicon(user_id: int, db: Session = Depends(get_db)):
+	"""Recount corpus words from all enabled exercises (admin only)"""
+	verify_admin(user_id, db)
+	words = lexicon.rebuild_from_corpus(db)
+	return {"message": "Lexicon rebuilt", "corpus_words": words}
+
+
+@router.post("/lexicon/import")
+async def import_lexicon(
+	user_id: int,
+	file: UploadFile = File(...),
+	fmt: str = Form("auto"),
+	source: str = Form("import"),
+	db: Session = Depends(get_db),
+):
+	"""Import an external Albanian word list: plain, freq or hunspell .dic (admin only)"""
+	verify_admin(user_id, db)
+	if fmt not in ("auto", "plain", "freq", "hunspell"):
+		raise HTTPException(status_code=400, detail="fmt must be one of: auto, plain, freq, hunspell")
+	raw = await file.read()
+	try:
+		text = raw.decode("utf-8")
+	except UnicodeDecodeError:
+		text = raw.decode("latin-1")
+	result = lexicon.import_words(db, lexicon.parse_wordlist(text.splitlines(), fmt), source or file.filename or "import")
+	return {"message": "Word list imported", **result}
+
+
 # ============ STATISTICS ============
 
 @router.get("/stats")
@@ -455,19 +488,9 @@ def get_admin_stats(user_id: int, db: Session = Depends(get_db)):
 	"""Get admin statistics (admin only)"""
 	verify_admin(user_id, db)
 	
-	total_users = db.query(models.User).count()
-	total_classes = db.query(models.Course).filter(models.Course.parent_class_id == None).count()
-	total_courses = db.query(models.Course).filter(models.Course.parent_class_id != None).count()
-	total_levels = db.query(models.Level).count()
-	total_exercises = db.query(models.Exercise).count()
-	total_attempts = db.query(models.Attempt).count()
-	
+	snapshot = stats.get_snapshot(db)
 	return {
-		"total_users": total_users,
-		"total_classes": total_classes,
-		"total_courses": total_courses,
-		"total_levels": total_levels,
-		"total_exercises": total_exercises,
-		"total_attempts": total_attempts
+		key: snapshot[key]
+		for key in ("total_users", "total_classes", "total_courses", "total_levels", "total_exercises", "total_attempts")
 	}
 
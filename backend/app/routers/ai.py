@@ -8,6 +8,7 @@ import unicodedata
 from collections import Counter
 from ..database import get_db
 from .. import models, schemas
+from ..similarity import edit_ops, strip_diacritics
 
 
 router = APIRouter()
@@ -17,6 +18,26 @@ def _norm(s: Optional[str]) -> str:
 	return re.sub(r"\s+", " ", unicodedata.normalize("NFKC", (s or "")).strip().lower())
 
 
+def _mistake_shape(correct: str, user: str) -> Optional[str]:
+	"""
+	Align the two spellings (ë/ç folded) and report "missing" when the user only
+	dropped letters, "extra" when they only added letters, else None.
+	"""
+	diffs = edit_ops(strip_diacritics(correct), strip_diacritics(user))
+	if not diffs:
+		return None
+	kinds = {op["op"] for op in diffs}
+	if kinds == {"delete"}:
+		return "missing"
+	if kinds == {"insert"}:
+		return "extra"
+	return None
+
+
+def _collapse_double(x: str) -> str:
+	return re.sub(r"([a-zëç])\1+", r"\1", x)
+
+
 def _classify_spelling_error(correct: str, user: str) -> str:
 	c = _norm(correct)
 	u = _norm(user)
@@ -25,24 +46,19 @@ def _classify_spelling_error(correct: str, user: str) -> str:
 	if c == u:
 		return "none"
 
-	def strip_diacritics(x: str) -> str:
-		return x.replace("ë", "e").replace("ç", "c")
-
 	if strip_diacritics(c) == strip_diacritics(u) and c != u:
 		return "diacritics(ë/e, ç/c)"
 
-	if len(u) < len(c) and strip_diacritics(u) in strip_diacritics(c):
-		return "missing_letters"
-	if len(u) > len(c) and strip_diacritics(c) in strip_diacritics(u):
-		return "extra_letters"
-
 	# Double consonant noise (either direction)
-	def collapse_double(x: str) -> str:
-		return re.sub(r"([a-zëç])\\1+", r"\\1", x)
-
-	if collapse_double(c) == collapse_double(u) and c != u:
+	if _collapse_double(c) == _collapse_double(u) and c != u:
 		return "double_consonants"
 
+	shape = _mistake_shape(c, u)
+	if shape == "missing":
+		return "missing_letters"
+	if shape == "extra":
+		return "extra_letters"
+
 	return "substitution"
 
 
@@ -120,7 +136,7 @@ def ai_coach(request: schemas.AICoachRequest, db: Session = Depends(get_db)):
 
 
 @router.get("/ai/recommendations/{user_id}")
-def get_ai_recommendations(user_id: str, db: Session = Depends(get_db)):
+def get_ai_recommendations(user_id: int, db: Session = Depends(get_db)):
 	"""Get AI-powered exercise recommendations based on user performance"""
 	
 	# Get user's performance data
@@ -203,7 +219,7 @@ def get_ai_recommendations(user_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/ai/adaptive-difficulty/{user_id}")
-def get_adaptive_difficulty(user_id: str, db: Session = Depends(get_db)):
+def get_adaptive_difficulty(user_id: int, db: Session = Depends(get_db)):
 	"""Get adaptive difficulty settings based on user performance"""
 	
 	# Get recent performance (last 20 attempts)
@@ -244,7 +260,7 @@ def get_adaptive_difficulty(user_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/ai/learning-path/{user_id}")
-def get_learning_path(user_id: str, db: Session = Depends(get_db)):
+def get_learning_path(user_id: int, db: Session = Depends(get_db)):
 	"""Get personalized learning path based on user's learning style and performance"""
 	
 	# Analyze learning patterns
@@ -301,7 +317,7 @@ def get_learning_path(user_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/ai/smart-hints/{exercise_id}/{user_id}")
-def get_smart_hints(exercise_id: int, user_id: str, db: Session = Depends(get_db)):
+def get_smart_hints(exercise_id: int, user_id: int, db: Session = Depends(get_db)):
 	"""Get smart hints based on user's previous mistakes and learning patterns"""
 	
 	exercise = db.get(models.Exercise, exercise_id)
@@ -357,7 +373,7 @@ def get_smart_hints(exercise_id: int, user_id: str, db: Session = Depends(get_db
 
 
 @router.get("/ai/progress-insights/{user_id}")
-def get_progress_insights(user_id: str, db: Session = Depends(get_db)):
+def get_progress_insights(user_id: int, db: Session = Depends(get_db)):
 	"""Get AI-generated insights about user's learning progress"""
 	
 	# Get comprehensive user data
@@ -631,18 +647,16 @@ def _analyze_mistake(term: str, attempt_response: Optional[str]) -> dict:
 	if not r:
 		return {"type": "none", "hint": None}
 
-	def normalize_diacritics(s: str) -> str:
-		return s.replace("ë", "e").replace("ç", "c")
-
-	if normalize_diacritics(t) == normalize_diacritics(r) and t != r:
+	if strip_diacritics(t) == strip_diacritics(r) and t != r:
 		return {
 			"type": "diacritics",
 			"hint": f"Fokusi: dallimi i shkronjave të veçanta (p.sh. ë/e, ç/c). Ke shkruar \"{attempt_response}\"."
 		}
 
-	if len(r) < len(t) and normalize_diacritics(r) in normalize_diacritics(t):
+	shape = _mistake_shape(t, r)
+	if shape == "missing":
 		return {"type": "missing", "hint": f"Fokusi: mungesë shkronjash. Ke shkruar \"{attempt_response}\"."}
-	if len(r) > len(t) and normalize_diacritics(t) in normalize_diacritics(r):
+	if shape == "extra":
 		return {"type": "extra", "hint": f"Fokusi: shkronja shtesë. Ke shkruar \"{attempt_response}\"."}
 
 	return {"type": "substitution", "hint": _describe_mistake(term, attempt_response)}
@@ -735,10 +749,12 @@ def _describe_mistake(term: str, attempt_response: Optional[str]) -> Optional[st
 		return None
 	term_clean = term.strip().lower()
 	response_clean = attempt_response.strip().lower()
-	for idx, (t_char, r_char) in enumerate(zip(term_clean, response_clean)):
-		if t_char != r_char:
+	# Align instead of comparing position by position, so one missing or extra
+	# letter doesn't shift the reported position
+	for op in edit_ops(term_clean, response_clean):
+		if op["op"] == "substitute":
 			return (
-				f"Ke shkruar \"{attempt_response}\" në vend të \"{term}\" (qëndro te shkronja #{idx + 1}: '{t_char}'). "
+				f"Ke shkruar \"{attempt_response}\" në vend të \"{term}\" (qëndro te shkronja #{op['a_index'] + 1}: '{op['a']}'). "
 				"Shiko kujdesin me ë/e apo ç/çh për të mos përsëritur gabimin."
 			)
 	if len(response_clean) != len(term_clean):
@@ -1,15 +1,17 @@
-from fastapi import APIRouter, HTTPException, UploadFile, File
+from fastapi import APIRouter, HTTPException, UploadFile, File, Form
 from fastapi.responses import FileResponse
+from starlette.concurrency import run_in_threadpool
 import os
+import asyncio
 import tempfile
 import subprocess
-from gtts import gTTS
-import speech_recognition as sr
-from pydub import AudioSegment
 import uuid
 import json
 import time
-from typing import Optional, Literal
+from typing import List, Optional, Literal
+from .. import metrics, providers
+from ..speech import STT_BATCH_MAX_CLIPS, read_upload, decode_to_pcm, get_recognizer
+from ..similarity import similarity_ratio, fold_albanian, graphemes, edit_ops
 
 router = APIRouter()
 
@@ -21,12 +23,23 @@ os.makedirs(TEMP_AUDIO_DIR, exist_ok=True)
 AZURE_SPEECH_KEY = os.getenv("AZURE_SPEECH_KEY")
 AZURE_SPEECH_REGION = os.getenv("AZURE_SPEECH_REGION", "westeurope")
 
-try:
+
+def _load_azure_speech():
 	import azure.cognitiveservices.speech as speechsdk
-	AZURE_AVAILABLE = bool(AZURE_SPEECH_KEY)
-except ImportError:
-	AZURE_AVAILABLE = False
-	speechsdk = None
+	return speechsdk
+
+
+def _load_gtts():
+	from gtts import gTTS
+	return gTTS
+
+
+# TTS engines are imported on first use (app/providers.py)
+_AZURE_SPEECH = providers.register(
+	"azure_speech", _load_azure_speech, requires=("azure.cognitiveservices.speech",), enabled=bool(AZURE_SPEECH_KEY)
+)
+_GTTS = providers.register("gtts", _load_gtts, requires=("gtts",))
+AZURE_AVAILABLE = _AZURE_SPEECH.available
 
 
 def _generate_speech_azure(
@@ -53,7 +66,8 @@ def _generate_speech_azure(
 	Returns:
 		Path to generated audio file
 	"""
-	if not AZURE_AVAILABLE or not AZURE_SPEECH_KEY:
+	speechsdk = _AZURE_SPEECH.get()
+	if speechsdk is None:
 		raise ValueError("Azure TTS not configured")
 	
 	speech_config = speechsdk.SpeechConfig(subscription=AZURE_SPEECH_KEY, region=AZURE_SPEECH_REGION)
@@ -75,7 +89,8 @@ def _generate_speech_azure(
 	audio_config = speechsdk.audio.AudioOutputConfig(filename=output_path)
 	synthesizer = speechsdk.SpeechSynthesizer(speech_config=speech_config, audio_config=audio_config)
 	
-	result = synthesizer.speak_ssml_async(ssml).get()
+	with metrics.external("azure_tts"):
+		result = synthesizer.speak_ssml_async(ssml).get()
 	
 	if result.reason != speechsdk.ResultReason.SynthesizingAudioCompleted:
 		raise Exception(f"Azure TTS failed: {result.reason}")
@@ -98,8 +113,12 @@ def _generate_speech_gtts(text: str, slow: bool = False, output_path: str = None
 	if not output_path:
 		output_path = os.path.join(TEMP_AUDIO_DIR, f"gtts_{uuid.uuid4()}.mp3")
 	
+	gTTS = _GTTS.get()
+	if gTTS is None:
+		raise RuntimeError("gTTS is not installed")
 	tts = gTTS(text=text, lang="sq", slow=slow)
-	tts.save(output_path)
+	with metrics.external("gtts"):
+		tts.save(output_path)
 	
 	return output_path
 
@@ -167,54 +186,35 @@ async def text_to_speech(
 		raise HTTPException(status_code=500, detail=f"Text-to-speech failed: {str(e)}")
 
 
+async def _recognize(audio_file: UploadFile, language: str, hint: Optional[str] = None) -> dict:
+	"""Stream, decode and transcribe one upload with the configured STT backend."""
+	buffer = await read_upload(audio_file)
+	pcm = await run_in_threadpool(decode_to_pcm, buffer)
+	recognizer = get_recognizer()
+	return await run_in_threadpool(recognizer.transcribe, pcm, language, hint)
+
+
 @router.post("/speech-to-text")
 async def speech_to_text(audio_file: UploadFile = File(...), language: str = "sq-AL"):
 	"""
-	Convert speech to text using Google Speech Recognition
+	Convert speech to text with the configured recognizer (STT_BACKEND: google, vosk, stub)
 	Language codes: 'sq-AL' for Albanian, 'en-US' for English
+
+	The upload is streamed into memory, decoded and resampled to 16 kHz mono
+	PCM there, and fed to the recognizer without temp files.
 	"""
+	import speech_recognition as sr
 	try:
-		# Save uploaded file temporarily
-		temp_filename = f"stt_{uuid.uuid4()}.wav"
-		temp_filepath = os.path.join(TEMP_AUDIO_DIR, temp_filename)
-		
-		with open(temp_filepath, "wb") as buffer:
-			buffer.write(await audio_file.read())
-		
-		# Convert to proper format if needed
-		audio = AudioSegment.from_file(temp_filepath)
-		audio = audio.set_frame_rate(16000).set_channels(1)
-		audio.export(temp_filepath, format="wav")
-		
-		# Initialize recognizer
-		recognizer = sr.Recognizer()
-		
-		# Load audio file
-		with sr.AudioFile(temp_filepath) as source:
-			audio_data = recognizer.record(source)
-		
-		# Recognize speech
-		text = recognizer.recognize_google(audio_data, language=language)
-		
-		# Clean up temp files
-		os.remove(temp_filepath)
-		
-		return {
-			"text": text,
-			"confidence": 0.9,  # Google doesn't provide confidence for free tier
-			"language": language
-		}
-		
+		return await _recognize(audio_file, language)
+
+	except HTTPException:
+		raise
 	except sr.UnknownValueError:
 		raise HTTPException(status_code=400, detail="Could not understand audio")
 	except sr.RequestError as e:
 		raise HTTPException(status_code=500, detail=f"Speech recognition service error: {str(e)}")
 	except Exception as e:
 		raise HTTPException(status_code=500, detail=f"Speech-to-text failed: {str(e)}")
-	finally:
-		# Clean up temp files
-		if 'temp_filepath' in locals() and os.path.exists(temp_filepath):
-			os.remove(temp_filepath)
 
 
 @router.post("/pronunciation-check")
@@ -226,9 +226,10 @@ async def pronunciation_check(
 	"""
 	Check pronunciation by comparing spoken text with target text
 	"""
+	import speech_recognition as sr
 	try:
 		# Convert speech to text
-		recognized_text = await speech_to_text(audio_file, language)
+		recognized_text = await _recognize(audio_file, language, hint=target_text)
 		
 		# Simple similarity check (can be enhanced with more sophisticated algorithms)
 		similarity = calculate_similarity(recognized_text["text"], target_text)
@@ -238,15 +239,90 @@ async def pronunciation_check(
 			"target_text": target_text,
 			"similarity_score": similarity,
 			"is_correct": similarity > 0.7,
-			"feedback": get_pronunciation_feedback(similarity, recognized_text["text"], target_text)
+			"feedback": get_pronunciation_feedback(similarity, recognized_text["text"], target_text),
+			"recognition_confidence": recognized_text["confidence"],
+			"words": recognized_text["words"],
+			"recognizer": recognized_text["backend"]
 		}
 		
+	except HTTPException:
+		raise
+	except sr.UnknownValueError:
+		raise HTTPException(status_code=400, detail="Could not understand audio")
 	except Exception as e:
 		raise HTTPException(status_code=500, detail=f"Pronunciation check failed: {str(e)}")
 
 
+@router.post("/pronunciation-check/batch")
+async def pronunciation_check_batch(
+	audio_files: List[UploadFile] = File(...),
+	target_texts: List[str] = Form(...),
+	language: str = Form("sq-AL"),
+	albanian: bool = Form(True)
+):
+	"""
+	Score many clips in one request (e.g. a whole word list).
+	target_texts[i] is the expected text for audio_files[i]. Clips are decoded
+	concurrently and transcribed with the backend's batch mode; a clip that
+	fails is reported in its own result instead of failing the batch.
+	"""
+	if len(audio_files) != len(target_texts):
+		raise HTTPException(status_code=400, detail="audio_files and target_texts must have the same length")
+	if len(audio_files) > STT_BATCH_MAX_CLIPS:
+		raise HTTPException(status_code=413, detail=f"Too many clips (max {STT_BATCH_MAX_CLIPS})")
+
+	async def _decode(upload: UploadFile):
+		# An empty or oversized clip (400/413 from read_upload) fails only its own result
+		return await run_in_threadpool(decode_to_pcm, await read_upload(upload))
+
+	clips = await asyncio.gather(*(_decode(f) for f in audio_files), return_exceptions=True)
+
+	decoded = [(i, c) for i, c in enumerate(clips) if not isinstance(c, Exception)]
+	recognizer = get_recognizer()
+	transcriptions = await run_in_threadpool(
+		recognizer.transcribe_batch,
+		[c for _, c in decoded],
+		language,
+		[target_texts[i] for i, _ in decoded],
+	)
+	by_index = dict(zip((i for i, _ in decoded), transcriptions))
+
+	import speech_recognition as sr
+	results = []
+	for i, target_text in enumerate(target_texts):
+		item = by_index.get(i, clips[i])
+		if isinstance(item, HTTPException):
+			results.append({"index": i, "target_text": target_text, "error": item.detail, "status_code": item.status_code})
+			continue
+		if isinstance(item, Exception):
+			error = "Could not understand audio" if isinstance(item, sr.UnknownValueError) else str(item)
+			results.append({"index": i, "target_text": target_text, "error": error})
+			continue
+		if albanian:
+			similarity = calculate_albanian_similarity(item["text"], target_text)
+			feedback = get_albanian_feedback(similarity, item["text"], target_text)
+			is_correct = similarity > 0.8
+		else:
+			similarity = calculate_similarity(item["text"], target_text)
+			feedback = get_pronunciation_feedback(similarity, item["text"], target_text)
+			is_correct = similarity > 0.7
+		results.append({
+			"index": i,
+			"spoken_text": item["text"],
+			"target_text": target_text,
+			"similarity_score": similarity,
+			"is_correct": is_correct,
+			"score": get_albanian_score(similarity) if albanian else None,
+			"feedback": feedback,
+			"recognition_confidence": item["confidence"],
+			"words": item["words"],
+		})
+
+	return {"recognizer": recognizer.name, "results": results}
+
+
 def calculate_similarity(text1: str, text2: str) -> float:
-	"""Calculate similarity between two texts"""
+	"""Calculate similarity between two texts (1 - word error rate)"""
 	if not text1 or not text2:
 		return 0.0
 	
@@ -254,17 +330,14 @@ def calculate_similarity(text1: str, text2: str) -> float:
 	text1_clean = ''.join(c.lower() for c in text1 if c.isalnum() or c.isspace())
 	text2_clean = ''.join(c.lower() for c in text2 if c.isalnum() or c.isspace())
 	
-	# Simple word-based similarity
-	words1 = set(text1_clean.split())
-	words2 = set(text2_clean.split())
+	# Word-level edit distance: order-aware and counts repeated words
+	words1 = text1_clean.split()
+	words2 = text2_clean.split()
 	
 	if not words1 or not words2:
 		return 0.0
 	
-	intersection = words1.intersection(words2)
-	union = words1.union(words2)
-	
-	return len(intersection) / len(union) if union else 0.0
+	return similarity_ratio(words1, words2)
 
 
 def get_pronunciation_feedback(similarity: float, spoken: str, target: str) -> str:
@@ -424,6 +497,7 @@ async def albanian_pronunciation_check(
 	Specialized pronunciation check for Albanian corpus exercises
 	Includes Albanian-specific phonetic considerations
 	"""
+	import speech_recognition as sr
 	try:
 		from ..database import get_db
 		from .. import models
@@ -436,7 +510,7 @@ async def albanian_pronunciation_check(
 				target_text = exercise.answer
 		
 		# Convert speech to text with Albanian language model
-		recognized_text = await speech_to_text(audio_file, "sq-AL")
+		recognized_text = await _recognize(audio_file, "sq-AL", hint=target_text)
 		
 		# Enhanced similarity check for Albanian
 		similarity = calculate_albanian_similarity(recognized_text["text"], target_text)
@@ -452,9 +526,16 @@ async def albanian_pronunciation_check(
 			"is_correct": is_correct,
 			"score": score,
 			"feedback": get_albanian_feedback(similarity, recognized_text["text"], target_text),
-			"pronunciation_tips": get_albanian_pronunciation_tips(recognized_text["text"], target_text)
+			"pronunciation_tips": get_albanian_pronunciation_tips(recognized_text["text"], target_text),
+			"recognition_confidence": recognized_text["confidence"],
+			"words": recognized_text["words"],
+			"recognizer": recognized_text["backend"]
 		}
 		
+	except HTTPException:
+		raise
+	except sr.UnknownValueError:
+		raise HTTPException(status_code=400, detail="Could not understand audio")
 	except Exception as e:
 		raise HTTPException(status_code=500, detail=f"Albanian pronunciation check failed: {str(e)}")
 
@@ -464,16 +545,9 @@ def calculate_albanian_similarity(text1: str, text2: str) -> float:
 	if not text1 or not text2:
 		return 0.0
 	
-	# Albanian-specific character normalization
-	albanian_chars = {
-		'ë': 'e', 'ç': 'c', 'rr': 'r', 'll': 'l', 'nj': 'n', 'gj': 'g', 
-		'dh': 'd', 'th': 't', 'sh': 's', 'zh': 'z', 'xh': 'x'
-	}
-	
+	# Albanian-specific normalization (ë/ç and digraphs folded, see similarity.fold_albanian)
 	def normalize_albanian(text):
-		text = text.lower().strip()
-		for alb_char, replacement in albanian_chars.items():
-			text = text.replace(alb_char, replacement)
+		text = fold_albanian(text.strip())
 		return ''.join(c for c in text if c.isalnum() or c.isspace())
 	
 	text1_norm = normalize_albanian(text1)
@@ -487,33 +561,22 @@ def calculate_albanian_similarity(text1: str, text2: str) -> float:
 	if len(text2_norm.split()) == 1:
 		return character_similarity(text1_norm, text2_norm)
 	
-	# Word-level similarity for sentences
-	words1 = set(text1_norm.split())
-	words2 = set(text2_norm.split())
+	# Word-level similarity for sentences (1 - word error rate)
+	words1 = text1_norm.split()
+	words2 = text2_norm.split()
 	
 	if not words1 or not words2:
 		return 0.0
 	
-	intersection = words1.intersection(words2)
-	union = words1.union(words2)
-	
-	return len(intersection) / len(union) if union else 0.0
+	return similarity_ratio(words1, words2)
 
 
 def character_similarity(text1: str, text2: str) -> float:
-	"""Calculate character-level similarity"""
+	"""Calculate character-level similarity (1 - normalized Levenshtein distance)"""
 	if not text1 or not text2:
 		return 0.0
 	
-	# Levenshtein distance approximation
-	if len(text1) == len(text2):
-		matches = sum(c1 == c2 for c1, c2 in zip(text1, text2))
-		return matches / len(text1)
-	
-	# For different lengths, use a simple approach
-	shorter, longer = (text1, text2) if len(text1) < len(text2) else (text2, text1)
-	matches = sum(c in longer for c in shorter)
-	return matches / len(longer)
+	return similarity_ratio(text1, text2)
 
 
 def get_albanian_score(similarity: float) -> int:
@@ -549,20 +612,22 @@ def get_albanian_pronunciation_tips(spoken: str, target: str) -> list:
 	if not spoken or not target:
 		return ["Dëgjo me kujdes fjalën dhe provo të flasësh qartë."]
 	
-	spoken_lower = spoken.lower()
-	target_lower = target.lower()
+	# Align letter by letter (digraphs such as 'rr'/'ll' count as one letter)
+	# and only give tips for letters that were actually mispronounced
+	diffs = edit_ops(graphemes(target), graphemes(spoken))
+	missed = {op["a"] for op in diffs if op["op"] in ("substitute", "delete")}
 	
 	# Check for common Albanian pronunciation issues
-	if 'ë' in target_lower and 'e' in spoken_lower:
+	if 'ë' in missed:
 		tips.append("💡 Kujdes me shkronjën 'ë' - shqiptohet si 'uh' në anglisht.")
 	
-	if 'rr' in target_lower and 'r' in spoken_lower:
+	if 'rr' in missed:
 		tips.append("💡 Shkronja 'rr' duhet të jetë më e fortë se 'r' e thjeshtë.")
 	
-	if 'ç' in target_lower and 'c' in spoken_lower:
+	if 'ç' in missed:
 		tips.append("💡 Shkronja 'ç' shqiptohet si 'ch' në anglisht.")
 	
-	if 'll' in target_lower and 'l' in spoken_lower:
+	if 'll' in missed:
 		tips.append("💡 Shkronja 'll' ka një tingull të veçantë shqip.")
 	
 	if not tips:
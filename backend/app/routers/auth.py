@@ -1,6 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
 from ..database import get_db
 from .. import models, schemas
@@ -38,101 +37,34 @@ def register(user_data: schemas.UserCreate, db: Session = Depends(get_db)):
 	# Hash password
 	hashed_password = pwd_context.hash(user_data.password)
 	
-	# Create user with retry logic for sequence issues
-	max_retries = 2
-	for attempt in range(max_retries):
-		try:
-			db_user = models.User(
-				username=user_data.username.strip(),
-				email=user_data.email.strip(),
-				age=user_data.age,
-				password_hash=hashed_password,
-				created_at=datetime.utcnow()
-			)
-			
-			db.add(db_user)
-			db.commit()
-			db.refresh(db_user)
-			
-			return schemas.AuthResponse(
-				user_id=db_user.id,
-				username=db_user.username,
-				message="Registration successful! Please log in to continue.",
-				is_admin=db_user.is_admin
-			)
-			
-		except IntegrityError as e:
-			# Rollback before handling error
-			db.rollback()
-			
-			error_str = str(e.orig) if hasattr(e, 'orig') else str(e)
-			
-			# Check if it's a username/email unique constraint violation
-			if "users_username_key" in error_str or "unique constraint" in error_str.lower() and "username" in error_str.lower():
-				raise HTTPException(status_code=400, detail="Username already registered")
-			if "users_email_key" in error_str or "unique constraint" in error_str.lower() and "email" in error_str.lower():
-				raise HTTPException(status_code=400, detail="Email already registered")
-			
-			# Check if it's a sequence issue (duplicate key on primary key)
-			is_sequence_error = (
-				"duplicate key value violates unique constraint" in error_str and 
-				"users_pkey" in error_str
-			)
-			
-			if is_sequence_error and attempt < max_retries - 1:
-				# Try to fix the sequence and retry
-				try:
-					result = db.execute(text("SELECT COALESCE(MAX(id), 0) FROM users"))
-					max_id = result.scalar()
-					db.execute(text(f"SELECT setval('users_id_seq', {max_id + 1}, false)"))
-					db.commit()
-					print(f"[FIXED] Reset users_id_seq to {max_id + 1}, retrying registration...")
-					continue  # Retry the user creation
-				except Exception as seq_error:
-					print(f"[ERROR] Failed to fix sequence: {seq_error}")
-					import traceback
-					traceback.print_exc()
-					raise HTTPException(status_code=500, detail="Registration failed: Database sequence error. Please contact support.")
-			else:
-				# Other IntegrityError - log and raise
-				print(f"[ERROR] IntegrityError during registration: {error_str}")
-				import traceback
-				traceback.print_exc()
-				raise HTTPException(status_code=400, detail=f"Registration failed: {error_str}")
-		except Exception as e:
-			# Rollback before handling error
-			db.rollback()
-			
-			error_str = str(e)
-			# Check if it's a sequence issue (duplicate key on primary key)
-			is_sequence_error = (
-				"duplicate key value violates unique constraint" in error_str and 
-				"users_pkey" in error_str
-			)
-			
-			if is_sequence_error and attempt < max_retries - 1:
-				# Try to fix the sequence and retry
-				try:
-					result = db.execute(text("SELECT COALESCE(MAX(id), 0) FROM users"))
-					max_id = result.scalar()
-					db.execute(text(f"SELECT setval('users_id_seq', {max_id + 1}, false)"))
-					db.commit()
-					print(f"[FIXED] Reset users_id_seq to {max_id + 1}, retrying registration...")
-					continue  # Retry the user creation
-				except Exception as seq_error:
-					print(f"[ERROR] Failed to fix sequence: {seq_error}")
-					import traceback
-					traceback.print_exc()
-					raise HTTPException(status_code=500, detail="Registration failed: Database sequence error. Please contact support.")
-			else:
-				# Other errors - raise immediately
-				print(f"[ERROR] Registration error: {e}")
-				import traceback
-				traceback.print_exc()
-				raise HTTPException(status_code=500, detail=f"Registration failed: {str(e)}")
+	db_user = models.User(
+		username=user_data.username.strip(),
+		email=user_data.email.strip(),
+		age=user_data.age,
+		password_hash=hashed_password,
+		created_at=datetime.utcnow()
+	)
+	db.add(db_user)
+	try:
+		db.commit()
+	except IntegrityError as e:
+		# A concurrent registration took the username/email between the checks above and the insert
+		db.rollback()
+		error_str = str(e.orig) if hasattr(e, 'orig') else str(e)
+		if "username" in error_str.lower():
+			raise HTTPException(status_code=400, detail="Username already registered")
+		if "email" in error_str.lower():
+			raise HTTPException(status_code=400, detail="Email already registered")
+		print(f"[ERROR] IntegrityError during registration: {error_str}")
+		raise HTTPException(status_code=400, detail=f"Registration failed: {error_str}")
+	db.refresh(db_user)
 	
-	# Should never reach here, but just in case
-	raise HTTPException(status_code=500, detail="Registration failed: Unexpected error")
+	return schemas.AuthResponse(
+		user_id=db_user.id,
+		username=db_user.username,
+		message="Registration successful! Please log in to continue.",
+		is_admin=db_user.is_admin
+	)
 
 
 @router.post("/login", response_model=schemas.AuthResponse)
@@ -233,90 +165,3 @@ def update_user_preferences(
 	
 	db.commit()
 	return {"message": "Preferences updated successfully"}
-
-
-@router.post("/fix-users-sequence")
-def fix_users_sequence(db: Session = Depends(get_db)):
-	"""Fix PostgreSQL sequence for users table - admin utility"""
-	try:
-		result = db.execute(text("SELECT COALESCE(MAX(id), 0) FROM users"))
-		max_id = result.scalar()
-		
-		result = db.execute(text("SELECT last_value FROM users_id_seq"))
-		current_seq = result.scalar()
-		
-		if max_id >= current_seq:
-			new_seq_value = max_id + 1
-			db.execute(text(f"SELECT setval('users_id_seq', {new_seq_value}, false)"))
-			db.commit()
-			return {
-				"message": "Sequence fixed successfully",
-				"max_id": max_id,
-				"old_sequence": current_seq,
-				"new_sequence": new_seq_value
-			}
-		else:
-			return {
-				"message": "Sequence is already correct",
-				"max_id": max_id,
-				"current_sequence": current_seq
-			}
-	except Exception as e:
-		db.rollback()
-		raise HTTPException(status_code=500, detail=f"Failed to fix sequence: {str(e)}")
-
-
-@router.post("/fix-all-sequences")
-def fix_all_sequences(db: Session = Depends(get_db)):
-	"""Fix PostgreSQL sequences for all tables - admin utility"""
-	tables = [
-		"users", "courses", "levels", "exercises", 
-		"attempts", "progress", "course_progress",
-		"achievements", "user_achievements", "daily_challenges",
-		"user_daily_progress", "srs_cards", "chat_sessions", "chat_messages"
-	]
-	
-	results = {}
-	
-	for table_name in tables:
-		try:
-			# Get max ID
-			result = db.execute(text(f"SELECT COALESCE(MAX(id), 0) FROM {table_name}"))
-			max_id = result.scalar()
-			
-			# Get current sequence value
-			try:
-				result = db.execute(text(f"SELECT last_value FROM {table_name}_id_seq"))
-				current_seq = result.scalar()
-			except:
-				# Sequence might not exist yet
-				current_seq = 0
-			
-			if max_id >= current_seq:
-				new_seq_value = max_id + 1
-				db.execute(text(f"SELECT setval('{table_name}_id_seq', {new_seq_value}, false)"))
-				results[table_name] = {
-					"status": "fixed",
-					"max_id": max_id,
-					"old_sequence": current_seq,
-					"new_sequence": new_seq_value
-				}
-			else:
-				results[table_name] = {
-					"status": "ok",
-					"max_id": max_id,
-					"current_sequence": current_seq
-				}
-		except Exception as e:
-			results[table_name] = {
-				"status": "error",
-				"error": str(e)
-			}
-	
-	db.commit()
-	return {
-		"message": "Sequence check completed",
-		"results": results
-	}
-
-
@@ -95,7 +95,7 @@ PLATFORM_KNOWLEDGE = {
 
 class ChatMessage(BaseModel):
     message: str
-    user_id: Optional[str] = None
+    user_id: Optional[int] = None
     context: Optional[Dict[str, Any]] = None
 
 
@@ -154,7 +154,7 @@ def _match_faq(query: str) -> Optional[Dict[str, Any]]:
     return None
 
 
-def _get_contextual_response(query: str, user_id: Optional[str], db: Optional[Session]) -> Dict[str, Any]:
+def _get_contextual_response(query: str, user_id: Optional[int], db: Optional[Session]) -> Dict[str, Any]:
     """Generate contextual response based on query and user data"""
     query_norm = _normalize_query(query)
     
@@ -212,7 +212,7 @@ def _get_contextual_response(query: str, user_id: Optional[str], db: Optional[Se
     # User-specific responses if logged in
     if user_id and db:
         try:
-            user = db.query(models.User).filter(models.User.id == int(user_id)).first()
+            user = db.query(models.User).filter(models.User.id == user_id).first()
             if user:
                 progress_count = db.query(models.Progress).filter(models.Progress.user_id == user_id).count()
                 
@@ -16,36 +16,19 @@ import os
 import json
 import uuid
 import time
-from ..database import get_db
-from .. import models
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from ..database import get_db, get_async_db
+from .. import metrics, models, providers
 
 router = APIRouter()
 
 # LLM Configuration
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
 USE_LLM = os.getenv("USE_LLM", "false").lower() == "true"
 
-# Try to import LLM libraries
-try:
-    import openai
-    if OPENAI_API_KEY:
-        openai.api_key = OPENAI_API_KEY
-        OPENAI_AVAILABLE = True
-    else:
-        OPENAI_AVAILABLE = False
-except ImportError:
-    OPENAI_AVAILABLE = False
-
-try:
-    import anthropic
-    if ANTHROPIC_API_KEY:
-        ANTHROPIC_CLIENT = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY)
-        ANTHROPIC_AVAILABLE = True
-    else:
-        ANTHROPIC_AVAILABLE = False
-except ImportError:
-    ANTHROPIC_AVAILABLE = False
+# LLM clients are imported on first use (app/providers.py)
+OPENAI_AVAILABLE = providers.OPENAI.available
+ANTHROPIC_AVAILABLE = providers.ANTHROPIC.available
 
 
 # ============================================================================
@@ -54,7 +37,7 @@ except ImportError:
 
 class AdvancedChatRequest(BaseModel):
     message: str
-    user_id: Optional[str] = None
+    user_id: Optional[int] = None
     session_token: Optional[str] = None
     use_llm: bool = False
     generate_exercise: bool = False
@@ -136,15 +119,17 @@ def _build_rag_context(query: str, db: Session) -> str:
 
 def _call_openai(messages: List[Dict[str, str]], temperature: float = 0.7) -> tuple[str, int]:
     """Call OpenAI API"""
-    if not OPENAI_AVAILABLE:
+    openai = providers.OPENAI.get()
+    if openai is None:
         raise ValueError("OpenAI not available")
     
-    response = openai.ChatCompletion.create(
-        model="gpt-4-turbo-preview",
-        messages=messages,
-        temperature=temperature,
-        max_tokens=800
-    )
+    with metrics.external("openai"):
+        response = openai.ChatCompletion.create(
+            model="gpt-4-turbo-preview",
+            messages=messages,
+            temperature=temperature,
+            max_tokens=800
+        )
     
     content = response.choices[0].message.content
     tokens = response.usage.total_tokens
@@ -154,20 +139,22 @@ def _call_openai(messages: List[Dict[str, str]], temperature: float = 0.7) -> tu
 
 def _call_anthropic(messages: List[Dict[str, str]], temperature: float = 0.7) -> tuple[str, int]:
     """Call Anthropic Claude API"""
-    if not ANTHROPIC_AVAILABLE:
+    client = providers.ANTHROPIC.get()
+    if client is None:
         raise ValueError("Anthropic not available")
     
     # Convert messages format
     system_msg = next((m["content"] for m in messages if m["role"] == "system"), None)
     user_messages = [m for m in messages if m["role"] != "system"]
     
-    response = ANTHROPIC_CLIENT.messages.create(
-        model="claude-3-sonnet-20240229",
-        max_tokens=800,
-        temperature=temperature,
-        system=system_msg or "Ti je një asistent mësimor për gjuhën shqipe.",
-        messages=user_messages
-    )
+    with metrics.external("anthropic"):
+        response = client.messages.create(
+            model="claude-3-sonnet-20240229",
+            max_tokens=800,
+            temperature=temperature,
+            system=system_msg or "Ti je një asistent mësimor për gjuhën shqipe.",
+            messages=user_messages
+        )
     
     content = response.content[0].text
     tokens = response.usage.input_tokens + response.usage.output_tokens
@@ -263,15 +250,16 @@ Sigurohu që ushtrimi të jetë i përshtatshëm për fëmijë dhe të fokusohet
 
     try:
         if OPENAI_AVAILABLE:
-            response = openai.ChatCompletion.create(
-                model="gpt-4-turbo-preview",
-                messages=[
-                    {"role": "system", "content": "Ti je një gjenerues ushtrimesh për mësimin e gjuhës shqipe."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.8,
-                max_tokens=400
-            )
+            with metrics.external("openai"):
+                response = providers.OPENAI.get().ChatCompletion.create(
+                    model="gpt-4-turbo-preview",
+                    messages=[
+                        {"role": "system", "content": "Ti je një gjenerues ushtrimesh për mësimin e gjuhës shqipe."},
+                        {"role": "user", "content": prompt}
+                    ],
+                    temperature=0.8,
+                    max_tokens=400
+                )
             
             content = response.choices[0].message.content
             # Extract JSON
@@ -291,7 +279,7 @@ Sigurohu që ushtrimi të jetë i përshtatshëm për fëmijë dhe të fokusohet
 # ============================================================================
 
 def _get_or_create_session(
-    user_id: Optional[str],
+    user_id: Optional[int],
     session_token: Optional[str],
     db: Session
 ) -> models.ChatSession:
@@ -340,7 +328,7 @@ def _get_conversation_history(session: models.ChatSession, db: Session) -> List[
 # ============================================================================
 
 @router.post("/chatbot/advanced/ask", response_model=AdvancedChatResponse)
-async def advanced_chatbot_ask(request: AdvancedChatRequest, db: Session = Depends(get_db)):
+async def advanced_chatbot_ask(request: AdvancedChatRequest, db: AsyncSession = Depends(get_async_db)):
     """
     Advanced AI Chatbot with LLM, RAG, conversation history, and exercise generation.
     
@@ -356,32 +344,40 @@ async def advanced_chatbot_ask(request: AdvancedChatRequest, db: Session = Depen
     if not request.message or len(request.message.strip()) < 2:
         raise HTTPException(status_code=400, detail="Mesazhi është shumë i shkurtër")
     
-    # Get or create session
-    session = _get_or_create_session(request.user_id, request.session_token, db)
-    
-    # Get conversation history
-    conversation_history = _get_conversation_history(session, db)
-    
-    # Get user info if logged in
-    user_info = None
-    if request.user_id:
-        user = db.query(models.User).filter(models.User.id == int(request.user_id)).first()
-        if user:
-            progress_count = db.query(models.Progress).filter(models.Progress.user_id == request.user_id).count()
-            user_info = {
-                "user_id": request.user_id,
-                "username": user.username,
-                "progress_count": progress_count,
-                "current_streak": user.current_streak,
-                "total_achievements": user.total_achievements
-            }
+    use_llm = request.use_llm or USE_LLM
+    
+    def _load_context(sync_db: Session):
+        # Get or create session
+        session = _get_or_create_session(request.user_id, request.session_token, sync_db)
+        
+        # Get conversation history
+        conversation_history = _get_conversation_history(session, sync_db)
+        
+        # Get user info if logged in
+        user_info = None
+        if request.user_id:
+            user = sync_db.query(models.User).filter(models.User.id == request.user_id).first()
+            if user:
+                progress_count = sync_db.query(models.Progress).filter(models.Progress.user_id == request.user_id).count()
+                user_info = {
+                    "user_id": request.user_id,
+                    "username": user.username,
+                    "progress_count": progress_count,
+                    "current_streak": user.current_streak,
+                    "total_achievements": user.total_achievements
+                }
+        
+        # RAG: Search corpus
+        rag_context = _build_rag_context(request.message, sync_db) if use_llm else ""
+        return session, conversation_history, user_info, rag_context
     
-    # RAG: Search corpus
-    rag_context = _build_rag_context(request.message, db) if (request.use_llm or USE_LLM) else ""
+    # DB work runs on the async engine; the LLM calls below go to the threadpool
+    session, conversation_history, user_info, rag_context = await db.run_sync(_load_context)
     
     # Generate response
-    if request.use_llm or USE_LLM:
-        response_text, model_used, tokens_used = _generate_llm_response(
+    if use_llm:
+        response_text, model_used, tokens_used = await run_in_threadpool(
+            _generate_llm_response,
             query=request.message,
             conversation_history=conversation_history,
             rag_context=rag_context,
@@ -390,7 +386,7 @@ async def advanced_chatbot_ask(request: AdvancedChatRequest, db: Session = Depen
     else:
         # Fallback to basic chatbot
         from .chatbot import _get_contextual_response
-        result = _get_contextual_response(request.message, request.user_id, db)
+        result = await db.run_sync(lambda sync_db: _get_contextual_response(request.message, request.user_id, sync_db))
         response_text = result["response"]
         model_used = "local-basic"
         tokens_used = 0
@@ -409,11 +405,12 @@ async def advanced_chatbot_ask(request: AdvancedChatRequest, db: Session = Depen
     if request.generate_exercise:
         # Detect topic and user mistakes
         user_mistakes = []  # TODO: Extract from progress
-        generated_exercise = _generate_exercise_with_llm(
+        generated_exercise = await run_in_threadpool(
+            _generate_exercise_with_llm,
             topic=request.message,
             difficulty="medium",
             user_mistakes=user_mistakes,
-            db=db
+            db=None  # unused by the generator
         )
     
     # Calculate response time
@@ -435,7 +432,7 @@ async def advanced_chatbot_ask(request: AdvancedChatRequest, db: Session = Depen
     session.total_messages += 2
     session.last_activity = datetime.utcnow()
     
-    db.commit()
+    await db.commit()
     
     return AdvancedChatResponse(
         response=response_text,
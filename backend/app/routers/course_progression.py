@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, func
 from ..database import get_db
-from .. import models, schemas
+from .. import metrics, models, schemas
 from datetime import datetime
 from typing import List
 
@@ -18,7 +18,7 @@ def calculate_course_progress(db: Session, user_id: int, course_id: int) -> dict
     # Get user's attempts for this course
     attempts = db.query(models.Attempt).join(models.Exercise).filter(
         and_(
-            models.Attempt.user_id == str(user_id),
+            models.Attempt.user_id == user_id,
             models.Exercise.course_id == course_id
         )
     ).all()
@@ -38,14 +38,15 @@ def calculate_course_progress(db: Session, user_id: int, course_id: int) -> dict
         total_exercises > 0
     )
     
-    # Debug logging
-    print(f"[DEBUG] Course {course_id} progress for user {user_id}:")
-    print(f"  Total exercises: {total_exercises}")
-    print(f"  Completed exercises: {completed_exercises}")
-    print(f"  Correct answers: {correct_answers}")
-    print(f"  Total attempts: {len(attempts)}")
-    print(f"  Accuracy: {accuracy_percentage:.1f}%")
-    print(f"  Is completed: {is_completed}")
+    metrics.note(f"course_progress:{course_id}", {
+        "user_id": user_id,
+        "completed": completed_exercises,
+        "total": total_exercises,
+        "correct": correct_answers,
+        "attempts": len(attempts),
+        "accuracy": round(accuracy_percentage, 1),
+        "is_completed": is_completed,
+    })
     
     return {
         'total_exercises': total_exercises,
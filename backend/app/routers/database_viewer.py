@@ -3,7 +3,7 @@ from fastapi.responses import HTMLResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import text
 from ..database import get_db
-from .. import models
+from .. import models, stats
 
 router = APIRouter()
 
@@ -11,32 +11,22 @@ router = APIRouter()
 async def database_viewer(db: Session = Depends(get_db)):
     """Dashboard për të parë databazën në shfletues"""
     
-    # Get statistics
-    total_users = db.query(models.User).count()
-    total_classes = db.query(models.Course).filter(models.Course.parent_class_id.is_(None)).count()
-    total_courses = db.query(models.Course).filter(models.Course.parent_class_id.isnot(None)).count()
-    total_exercises = db.query(models.Exercise).count()
-    total_progress = db.query(models.CourseProgress).count()
-    completed_progress = db.query(models.CourseProgress).filter(models.CourseProgress.is_completed == True).count()
-    total_attempts = db.query(models.Attempt).count()
-    correct_attempts = db.query(models.Attempt).filter(models.Attempt.is_correct == True).count()
+    # Get statistics (precomputed snapshot, see app/stats.py)
+    snapshot = stats.get_snapshot(db)
+    total_users = snapshot["total_users"]
+    total_classes = snapshot["total_classes"]
+    total_courses = snapshot["total_courses"]
+    total_exercises = snapshot["total_exercises"]
+    total_progress = snapshot["total_progress"]
+    completed_progress = snapshot["completed_progress"]
+    total_attempts = snapshot["total_attempts"]
+    correct_attempts = snapshot["correct_attempts"]
     
     # Get users
     users = db.query(models.User).order_by(models.User.created_at.desc()).limit(20).all()
     
-    # Get classes with course counts
-    classes = db.query(models.Course).filter(models.Course.parent_class_id.is_(None)).order_by(models.Course.order_index).all()
-    class_data = []
-    for cls in classes:
-        course_count = db.query(models.Course).filter(models.Course.parent_class_id == cls.id).count()
-        exercise_count = db.query(models.Exercise).join(models.Course).filter(models.Course.parent_class_id == cls.id).count()
-        class_data.append({
-            'id': cls.id,
-            'name': cls.name,
-            'order': cls.order_index,
-            'courses': course_count,
-            'exercises': exercise_count
-        })
+    # Classes with course and exercise counts
+    class_data = snapshot["classes"]
     
     # Get recent progress
     recent_progress = db.query(models.CourseProgress).order_by(models.CourseProgress.updated_at.desc()).limit(10).all()
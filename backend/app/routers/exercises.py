@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, distinct, text
-from sqlalchemy.exc import IntegrityError
-from app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import func, select
+from app.database import get_db, get_async_db
 from app.models import Exercise, Progress, User, Course, Level, Attempt, CourseProgress
-from app.schemas import SubmitRequest, SubmitResult, ExerciseOut
-from typing import List
+from app.schemas import SubmitRequest, SubmitResult, ExerciseOut, LevelOut
+from app import content_cache, metrics, stats
+from typing import List, Optional
 from datetime import datetime
 import unicodedata
 import re
@@ -13,57 +14,41 @@ import json
 
 router = APIRouter()
 
-def fix_sequence_if_needed(db: Session, table_name: str, error: Exception) -> bool:
-	"""Fix PostgreSQL sequence if duplicate key error occurs"""
-	error_str = str(error.orig) if hasattr(error, 'orig') else str(error)
-	
-	# Check if it's a sequence issue (duplicate key on primary key)
-	if "duplicate key value violates unique constraint" in error_str and f"{table_name}_pkey" in error_str:
-		try:
-			result = db.execute(text(f"SELECT COALESCE(MAX(id), 0) FROM {table_name}"))
-			max_id = result.scalar()
-			db.execute(text(f"SELECT setval('{table_name}_id_seq', {max_id + 1}, false)"))
-			db.commit()
-			print(f"[FIXED] Reset {table_name}_id_seq to {max_id + 1}")
-			return True
-		except Exception as seq_error:
-			print(f"[ERROR] Failed to fix {table_name} sequence: {seq_error}")
-			return False
-	return False
-
-@router.get("/public-stats")
-def get_public_stats(db: Session = Depends(get_db)):
-	"""Get public statistics (no auth required)"""
-	total_classes = db.query(Course).filter(Course.parent_class_id == None).count()
-	total_courses = db.query(Course).filter(Course.parent_class_id != None).count()
-	total_levels = db.query(Level).count()
-	total_exercises = db.query(Exercise).count()
-	# Count distinct categories
-	total_categories = db.query(distinct(Exercise.category)).count()
-	
+def _public_stats(db: Session) -> dict:
+	snapshot = stats.get_snapshot(db)
 	return {
-		"total_classes": total_classes,
-		"total_courses": total_courses,
-		"total_levels": total_levels,
-		"total_exercises": total_exercises,
-		"total_categories": total_categories
+		key: snapshot[key]
+		for key in ("total_classes", "total_courses", "total_levels", "total_exercises", "total_categories")
 	}
 
+@router.get("/public-stats")
+async def get_public_stats(request: Request):
+	"""Get public statistics (no auth required; cached per content version, supports If-None-Match)"""
+	return await content_cache.acached_response(request, "public-stats", _public_stats)
+
+def _mismatch_details(expected: str, response: str) -> dict:
+	"""Lengths and the first differing characters (code points) of a wrong answer."""
+	diffs = []
+	for i in range(max(len(expected), len(response))):
+		ec = expected[i] if i < len(expected) else None
+		uc = response[i] if i < len(response) else None
+		if ec != uc:
+			diffs.append({
+				"pos": i,
+				"expected": f"{ec} (U+{ord(ec):04X})" if ec else None,
+				"response": f"{uc} (U+{ord(uc):04X})" if uc else None,
+			})
+	return {"lengths": [len(expected), len(response)], "differences": len(diffs), "first": diffs[:5]}
+
 @router.post("/{exercise_id}/submit")
-async def submit_answer(exercise_id: int, request: SubmitRequest, db: Session = Depends(get_db)):
+async def submit_answer(exercise_id: int, request: SubmitRequest, db: AsyncSession = Depends(get_async_db)):
     # Get the exercise
-    exercise = db.query(Exercise).filter(Exercise.id == exercise_id).first()
+    exercise = await db.scalar(select(Exercise).where(Exercise.id == exercise_id))
     if not exercise:
         raise HTTPException(status_code=404, detail="Exercise not found")
     
-    # Get the user - user_id can be string or int
-    try:
-        user_id_int = int(request.user_id) if isinstance(request.user_id, str) else request.user_id
-        user = db.query(User).filter(User.id == user_id_int).first()
-    except (ValueError, TypeError):
-        # If user_id is not a valid int, try as string
-        user = db.query(User).filter(User.id == str(request.user_id)).first()
-    
+    user_id = request.user_id
+    user = await db.scalar(select(User).where(User.id == user_id))
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     
@@ -119,89 +104,40 @@ async def submit_answer(exercise_id: int, request: SubmitRequest, db: Session =
         if exercise_no_spaces == user_no_spaces and exercise_no_spaces:
             is_correct = True
     
-    # Always log for debugging (will show in Render logs)
-    
-    print(f"[ANSWER_CHECK] Exercise {exercise_id} (Level {exercise.level_id}):")
-    print(f"  Original answer from DB: '{exercise.answer}'")
-    print(f"  Processed answer: '{exercise_answer_clean}'")
-    print(f"  User response: '{request.response}'")
-    print(f"  Processed response: '{user_response_clean}'")
-    print(f"  Match result: {is_correct}")
-    
+    # Kept for the request's log line ([SLOW]/[SAMPLE], app/metrics.py) instead of printed on every submit
+    metrics.note("answer_check", {
+        "exercise_id": exercise_id,
+        "level_id": exercise.level_id,
+        "answer": exercise.answer,
+        "expected": exercise_answer_clean,
+        "response": request.response,
+        "normalized": user_response_clean,
+        "match": is_correct,
+    })
     if not is_correct:
-        print(f"  [MISMATCH DETAILS]:")
-        print(f"    Exercise bytes: {exercise_answer_clean.encode('utf-8')}")
-        print(f"    User bytes: {user_response_clean.encode('utf-8')}")
-        print(f"    Length: {len(exercise_answer_clean)} vs {len(user_response_clean)}")
-        if len(exercise_answer_clean) != len(user_response_clean):
-            print(f"    Length mismatch!")
-        else:
-            print(f"    Character-by-character comparison:")
-            max_len = max(len(exercise_answer_clean), len(user_response_clean))
-            diff_count = 0
-            for i in range(max_len):
-                ec = exercise_answer_clean[i] if i < len(exercise_answer_clean) else None
-                uc = user_response_clean[i] if i < len(user_response_clean) else None
-                if ec != uc:
-                    diff_count += 1
-                    if diff_count <= 5:  # Show first 5 differences
-                        ec_str = f"'{ec}' (U+{ord(ec):04X})" if ec else "None"
-                        uc_str = f"'{uc}' (U+{ord(uc):04X})" if uc else "None"
-                        print(f"      Pos {i}: {ec_str} vs {uc_str}")
-            if diff_count > 5:
-                print(f"    ... and {diff_count - 5} more differences")
+        metrics.note("answer_mismatch", lambda: _mismatch_details(exercise_answer_clean, user_response_clean))
     
     # Calculate points (use exercise.points directly)
     points_earned = exercise.points if is_correct else 0
     
-    # Create attempt record for course progress tracking
-    # Handle sequence issues automatically
-    max_retries = 2
-    attempt_created = False
-    for attempt_num in range(max_retries):
-        try:
-            # Ensure user_id is string (as per Attempt model)
-            user_id_str = str(request.user_id)
-            attempt = Attempt(
-                exercise_id=exercise_id,
-                user_id=user_id_str,
-                response=request.response,
-                is_correct=is_correct,
-                score_delta=points_earned
-            )
-            db.add(attempt)
-            db.flush()  # Flush to trigger sequence, but don't commit yet
-            attempt_created = True
-            break
-        except IntegrityError as e:
-            db.rollback()
-            if attempt_num < max_retries - 1 and fix_sequence_if_needed(db, "attempts", e):
-                continue  # Retry
-            else:
-                print(f"[ERROR] Failed to create attempt after {max_retries} tries: {e}")
-                raise HTTPException(status_code=500, detail="Failed to save attempt. Please try again.")
-        except Exception as e:
-            db.rollback()
-            error_str = str(e)
-            if "duplicate key value violates unique constraint" in error_str and "attempts_pkey" in error_str:
-                if attempt_num < max_retries - 1 and fix_sequence_if_needed(db, "attempts", e):
-                    continue  # Retry
-            print(f"[ERROR] Failed to create attempt: {e}")
-            raise HTTPException(status_code=500, detail="Failed to save attempt. Please try again.")
-    
-    if not attempt_created:
-        raise HTTPException(status_code=500, detail="Failed to create attempt record")
-    
-    # Get or create progress record - ensure user_id is string
-    user_id_str = str(request.user_id)
-    progress = db.query(Progress).filter(
-        Progress.user_id == user_id_str,
+    # Create attempt record for course progress tracking (committed with the progress below)
+    db.add(Attempt(
+        exercise_id=exercise_id,
+        user_id=user_id,
+        response=request.response,
+        is_correct=is_correct,
+        score_delta=points_earned
+    ))
+    
+    # Get or create progress record
+    progress = await db.scalar(select(Progress).where(
+        Progress.user_id == user_id,
         Progress.level_id == exercise.level_id
-    ).first()
+    ))
     
     if not progress:
         progress = Progress(
-            user_id=user_id_str,
+            user_id=user_id,
             category=exercise.category,
             level_id=exercise.level_id,
             course_id=exercise.course_id,
@@ -226,14 +162,14 @@ async def submit_answer(exercise_id: int, request: SubmitRequest, db: Session =
         progress.errors += 1
     
     # Check if level is completed (all exercises in level attempted with 80% accuracy)
-    level_exercises = db.query(Exercise).filter(Exercise.level_id == exercise.level_id).all()
+    level_exercises = (await db.scalars(select(Exercise).where(Exercise.level_id == exercise.level_id))).all()
     total_exercises = len(level_exercises)
     
     # Get all progress records for this level
-    level_progress = db.query(Progress).filter(
-        Progress.user_id == user_id_str,
+    level_progress = await db.scalar(select(Progress).where(
+        Progress.user_id == user_id,
         Progress.level_id == exercise.level_id
-    ).first()
+    ))
     
     if level_progress:
         # Calculate accuracy based on points vs total possible points
@@ -249,31 +185,29 @@ async def submit_answer(exercise_id: int, request: SubmitRequest, db: Session =
         level_completed = False
     
     # Check if course is completed (all levels in course completed)
-    course_levels = db.query(Level).filter(Level.course_id == exercise.course_id).all()
-    completed_levels = db.query(Progress).filter(
-        Progress.user_id == user_id_str,
+    course_levels = (await db.scalars(select(Level).where(Level.course_id == exercise.course_id))).all()
+    completed_levels = await db.scalar(select(func.count(Progress.id)).where(
+        Progress.user_id == user_id,
         Progress.course_id == exercise.course_id,
         Progress.completed == True
-    ).count()
+    ))
     
     # Course is completed only if all levels are completed AND we have at least one level
     course_completed = (completed_levels == len(course_levels)) and len(course_levels) > 0 and completed_levels > 0
     
     # Commit attempt and level progress before any optional/secondary logic
-    db.commit()
+    await db.commit()
     
     # Update course progress in a safe way so that any DB inconsistencies
     # (e.g. legacy data, constraint issues) do NOT break answer submission.
     course_progress = None
     try:
         from .course_progression import update_course_progress
-        # Convert user_id to int for course_progression functions that expect int
-        user_id_int = int(user_id_str) if user_id_str.isdigit() else None
-        if user_id_int:
-            course_progress = update_course_progress(db, user_id_int, exercise.course_id)
+        # Shared sync helper, run on this session's connection without blocking the loop
+        course_progress = await db.run_sync(update_course_progress, user_id, exercise.course_id)
     except Exception as e:
         # Log but continue – the main flow (answer evaluation) must not fail
-        print(f"[WARNING] Course progress update error for user {user_id_str}, course {exercise.course_id}: {e}")
+        print(f"[WARNING] Course progress update error for user {user_id}, course {exercise.course_id}: {e}")
     
     # ========== GAMIFICATION INTEGRATION ==========
     try:
@@ -284,22 +218,25 @@ async def submit_answer(exercise_id: int, request: SubmitRequest, db: Session =
             create_srs_card_for_mistake
         )
         
-        # 1. Update streak (every submission)
-        update_user_streak(db, user_id_str)
-        
-        # 2. Update daily challenge progress
-        update_daily_challenge_progress(db, user_id_str, "complete_n_exercises", increment=1)
-        
-        # 3. If perfect answer, update perfect_accuracy challenge
-        if is_correct:
-            update_daily_challenge_progress(db, user_id_str, "perfect_accuracy", increment=1)
-        
-        # 4. Check and award any achievements earned
-        check_and_award_achievements(db, user_id_str)
+        def _gamification(sync_db: Session) -> None:
+            # 1. Update streak (every submission)
+            update_user_streak(sync_db, user_id)
+            
+            # 2. Update daily challenge progress
+            update_daily_challenge_progress(sync_db, user_id, "complete_n_exercises", increment=1)
+            
+            # 3. If perfect answer, update perfect_accuracy challenge
+            if is_correct:
+                update_daily_challenge_progress(sync_db, user_id, "perfect_accuracy", increment=1)
+            
+            # 4. Check and award any achievements earned
+            check_and_award_achievements(sync_db, user_id)
+            
+            # 5. If answer is wrong, create SRS card for spaced repetition
+            if not is_correct:
+                create_srs_card_for_mistake(sync_db, user_id, exercise_id)
         
-        # 5. If answer is wrong, create SRS card for spaced repetition
-        if not is_correct:
-            create_srs_card_for_mistake(db, user_id_str, exercise_id)
+        await db.run_sync(_gamification)
     
     except Exception as e:
         # Gamification is optional - don't break the main flow if it fails
@@ -329,17 +266,27 @@ async def submit_answer(exercise_id: int, request: SubmitRequest, db: Session =
         message=message
     )
 
-@router.get("/courses/{course_id}/levels")
-async def get_course_levels(course_id: int, db: Session = Depends(get_db)):
+def course_levels(db: Session, course_id: int) -> List[dict]:
     levels = db.query(Level).filter(Level.course_id == course_id).order_by(Level.order_index).all()
-    return levels
+    return [LevelOut.model_validate(level).model_dump() for level in levels]
 
-@router.get("/levels/{level_id}/exercises", response_model=List[ExerciseOut])
-async def get_level_exercises(level_id: int, db: Session = Depends(get_db)):
+@router.get("/courses/{course_id}/levels")
+async def get_course_levels(course_id: int, request: Request):
+    # Cached per content version; repeat polls with If-None-Match get a 304
+    return await content_cache.acached_response(
+        request, f"course-levels:{course_id}", lambda db: course_levels(db, course_id)
+    )
+
+def _level_exercises(db: Session, level_id: int) -> List[dict]:
     # Only return fields defined in ExerciseOut (answer is excluded)
     exercises = db.query(Exercise).filter(Exercise.level_id == level_id).order_by(Exercise.order_index).all()
-    print(f"[DEBUG] Level {level_id}: Found {len(exercises)} exercises")
-    return exercises
+    return [ExerciseOut.model_validate(e).model_dump() for e in exercises]
+
+@router.get("/levels/{level_id}/exercises", response_model=List[ExerciseOut])
+async def get_level_exercises(level_id: int, request: Request):
+    return await content_cache.acached_response(
+        request, f"level-exercises:{level_id}", lambda db: _level_exercises(db, level_id)
+    )
 
 @router.get("/debug/database-structure")
 async def debug_database_structure(db: Session = Depends(get_db)):
@@ -389,76 +336,77 @@ async def debug_database_structure(db: Session = Depends(get_db)):
     
     return result
 
-@router.get("/classes")
-async def get_classes(user_id: str = None, db: Session = Depends(get_db)):
-    # Get top-level classes (parent_class_id is None)
+def _class_structure(db: Session) -> List[dict]:
+    """Top-level classes with the ids of their courses (cached per content version)."""
     classes = db.query(Course).filter(Course.parent_class_id == None).order_by(Course.order_index).all()
-    
+    course_ids = {}
+    for parent_id, course_id in (
+        db.query(Course.parent_class_id, Course.id)
+        .filter(Course.parent_class_id != None)
+        .order_by(Course.order_index)
+    ):
+        course_ids.setdefault(parent_id, []).append(course_id)
+    return [
+        {
+            "id": c.id,
+            "name": c.name,
+            "description": c.description,
+            "order_index": c.order_index,
+            "course_ids": course_ids.get(c.id, []),
+        }
+        for c in classes
+    ]
+
+def _public_classes(db: Session) -> List[dict]:
+    return [
+        {
+            "id": c["id"],
+            "name": c["name"],
+            "description": c["description"],
+            "order_index": c["order_index"],
+            "unlocked": i == 0,
+            "progress_percent": 0.0,
+        }
+        for i, c in enumerate(_class_structure(db))
+    ]
+
+@router.get("/classes")
+async def get_classes(request: Request, user_id: Optional[int] = None, db: AsyncSession = Depends(get_async_db)):
+    if not user_id:
+        # No user_id provided, only first class unlocked: pure content, served from the cache
+        return await content_cache.acached_response(request, "classes", _public_classes)
+
+    # Top-level classes with their course ids come from the content cache; only progress is queried
+    classes = await content_cache.acached("class-structure", _class_structure)
     class_data = []
-    user_id_int = int(user_id) if user_id and user_id.isdigit() else None
+    completed_per_course = dict((await db.execute(
+        select(CourseProgress.course_id, func.count(CourseProgress.id))
+        .where(CourseProgress.user_id == user_id, CourseProgress.is_completed == True)
+        .group_by(CourseProgress.course_id)
+    )).all())
+    completed = [sum(completed_per_course.get(cid, 0) for cid in c["course_ids"]) for c in classes]
     
     for i, class_obj in enumerate(classes):
-        unlocked = False
-        progress_percent = 0.0
+        course_ids = class_obj["course_ids"]
+        progress_percent = (completed[i] / len(course_ids)) * 100 if course_ids else 0.0
         
-        if user_id_int:
-            # Get all courses under this class
-            class_courses = db.query(Course).filter(
-                Course.parent_class_id == class_obj.id
-            ).order_by(Course.order_index).all()
-            
-            if class_courses:
-                course_ids = [c.id for c in class_courses]
-                
-                # Calculate progress percentage
-                completed_count = db.query(CourseProgress).filter(
-                    and_(
-                        CourseProgress.user_id == user_id_int,
-                        CourseProgress.course_id.in_(course_ids),
-                        CourseProgress.is_completed == True
-                    )
-                ).count()
-                
-                progress_percent = (completed_count / len(course_ids)) * 100 if course_ids else 0.0
-                
-                # Check if class should be unlocked
-                if i == 0:
-                    # First class is always unlocked
-                    unlocked = True
-                else:
-                    # Check if previous class has 80% completion
-                    prev_class = classes[i - 1]
-                    prev_class_courses = db.query(Course).filter(
-                        Course.parent_class_id == prev_class.id
-                    ).all()
-                    
-                    if prev_class_courses:
-                        prev_course_ids = [c.id for c in prev_class_courses]
-                        prev_completed_count = db.query(CourseProgress).filter(
-                            and_(
-                                CourseProgress.user_id == user_id_int,
-                                CourseProgress.course_id.in_(prev_course_ids),
-                                CourseProgress.is_completed == True
-                            )
-                        ).count()
-                        
-                        prev_completion_ratio = (prev_completed_count / len(prev_class_courses)) if prev_class_courses else 0.0
-                        
-                        # Unlock if previous class has 80%+ completion
-                        unlocked = prev_completion_ratio >= 0.8
-            else:
-                # No courses in this class, unlock by default
-                unlocked = i == 0
+        if i == 0:
+            # First class is always unlocked
+            unlocked = True
+        elif course_ids:
+            # Unlock if previous class has 80%+ completion
+            prev_course_ids = classes[i - 1]["course_ids"]
+            prev_completion_ratio = (completed[i - 1] / len(prev_course_ids)) if prev_course_ids else 0.0
+            unlocked = prev_completion_ratio >= 0.8
         else:
-            # No user_id provided, only first class unlocked
-            unlocked = i == 0
-            progress_percent = 0.0
+            # No courses in this class, unlock by default
+            unlocked = False
         
         class_data.append({
-            "id": class_obj.id,
-            "name": class_obj.name,
-            "description": class_obj.description,
-            "order_index": class_obj.order_index,
+            "id": class_obj["id"],
+            "name": class_obj["name"],
+            "description": class_obj["description"],
+            "order_index": class_obj["order_index"],
             "unlocked": unlocked,
             "progress_percent": progress_percent
         })
@@ -466,46 +414,44 @@ async def get_classes(user_id: str = None, db: Session = Depends(get_db)):
     return class_data
 
 @router.get("/classes/{class_id}/courses")
-async def get_class_courses(class_id: int, user_id: str = "1", db: Session = Depends(get_db)):
+async def get_class_courses(class_id: int, user_id: int = 1, db: AsyncSession = Depends(get_async_db)):
     # Get courses for the specified class
-    courses = db.query(Course).filter(Course.parent_class_id == class_id).order_by(Course.order_index).all()
+    courses = (await db.scalars(
+        select(Course).where(Course.parent_class_id == class_id).order_by(Course.order_index)
+    )).all()
     
     # Initialize course progress for user if needed
-    user_id_int = int(user_id)
+    existing = set(await db.scalars(
+        select(CourseProgress.course_id).where(
+            CourseProgress.user_id == user_id,
+            CourseProgress.course_id.in_([course.id for course in courses])
+        )
+    ))
     for course in courses:
-        existing_progress = db.query(CourseProgress).filter(
-            and_(
-                CourseProgress.user_id == user_id_int,
-                CourseProgress.course_id == course.id
-            )
-        ).first()
-        
-        if not existing_progress:
+        if course.id not in existing:
             # First course is unlocked by default
             is_unlocked = course.order_index == 1
             progress = CourseProgress(
-                user_id=user_id_int,
+                user_id=user_id,
                 course_id=course.id,
                 is_unlocked=is_unlocked
             )
             db.add(progress)
     
-    db.commit()
+    await db.commit()
     
     # Get course progress data
+    from .course_progression import update_course_progress
     course_data = []
     for course in courses:
-        course_progress = db.query(CourseProgress).filter(
-            and_(
-                CourseProgress.user_id == user_id_int,
-                CourseProgress.course_id == course.id
-            )
-        ).first()
+        course_progress = await db.scalar(select(CourseProgress).where(
+            CourseProgress.user_id == user_id,
+            CourseProgress.course_id == course.id
+        ))
         
         if course_progress:
-            # Update progress if needed
-            from .course_progression import update_course_progress
-            course_progress = update_course_progress(db, user_id_int, course.id)
+            # Update progress if needed (shared sync helper, run on this session's connection)
+            course_progress = await db.run_sync(update_course_progress, user_id, course.id)
         
         course_data.append({
             "id": course.id,
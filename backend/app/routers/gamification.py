@@ -34,7 +34,7 @@ def get_all_achievements(db: Session = Depends(get_db)):
 
 
 @router.get("/gamification/achievements/{user_id}")
-def get_user_achievements(user_id: str, db: Session = Depends(get_db)):
+def get_user_achievements(user_id: int, db: Session = Depends(get_db)):
 	"""Get achievements earned by a specific user"""
 	user_achievements = (
 		db.query(models.UserAchievement)
@@ -61,7 +61,7 @@ def get_user_achievements(user_id: str, db: Session = Depends(get_db)):
 	}
 
 
-def check_and_award_achievements(db: Session, user_id: str):
+def check_and_award_achievements(db: Session, user_id: int):
 	"""
 	Check if user has met criteria for any achievements and award them.
 	This should be called after significant events (completing exercise, level, etc.)
@@ -177,7 +177,7 @@ def check_and_award_achievements(db: Session, user_id: str):
 # ============================================================================
 
 @router.get("/gamification/streak/{user_id}")
-def get_user_streak(user_id: str, db: Session = Depends(get_db)):
+def get_user_streak(user_id: int, db: Session = Depends(get_db)):
 	"""Get user's current and longest streak"""
 	user = db.query(models.User).filter(models.User.id == user_id).first()
 	if not user:
@@ -190,7 +190,7 @@ def get_user_streak(user_id: str, db: Session = Depends(get_db)):
 	}
 
 
-def update_user_streak(db: Session, user_id: str):
+def update_user_streak(db: Session, user_id: int):
 	"""Update user's streak after an activity. Call this after submitting an exercise."""
 	user = db.query(models.User).filter(models.User.id == user_id).first()
 	if not user:
@@ -227,7 +227,7 @@ def update_user_streak(db: Session, user_id: str):
 # ============================================================================
 
 @router.get("/gamification/daily-challenge")
-def get_daily_challenge(user_id: Optional[str] = None, db: Session = Depends(get_db)):
+def get_daily_challenge(user_id: Optional[int] = None, db: Session = Depends(get_db)):
 	"""Get today's daily challenge"""
 	today = datetime.utcnow().strftime("%Y-%m-%d")
 	
@@ -320,7 +320,7 @@ def _generate_daily_challenge(db: Session, date_str: str) -> models.DailyChallen
 	return challenge
 
 
-def update_daily_challenge_progress(db: Session, user_id: str, challenge_type: str, increment: int = 1):
+def update_daily_challenge_progress(db: Session, user_id: int, challenge_type: str, increment: int = 1):
 	"""Update user's progress on today's daily challenge"""
 	today = datetime.utcnow().strftime("%Y-%m-%d")
 	
@@ -379,7 +379,7 @@ def update_daily_challenge_progress(db: Session, user_id: str, challenge_type: s
 # ============================================================================
 
 @router.get("/gamification/srs/due/{user_id}")
-def get_due_srs_cards(user_id: str, limit: int = 10, db: Session = Depends(get_db)):
+def get_due_srs_cards(user_id: int, limit: int = 10, db: Session = Depends(get_db)):
 	"""Get SRS cards due for review"""
 	now = datetime.utcnow()
 	
@@ -471,7 +471,7 @@ def review_srs_card(
 	}
 
 
-def create_srs_card_for_mistake(db: Session, user_id: str, exercise_id: int):
+def create_srs_card_for_mistake(db: Session, user_id: int, exercise_id: int):
 	"""Create an SRS card when user makes a mistake on an exercise"""
 	exercise = db.get(models.Exercise, exercise_id)
 	if not exercise:
@@ -506,7 +506,7 @@ def create_srs_card_for_mistake(db: Session, user_id: str, exercise_id: int):
 
 
 @router.get("/gamification/srs/stats/{user_id}")
-def get_srs_stats(user_id: str, db: Session = Depends(get_db)):
+def get_srs_stats(user_id: int, db: Session = Depends(get_db)):
 	"""Get SRS statistics for a user"""
 	total_cards = (
 		db.query(models.SpacedRepetitionCard)
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, cast, String, case
+from sqlalchemy import func, and_, case
 from typing import List
 from ..database import get_db
 from .. import models
@@ -63,9 +63,8 @@ def get_leaderboard(db: Session = Depends(get_db), limit: int = 0):
             func.coalesce(attempts_stats.c.total_correct, 0).label('total_correct'),
             func.coalesce(completed_courses_subq.c.completed_courses, 0).label('completed_courses')
         )
-        # Cast user.id (int) to string to match Attempt.user_id / CourseProgress.user_id types
-        .outerjoin(attempts_stats, cast(models.User.id, String) == attempts_stats.c.user_id)
-        .outerjoin(completed_courses_subq, cast(models.User.id, String) == completed_courses_subq.c.user_id)
+        .outerjoin(attempts_stats, models.User.id == attempts_stats.c.user_id)
+        .outerjoin(completed_courses_subq, models.User.id == completed_courses_subq.c.user_id)
         .order_by(
             func.coalesce(attempts_stats.c.total_points, 0).desc(),
             (func.coalesce(attempts_stats.c.total_correct, 0) * 100.0 / func.nullif(func.coalesce(attempts_stats.c.total_attempts, 1), 0)).desc(),
@@ -16,49 +16,64 @@ The LLM post-processor:
 This architecture is suitable for academic research and production use.
 """
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException, Depends
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
-from ..database import get_db
-from .. import models
+from starlette.concurrency import run_in_threadpool
+from ..database import get_db, SessionLocal
+from ..similarity import align_words, similarity_ratio
+from ..spelling import SpellIndex
+from ..ocr_runner import OcrPass, OCR_DEADLINE_SECONDS, run_in_pool, run_passes
+from .. import ocr_cache
+from .. import lexicon as lexicon_store
+from .. import ocr_correct
+from .. import ocr_jobs
+from .. import metrics, providers
+from ..ocr_planner import DATA_PASS, LOW_CONFIDENCE, describe_layout, plan_passes, record_outcome
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any, Tuple
+from typing import TYPE_CHECKING, Awaitable, Callable, List, Optional, Dict, Any, Tuple
 from io import BytesIO
+from types import SimpleNamespace
 import re
 import unicodedata
 import time
 import os
 import json
+import asyncio
+import threading
+import zipfile
+from collections import Counter
 
-try:
+if TYPE_CHECKING:
+	from PIL import Image
+
+
+def _load_tesseract() -> SimpleNamespace:
 	from PIL import Image
 	import pytesseract
-except ImportError:
-	Image = None
-	pytesseract = None
+	from .. import imaging
+	return SimpleNamespace(Image=Image, pytesseract=pytesseract, imaging=imaging)
 
-# Optional PaddleOCR fallback (për shkrim dore). Kërkon instalim manual të paddleocr.
-try:
+
+def _load_paddle():
 	from paddleocr import PaddleOCR  # type: ignore
-	import numpy as np  # type: ignore
-	_PADDLE_OCR = PaddleOCR(
+	return PaddleOCR(
 		use_angle_cls=True,
 		lang="latin",  # PaddleOCR nuk ka model specifik "sqi"; latin punon mirë për alfabetin tonë
 		show_log=False,
 	)
-except Exception:
-	_PADDLE_OCR = None
-	np = None  # type: ignore
-
-# LLM Integration for post-OCR refinement
-try:
-	import openai
-	OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-	if OPENAI_API_KEY:
-		openai.api_key = OPENAI_API_KEY
-		LLM_AVAILABLE = True
-	else:
-		LLM_AVAILABLE = False
-except ImportError:
-	LLM_AVAILABLE = False
+
+
+# Pillow/pytesseract/numpy are imported and the PaddleOCR model is built by the
+# first OCR request, not at startup (app/providers.py; STARTUP_WARMUP preloads them)
+_TESSERACT = providers.register("tesseract", _load_tesseract, requires=("PIL", "pytesseract", "numpy"))
+# Optional PaddleOCR fallback (për shkrim dore). Kërkon instalim manual të paddleocr.
+_PADDLE = providers.register("paddleocr", _load_paddle, requires=("paddleocr", "numpy"))
+
+# PaddleOCR predictors are not safe to call from several threads at once
+_PADDLE_LOCK = threading.Lock()
+
+# LLM Integration for post-OCR refinement (client imported on first use)
+LLM_AVAILABLE = providers.OPENAI.available
 
 router = APIRouter()
 
@@ -134,15 +149,16 @@ Confidence duhet të jetë 0.0-1.0 bazuar në sa i sigurt je për korrigjimet.""
 Kthe rezultatin në formatin JSON të specifikuar."""
 
 	try:
-		response = openai.ChatCompletion.create(
-			model="gpt-4-turbo-preview",
-			messages=[
-				{"role": "system", "content": system_prompt},
-				{"role": "user", "content": user_prompt}
-			],
-			temperature=0.3,  # Low temperature for more consistent corrections
-			max_tokens=1500
-		)
+		with metrics.external("openai"):
+			response = providers.OPENAI.get().ChatCompletion.create(
+				model="gpt-4-turbo-preview",
+				messages=[
+					{"role": "system", "content": system_prompt},
+					{"role": "user", "content": user_prompt}
+				],
+				temperature=0.3,  # Low temperature for more consistent corrections
+				max_tokens=1500
+			)
 		
 		content = response.choices[0].message.content.strip()
 		
@@ -171,20 +187,13 @@ Kthe rezultatin në formatin JSON të specifikuar."""
 		"processing_time_ms": int((time.time() - start_time) * 1000)
 	}
 
-# In-process cache for lexicon (keeps OCR fast). Safe for a single-process dev server.
-_LEXICON_CACHE: Optional[set] = None
-_BUCKETS_CACHE: Optional[Dict[Tuple[str, int], List[str]]] = None
-_LEXICON_CACHE_AT: float = 0.0
-_LEXICON_TTL_SECONDS: float = 300.0
-
-
 class OCRAnalysisOut(BaseModel):
 	extracted_text: str
 	refined_text: Optional[str] = None  # LLM-refined version
 	errors: List[Dict[str, Any]]
 	suggestions: List[str]
 	issues: List[Dict[str, Any]] = []
-	llm_corrections: List[Dict[str, Any]] = []  # Corrections made by LLM
+	llm_corrections: List[Dict[str, Any]] = []  # Corrections made in post-processing (noisy channel / LLM)
 	meta: Dict[str, Any] = {}
 
 
@@ -199,62 +208,37 @@ def _tokenize_sq(text: str) -> List[str]:
 
 def _preprocess_for_ocr(img: "Image.Image") -> "Image.Image":
 	"""
-	Upscale + denoise + sharpen + adaptive threshold për të rritur besueshmërinë e OCR.
+	Downsample + contrast + denoise + sharpen + Sauvola adaptive threshold për të rritur besueshmërinë e OCR.
 	"""
-	gray = img.convert("L")
-	try:
-		from PIL import ImageOps, ImageFilter, ImageEnhance
-
-		# 1) Upscale (1.5x) për të rritur lexueshmërinë e shkronjave
-		w, h = gray.size
-		scale = 1.5
-		gray = gray.resize((int(w * scale), int(h * scale)))
-
-		# 2) Rritje kontrasti + autocontrast
-		gray = ImageEnhance.Contrast(gray).enhance(2.0)
-		gray = ImageOps.autocontrast(gray)
-
-		# 3) Denoise i lehtë + Sharpen
-		gray = gray.filter(ImageFilter.MedianFilter(size=3))
-		gray = gray.filter(ImageFilter.UnsharpMask(radius=2, percent=150, threshold=3))
-
-		# 4) Adaptive-like threshold (pak më i ulët se më parë)
-		bw = gray.point(lambda x: 255 if x > 135 else 0, mode="1")
-		return bw.convert("L")
-	except Exception:
-		# Fallback minimal në rast mungese bibliotekash
-		bw = gray.point(lambda x: 255 if x > 140 else 0, mode="1")
-		return bw.convert("L")
+	return _TESSERACT.get().imaging.binarize_for_ocr(img)
 
 
 def _deskew_image(img: "Image.Image") -> "Image.Image":
 	"""
-	Përdor Tesseract OSD për të zbuluar këndin dhe e rrotullon imazhin nëse është e nevojshme.
+	Sjell imazhin në rezolucionin e OCR-së dhe e drejton me profile projeksioni
+	(kënde të vogla + 90°), pa thirrje OSD të tesseract-it.
 	"""
-	if not pytesseract or not hasattr(pytesseract, "image_to_osd"):
-		return img
+	imaging = _TESSERACT.get().imaging
+	img = imaging.downsample_for_ocr(img)
 	try:
-		osd = pytesseract.image_to_osd(img)
-		angle_match = re.search(r"Rotate: (\d+)", osd)
-		if angle_match:
-			angle = int(angle_match.group(1)) % 360
-			# rrotullim minimal, 0/90/180/270
-			if angle in (90, 180, 270):
-				return img.rotate(-angle, expand=True, fillcolor=255)
+		rotated, _ = imaging.deskew(img)
+		return rotated
 	except Exception:
-		pass
-	return img
+		return img
 
 
 def _run_paddle_fallback(img: "Image.Image") -> str:
 	"""
 	Fallback OCR me PaddleOCR (opsionale, nëse është instaluar). E përshtatshme për shkrim dore.
 	"""
-	if not _PADDLE_OCR or np is None:
+	paddle = _PADDLE.get()
+	if paddle is None:
 		return ""
 	try:
+		import numpy as np
 		np_img = np.array(img.convert("RGB"))
-		res = _PADDLE_OCR.ocr(np_img, cls=True)
+		with _PADDLE_LOCK, metrics.external("paddleocr"):
+			res = paddle.ocr(np_img, cls=True)
 		lines = []
 		for line in res:
 			if line and len(line) > 0:
@@ -266,57 +250,10 @@ def _run_paddle_fallback(img: "Image.Image") -> str:
 		return ""
 
 
-def _levenshtein(a: str, b: str, max_dist: int = 2) -> int:
-	# Bounded Levenshtein to keep it fast
-	if a == b:
-		return 0
-	if abs(len(a) - len(b)) > max_dist:
-		return max_dist + 1
-	previous = list(range(len(b) + 1))
-	for i, ca in enumerate(a, start=1):
-		current = [i]
-		min_row = current[0]
-		for j, cb in enumerate(b, start=1):
-			ins = current[j - 1] + 1
-			delete = previous[j] + 1
-			sub = previous[j - 1] + (0 if ca == cb else 1)
-			val = min(ins, delete, sub)
-			current.append(val)
-			if val < min_row:
-				min_row = val
-		previous = current
-		if min_row > max_dist:
-			return max_dist + 1
-	return previous[-1]
-
-
-def _build_lexicon(db: Session) -> Tuple[set, Dict[Tuple[str, int], List[str]]]:
-	# Use existing corpus (exercise prompts + answers) as an in-project "dictionary"
-	global _LEXICON_CACHE, _BUCKETS_CACHE, _LEXICON_CACHE_AT
-	now = time.time()
-	if _LEXICON_CACHE is not None and _BUCKETS_CACHE is not None and (now - _LEXICON_CACHE_AT) < _LEXICON_TTL_SECONDS:
-		return _LEXICON_CACHE, _BUCKETS_CACHE
-
-	lex = set()
-	buckets: Dict[Tuple[str, int], List[str]] = {}
-
-	rows = db.query(models.Exercise.prompt, models.Exercise.answer).filter(models.Exercise.enabled == True).all()
-	for prompt, answer in rows:
-		for src in [prompt or "", answer or ""]:
-			for tok in _tokenize_sq(_norm_text(src).lower()):
-				w = tok.lower()
-				if len(w) < 2:
-					continue
-				lex.add(w)
-
-	for w in lex:
-		key = (w[0], len(w))
-		buckets.setdefault(key, []).append(w)
-
-	_LEXICON_CACHE = lex
-	_BUCKETS_CACHE = buckets
-	_LEXICON_CACHE_AT = now
-	return lex, buckets
+def _build_lexicon(db: Session) -> Tuple[set, SpellIndex]:
+	# Corpus (exercise prompts + answers) + imported word lists, kept in sync by app/lexicon.py
+	index = lexicon_store.get_lexicon(db)
+	return index.words, index.spelling
 
 
 def _issue_meta(issue_type: str, conf: Optional[float], has_suggestions: bool) -> Dict[str, Any]:
@@ -330,6 +267,11 @@ def _issue_meta(issue_type: str, conf: Optional[float], has_suggestions: bool) -
 		return {"source": "ocr", "severity": "warning", "likelihood": 0.2}
 	if issue_type == "mismatch_expected":
 		return {"source": "orthography", "severity": "error", "likelihood": 0.95}
+	if issue_type == "missing_word":
+		return {"source": "orthography", "severity": "error", "likelihood": 0.85}
+	if issue_type == "extra_word":
+		# Often OCR noise (stray marks read as a word) rather than a written extra word
+		return {"source": "orthography", "severity": "warning", "likelihood": 0.6}
 	if issue_type in ("diacritics_suspected", "double_consonant_suspected"):
 		return {"source": "orthography", "severity": "warning", "likelihood": 0.8}
 	if issue_type in ("ending_ë_suspected", "ç_suspected"):
@@ -377,28 +319,9 @@ def _rule_based_candidates(token: str, lexicon: set) -> List[str]:
 	return out[:5]
 
 
-def _suggest_from_lexicon(token: str, buckets: Dict[Tuple[str, int], List[str]], max_suggestions: int = 5) -> List[str]:
-	t = token.lower()
-	if not t:
-		return []
-	first = t[0]
-	candidates: List[str] = []
-	for ln in range(max(2, len(t) - 2), len(t) + 3):
-		candidates.extend(buckets.get((first, ln), []))
-
-	scored = []
-	for c in candidates:
-		d = _levenshtein(t, c, max_dist=2)
-		if d <= 2:
-			scored.append((d, c))
-	scored.sort(key=lambda x: (x[0], x[1]))
-	out = []
-	for _, c in scored:
-		if c not in out:
-			out.append(c)
-		if len(out) >= max_suggestions:
-			break
-	return out
+def _suggest_from_lexicon(token: str, spelling: SpellIndex, max_suggestions: int = 5) -> List[str]:
+	# SymSpell lookup: weighted distance ≤ 2 (ë/ç and double letters are cheap), then frequency
+	return [word for word, _, _ in spelling.lookup(token, max_suggestions=max_suggestions)]
 
 
 def _collapse_double_consonants(word: str) -> str:
@@ -414,23 +337,82 @@ def _is_diacritics_variant(a: str, b: str) -> bool:
 	return _diacritics_normalize(a) == _diacritics_normalize(b) and a != b
 
 
-def _extract_tokens_with_confidence(img: "Image.Image") -> Tuple[List[Dict[str, Any]], float]:
+# Konfigurime të ndryshme psm/oem + whitelist për alfabetin shqip
+_COMMON_TESS_CFG = "-c preserve_interword_spaces=1 -c tessedit_char_whitelist=\"A-Za-zËÇëç?.,' -\""
+_TESSERACT_PASSES: List[Tuple[str, str, bool]] = [  # (name, config, use sqi)
+	("psm6_sqi", f"--oem 1 --psm 6 {_COMMON_TESS_CFG}", True),
+	("psm4_sqi", f"--oem 1 --psm 4 {_COMMON_TESS_CFG}", True),
+	("psm7_sqi", f"--oem 1 --psm 7 {_COMMON_TESS_CFG}", True),  # single line
+	("psm11_sqi", f"--oem 1 --psm 11 {_COMMON_TESS_CFG}", True),  # sparse text
+	("psm13_sqi", f"--oem 1 --psm 13 {_COMMON_TESS_CFG}", True),  # raw line
+	# Fallback pa lang nëse sqi mungon
+	("psm6", f"--oem 1 --psm 6 {_COMMON_TESS_CFG}", False),
+	("psm4", f"--oem 1 --psm 4 {_COMMON_TESS_CFG}", False),
+]
+# A candidate needs at least this many words before it can end the multi-pass run early
+_EARLY_EXIT_MIN_TOKENS = 3
+
+
+def _build_ocr_passes(ocr_ready: "Image.Image", deskewed: "Image.Image") -> List[OcrPass]:
+	pytesseract = _TESSERACT.get().pytesseract
+	passes: List[OcrPass] = []
+	for name, cfg, use_lang in _TESSERACT_PASSES:
+		def _tesseract(timeout: float, cfg: str = cfg, use_lang: bool = use_lang) -> str:
+			with metrics.external("tesseract"):
+				return pytesseract.image_to_string(
+					ocr_ready,
+					lang="sqi" if use_lang else None,
+					config=cfg,
+					timeout=timeout,
+				)
+		passes.append(OcrPass(name, "tesseract", _tesseract))
+
+	# PaddleOCR fallback (nëse është instaluar) për shkrim dore
+	if _PADDLE.available:
+		passes.append(OcrPass("paddle", "paddleocr", lambda timeout: _run_paddle_fallback(deskewed)))
+	return passes
+
+
+def _readability_score(text: str) -> int:
+	# Shkronja alfabetike + gjatësi: zgjedhim më të “lexueshmen”
+	alpha = sum(ch.isalpha() for ch in text)
+	return alpha + len(text)
+
+
+def _candidate_quality(text: str, lexicon: set) -> float:
+	"""Share of recognized words found in the corpus lexicon (0.0 for very short candidates)."""
+	words = [t.lower() for t in _tokenize_sq(text) if len(t) >= 2]
+	if len(words) < _EARLY_EXIT_MIN_TOKENS:
+		return 0.0
+	return sum(w in lexicon for w in words) / len(words)
+
+
+def _extract_tokens_with_confidence(img: "Image.Image", timeout: float = OCR_DEADLINE_SECONDS) -> Dict[str, Any]:
 	"""
-	Extract tokens with OCR confidence using Tesseract's image_to_data.
-	Returns (tokens, avg_confidence).
+	Extract tokens with OCR confidence using Tesseract's image_to_data
+	(tesseract is killed after timeout seconds).
+
+	This is the analyzer's first (and often only) tesseract pass, so it also
+	returns the reconstructed text and layout for the OCR planner:
+		{"tokens": [...], "avg_conf": float, "text": str, "layout": {...}}
 	"""
-	if not pytesseract:
-		return [], 0.0
+	result: Dict[str, Any] = {"tokens": [], "avg_conf": 0.0, "text": "", "layout": describe_layout({})}
+	tesseract = _TESSERACT.get()
+	if tesseract is None:
+		return result
+	pytesseract = tesseract.pytesseract
 	try:
 		output_type = getattr(pytesseract, "Output", None)
-		data = pytesseract.image_to_data(
-			img,
-			lang="sqi",
-			config="--oem 1 --psm 6 -c preserve_interword_spaces=1",
-			output_type=(output_type.DICT if output_type else None),
-		)
+		with metrics.external("tesseract"):
+			data = pytesseract.image_to_data(
+				img,
+				lang="sqi",
+				config="--oem 1 --psm 6 -c preserve_interword_spaces=1",
+				output_type=(output_type.DICT if output_type else None),
+				timeout=timeout,
+			)
 	except Exception:
-		return [], 0.0
+		return result
 
 	texts = data.get("text", []) if isinstance(data, dict) else []
 	confs = data.get("conf", []) if isinstance(data, dict) else []
@@ -453,142 +435,100 @@ def _extract_tokens_with_confidence(img: "Image.Image") -> Tuple[List[Dict[str,
 			conf_values.append(c)
 		tokens.append({"token": token, "raw": raw, "confidence": c})
 
-	avg_conf = sum(conf_values) / len(conf_values) if conf_values else 0.0
-	return tokens, avg_conf
-
-
-@router.post("/ocr/analyze", response_model=OCRAnalysisOut)
-async def analyze_dictation(
-	image: UploadFile = File(...),
-	expected_text: Optional[str] = Form(None),
-	use_llm: bool = Form(True),  # Enable LLM post-processing by default
-	db: Session = Depends(get_db)
-):
+	# Rebuild the text line by line (words in reading order)
+	lines: Dict[Tuple[int, int, int], List[str]] = {}
+	line_ids = zip(data.get("block_num", []), data.get("par_num", []), data.get("line_num", []))
+	for raw, key in zip(texts, line_ids):
+		raw = (raw or "").strip()
+		if raw:
+			lines.setdefault(key, []).append(raw)
+
+	result["tokens"] = tokens
+	result["avg_conf"] = sum(conf_values) / len(conf_values) if conf_values else 0.0
+	result["text"] = "\n".join(" ".join(words) for words in lines.values())
+	result["layout"] = describe_layout(data)
+	return result
+
+
+def _analyze_orthography(
+	text_for_analysis: str,
+	token_objs: List[Dict[str, Any]],
+	expected_text: Optional[str],
+	lexicon: set,
+	spelling: SpellIndex,
+) -> Dict[str, Any]:
 	"""
-	Intelligent OCR Pipeline for Albanian Language Documents.
-	
-	Pipeline stages:
-	1. Image preprocessing (deskew, contrast, denoise, threshold)
-	2. Multi-engine OCR (Tesseract sqi + PaddleOCR)
-	3. LLM post-processing (GPT-4 for language refinement) [optional]
-	4. Rule-based orthography analysis
-	
-	Parameters:
-	- image: Scanned image or photo of Albanian text
-	- expected_text: Optional reference text for comparison
-	- use_llm: Enable GPT-4 post-processing (default: True)
-	
-	Returns:
-	- extracted_text: Raw OCR output
-	- refined_text: LLM-corrected text (if use_llm=True)
-	- llm_corrections: List of corrections made by LLM
-	- issues: Orthography issues detected
+	Stage 4: rule-based orthography analysis of the (refined) OCR text.
+	Cheap compared to OCR/LLM, so it is recomputed on every request, cache hits included.
 	"""
-
-	if not pytesseract or not Image:
-		raise HTTPException(
-			status_code=501,
-			detail="OCR libraries not installed. Install pillow and pytesseract with system-level tesseract."
-		)
-
-	content = await image.read()
-	try:
-		ocr_image = Image.open(BytesIO(content))
-	except Exception as exc:
-		raise HTTPException(status_code=400, detail="Invalid image file") from exc
-
-	# Deskew + preprocess
-	deskewed = _deskew_image(ocr_image)
-	ocr_ready = _preprocess_for_ocr(deskewed)
-	token_objs, avg_conf = _extract_tokens_with_confidence(ocr_ready)
-
-	# Multi-pass OCR: provo disa konfigurime për të rritur saktësinë në shkrim dore
-	ocr_candidates: List[Tuple[str, str]] = []  # (text, engine)
-
-	def _try_ocr(cfg: str, use_lang: bool = True) -> None:
-		try:
-			txt = pytesseract.image_to_string(
-				ocr_ready,
-				lang="sqi" if use_lang else None,
-				config=cfg,
-			).strip()
-			if txt:
-				ocr_candidates.append((txt, "tesseract"))
-		except Exception:
-			pass
-
-	# Konfigurime të ndryshme psm/oem + whitelist për alfabetin shqip
-	common_cfg = "-c preserve_interword_spaces=1 -c tessedit_char_whitelist=\"A-Za-zËÇëç?.,' -\""
-	_try_ocr(f"--oem 1 --psm 6 {common_cfg}", True)
-	_try_ocr(f"--oem 1 --psm 4 {common_cfg}", True)
-	_try_ocr(f"--oem 1 --psm 7 {common_cfg}", True)  # single line
-	_try_ocr(f"--oem 1 --psm 11 {common_cfg}", True)  # sparse text
-	_try_ocr(f"--oem 1 --psm 13 {common_cfg}", True)  # raw line
-
-	# Fallback pa lang nëse sqi mungon
-	_try_ocr(f"--oem 1 --psm 6 {common_cfg}", False)
-	_try_ocr(f"--oem 1 --psm 4 {common_cfg}", False)
-
-	# PaddleOCR fallback (nëse është instaluar) për shkrim dore
-	paddle_text = _run_paddle_fallback(deskewed)
-	if paddle_text:
-		ocr_candidates.append((paddle_text, "paddleocr"))
-
-	def _score(text: str) -> int:
-		# Shkronja alfabetike + gjatësi: zgjedhim më të “lexueshmen”
-		alpha = sum(ch.isalpha() for ch in text)
-		return alpha + len(text)
-
-	if not ocr_candidates:
-		raise HTTPException(status_code=500, detail="OCR processing failed")
-
-	best_text, engine_used = max(ocr_candidates, key=lambda x: _score(x[0]))
-	extracted = best_text
-
-	# ========================================================================
-	# STAGE 3: LLM POST-PROCESSING (GPT-4 Language Refinement)
-	# ========================================================================
-	llm_result = _llm_refine_ocr_text(extracted, use_llm=use_llm)
-	refined_text = llm_result["refined_text"]
-	llm_corrections = llm_result["corrections"]
-	llm_confidence = llm_result["confidence"]
-	llm_model = llm_result["model_used"]
-	llm_time = llm_result["processing_time_ms"]
-
 	errors: List[Dict[str, Any]] = []
 	suggestions: List[str] = []
 	issues: List[Dict[str, Any]] = []
 
-	# Use refined text for analysis if LLM was used
-	text_for_analysis = refined_text if use_llm and llm_model != "none" else extracted
 	extracted_norm = _norm_text(text_for_analysis)
 	extracted_tokens = [t["token"] for t in token_objs] if token_objs else _tokenize_sq(extracted_norm)
 	expected_norm = _norm_text(expected_text) if expected_text else ""
 	expected_tokens = _tokenize_sq(expected_norm) if expected_text else []
 
-	lexicon, buckets = _build_lexicon(db)
-
 	if expected_text:
-		# Compare token-by-token against expected reference text (orthography check)
-		max_len = max(len(extracted_tokens), len(expected_tokens))
-		for idx in range(max_len):
-			rec_word = extracted_tokens[idx] if idx < len(extracted_tokens) else ""
-			exp_word = expected_tokens[idx] if idx < len(expected_tokens) else ""
-			if rec_word.lower() != exp_word.lower():
-				errors.append({"position": idx + 1, "expected": exp_word, "recognized": rec_word})
-				issues.append({
-					"position": idx + 1,
-					"token": rec_word or exp_word,
-					"type": "mismatch_expected",
-					"message": "Fjala nuk përputhet me tekstin e pritur.",
-					"expected": exp_word,
-					"recognized": rec_word,
-					"suggestions": [exp_word] if exp_word else [],
-					"ocr_confidence": (token_objs[idx]["confidence"] if token_objs and idx < len(token_objs) else None),
-					**_issue_meta("mismatch_expected", None, bool(exp_word)),
-				})
-				if exp_word:
-					suggestions.append(exp_word)
+		# Align words against the expected reference text: a missing or extra word is
+		# reported once instead of shifting every following word into a mismatch
+		recognized_pos = 0
+		for op in align_words(expected_tokens, extracted_tokens):
+			if op["op"] == "equal":
+				recognized_pos = op["b_index"] + 1
+				continue
+			exp_word = op["a"] or ""
+			rec_word = op["b"] or ""
+			if op["b_index"] is not None:
+				recognized_pos = op["b_index"] + 1
+				position = recognized_pos
+				conf = token_objs[op["b_index"]]["confidence"] if token_objs and op["b_index"] < len(token_objs) else None
+			else:
+				position = recognized_pos + 1  # where the missing word should have been
+				conf = None
+
+			if op["op"] == "substitute":
+				issue_type = "mismatch_expected"
+				msg = "Fjala nuk përputhet me tekstin e pritur."
+			elif op["op"] == "delete":
+				issue_type = "missing_word"
+				msg = "Mungon një fjalë e tekstit të pritur."
+			else:
+				issue_type = "extra_word"
+				msg = "Fjalë e tepërt që nuk është në tekstin e pritur."
+
+			errors.append({
+				"position": position,
+				"expected": exp_word,
+				"recognized": rec_word,
+				"type": op["op"],
+				"expected_position": op["a_index"] + 1 if op["a_index"] is not None else None,
+			})
+			issue = {
+				"position": position,
+				"token": rec_word or exp_word,
+				"type": issue_type,
+				"message": msg,
+				"expected": exp_word,
+				"recognized": rec_word,
+				"suggestions": [exp_word] if exp_word else [],
+				"ocr_confidence": conf,
+				**_issue_meta(issue_type, None, bool(exp_word)),
+			}
+			if op["op"] == "substitute":
+				issue["char_diffs"] = [
+					{
+						"op": c["op"],
+						"index": c["a_index"] if c["a_index"] is not None else c["b_index"],
+						"expected": c["a"],
+						"recognized": c["b"],
+					}
+					for c in op["chars"]
+				]
+			issues.append(issue)
+			if exp_word:
+				suggestions.append(exp_word)
 	else:
 		# No reference text: run Albanian spelling heuristics using corpus lexicon
 		for idx, tok in enumerate(extracted_tokens, start=1):
@@ -638,7 +578,7 @@ async def analyze_dictation(
 					msg = "Dyshohet shkronjë e dyfishtë (shpesh gabim OCR ose gabim drejtshkrimi)."
 			else:
 				# Second: distance-based suggestions from corpus
-				sugs = _suggest_from_lexicon(w, buckets, max_suggestions=5)
+				sugs = _suggest_from_lexicon(w, spelling, max_suggestions=5)
 				if sugs and _is_diacritics_variant(w, sugs[0]):
 					issue_type = "diacritics_suspected"
 					msg = "Dyshohet gabim te ë/e ose ç/c. Shiko sugjerimet."
@@ -656,24 +596,571 @@ async def analyze_dictation(
 				**_issue_meta(issue_type, conf, bool(sugs)),
 			})
 
+	return {
+		"errors": errors,
+		"suggestions": suggestions,
+		"issues": issues,
+		"tokens_extracted": len(extracted_tokens),
+	}
+
+
+def _open_image(content: bytes) -> "Image.Image":
+	try:
+		img = _TESSERACT.get().Image.open(BytesIO(content))
+		img.load()
+	except Exception as exc:
+		raise HTTPException(status_code=400, detail="Invalid image file") from exc
+	return img
+
+
+def _rotate_180(img: "Image.Image") -> "Image.Image":
+	return img.rotate(180)
+
+
+def _plain(text: str) -> str:
+	return " ".join(text.lower().split())
+
+
+async def _extract_ocr(content: bytes, db: Session, lexicon: set, expected_text: Optional[str] = None) -> Dict[str, Any]:
+	"""
+	Stages 1-2: preprocessing + planned OCR passes, cached per image.
+	expected_text only decides which pass the planner credits with the win.
+
+	Everything from decoding to the last pass shares one OCR_DEADLINE_SECONDS
+	budget; each stage gets what is left of it.
+
+	Returns:
+		{"text", "engine", "pass", "tokens", "avg_conf", "plan", "passes", "cache": "hit" | "miss"}
+	"""
+	deadline = time.monotonic() + OCR_DEADLINE_SECONDS
+
+	def _left() -> float:
+		return deadline - time.monotonic()
+
+	async def _staged(fn: Callable, *args) -> Any:
+		# The pool thread can't be interrupted, but the request stops waiting for it
+		if _left() <= 0:
+			raise asyncio.TimeoutError
+		return await asyncio.wait_for(run_in_pool(fn, *args), timeout=_left())
+
+	# Only images that decoded are cached, so a hit skips decoding altogether
+	key = ocr_cache.content_key(content)
+	cached = ocr_cache.get_ocr(key)
+	if cached is not None:
+		return {**cached, "cache": "hit"}
+
+	try:
+		ocr_image = await _staged(_open_image, content)
+	except asyncio.TimeoutError:
+		raise HTTPException(status_code=504, detail="OCR processing timed out")
+
+	# Pass 1: image_to_data gives token confidences, layout and the first candidate
+	try:
+		deskewed = await _staged(_deskew_image, ocr_image)
+		ocr_ready = await _staged(_preprocess_for_ocr, deskewed)
+		data_pass = await _staged(_extract_tokens_with_confidence, ocr_ready, _left())
+	except asyncio.TimeoutError:
+		raise HTTPException(status_code=504, detail="OCR processing timed out")
+	tesseract_calls = 1
+
+	# Projection profiles can't tell an upside-down page; retry flipped only when it reads badly
+	if data_pass["avg_conf"] < LOW_CONFIDENCE:
+		try:
+			flipped = await _staged(_rotate_180, deskewed)
+			flipped_ready = await _staged(_preprocess_for_ocr, flipped)
+			flipped_pass = await _staged(_extract_tokens_with_confidence, flipped_ready, _left())
+			tesseract_calls += 1
+			if flipped_pass["avg_conf"] > data_pass["avg_conf"]:
+				deskewed, ocr_ready, data_pass = flipped, flipped_ready, flipped_pass
+		except asyncio.TimeoutError:
+			pass  # keep the upright reading; run_passes below sees no time left
+
+	# Extra passes chosen by the planner (confidence band + layout + learned win rates)
+	layout = data_pass["layout"]
+	all_passes = _build_ocr_passes(ocr_ready, deskewed)
+	# Session work goes to the threadpool: batch sheets run concurrently on the event loop
+	plan = await run_in_threadpool(plan_passes, db, data_pass["avg_conf"], layout["layout"], [p.name for p in all_passes])
+	ocr_run = await run_passes(
+		[p for p in all_passes if p.name in plan["passes"]],
+		score=lambda text: _candidate_quality(text, lexicon),
+		deadline_seconds=max(0.0, _left()),
+	)
+	tesseract_calls += sum(1 for name in ocr_run["completed"] if name != "paddle")
+
+	ocr_candidates: List[Tuple[str, str, str]] = []  # (text, engine, pass)
+	if data_pass["text"].strip():
+		ocr_candidates.append((data_pass["text"].strip(), "tesseract", DATA_PASS))
+	ocr_candidates += [(c["text"], c["engine"], c["pass"]) for c in ocr_run["candidates"]]
+
+	if not ocr_candidates:
+		if ocr_run["timed_out"]:
+			raise HTTPException(status_code=504, detail="OCR processing timed out")
+		raise HTTPException(status_code=500, detail="OCR processing failed")
+
+	best_text, engine_used, best_pass = max(ocr_candidates, key=lambda x: _readability_score(x[0]))
+	# The planner learns from the reading closest to the expected text when there is one.
+	# The reported text stays the most readable: picking it by the expected text would
+	# hide the student's own mistakes.
+	winner = best_pass
+	if expected_text and expected_text.strip():
+		target = _plain(expected_text)
+		winner = max(ocr_candidates, key=lambda x: similarity_ratio(_plain(x[0]), target))[2]
+	ran = ([DATA_PASS] if data_pass["tokens"] or data_pass["text"] else []) + ocr_run["completed"]
+	await run_in_threadpool(record_outcome, db, plan["bucket"], ran, winner)
+
+	result = {
+		"text": best_text,
+		"engine": engine_used,
+		"pass": best_pass,
+		"tokens": data_pass["tokens"],
+		"avg_conf": data_pass["avg_conf"],
+		"plan": {
+			"bucket": plan["bucket"],
+			"passes": plan["passes"],
+			"reason": plan["reason"],
+			"layout": layout,
+			"winner": winner,
+			"tesseract_invocations": tesseract_calls,
+		},
+		"passes": {
+			"total": ocr_run["passes_total"],
+			"completed": ocr_run["passes_completed"],
+			"failed": ocr_run["passes_failed"],
+			"early_exit": ocr_run["early_exit"],
+			"timed_out": ocr_run["timed_out"],
+			"elapsed_ms": ocr_run["elapsed_ms"],
+		},
+	}
+	# Don't cache a result cut short by the deadline; a retry may do better
+	if not ocr_run["timed_out"]:
+		ocr_cache.put_ocr(key, result)
+	return {**result, "cache": "miss"}
+
+
+async def _refine_text(text: str, use_llm: bool, db: Session) -> Dict[str, Any]:
+	"""
+	Stage 3: local noisy-channel correction first; the LLM only sees texts the
+	corrector isn't confident about. LLM results are cached by their input text.
+	"""
+	if not use_llm or not text.strip():
+		return {**_llm_refine_ocr_text(text, use_llm=False), "cache": "off"}
+
+	start_time = time.time()
+	index = await run_in_threadpool(lexicon_store.get_lexicon, db)
+	model = await run_in_threadpool(ocr_correct.get_model, db)
+	local = await run_in_threadpool(ocr_correct.correct_text, text, index, model)
+	local_result = {
+		"refined_text": local["text"],
+		"corrections": local["corrections"],
+		"confidence": local["min_confidence"],
+		"model_used": "noisy_channel",
+		"processing_time_ms": int((time.time() - start_time) * 1000),
+		"uncertain_tokens": local["uncertain"],
+	}
+	if local["confident"] or not LLM_AVAILABLE:
+		return {**local_result, "cache": "skipped"}
+
+	cached = ocr_cache.get_llm(local["text"])
+	if cached is not None:
+		result, cache = cached, "hit"
+	else:
+		result = await run_in_threadpool(_llm_refine_ocr_text, local["text"], use_llm)
+		cache = "miss"
+		if result["model_used"] in ("none", "fallback"):
+			return {**local_result, "cache": "miss"}
+		ocr_cache.put_llm(local["text"], result)
+	return {
+		**result,
+		"corrections": local["corrections"] + list(result.get("corrections") or []),
+		"model_used": f"noisy_channel+{result['model_used']}",
+		"processing_time_ms": int((time.time() - start_time) * 1000),
+		"uncertain_tokens": local["uncertain"],
+		"cache": cache,
+	}
+
+
+async def _analyze_image(
+	content: bytes,
+	expected_text: Optional[str],
+	use_llm: bool,
+	db: Session,
+	lexicon: set,
+	spelling: SpellIndex,
+) -> OCRAnalysisOut:
+	"""Full pipeline for one image (shared by /ocr/analyze and /ocr/analyze-batch)."""
+	ocr = await _extract_ocr(content, db, lexicon, expected_text)
+	extracted = ocr["text"]
+	token_objs = ocr["tokens"]
+	if expected_text and ocr["cache"] == "miss":
+		# Training data for the noisy-channel corrector's confusion counts
+		await run_in_threadpool(ocr_correct.record_pair, db, extracted, expected_text)
+
+	# ========================================================================
+	# STAGE 3: POST-PROCESSING (noisy-channel corrector, GPT-4 when it is unsure)
+	# ========================================================================
+	llm_result = await _refine_text(extracted, use_llm, db)
+	refined_text = llm_result["refined_text"]
+	llm_model = llm_result["model_used"]
+
+	# Use refined text for analysis if LLM was used
+	text_for_analysis = refined_text if use_llm and llm_model != "none" else extracted
+	analysis = _analyze_orthography(text_for_analysis, token_objs, expected_text, lexicon, spelling)
+
 	return OCRAnalysisOut(
 		extracted_text=_norm_text(extracted),  # Raw OCR output
 		refined_text=refined_text if use_llm and llm_model != "none" else None,
-		errors=errors,
-		suggestions=suggestions,
-		issues=issues,
-		llm_corrections=llm_corrections,
+		errors=analysis["errors"],
+		suggestions=analysis["suggestions"],
+		issues=analysis["issues"],
+		llm_corrections=llm_result["corrections"],
 		meta={
 			"language": "sqi",
 			"expected_provided": bool(expected_text),
-			"tokens_extracted": len(extracted_tokens),
-			"issues_found": len(issues),
-			"ocr_confidence_avg": avg_conf,
-			"ocr_engine": engine_used,
+			"tokens_extracted": analysis["tokens_extracted"],
+			"issues_found": len(analysis["issues"]),
+			"ocr_confidence_avg": ocr["avg_conf"],
+			"ocr_engine": ocr["engine"],
+			"ocr_plan": ocr["plan"],
+			"ocr_passes": ocr["passes"],
+			"cache": {"ocr": ocr["cache"], "llm": llm_result["cache"]},
 			"llm_enabled": use_llm,
 			"llm_model": llm_model,
-			"llm_confidence": llm_confidence,
-			"llm_processing_time_ms": llm_time,
+			"llm_confidence": llm_result["confidence"],
+			"llm_processing_time_ms": llm_result["processing_time_ms"],
+			"refine_uncertain_tokens": llm_result.get("uncertain_tokens"),
 			"pipeline_version": "2.0-llm",
 		},
 	)
+
+
+@router.post("/ocr/analyze", response_model=OCRAnalysisOut)
+async def analyze_dictation(
+	image: UploadFile = File(...),
+	expected_text: Optional[str] = Form(None),
+	use_llm: bool = Form(True),  # Enable LLM post-processing by default
+	db: Session = Depends(get_db)
+):
+	"""
+	Intelligent OCR Pipeline for Albanian Language Documents.
+	
+	Pipeline stages:
+	1. Image preprocessing (deskew, contrast, denoise, threshold)
+	2. Multi-engine OCR (Tesseract sqi + PaddleOCR)
+	3. Post-processing [optional]: local noisy-channel corrector; GPT-4 only for
+	   texts the corrector isn't confident about
+	4. Rule-based orthography analysis
+	
+	Parameters:
+	- image: Scanned image or photo of Albanian text
+	- expected_text: Optional reference text for comparison
+	- use_llm: Enable post-processing (default: True)
+	
+	Returns:
+	- extracted_text: Raw OCR output
+	- refined_text: Corrected text (if use_llm=True)
+	- llm_corrections: Corrections (noisy-channel ones carry a probability)
+	- issues: Orthography issues detected
+	"""
+
+	if not _TESSERACT.available:
+		raise HTTPException(
+			status_code=501,
+			detail="OCR libraries not installed. Install pillow and pytesseract with system-level tesseract."
+		)
+
+	content = await image.read()
+	lexicon, spelling = await run_in_threadpool(_build_lexicon, db)
+	return await _analyze_image(content, expected_text, use_llm, db, lexicon, spelling)
+
+
+# ============================================================================
+# BATCH ANALYSIS (a whole class's dictation sheets)
+# ============================================================================
+
+OCR_BATCH_MAX_IMAGES = int(os.getenv("OCR_BATCH_MAX_IMAGES", "60"))
+OCR_BATCH_MAX_IMAGE_BYTES = int(os.getenv("OCR_BATCH_MAX_IMAGE_BYTES", str(15 * 1024 * 1024)))
+# Images in flight at once; their OCR passes share the OCR worker pool
+OCR_BATCH_CONCURRENCY = int(os.getenv("OCR_BATCH_CONCURRENCY", "4"))
+_BATCH_IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp", ".webp", ".heic")
+
+
+def _upload_size(upload: UploadFile) -> int:
+	# The multipart parser spools uploads to temporary files; their size is known without reading them
+	upload.file.seek(0, os.SEEK_END)
+	size = upload.file.tell()
+	upload.file.seek(0)
+	return size
+
+
+def _zip_sheets(archive: zipfile.ZipFile) -> List[Tuple[str, Callable[[], Awaitable[bytes]]]]:
+	"""The archive's images, checked against the batch limits from its directory alone; each read on demand."""
+	sheets: List[Tuple[str, Callable[[], Awaitable[bytes]]]] = []
+	for info in sorted(archive.infolist(), key=lambda i: i.filename):
+		name = info.filename
+		if info.is_dir() or name.startswith("__MACOSX/") or os.path.basename(name).startswith("."):
+			continue
+		if not name.lower().endswith(_BATCH_IMAGE_EXTS):
+			continue
+		if info.file_size > OCR_BATCH_MAX_IMAGE_BYTES:
+			raise HTTPException(status_code=413, detail=f"{name} is too large")
+
+		async def _read(info: zipfile.ZipInfo = info) -> bytes:
+			return await run_in_threadpool(archive.read, info)
+		sheets.append((name, _read))
+		if len(sheets) > OCR_BATCH_MAX_IMAGES:
+			break
+	return sheets
+
+
+def _class_report(results: List[Dict[str, Any]], expected_text: Optional[str], top_n: int = 10) -> Dict[str, Any]:
+	"""
+	Aggregate per-image results into a class report: most common issue types,
+	most often misspelled expected words and (expected, written) pairs, per-sheet accuracy.
+	"""
+	issue_types: Counter = Counter()
+	missed_words: Counter = Counter()
+	mistake_pairs: Counter = Counter()
+	flagged_tokens: Counter = Counter()
+	expected_count = len(_tokenize_sq(_norm_text(expected_text))) if expected_text else 0
+	sheets = []
+
+	for r in results:
+		analysis = r["result"]
+		for issue in analysis["issues"]:
+			issue_types[issue["type"]] += 1
+			if not expected_text and issue["type"] != "low_confidence":
+				flagged_tokens[(issue.get("token") or "").lower()] += 1
+		for err in analysis["errors"]:
+			exp = (err.get("expected") or "").lower()
+			rec = (err.get("recognized") or "").lower()
+			if exp:
+				missed_words[exp] += 1
+			mistake_pairs[(exp, rec)] += 1
+		sheet = {"index": r["index"], "filename": r["filename"], "issues": len(analysis["issues"])}
+		if expected_count:
+			sheet["word_accuracy"] = round(max(0.0, 1.0 - len(analysis["errors"]) / expected_count), 3)
+		sheets.append(sheet)
+
+	report: Dict[str, Any] = {
+		"sheets_analyzed": len(results),
+		"issue_types": dict(issue_types.most_common()),
+		"sheets": sorted(sheets, key=lambda s: s["index"]),
+	}
+	if expected_text:
+		accuracies = [s["word_accuracy"] for s in sheets if "word_accuracy" in s]
+		report["average_word_accuracy"] = round(sum(accuracies) / len(accuracies), 3) if accuracies else None
+		report["most_missed_words"] = [{"word": w, "sheets": c} for w, c in missed_words.most_common(top_n)]
+		report["most_common_mistakes"] = [
+			{"expected": e, "written": w, "count": c} for (e, w), c in mistake_pairs.most_common(top_n)
+		]
+	else:
+		report["most_flagged_words"] = [{"word": w, "count": c} for w, c in flagged_tokens.most_common(top_n)]
+	return report
+
+
+def _stream_line(payload: Dict[str, Any], fmt: str) -> str:
+	data = json.dumps(payload, ensure_ascii=False, default=str)
+	if fmt == "sse":
+		return f"event: {payload['type']}\ndata: {data}\n\n"
+	return data + "\n"
+
+
+@router.post("/ocr/analyze-batch")
+async def analyze_dictation_batch(
+	images: List[UploadFile] = File(None),
+	archive: Optional[UploadFile] = File(None),
+	expected_text: Optional[str] = Form(None),
+	use_llm: bool = Form(True),
+	stream_format: str = Form("ndjson"),
+):
+	"""
+	Analyze a whole class's dictation sheets in one request.
+
+	Parameters:
+	- images: one or more image files (multipart), and/or
+	- archive: a zip with the images
+	- expected_text: the dictation text, shared by all sheets
+	- use_llm: Enable GPT-4 post-processing
+	- stream_format: "ndjson" (default) or "sse"
+
+	Sheets stay in the spooled upload (or the archive) until their turn, so at
+	most OCR_BATCH_CONCURRENCY images are held in memory, and each sheet has
+	its own database session.
+
+	Results are streamed as each sheet finishes (not in upload order):
+	- {"type": "result", "index", "filename", "result": {...same as /ocr/analyze...}}
+	- {"type": "error", "index", "filename", "status_code", "detail"}
+	- {"type": "report", ...class report...} as the last line
+	"""
+	if not _TESSERACT.available:
+		raise HTTPException(
+			status_code=501,
+			detail="OCR libraries not installed. Install pillow and pytesseract with system-level tesseract."
+		)
+	if stream_format not in ("ndjson", "sse"):
+		raise HTTPException(status_code=400, detail="stream_format must be 'ndjson' or 'sse'")
+
+	sheets: List[Tuple[str, Callable[[], Awaitable[bytes]]]] = []
+	for upload in images or []:
+		if _upload_size(upload) > OCR_BATCH_MAX_IMAGE_BYTES:
+			raise HTTPException(status_code=413, detail=f"{upload.filename} is too large")
+		sheets.append((upload.filename or f"image_{len(sheets) + 1}", upload.read))
+	zip_file = None
+	if archive is not None:
+		try:
+			# Opened on the spooled upload: only the central directory is read here
+			zip_file = zipfile.ZipFile(archive.file)
+		except zipfile.BadZipFile as exc:
+			raise HTTPException(status_code=400, detail="Invalid zip archive") from exc
+		sheets.extend(_zip_sheets(zip_file))
+	if not sheets:
+		raise HTTPException(status_code=400, detail="No images provided")
+	if len(sheets) > OCR_BATCH_MAX_IMAGES:
+		raise HTTPException(status_code=413, detail=f"Too many images (max {OCR_BATCH_MAX_IMAGES})")
+
+	def _load_lexicon() -> Tuple[set, SpellIndex]:
+		db = SessionLocal()
+		try:
+			return _build_lexicon(db)
+		finally:
+			db.close()
+
+	async def _generate():
+		try:
+			# Built once for the whole batch
+			lexicon, spelling = await run_in_threadpool(_load_lexicon)
+			semaphore = asyncio.Semaphore(max(1, OCR_BATCH_CONCURRENCY))
+
+			async def _one(index: int, filename: str, read: Callable[[], Awaitable[bytes]]) -> Dict[str, Any]:
+				async with semaphore:
+					# A session per sheet: sheets commit (planner outcomes, training pairs) concurrently
+					db = SessionLocal()
+					try:
+						result = await _analyze_image(await read(), expected_text, use_llm, db, lexicon, spelling)
+						return {"type": "result", "index": index, "filename": filename, "result": result.model_dump()}
+					except HTTPException as exc:
+						return {"type": "error", "index": index, "filename": filename, "status_code": exc.status_code, "detail": exc.detail}
+					except Exception as exc:
+						print(f"[OCR BATCH] {filename}: {exc}")
+						return {"type": "error", "index": index, "filename": filename, "status_code": 500, "detail": "OCR processing failed"}
+					finally:
+						await run_in_threadpool(db.close)
+
+			tasks = [asyncio.ensure_future(_one(i, name, read)) for i, (name, read) in enumerate(sheets)]
+			done: List[Dict[str, Any]] = []
+			try:
+				for next_done in asyncio.as_completed(tasks):
+					item = await next_done
+					if item["type"] == "result":
+						done.append(item)
+					yield _stream_line(item, stream_format)
+			finally:
+				for task in tasks:
+					task.cancel()
+
+			report = _class_report(done, expected_text)
+			report.update({"type": "report", "sheets_submitted": len(sheets), "sheets_failed": len(sheets) - len(done)})
+			yield _stream_line(report, stream_format)
+		finally:
+			if zip_file is not None:
+				zip_file.close()
+
+	media_type = "text/event-stream" if stream_format == "sse" else "application/x-ndjson"
+	return StreamingResponse(_generate(), media_type=media_type)
+
+
+# ============================================================================
+# JOB QUEUE (submit now, poll or subscribe for the result)
+# ============================================================================
+
+# How long /ocr/jobs/{id}/events keeps a subscription open
+OCR_JOB_EVENTS_TIMEOUT_SECONDS = float(os.getenv("OCR_JOB_EVENTS_TIMEOUT_SECONDS", "300"))
+
+
+async def _run_ocr_job(db: Session, job) -> Dict[str, Any]:
+	lexicon, spelling = await run_in_threadpool(_build_lexicon, db)
+	result = await _analyze_image(job.image, job.expected_text, job.use_llm, db, lexicon, spelling)
+	return result.model_dump()
+
+
+def start_job_workers() -> None:
+	"""Called from the app lifespan: picks up jobs left queued by a previous process."""
+	if _TESSERACT.available:
+		ocr_jobs.start(_run_ocr_job)
+
+
+@router.post("/ocr/jobs", status_code=202)
+async def submit_ocr_job(
+	image: UploadFile = File(...),
+	expected_text: Optional[str] = Form(None),
+	use_llm: bool = Form(True),
+	db: Session = Depends(get_db),
+):
+	"""
+	Queue an analysis (same parameters as /ocr/analyze) and return at once.
+
+	Returns {"job_id", "status", "status_url", "events_url", ...}. Resubmitting
+	the same image and parameters returns the existing job; if it is already
+	done the response is 200 and includes "result".
+	"""
+	if not _TESSERACT.available:
+		raise HTTPException(
+			status_code=501,
+			detail="OCR libraries not installed. Install pillow and pytesseract with system-level tesseract."
+		)
+
+	# Checked on the spooled upload: the image is stored in the job row until it is done
+	if _upload_size(image) > ocr_jobs.OCR_JOB_MAX_IMAGE_BYTES:
+		raise HTTPException(status_code=413, detail=f"Image too large (max {ocr_jobs.OCR_JOB_MAX_IMAGE_BYTES // (1024 * 1024)} MB)")
+	content = await image.read()
+	if not content:
+		raise HTTPException(status_code=400, detail="Invalid image file")
+	ocr_jobs.start(_run_ocr_job)
+	job = await run_in_threadpool(ocr_jobs.submit, db, content, expected_text, use_llm)
+	payload = await run_in_threadpool(ocr_jobs.job_payload, db, job)
+	payload["status_url"] = f"/api/ocr/jobs/{job.id}"
+	payload["events_url"] = f"/api/ocr/jobs/{job.id}/events"
+	return JSONResponse(payload, status_code=200 if job.status == "done" else 202)
+
+
+@router.get("/ocr/jobs/{job_id}")
+def get_ocr_job(job_id: str, db: Session = Depends(get_db)):
+	"""
+	Job status: "queued" (with queue_position), "running", "done" (with the
+	/ocr/analyze response as "result") or "failed" (with status_code, detail).
+	"""
+	job = ocr_jobs.get_job(db, job_id)
+	if job is None:
+		raise HTTPException(status_code=404, detail="OCR job not found")
+	return ocr_jobs.job_payload(db, job)
+
+
+@router.get("/ocr/jobs/{job_id}/events")
+async def ocr_job_events(job_id: str):
+	"""
+	Server-sent events for a job: a "status" event on every change and a
+	final "done" or "failed" event with the same payload as GET /ocr/jobs/{id}.
+	"""
+	if await run_in_threadpool(ocr_jobs.poll_payload, job_id) is None:
+		raise HTTPException(status_code=404, detail="OCR job not found")
+
+	async def _generate():
+		deadline = time.time() + OCR_JOB_EVENTS_TIMEOUT_SECONDS
+		last_status = None
+		while True:
+			payload = await run_in_threadpool(ocr_jobs.poll_payload, job_id)
+			if payload is None:
+				yield _stream_line({"type": "failed", "status_code": 404, "detail": "OCR job not found"}, "sse")
+				return
+			if payload["status"] in ocr_jobs.FINISHED:
+				yield _stream_line({**payload, "type": payload["status"]}, "sse")
+				return
+			if payload["status"] != last_status:
+				last_status = payload["status"]
+				yield _stream_line({**payload, "type": "status"}, "sse")
+			if time.time() >= deadline:
+				return
+			# Woken at once by this process's workers; polls for jobs run elsewhere
+			await ocr_jobs.wait_for_change(job_id, ocr_jobs.OCR_JOB_POLL_SECONDS)
+
+	return StreamingResponse(_generate(), media_type="text/event-stream")
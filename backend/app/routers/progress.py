@@ -4,13 +4,14 @@ from sqlalchemy import func, and_
 from typing import List
 from ..database import get_db
 from .. import models, schemas
+from .. import content_cache
 
 
 router = APIRouter()
 
 
 @router.get("/progress/{user_id}", response_model=List[schemas.ProgressOut])
-def get_user_progress(user_id: str, db: Session = Depends(get_db)):
+def get_user_progress(user_id: int, db: Session = Depends(get_db)):
 	"""Get progress for all categories for a user"""
 	progress = (
 		db.query(models.Progress)
@@ -21,7 +22,7 @@ def get_user_progress(user_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/progress/{user_id}/status", response_model=List[schemas.CategoryStatusOut])
-def get_category_status(user_id: str, db: Session = Depends(get_db)):
+def get_category_status(user_id: int, db: Session = Depends(get_db)):
 	"""Get status for all categories for a user"""
 	# Get user's attempts grouped by category
 	status_data = []
@@ -67,11 +68,26 @@ def get_category_status(user_id: str, db: Session = Depends(get_db)):
 	return status_data
 
 
+def _course_structure(db: Session) -> List[dict]:
+	"""All courses with their levels, serialized (cached per content version)."""
+	courses = db.query(models.Course).order_by(models.Course.order_index).all()
+	levels = {}
+	for level in db.query(models.Level).order_by(models.Level.order_index):
+		levels.setdefault(level.course_id, []).append(schemas.LevelOut.model_validate(level).model_dump())
+	return [
+		{
+			"course": schemas.CourseOut.model_validate(course).model_dump(),
+			"levels": levels.get(course.id, []),
+		}
+		for course in courses
+	]
+
+
 @router.get("/progress/{user_id}/overview", response_model=schemas.UserProgressOut)
-def get_user_overview(user_id: str, db: Session = Depends(get_db)):
+def get_user_overview(user_id: int, db: Session = Depends(get_db)):
 	"""Get comprehensive overview of user progress across all courses"""
-	# Get all courses
-	courses = db.query(models.Course).order_by(models.Course.order_index).all()
+	# Get all courses with their levels from the content cache
+	courses = content_cache.cached("course-structure", _course_structure)
 	
 	# Get user's progress
 	user_progress = (
@@ -86,19 +102,13 @@ def get_user_overview(user_id: str, db: Session = Depends(get_db)):
 	
 	course_progress_list = []
 	
-	for course in courses:
-		# Get levels for this course
-		levels = (
-			db.query(models.Level)
-			.filter(models.Level.course_id == course.id)
-			.order_by(models.Level.order_index)
-			.all()
-		)
+	for entry in courses:
+		course = entry["course"]
 		
 		# Get progress for this course
 		course_progress = [
 			p for p in user_progress 
-			if p.course_id == course.id
+			if p.course_id == course["id"]
 		]
 		
 		# Calculate overall score for this course
@@ -110,14 +120,14 @@ def get_user_overview(user_id: str, db: Session = Depends(get_db)):
 			overall_score = 0
 		
 		# Determine if course is unlocked
-		unlocked = course.order_index == 1 or any(p.completed for p in course_progress)
+		unlocked = course["order_index"] == 1 or any(p.completed for p in course_progress)
 		
 		# Determine if course is completed
 		completed = all(p.completed for p in course_progress) if course_progress else False
 		
 		course_progress_list.append(schemas.CourseProgressOut(
 			course=course,
-			levels=levels,
+			levels=entry["levels"],
 			progress=course_progress,
 			unlocked=unlocked,
 			completed=completed,
@@ -133,7 +143,7 @@ def get_user_overview(user_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/courses/{course_id}/levels/{level_id}/progress/{user_id}", response_model=schemas.ProgressOut)
-def get_level_progress(course_id: int, level_id: int, user_id: str, db: Session = Depends(get_db)):
+def get_level_progress(course_id: int, level_id: int, user_id: int, db: Session = Depends(get_db)):
 	"""Get progress for a specific level for a user"""
 	progress = (
 		db.query(models.Progress)
@@ -2,23 +2,37 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 from ..database import get_db
 from .. import models
+from .. import lexicon
+from .. import content_cache
+from .. import corpus
 from passlib.context import CryptContext
-from .seed_albanian_corpus import (
-    seed_first_class_exercises,
-    seed_second_class_exercises,
-    seed_third_class_exercises,
-    seed_fourth_class_exercises,
-    seed_fifth_class_exercises,
-    seed_sixth_class_exercises,
-    seed_seventh_class_exercises,
-    seed_eighth_class_exercises,
-)
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 router = APIRouter()
 
 
+def _seed_class(number: int):
+    """Load one class from its corpus file (app/corpus_data/klasa_<number>.json)"""
+    db = next(get_db())
+
+    try:
+        result = corpus.load_class(db, number)
+        return {
+            "message": f"Successfully seeded {result['courses']} courses for Class {number}",
+            "course_id": result["class_id"],
+            "courses_count": result["courses"],
+            "exercises_count": result["exercises"],
+            "inserted": result["inserted"],
+            "updated": result["updated"],
+            "disabled": result["disabled"],
+            "unchanged": result["unchanged"],
+        }
+    except Exception as e:
+        db.rollback()
+        raise e
+
+
 @router.get("/fix-empty-levels")
 def fix_empty_levels():
     """Add exercises to levels that have 0 exercises"""
@@ -28,10 +42,6 @@ def fix_empty_levels():
     
     db = SessionLocal()
     try:
-        # First, fix the exercises sequence to avoid primary key conflicts
-        db.execute(text("SELECT setval('exercises_id_seq', (SELECT COALESCE(MAX(id), 0) + 1 FROM exercises), false)"))
-        db.commit()
-        
         # Find all levels with 0 exercises
         empty_levels = []
         all_levels = db.query(models.Level).all()
@@ -53,10 +63,6 @@ def fix_empty_levels():
                 level_id = level_info["level_id"]
                 course_id = level_info["course_id"]
                 
-                # Fix sequence again before each batch
-                db2.execute(text("SELECT setval('exercises_id_seq', (SELECT COALESCE(MAX(id), 0) + 1 FROM exercises), false)"))
-                db2.commit()
-                
                 # Create 5 basic exercises for this level - one at a time
                 sample_exercises = [
                     {"prompt": "Shkruaj fjalën 'shkollë'", "answer": "shkollë"},
@@ -93,6 +99,12 @@ def fix_empty_levels():
             finally:
                 db2.close()
         
+        # Raw SQL inserts bypass the lexicon and content cache session hooks
+        if exercises_added:
+            lexicon.rebuild_from_corpus(db)
+            content_cache.bump(db)
+            db.commit()
+        
         # Get updated totals
         total_exercises = db.query(models.Exercise).count()
         
@@ -112,33 +124,21 @@ def fix_empty_levels():
 
 @router.get("/seed-all-classes")
 def seed_all_classes_get():
-    """Seed ALL classes (1-8) with exercises - GET version for easy browser access"""
+    """Seed ALL classes (1-8) from the corpus files - GET version for easy browser access"""
     from ..database import SessionLocal
     
-    results = []
-    seed_functions = [
-        (1, seed_first_class_exercises),
-        (2, seed_second_class_exercises),
-        (3, seed_third_class_exercises),
-        (4, seed_fourth_class_exercises),
-        (5, seed_fifth_class_exercises),
-        (6, seed_sixth_class_exercises),
-        (7, seed_seventh_class_exercises),
-        (8, seed_eighth_class_exercises),
-    ]
-    
-    for class_num, seed_func in seed_functions:
-        # Create a fresh session for each class to avoid transaction issues
-        db = SessionLocal()
-        try:
-            course_id = seed_func(db)
-            db.commit()
-            results.append({"class": class_num, "status": "success", "course_id": course_id})
-        except Exception as e:
-            db.rollback()
-            results.append({"class": class_num, "status": "error", "error": str(e)[:200]})
-        finally:
-            db.close()
+    # One transaction: every file is validated first, unchanged exercises are skipped
+    db = SessionLocal()
+    try:
+        results = [
+            {"class": r["class"], "status": "success", "course_id": r["class_id"],
+             "inserted": r["inserted"], "updated": r["updated"], "disabled": r["disabled"], "unchanged": r["unchanged"]}
+            for r in corpus.load(db)
+        ]
+    except Exception as e:
+        return {"message": "Seeding failed, nothing was written", "error": str(e)[:2000]}
+    finally:
+        db.close()
     
     # Get totals with a fresh session
     db = SessionLocal()
@@ -171,7 +171,7 @@ def seed_database():
         db.query(models.Course).delete()
         db.query(models.User).delete()
         
-        # Create top-level classes 2–9 (first class will be created by seed_first_class_exercises)
+        # Create top-level classes 2–9 (first class comes from the corpus)
         classes = []
         for i in range(2, 10):
             class_data = {
@@ -189,7 +189,7 @@ def seed_database():
         
         # Seed the comprehensive Albanian corpus for first class
         try:
-            seed_first_class_exercises(db)
+            corpus.load_class(db, 1)
             print("Albanian corpus seeded successfully!")
         except Exception as e:
             print(f"Warning: Could not seed Albanian corpus: {e}")
@@ -231,13 +231,13 @@ def seed_albanian_corpus():
         db.query(models.Course).filter(models.Course.name.like("Klasa e Parë%")).delete()
         
         # Seed the new 12-course structure
-        course_id = seed_first_class_exercises(db)
+        result = corpus.load_class(db, 1)
         
         return {
-            "message": "Successfully seeded 12 courses for Class 1",
-            "course_id": course_id,
-            "courses_count": 12,
-            "exercises_count": 93
+            "message": f"Successfully seeded {result['courses']} courses for Class 1",
+            "course_id": result["class_id"],
+            "courses_count": result["courses"],
+            "exercises_count": result["exercises"]
         }
         
     except Exception as e:
@@ -595,150 +595,35 @@ def klasa1_add_courses_with_exercises():
 
 @router.post("/seed-class-2")
 def seed_class_2():
-    """Seed Class 2 with advanced exercises following Class 1 structure"""
-    db = next(get_db())
-    
-    try:
-        # Seed Class 2
-        course_id = seed_second_class_exercises(db)
-        
-        return {
-            "message": "Successfully seeded 12 courses for Class 2",
-            "course_id": course_id,
-            "courses_count": 12,
-            "exercises_count": 93
-        }
-        
-    except Exception as e:
-        db.rollback()
-        raise e
-
+    """Seed Class 2 from its corpus file"""
+    return _seed_class(2)
 
 @router.post("/seed-class-3")
 def seed_class_3():
-    """Seed Class 3 with advanced exercises following the same structure"""
-    db = next(get_db())
-
-    try:
-        course_id = seed_third_class_exercises(db)
-        return {
-            "message": "Successfully seeded 12 courses for Class 3",
-            "course_id": course_id,
-            "courses_count": 12,
-            "exercises_count": 93,
-        }
-    except Exception as e:
-        db.rollback()
-        raise e
-
+    """Seed Class 3 from its corpus file"""
+    return _seed_class(3)
 
 @router.post("/seed-class-4")
 def seed_class_4():
-    """Seed Class 4 with advanced exercises following the same structure"""
-    db = next(get_db())
-
-    try:
-        course_id = seed_fourth_class_exercises(db)
-        return {
-            "message": "Successfully seeded 12 courses for Class 4",
-            "course_id": course_id,
-            "courses_count": 12,
-            "exercises_count": 60,
-        }
-    except Exception as e:
-        db.rollback()
-        raise e
-
+    """Seed Class 4 from its corpus file"""
+    return _seed_class(4)
 
 @router.post("/seed-class-5")
 def seed_class_5():
-    """Seed Class 5 with very advanced exercises following the same structure"""
-    db = next(get_db())
-
-    try:
-        course_id = seed_fifth_class_exercises(db)
-        exercise_count = db.query(models.Exercise).filter(
-            models.Exercise.course_id.in_(
-                db.query(models.Course.id).filter(models.Course.parent_class_id == course_id)
-            )
-        ).count()
-        return {
-            "message": "Successfully seeded 12 courses for Class 5",
-            "course_id": course_id,
-            "courses_count": 12,
-            "exercises_count": exercise_count,
-        }
-    except Exception as e:
-        db.rollback()
-        raise e
-
+    """Seed Class 5 from its corpus file"""
+    return _seed_class(5)
 
 @router.post("/seed-class-6")
 def seed_class_6():
-    """Seed Class 6 with extremely advanced exercises following the same structure"""
-    db = next(get_db())
-
-    try:
-        course_id = seed_sixth_class_exercises(db)
-        exercise_count = db.query(models.Exercise).filter(
-            models.Exercise.course_id.in_(
-                db.query(models.Course.id).filter(models.Course.parent_class_id == course_id)
-            )
-        ).count()
-        return {
-            "message": "Successfully seeded 12 courses for Class 6",
-            "course_id": course_id,
-            "courses_count": 12,
-            "exercises_count": exercise_count,
-        }
-    except Exception as e:
-        db.rollback()
-        raise e
-
+    """Seed Class 6 from its corpus file"""
+    return _seed_class(6)
 
 @router.post("/seed-class-7")
 def seed_class_7():
-    """Seed Class 7 with highly advanced exercises following the same structure"""
-    db = next(get_db())
-
-    try:
-        course_id = seed_seventh_class_exercises(db)
-        exercise_count = db.query(models.Exercise).filter(
-            models.Exercise.course_id.in_(
-                db.query(models.Course.id).filter(models.Course.parent_class_id == course_id)
-            )
-        ).count()
-        return {
-            "message": "Successfully seeded 12 courses for Class 7",
-            "course_id": course_id,
-            "courses_count": 12,
-            "exercises_count": exercise_count,
-        }
-    except Exception as e:
-        db.rollback()
-        raise e
-
+    """Seed Class 7 from its corpus file"""
+    return _seed_class(7)
 
 @router.post("/seed-class-8")
 def seed_class_8():
-    """Seed Class 8 with most advanced exercises following the same structure"""
-    db = next(get_db())
-
-    try:
-        course_id = seed_eighth_class_exercises(db)
-        exercise_count = db.query(models.Exercise).filter(
-            models.Exercise.course_id.in_(
-                db.query(models.Course.id).filter(models.Course.parent_class_id == course_id)
-            )
-        ).count()
-        return {
-            "message": "Successfully seeded 12 courses for Class 8",
-            "course_id": course_id,
-            "courses_count": 12,
-            "exercises_count": exercise_count,
-        }
-    except Exception as e:
-        db.rollback()
-        raise e
-
-
+    """Seed Class 8 from its corpus file"""
+    return _seed_class(8)
@@ -62,7 +62,7 @@ class ExerciseOut(BaseModel):
 
 
 class SubmitRequest(BaseModel):
-	user_id: str
+	user_id: int
 	response: str
 
 
@@ -88,7 +88,7 @@ class PersonalizedPracticeExerciseOut(BaseModel):
 
 
 class PersonalizedPracticeRequest(BaseModel):
-	user_id: str
+	user_id: int
 	class_id: Optional[int]
 	level_id: int
 
@@ -99,7 +99,7 @@ class PersonalizedPracticeResponse(BaseModel):
 
 
 class AICoachRequest(BaseModel):
-	user_id: str
+	user_id: int
 	level_id: Optional[int] = None
 
 
@@ -110,7 +110,7 @@ class AICoachMistakePattern(BaseModel):
 
 
 class AICoachResponse(BaseModel):
-	user_id: str
+	user_id: int
 	level_id: Optional[int] = None
 	total_attempts_analyzed: int
 	incorrect_attempts_analyzed: int
@@ -152,7 +152,7 @@ class CourseProgressOut(BaseModel):
 
 
 class UserProgressOut(BaseModel):
-	user_id: str
+	user_id: int
 	total_points: int
 	total_stars: int
 	courses: List[CourseProgressOut]
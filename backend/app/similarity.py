@@ -0,0 +1,346 @@
+"""
+Shared edit-distance and alignment engine for Albanian text.
+
+Used by pronunciation scoring (routers/audio.py), mistake classification and
+answer feedback (routers/ai.py) and OCR spelling suggestions (routers/ocr.py).
+
+- fold_albanian: ë/ç and digraph folding
+- graphemes: split text into Albanian letters (dh, gj, ll, nj, rr, sh, th, xh, zh are one letter)
+- levenshtein / damerau_levenshtein: bounded distances with early exit
+- align: minimal edit script with per-position diffs
+- batch_levenshtein: one query against many candidates, vectorized with NumPy
+- align_words: banded word-level alignment with character diffs per substituted pair
+
+All functions accept str or token sequences (e.g. graphemes() or word lists).
+"""
+import re
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+# NumPy is optional and imported by the first batch_levenshtein call that can
+# use it, not at import (it would add ~60ms to every worker's startup)
+_np: Any = None
+
+
+def _numpy():
+	global _np
+	if _np is None:
+		try:
+			import numpy  # type: ignore
+			_np = numpy
+		except ImportError:
+			_np = False
+	return _np or None
+
+
+Seq = Union[str, Sequence[str]]
+
+# align_words: half-width of the diagonal band (in words) used for long texts
+ALIGN_BAND = 12
+
+ALBANIAN_DIGRAPHS = ("dh", "gj", "ll", "nj", "rr", "sh", "th", "xh", "zh")
+
+_GRAPHEME_RE = re.compile(r"dh|gj|ll|nj|rr|sh|th|xh|zh|.", re.DOTALL)
+
+# Folding used for lenient comparison (e.g. pronunciation): Albanian-only letters
+# collapse to their closest Latin base letter.
+_FOLD_PAIRS = (
+	("ë", "e"), ("ç", "c"), ("rr", "r"), ("ll", "l"), ("nj", "n"), ("gj", "g"),
+	("dh", "d"), ("th", "t"), ("sh", "s"), ("zh", "z"), ("xh", "x"),
+)
+
+
+def fold_albanian(text: str) -> str:
+	"""Lowercase and fold ë/ç and digraphs to their base letter (rr→r, sh→s, ...)."""
+	# One C-level str.replace per pair present beats a regex pass with a Python callback
+	# (scripts/bench_similarity.py)
+	text = (text or "").lower()
+	for src, dst in _FOLD_PAIRS:
+		if src in text:
+			text = text.replace(src, dst)
+	return text
+
+
+def strip_diacritics(text: str) -> str:
+	"""ë→e, ç→c (keeps digraphs)."""
+	return (text or "").replace("ë", "e").replace("ç", "c").replace("Ë", "E").replace("Ç", "C")
+
+
+def graphemes(text: str) -> List[str]:
+	"""Split lowercase text into Albanian letters, treating digraphs as single units."""
+	return _GRAPHEME_RE.findall((text or "").lower())
+
+
+def levenshtein(a: Seq, b: Seq, max_dist: Optional[int] = None) -> int:
+	"""
+	Levenshtein distance. With max_dist, only a diagonal band of width
+	2*max_dist+1 is computed and max_dist+1 is returned as soon as the
+	distance is known to exceed it.
+	"""
+	if a == b:
+		return 0
+	la, lb = len(a), len(b)
+	if max_dist is not None and abs(la - lb) > max_dist:
+		return max_dist + 1
+	if la == 0 or lb == 0:
+		d = max(la, lb)
+		return d if max_dist is None or d <= max_dist else max_dist + 1
+	# Keep the inner loop on the shorter sequence
+	if la < lb:
+		a, b, la, lb = b, a, lb, la
+
+	big = la + lb + 1
+	previous = list(range(lb + 1))
+	for i in range(1, la + 1):
+		ca = a[i - 1]
+		if max_dist is None:
+			lo, hi = 1, lb
+		else:
+			lo, hi = max(1, i - max_dist), min(lb, i + max_dist)
+		current = [big] * (lb + 1)
+		current[0] = i if lo == 1 else big
+		row_min = current[0]
+		for j in range(lo, hi + 1):
+			cost = 0 if ca == b[j - 1] else 1
+			val = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+			current[j] = val
+			if val < row_min:
+				row_min = val
+		if max_dist is not None and row_min > max_dist:
+			return max_dist + 1
+		previous = current
+	d = previous[lb]
+	if max_dist is not None and d > max_dist:
+		return max_dist + 1
+	return d
+
+
+def damerau_levenshtein(a: Seq, b: Seq, max_dist: Optional[int] = None) -> int:
+	"""
+	Optimal-string-alignment distance: Levenshtein plus adjacent transpositions
+	(a common typing/handwriting slip, e.g. "shkolël" for "shkollë" variants).
+	"""
+	if a == b:
+		return 0
+	la, lb = len(a), len(b)
+	if max_dist is not None and abs(la - lb) > max_dist:
+		return max_dist + 1
+	if la == 0 or lb == 0:
+		d = max(la, lb)
+		return d if max_dist is None or d <= max_dist else max_dist + 1
+
+	before = None
+	previous = list(range(lb + 1))
+	for i in range(1, la + 1):
+		current = [i] + [0] * lb
+		row_min = i
+		for j in range(1, lb + 1):
+			cost = 0 if a[i - 1] == b[j - 1] else 1
+			val = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+			if before is not None and i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+				val = min(val, before[j - 2] + 1)
+			current[j] = val
+			if val < row_min:
+				row_min = val
+		if max_dist is not None and row_min > max_dist:
+			return max_dist + 1
+		before, previous = previous, current
+	d = previous[lb]
+	if max_dist is not None and d > max_dist:
+		return max_dist + 1
+	return d
+
+
+def similarity_ratio(a: Seq, b: Seq, transpositions: bool = False) -> float:
+	"""1 - distance / max(len), in [0, 1]."""
+	if not a and not b:
+		return 1.0
+	if not a or not b:
+		return 0.0
+	dist = damerau_levenshtein(a, b) if transpositions else levenshtein(a, b)
+	return 1.0 - dist / max(len(a), len(b))
+
+
+def align(a: Seq, b: Seq) -> List[Dict[str, Any]]:
+	"""
+	Minimal edit script turning a into b, one entry per aligned position:
+		{"op": "equal" | "substitute" | "delete" | "insert",
+		 "a_index": Optional[int], "b_index": Optional[int],
+		 "a": Optional[item], "b": Optional[item]}
+	"delete" means a[a_index] is missing from b; "insert" means b[b_index] is extra.
+	"""
+	la, lb = len(a), len(b)
+	dp = [[0] * (lb + 1) for _ in range(la + 1)]
+	for i in range(la + 1):
+		dp[i][0] = i
+	for j in range(lb + 1):
+		dp[0][j] = j
+	for i in range(1, la + 1):
+		row, prev = dp[i], dp[i - 1]
+		ca = a[i - 1]
+		for j in range(1, lb + 1):
+			cost = 0 if ca == b[j - 1] else 1
+			row[j] = min(prev[j] + 1, row[j - 1] + 1, prev[j - 1] + cost)
+
+	ops: List[Dict[str, Any]] = []
+	i, j = la, lb
+	while i > 0 or j > 0:
+		if i > 0 and j > 0 and dp[i][j] == dp[i - 1][j - 1] + (0 if a[i - 1] == b[j - 1] else 1):
+			op = "equal" if a[i - 1] == b[j - 1] else "substitute"
+			ops.append({"op": op, "a_index": i - 1, "b_index": j - 1, "a": a[i - 1], "b": b[j - 1]})
+			i, j = i - 1, j - 1
+		elif i > 0 and dp[i][j] == dp[i - 1][j] + 1:
+			ops.append({"op": "delete", "a_index": i - 1, "b_index": None, "a": a[i - 1], "b": None})
+			i -= 1
+		else:
+			ops.append({"op": "insert", "a_index": None, "b_index": j - 1, "a": None, "b": b[j - 1]})
+			j -= 1
+	ops.reverse()
+	return ops
+
+
+def edit_ops(a: Seq, b: Seq) -> List[Dict[str, Any]]:
+	"""align() without the "equal" entries."""
+	return [op for op in align(a, b) if op["op"] != "equal"]
+
+
+def batch_levenshtein(query: Seq, candidates: Sequence[Seq], max_dist: Optional[int] = None) -> List[int]:
+	"""
+	Distances from query to every candidate.
+
+	With NumPy the DP runs once per query position over all candidates at once:
+	the insertion recurrence new[j] = min(tmp[j], new[j-1] + 1) is resolved with a
+	running minimum (cummin(tmp - j) + j), so there is no Python loop over
+	candidates or candidate positions. Distances above max_dist are reported as max_dist + 1.
+	"""
+	if not candidates:
+		return []
+	np = _numpy() if len(candidates) >= 8 else None
+	if np is None:
+		return [levenshtein(query, c, max_dist) for c in candidates]
+
+	alphabet: Dict[Any, int] = {}
+	def encode(seq: Seq) -> List[int]:
+		return [alphabet.setdefault(ch, len(alphabet) + 1) for ch in seq]
+
+	q = encode(query)
+	lengths = np.fromiter((len(c) for c in candidates), dtype=np.int32, count=len(candidates))
+	width = int(lengths.max()) if len(candidates) else 0
+	codes = np.zeros((len(candidates), width), dtype=np.int32)  # 0 = padding, never equal to a real symbol
+	for row, cand in enumerate(candidates):
+		if len(cand):
+			codes[row, :len(cand)] = encode(cand)
+
+	offsets = np.arange(width + 1, dtype=np.int32)
+	previous = np.broadcast_to(offsets, (len(candidates), width + 1)).copy()
+	for i, qc in enumerate(q, start=1):
+		cost = (codes != qc).astype(np.int32)
+		tmp = np.empty_like(previous)
+		tmp[:, 0] = i
+		tmp[:, 1:] = np.minimum(previous[:, 1:] + 1, previous[:, :-1] + cost)
+		previous = np.minimum.accumulate(tmp - offsets, axis=1) + offsets
+
+	dist = previous[np.arange(len(candidates)), lengths]
+	if max_dist is not None:
+		dist = np.minimum(dist, max_dist + 1)
+	return dist.tolist()
+
+
+def _word_costs(word: str, others: Sequence[str]) -> List[float]:
+	"""
+	Substitution costs from word to each of others: 0 if equal, else normalized
+	edit distance in (0, 1]; pairs further apart than half the word count as 1.
+	"""
+	distances = batch_levenshtein(word, others)
+	out = []
+	for other, d in zip(others, distances):
+		longest = max(len(word), len(other), 1)
+		out.append(0.0 if d == 0 else (1.0 if d > max(1, longest // 2) else max(d / longest, 0.01)))
+	return out
+
+
+def align_words(expected: Sequence[str], recognized: Sequence[str], band: Optional[int] = None) -> List[Dict[str, Any]]:
+	"""
+	Word-level alignment of recognized text against expected text.
+
+	Substituting similar words is cheap (normalized character distance), so a
+	misspelled word pairs with the word it was meant to be, while a missing or
+	extra word costs 1 and does not shift the rest of the text.
+	For long texts only a band of cells around the (length-scaled) diagonal is
+	computed: the band is ALIGN_BAND words wide plus the length difference.
+
+	Returns one entry per aligned position:
+		{"op": "equal" | "substitute" | "delete" | "insert",
+		 "a_index", "b_index", "a", "b", "cost", "chars": edit_ops(a, b) for substitutions}
+	"delete" means an expected word is missing; "insert" means an extra recognized word.
+	"""
+	la, lb = len(expected), len(recognized)
+	width = (band if band is not None else ALIGN_BAND) + abs(la - lb)
+	inf = float("inf")
+	exp_l = [w.lower() for w in expected]
+	rec_l = [w.lower() for w in recognized]
+	costs: Dict[Tuple[str, str], float] = {}  # texts repeat words; each pair is scored once
+
+	def row_costs(i: int, lo: int, hi: int) -> Dict[int, float]:
+		"""Substitution costs of expected word i against recognized words lo..hi-1 (one vectorized call)."""
+		a = exp_l[i]
+		todo = sorted({rec_l[j] for j in range(lo, hi) if rec_l[j] != a and (a, rec_l[j]) not in costs})
+		if todo:
+			for b, c in zip(todo, _word_costs(a, todo)):
+				costs[(a, b)] = c
+		return {j: 0.0 if rec_l[j] == a else costs[(a, rec_l[j])] for j in range(lo, hi)}
+
+	def span(i: int) -> Tuple[int, int]:
+		if la + lb <= 2 * width:
+			return 0, lb
+		center = i * lb // la if la else 0
+		return max(0, center - width), min(lb, center + width)
+
+	# dp[i] holds row i for columns lo..hi (dict keeps banded rows sparse)
+	rows: List[Dict[int, float]] = []
+	back: List[Dict[int, str]] = []
+	for i in range(la + 1):
+		lo, hi = span(i)
+		row: Dict[int, float] = {}
+		ptr: Dict[int, str] = {}
+		prev = rows[i - 1] if i else None
+		subs = row_costs(i - 1, max(lo - 1, 0), hi) if i else {}
+		for j in range(lo, hi + 1):
+			if i == 0 and j == 0:
+				row[j], ptr[j] = 0.0, ""
+				continue
+			best, how = inf, ""
+			if prev is not None and j > 0 and (j - 1) in prev:
+				c = prev[j - 1] + subs[j - 1]
+				if c < best:
+					best, how = c, "diag"
+			if prev is not None and j in prev and prev[j] + 1 < best:
+				best, how = prev[j] + 1, "delete"
+			if j > 0 and (j - 1) in row and row[j - 1] + 1 < best:
+				best, how = row[j - 1] + 1, "insert"
+			row[j], ptr[j] = best, how
+		rows.append(row)
+		back.append(ptr)
+
+	ops: List[Dict[str, Any]] = []
+	i, j = la, lb
+	while i > 0 or j > 0:
+		how = back[i].get(j, "")
+		if how == "diag":
+			a, b = expected[i - 1], recognized[j - 1]
+			cost = rows[i][j] - rows[i - 1][j - 1]
+			if cost == 0.0:
+				ops.append({"op": "equal", "a_index": i - 1, "b_index": j - 1, "a": a, "b": b, "cost": 0.0})
+			else:
+				ops.append({
+					"op": "substitute", "a_index": i - 1, "b_index": j - 1, "a": a, "b": b,
+					"cost": round(cost, 3), "chars": edit_ops(a.lower(), b.lower()),
+				})
+			i, j = i - 1, j - 1
+		elif how == "delete" or (how == "" and j == 0):
+			ops.append({"op": "delete", "a_index": i - 1, "b_index": None, "a": expected[i - 1], "b": None, "cost": 1.0})
+			i -= 1
+		else:
+			ops.append({"op": "insert", "a_index": None, "b_index": j - 1, "a": None, "b": recognized[j - 1], "cost": 1.0})
+			j -= 1
+	ops.reverse()
+	return ops
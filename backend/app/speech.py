@@ -0,0 +1,282 @@
+"""
+In-memory audio pipeline and pluggable speech recognizers.
+
+Uploads are streamed in chunks into a memory buffer, decoded with pydub
+(WAV is parsed in-process, other containers are piped through ffmpeg's
+stdin), resampled to 16 kHz mono 16-bit PCM and handed to the recognizer
+as raw frames. Nothing is written to TEMP_AUDIO_DIR.
+
+Recognizer backends (selected with STT_BACKEND):
+- google: Google web recognizer (network, default)
+- vosk: offline on-CPU Kaldi model (VOSK_MODEL_PATH), word timings + confidences
+- stub: deterministic, echoes the hint text; for tests and load experiments
+
+All backends raise speech_recognition's UnknownValueError / RequestError so
+callers keep a single error-handling path. pydub and speech_recognition are
+imported where they are used, so importing this module (and the app) doesn't
+load them.
+"""
+import contextvars
+import os
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from typing import Any, Dict, List, Optional
+
+from fastapi import HTTPException, UploadFile
+
+from . import metrics
+
+TARGET_SAMPLE_RATE = 16000
+TARGET_SAMPLE_WIDTH = 2  # 16-bit PCM
+TARGET_CHANNELS = 1
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+MAX_AUDIO_UPLOAD_BYTES = int(os.getenv("MAX_AUDIO_UPLOAD_BYTES", str(10 * 1024 * 1024)))
+
+
+class PcmAudio:
+	"""Mono 16-bit PCM frames ready for recognition."""
+
+	def __init__(self, data: bytes, sample_rate: int = TARGET_SAMPLE_RATE, sample_width: int = TARGET_SAMPLE_WIDTH):
+		self.data = data
+		self.sample_rate = sample_rate
+		self.sample_width = sample_width
+
+	@property
+	def duration_seconds(self) -> float:
+		frame_bytes = self.sample_rate * self.sample_width
+		return len(self.data) / frame_bytes if frame_bytes else 0.0
+
+	def to_numpy(self):
+		"""Return the samples as an int16 NumPy array (zero-copy view over the PCM bytes)."""
+		import numpy as np
+		return np.frombuffer(self.data, dtype=np.int16)
+
+
+async def read_upload(
+	upload: UploadFile,
+	chunk_size: int = UPLOAD_CHUNK_SIZE,
+	max_bytes: int = MAX_AUDIO_UPLOAD_BYTES,
+) -> BytesIO:
+	"""
+	Stream an uploaded file into a memory buffer chunk by chunk.
+
+	Raises 413 as soon as the body exceeds max_bytes instead of reading
+	the whole request first.
+	"""
+	buffer = BytesIO()
+	total = 0
+	while True:
+		chunk = await upload.read(chunk_size)
+		if not chunk:
+			break
+		total += len(chunk)
+		if max_bytes and total > max_bytes:
+			raise HTTPException(
+				status_code=413,
+				detail=f"Audio file too large (max {max_bytes // (1024 * 1024)} MB)"
+			)
+		buffer.write(chunk)
+	if total == 0:
+		raise HTTPException(status_code=400, detail="Empty audio file")
+	buffer.seek(0)
+	return buffer
+
+
+def _sniff_format(head: bytes) -> Optional[str]:
+	"""Detect containers pydub can parse without ffmpeg."""
+	if head[:4] == b"RIFF" and head[8:12] == b"WAVE":
+		return "wav"
+	return None
+
+
+def decode_to_pcm(buffer: BytesIO) -> PcmAudio:
+	"""
+	Decode any supported container to 16 kHz mono 16-bit PCM in memory.
+
+	CPU-bound; call it from a worker thread when running inside the event loop.
+	"""
+	from pydub import AudioSegment
+	head = buffer.read(12)
+	buffer.seek(0)
+	segment = AudioSegment.from_file(buffer, format=_sniff_format(head))
+	segment = (
+		segment
+		.set_frame_rate(TARGET_SAMPLE_RATE)
+		.set_channels(TARGET_CHANNELS)
+		.set_sample_width(TARGET_SAMPLE_WIDTH)
+	)
+	return PcmAudio(segment.raw_data, segment.frame_rate, segment.sample_width)
+
+
+# ============================================================================
+# RECOGNIZER BACKENDS
+# ============================================================================
+
+STT_BACKEND = os.getenv("STT_BACKEND", "google").lower()
+STT_BATCH_WORKERS = int(os.getenv("STT_BATCH_WORKERS", "4"))
+# Clips per /pronunciation-check/batch request; each is buffered (up to MAX_AUDIO_UPLOAD_BYTES)
+STT_BATCH_MAX_CLIPS = int(os.getenv("STT_BATCH_MAX_CLIPS", "50"))
+
+
+def _transcription(text: str, confidence: Optional[float], words: List[Dict[str, Any]], backend: str, language: str) -> Dict[str, Any]:
+	return {
+		"text": text,
+		"confidence": confidence,
+		"words": words,
+		"backend": backend,
+		"language": language,
+	}
+
+
+class SpeechRecognizerBackend:
+	"""
+	Base recognizer. transcribe() returns:
+		{
+			"text": str,
+			"confidence": Optional[float],  # 0.0-1.0, None if the engine reports none
+			"words": [{"word", "start", "end", "confidence"}],  # seconds; empty if unsupported
+			"backend": str,
+			"language": str
+		}
+	"""
+	name = "base"
+
+	def transcribe(self, audio: PcmAudio, language: str, hint: Optional[str] = None) -> Dict[str, Any]:
+		raise NotImplementedError
+
+	def transcribe_batch(
+		self,
+		clips: List[PcmAudio],
+		language: str,
+		hints: Optional[List[Optional[str]]] = None,
+	) -> List[Any]:
+		"""
+		Transcribe several clips concurrently. Each item is either a transcription
+		dict or the exception raised for that clip, so one bad clip doesn't fail the batch.
+		"""
+		hints = hints or [None] * len(clips)
+
+		def _one(args):
+			clip, hint = args
+			try:
+				return self.transcribe(clip, language, hint)
+			except Exception as exc:
+				return exc
+
+		workers = max(1, min(STT_BATCH_WORKERS, len(clips)))
+		# Each clip runs in a copy of the caller's context (the request's metrics)
+		contexts = [contextvars.copy_context() for _ in clips]
+		with ThreadPoolExecutor(max_workers=workers) as pool:
+			return list(pool.map(lambda ctx, args: ctx.run(_one, args), contexts, zip(clips, hints)))
+
+
+class GoogleWebBackend(SpeechRecognizerBackend):
+	"""Google web speech API via speech_recognition (network round trip per clip)."""
+	name = "google"
+
+	def transcribe(self, audio: PcmAudio, language: str, hint: Optional[str] = None) -> Dict[str, Any]:
+		import speech_recognition as sr
+		recognizer = sr.Recognizer()
+		audio_data = sr.AudioData(audio.data, audio.sample_rate, audio.sample_width)
+		with metrics.external("google_stt"):
+			result = recognizer.recognize_google(audio_data, language=language, show_all=True)
+		alternatives = result.get("alternative", []) if isinstance(result, dict) else []
+		alternatives = [a for a in alternatives if a.get("transcript")]
+		if not alternatives:
+			raise sr.UnknownValueError()
+		best = max(alternatives, key=lambda a: a.get("confidence", -1.0))
+		return _transcription(best["transcript"], best.get("confidence"), [], self.name, language)
+
+
+class VoskBackend(SpeechRecognizerBackend):
+	"""
+	Offline Kaldi recognizer. The model is loaded once per process and shared;
+	each clip gets its own KaldiRecognizer so batches run in parallel threads.
+	"""
+	name = "vosk"
+
+	def __init__(self, model_path: Optional[str] = None):
+		self.model_path = model_path or os.getenv("VOSK_MODEL_PATH", "models/vosk-sq")
+		self._model = None
+		self._lock = threading.Lock()
+
+	def _get_model(self):
+		if self._model is None:
+			with self._lock:
+				if self._model is None:
+					try:
+						import vosk  # type: ignore
+						vosk.SetLogLevel(-1)
+						self._model = vosk.Model(self.model_path)
+					except Exception as exc:
+						import speech_recognition as sr
+						raise sr.RequestError(f"Vosk model unavailable ({self.model_path}): {exc}")
+		return self._model
+
+	def transcribe(self, audio: PcmAudio, language: str, hint: Optional[str] = None) -> Dict[str, Any]:
+		import vosk  # type: ignore
+		rec = vosk.KaldiRecognizer(self._get_model(), audio.sample_rate)
+		rec.SetWords(True)
+		with metrics.external("vosk"):
+			rec.AcceptWaveform(audio.data)
+			result = json.loads(rec.FinalResult())
+		text = (result.get("text") or "").strip()
+		if not text:
+			import speech_recognition as sr
+			raise sr.UnknownValueError()
+		words = [
+			{
+				"word": w.get("word", ""),
+				"start": float(w.get("start", 0.0)),
+				"end": float(w.get("end", 0.0)),
+				"confidence": float(w.get("conf", 0.0)),
+			}
+			for w in result.get("result", [])
+		]
+		confidence = sum(w["confidence"] for w in words) / len(words) if words else None
+		return _transcription(text, confidence, words, self.name, language)
+
+
+class StubBackend(SpeechRecognizerBackend):
+	"""
+	Deterministic recognizer: returns the hint (target text) or STT_STUB_TEXT,
+	with word timings spread evenly over the clip duration.
+	"""
+	name = "stub"
+
+	def __init__(self, text: Optional[str] = None):
+		self.text = text if text is not None else os.getenv("STT_STUB_TEXT", "")
+
+	def transcribe(self, audio: PcmAudio, language: str, hint: Optional[str] = None) -> Dict[str, Any]:
+		text = (hint if hint else self.text).strip()
+		if not text:
+			import speech_recognition as sr
+			raise sr.UnknownValueError()
+		tokens = text.split()
+		step = audio.duration_seconds / len(tokens) if tokens else 0.0
+		words = [
+			{"word": tok, "start": round(i * step, 3), "end": round((i + 1) * step, 3), "confidence": 1.0}
+			for i, tok in enumerate(tokens)
+		]
+		return _transcription(text, 1.0, words, self.name, language)
+
+
+_BACKENDS = {
+	"google": GoogleWebBackend,
+	"vosk": VoskBackend,
+	"stub": StubBackend,
+}
+_RECOGNIZERS: Dict[str, SpeechRecognizerBackend] = {}
+
+
+def get_recognizer(name: Optional[str] = None) -> SpeechRecognizerBackend:
+	"""Return the process-wide recognizer for name (defaults to STT_BACKEND)."""
+	key = (name or STT_BACKEND).lower()
+	if key not in _BACKENDS:
+		raise ValueError(f"Unknown STT backend '{key}'. Available: {', '.join(sorted(_BACKENDS))}")
+	if key not in _RECOGNIZERS:
+		_RECOGNIZERS[key] = _BACKENDS[key]()
+	return _RECOGNIZERS[key]
@@ -0,0 +1,226 @@
+"""
+Symmetric-delete (SymSpell) candidate index for OCR spelling suggestions.
+
+Words are indexed under a folded key (lowercase, ë→e, ç→c, doubled letters
+collapsed), and every string obtained by deleting up to MAX_DISTANCE
+characters from the key's first PREFIX_LENGTH characters points back to it.
+A lookup generates the same deletes for the query, so the candidates are
+found with a handful of dict hits instead of a scan over the lexicon. They
+are then verified and ranked with an Albanian-weighted edit distance:
+
+- e↔ë and c↔ç substitutions cost CHEAP_EDIT
+- inserting or deleting a doubled letter (l↔ll, t↔tt) costs CHEAP_EDIT
+- any other insertion, deletion, substitution or adjacent transposition costs 1
+
+Because the key is folded, any number of ë/ç and doubling errors still meets
+at distance 0, and first-letter errors are found like any other edit. Short
+words (folded key of SHORT_WORD letters or fewer) get at most one edit.
+
+The index is maintained incrementally (add/remove) by app/lexicon.py, on a
+copy (copy()) of the one requests are reading, which shares the unchanged
+per-key sets with it.
+
+Config (env):
+- SPELL_MAX_DISTANCE: max edit distance of suggestions (default 2)
+- SPELL_PREFIX_LENGTH: indexed key prefix; longer = more memory, fewer candidates to verify (default 7)
+"""
+import os
+import re
+from typing import Dict, List, Optional, Set, Tuple
+
+from .similarity import batch_levenshtein, strip_diacritics
+
+MAX_DISTANCE = int(os.getenv("SPELL_MAX_DISTANCE", "2"))
+PREFIX_LENGTH = int(os.getenv("SPELL_PREFIX_LENGTH", "7"))
+CHEAP_EDIT = 0.3
+# Folded keys up to this length get at most 1 edit
+SHORT_WORD = 4
+
+_CHEAP_SUBSTITUTIONS = {("e", "ë"), ("ë", "e"), ("c", "ç"), ("ç", "c")}
+_DOUBLED_RE = re.compile(r"(.)\1+")
+
+
+def fold_key(word: str) -> str:
+	"""Index key: lowercase, without ë/ç diacritics, doubled letters collapsed."""
+	return _DOUBLED_RE.sub(r"\1", strip_diacritics(word.lower()))
+
+
+def _deletes(key: str, max_distance: int) -> Set[str]:
+	"""key plus every string with up to max_distance characters removed."""
+	out = {key}
+	frontier = {key}
+	for _ in range(max_distance):
+		nxt = set()
+		for s in frontier:
+			if len(s) <= 1:
+				continue
+			for i in range(len(s)):
+				nxt.add(s[:i] + s[i + 1:])
+		nxt -= out
+		out |= nxt
+		frontier = nxt
+	return out
+
+
+def _indel_costs(s: str) -> List[float]:
+	n = len(s)
+	return [
+		CHEAP_EDIT if (i > 0 and s[i - 1] == s[i]) or (i + 1 < n and s[i + 1] == s[i]) else 1.0
+		for i in range(n)
+	]
+
+
+def albanian_edit_cost(a: str, b: str, max_cost: Optional[float] = None) -> float:
+	"""
+	Weighted Damerau-Levenshtein distance (optimal string alignment) with cheap
+	ë/ç substitutions and doubled-letter insertions/deletions. Returns a value
+	above max_cost as soon as every path exceeds it.
+	"""
+	a = a.lower()
+	b = b.lower()
+	if a == b:
+		return 0.0
+	la, lb = len(a), len(b)
+	limit = float("inf") if max_cost is None else max_cost
+	if abs(la - lb) * CHEAP_EDIT > limit:
+		return limit + 1
+
+	# Indel cost per position: a letter that repeats a neighbour is a doubling error
+	del_a = _indel_costs(a)
+	ins_b = _indel_costs(b)
+
+	prev2: List[float] = []
+	prev = [0.0] * (lb + 1)
+	for j in range(1, lb + 1):
+		prev[j] = prev[j - 1] + ins_b[j - 1]
+	for i in range(1, la + 1):
+		ca = a[i - 1]
+		del_cost = del_a[i - 1]
+		cur = [prev[0] + del_cost] + [0.0] * lb
+		row_min = cur[0]
+		for j in range(1, lb + 1):
+			cb = b[j - 1]
+			if ca == cb:
+				best = prev[j - 1]
+			else:
+				best = prev[j - 1] + (CHEAP_EDIT if (ca, cb) in _CHEAP_SUBSTITUTIONS else 1.0)
+				if i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+					best = min(best, prev2[j - 2] + 1.0)
+			x = prev[j] + del_cost
+			if x < best:
+				best = x
+			x = cur[j - 1] + ins_b[j - 1]
+			if x < best:
+				best = x
+			cur[j] = best
+			if best < row_min:
+				row_min = best
+		if row_min > limit:
+			return limit + 1
+		prev2, prev = prev, cur
+	return prev[lb]
+
+
+class SpellIndex:
+	"""SymSpell index over a word → frequency mapping (shared with the lexicon index)."""
+
+	def __init__(self, frequency: Dict[str, int], max_distance: int = MAX_DISTANCE, prefix_length: int = PREFIX_LENGTH):
+		self.frequency = frequency
+		self.max_distance = max_distance
+		self.prefix_length = prefix_length
+		self._words_by_key: Dict[str, Set[str]] = {}
+		self._keys_by_delete: Dict[str, Set[str]] = {}
+		# Keys whose set this index created (the rest may be shared with a copy, see copy())
+		self._own_words: Set[str] = set()
+		self._own_deletes: Set[str] = set()
+
+	def __len__(self) -> int:
+		return len(self._words_by_key)
+
+	def copy(self, frequency: Dict[str, int]) -> "SpellIndex":
+		"""
+		Index over frequency (a copy of this one's) that shares the per-key sets
+		and copies each one the first time it changes. This index must not be
+		modified afterwards.
+		"""
+		other = SpellIndex(frequency, self.max_distance, self.prefix_length)
+		other._words_by_key = dict(self._words_by_key)
+		other._keys_by_delete = dict(self._keys_by_delete)
+		self._own_words = set()
+		self._own_deletes = set()
+		return other
+
+	@staticmethod
+	def _writable(table: Dict[str, Set[str]], owned: Set[str], k: str) -> Set[str]:
+		# Sets not created by this index may be shared with the one it was copied from
+		s = table.get(k)
+		if s is None or k not in owned:
+			s = table[k] = set(s or ())
+			owned.add(k)
+		return s
+
+	def add(self, word: str) -> None:
+		key = fold_key(word)
+		if key not in self._words_by_key:
+			for d in _deletes(key[:self.prefix_length], self.max_distance):
+				self._writable(self._keys_by_delete, self._own_deletes, d).add(key)
+		self._writable(self._words_by_key, self._own_words, key).add(word)
+
+	def remove(self, word: str) -> None:
+		key = fold_key(word)
+		words = self._words_by_key.get(key)
+		if not words or word not in words:
+			return
+		if len(words) > 1:
+			self._writable(self._words_by_key, self._own_words, key).discard(word)
+			return
+		del self._words_by_key[key]
+		self._own_words.discard(key)
+		for d in _deletes(key[:self.prefix_length], self.max_distance):
+			keys = self._keys_by_delete.get(d)
+			if keys is None or key not in keys:
+				continue
+			if len(keys) > 1:
+				self._writable(self._keys_by_delete, self._own_deletes, d).discard(key)
+			else:
+				del self._keys_by_delete[d]
+				self._own_deletes.discard(d)
+
+	def lookup(self, token: str, max_suggestions: int = 5, max_distance: Optional[float] = None) -> List[Tuple[str, float, int]]:
+		"""
+		Suggestions for token as (word, weighted distance, frequency), closest first,
+		then most frequent. The token itself is not returned.
+		"""
+		t = token.lower()
+		if not t:
+			return []
+		limit = self.max_distance if max_distance is None else max_distance
+		key = fold_key(t)
+		if len(key) <= SHORT_WORD:
+			# Two edits on a short word match half the lexicon and are rarely the intended word
+			limit = min(limit, 1)
+
+		keys: Set[str] = set()
+		for d in _deletes(key[:self.prefix_length], int(limit)):
+			hit = self._keys_by_delete.get(d)
+			if hit:
+				keys |= hit
+
+		# Folding only removes cheap edits, so keys further apart than the limit can't match
+		# (+1: batch_levenshtein counts a transposition as 2). One vectorized pass discards
+		# the prefix-only matches before the weighted DP.
+		candidates = list(keys)
+		key_limit = int(limit) + 1
+		distances = batch_levenshtein(key, candidates, max_dist=key_limit)
+		scored = []
+		for k, dist in zip(candidates, distances):
+			if dist > key_limit:
+				continue
+			for w in self._words_by_key.get(k, ()):
+				if w == t:
+					continue
+				cost = albanian_edit_cost(t, w, limit)
+				if cost <= limit:
+					scored.append((w, round(cost, 2), self.frequency.get(w, 0)))
+		scored.sort(key=lambda s: (s[1], -s[2], s[0]))
+		return scored[:max_suggestions]
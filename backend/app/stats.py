@@ -0,0 +1,201 @@
+"""
+Precomputed counters for /api/public-stats, /api/admin/stats and /database-viewer.
+
+The dashboards read one stats_snapshot row instead of running a COUNT(*)
+per table (and two per class). The row is fully recounted when:
+- the content version (app/content_cache.py) no longer matches, i.e. after
+  any course/level/exercise write
+- it is older than STATS_REFRESH_SECONDS (corrects any drift)
+- a bulk delete of users/attempts/progress marked it stale
+
+Between recounts, session hooks keep the user, attempt and course progress
+counters current: each flush adds its inserts/deletes to the row with an
+atomic `col = col + n` update in the same transaction.
+
+Config (env):
+- STATS_REFRESH_SECONDS: max age of a full recount (default 900)
+"""
+import json
+import os
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict
+
+from sqlalchemy import distinct, event, func, inspect, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from . import content_cache, models
+
+STATS_REFRESH_SECONDS = float(os.getenv("STATS_REFRESH_SECONDS", "900"))
+
+_S = models.StatsSnapshot
+
+COUNTERS = (
+	"total_users", "total_classes", "total_courses", "total_levels", "total_exercises",
+	"total_categories", "total_attempts", "correct_attempts", "total_progress", "completed_progress",
+)
+
+
+def _count_all(db: Session) -> Dict[str, Any]:
+	Course = models.Course
+	courses_per_class = dict(
+		db.query(Course.parent_class_id, func.count(Course.id))
+		.filter(Course.parent_class_id.isnot(None))
+		.group_by(Course.parent_class_id)
+	)
+	exercises_per_class = dict(
+		db.query(Course.parent_class_id, func.count(models.Exercise.id))
+		.join(models.Exercise, models.Exercise.course_id == Course.id)
+		.filter(Course.parent_class_id.isnot(None))
+		.group_by(Course.parent_class_id)
+	)
+	classes = (
+		db.query(Course.id, Course.name, Course.order_index)
+		.filter(Course.parent_class_id.is_(None))
+		.order_by(Course.order_index)
+		.all()
+	)
+	attempts, correct = db.query(
+		func.count(models.Attempt.id),
+		func.count(models.Attempt.id).filter(models.Attempt.is_correct == True),  # noqa: E712
+	).one()
+	progress, completed = db.query(
+		func.count(models.CourseProgress.id),
+		func.count(models.CourseProgress.id).filter(models.CourseProgress.is_completed == True),  # noqa: E712
+	).one()
+	return {
+		"total_users": db.query(func.count(models.User.id)).scalar(),
+		"total_classes": len(classes),
+		"total_courses": sum(courses_per_class.values()),
+		"total_levels": db.query(func.count(models.Level.id)).scalar(),
+		"total_exercises": db.query(func.count(models.Exercise.id)).scalar(),
+		"total_categories": db.query(func.count(distinct(models.Exercise.category))).scalar(),
+		"total_attempts": attempts,
+		"correct_attempts": correct,
+		"total_progress": progress,
+		"completed_progress": completed,
+		"classes": [
+			{
+				"id": cid,
+				"name": name,
+				"order": order,
+				"courses": courses_per_class.get(cid, 0),
+				"exercises": exercises_per_class.get(cid, 0),
+			}
+			for cid, name, order in classes
+		],
+	}
+
+
+def refresh(db: Session) -> models.StatsSnapshot:
+	"""Recount everything into the snapshot row and commit."""
+	version = content_cache.get_version(db)
+	counts = _count_all(db)
+	values = {k: counts[k] for k in COUNTERS}
+	values.update(
+		classes=json.dumps(counts["classes"], ensure_ascii=False),
+		content_version=version,
+		refreshed_at=datetime.utcnow(),
+	)
+	row = db.get(_S, 1)
+	if row is None:
+		db.add(_S(id=1, **values))
+	else:
+		for key, value in values.items():
+			setattr(row, key, value)
+	try:
+		db.commit()
+	except IntegrityError:
+		# Another worker created the row first; it recounted too
+		db.rollback()
+	print(f"[STATS] recounted: {values['total_users']} users, {values['total_exercises']} exercises, {values['total_attempts']} attempts")
+	return db.get(_S, 1)
+
+
+def get_snapshot(db: Session) -> Dict[str, Any]:
+	"""Dashboard counters from the snapshot row, recounting first when it is stale."""
+	row = db.get(_S, 1)
+	stale = (
+		row is None
+		or row.refreshed_at is None
+		or row.content_version != content_cache.get_version(db)
+		or datetime.utcnow() - row.refreshed_at > timedelta(seconds=STATS_REFRESH_SECONDS)
+	)
+	if stale:
+		row = refresh(db)
+	out: Dict[str, Any] = {k: getattr(row, k) for k in COUNTERS}
+	out["classes"] = json.loads(row.classes) if row.classes else []
+	out["refreshed_at"] = row.refreshed_at.isoformat() if row.refreshed_at else None
+	return out
+
+
+# ============================================================================
+# SESSION HOOKS (incremental user/attempt/progress counters)
+# ============================================================================
+
+def _committed(obj, attr: str) -> bool:
+	"""Boolean attr as last loaded from the database."""
+	hist = inspect(obj).attrs[attr].history
+	if hist.deleted:
+		return bool(hist.deleted[0])
+	if hist.unchanged:
+		return bool(hist.unchanged[0])
+	return bool(getattr(obj, attr))
+
+
+def _row_deltas(obj, sign: int, deltas: Counter) -> None:
+	if isinstance(obj, models.User):
+		deltas["total_users"] += sign
+	elif isinstance(obj, models.Attempt):
+		deltas["total_attempts"] += sign
+		correct = obj.is_correct if sign > 0 else _committed(obj, "is_correct")
+		deltas["correct_attempts"] += sign * bool(correct)
+	elif isinstance(obj, models.CourseProgress):
+		deltas["total_progress"] += sign
+		completed = obj.is_completed if sign > 0 else _committed(obj, "is_completed")
+		deltas["completed_progress"] += sign * bool(completed)
+
+
+def _before_flush(session: Session, flush_context, instances) -> None:
+	deltas: Counter = Counter()
+	for obj in session.new:
+		_row_deltas(obj, 1, deltas)
+	for obj in session.deleted:
+		_row_deltas(obj, -1, deltas)
+	for obj in session.dirty:
+		if isinstance(obj, models.CourseProgress) and session.is_modified(obj):
+			was, now = _committed(obj, "is_completed"), bool(obj.is_completed)
+			if was != now:
+				deltas["completed_progress"] += 1 if now else -1
+	values = {k: getattr(_S, k) + n for k, n in deltas.items() if n}
+	if values:
+		session.execute(update(_S).where(_S.id == 1).values(**values))
+
+
+def _do_orm_execute(state) -> None:
+	"""Bulk ORM updates/deletes skip the flush: mark the snapshot for a recount instead."""
+	if not (state.is_update or state.is_delete):
+		return
+	if not any(m.class_ in (models.User, models.Attempt, models.CourseProgress) for m in state.all_mappers):
+		return
+	state.session.execute(update(_S).where(_S.id == 1).values(refreshed_at=None))
+
+
+def _keep_history(target, value, oldvalue, initiator):
+	return value
+
+
+_HOOKS_INSTALLED = False
+
+
+def install_hooks() -> None:
+	"""Register the session hooks on every Session (idempotent)."""
+	global _HOOKS_INSTALLED
+	if _HOOKS_INSTALLED:
+		return
+	# Load the old value on assignment, so history has it even after commit expired the row
+	event.listen(models.CourseProgress.is_completed, "set", _keep_history, active_history=True)
+	event.listen(Session, "before_flush", _before_flush)
+	event.listen(Session, "do_orm_execute", _do_orm_execute)
+	_HOOKS_INSTALLED = True
@@ -0,0 +1,190 @@
+"""
+Throughput of one uvicorn worker for the same DB work done three ways:
+
+- blocking: `async def` endpoint using the sync Session (the old pattern; every
+  query blocks the event loop)
+- threadpool: `def` endpoint using the sync Session (FastAPI runs it in its
+  threadpool)
+- async: `async def` endpoint using AsyncSession (asyncpg / aiosqlite)
+
+Each request does what the hot read path does: load an exercise, count the
+user's progress rows and the per-course completed counts. --db-latency-ms
+adds a server-side sleep to every request on PostgreSQL (pg_sleep), to see
+the effect of a database that isn't on the same machine. On SQLite queries
+take microseconds and the three variants stay close.
+
+With more requests in flight than the sync pool holds, "blocking" can stall:
+a request waiting for a connection blocks the loop that would return one,
+until DB_POOL_TIMEOUT. Those requests show up as errors.
+
+The benchmark app runs in a separate process (single uvicorn worker) against
+DATABASE_URL; the client drives it with --concurrency requests in flight.
+
+Usage (from backend/):
+	python scripts/bench_async_db.py [--concurrency 32] [--seconds 10] [--db-latency-ms 5]
+"""
+import argparse
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+# Ensure backend/ is on sys.path when running as a script
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if BACKEND_DIR not in sys.path:
+	sys.path.insert(0, BACKEND_DIR)
+
+VARIANTS = ("blocking", "threadpool", "async")
+
+
+def _build_app(latency_ms: float):
+	from fastapi import Depends, FastAPI
+	from sqlalchemy import func, select, text
+	from sqlalchemy.ext.asyncio import AsyncSession
+	from sqlalchemy.orm import Session
+
+	from app import models
+	from app.database import DATABASE_URL, get_async_db, get_db
+
+	sleep_sql = None
+	if latency_ms > 0 and DATABASE_URL.startswith("postgresql"):
+		sleep_sql = text(f"SELECT pg_sleep({latency_ms / 1000.0})")
+
+	def _statements():
+		stmts = [
+			select(models.Exercise).order_by(models.Exercise.id).limit(1),
+			select(func.count(models.Progress.id)).where(models.Progress.user_id == "1"),
+			select(models.CourseProgress.course_id, func.count(models.CourseProgress.id))
+			.where(models.CourseProgress.user_id == 1, models.CourseProgress.is_completed == True)  # noqa: E712
+			.group_by(models.CourseProgress.course_id),
+		]
+		if sleep_sql is not None:
+			stmts.append(sleep_sql)
+		return stmts
+
+	def _sync_work(db: Session) -> int:
+		return sum(len(db.execute(stmt).all()) for stmt in _statements())
+
+	bench = FastAPI()
+
+	@bench.get("/blocking")
+	async def blocking(db: Session = Depends(get_db)):
+		return {"rows": _sync_work(db)}
+
+	@bench.get("/threadpool")
+	def threadpool(db: Session = Depends(get_db)):
+		return {"rows": _sync_work(db)}
+
+	@bench.get("/async")
+	async def async_(db: AsyncSession = Depends(get_async_db)):
+		rows = 0
+		for stmt in _statements():
+			rows += len((await db.execute(stmt)).all())
+		return {"rows": rows}
+
+	return bench
+
+
+def _serve(port: int, latency_ms: float) -> None:
+	import logging
+	import uvicorn
+	from app.database import Base, engine
+	app = _build_app(latency_ms)  # imports the models
+	Base.metadata.create_all(bind=engine)
+	# Failed requests are counted by the client; one traceback each would drown the output
+	logging.getLogger("app.database").setLevel(logging.CRITICAL)
+	uvicorn.run(app, host="127.0.0.1", port=port, log_level="critical", workers=1)
+
+
+def _free_port() -> int:
+	with socket.socket() as s:
+		s.bind(("127.0.0.1", 0))
+		return s.getsockname()[1]
+
+
+async def _drive(base: str, variant: str, concurrency: int, seconds: float) -> Dict[str, float]:
+	import httpx
+	latencies: List[float] = []
+	errors = 0
+	deadline = time.perf_counter() + seconds
+
+	async def _client(client) -> None:
+		nonlocal errors
+		while time.perf_counter() < deadline:
+			start = time.perf_counter()
+			try:
+				r = await client.get(f"{base}/{variant}")
+				if r.status_code != 200:
+					errors += 1
+					continue
+			except httpx.HTTPError:
+				errors += 1
+				continue
+			latencies.append(time.perf_counter() - start)
+
+	limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+	async with httpx.AsyncClient(limits=limits, timeout=60) as client:
+		# Warm up the pools
+		for _ in range(3):
+			await client.get(f"{base}/{variant}")
+		started = time.perf_counter()
+		await asyncio.gather(*(_client(client) for _ in range(concurrency)))
+		elapsed = time.perf_counter() - started
+	latencies.sort()
+	return {
+		"rps": len(latencies) / elapsed,
+		"p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+		"p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000 if latencies else 0.0,
+		"errors": errors,
+	}
+
+
+def _wait_ready(port: int, timeout: float = 30.0) -> None:
+	deadline = time.time() + timeout
+	while time.time() < deadline:
+		try:
+			with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+				return
+		except OSError:
+			time.sleep(0.2)
+	raise RuntimeError("benchmark server did not start")
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Compare sync, threadpool and async DB endpoints per uvicorn worker.")
+	parser.add_argument("--concurrency", type=int, default=32, help="Requests in flight")
+	parser.add_argument("--seconds", type=float, default=10.0, help="Duration per variant")
+	parser.add_argument("--db-latency-ms", type=float, default=0.0, help="Extra server-side latency per request (PostgreSQL only)")
+	parser.add_argument("--variants", default=",".join(VARIANTS))
+	parser.add_argument("--serve", type=int, help=argparse.SUPPRESS)
+	args = parser.parse_args()
+
+	if args.serve:
+		_serve(args.serve, args.db_latency_ms)
+		return
+
+	port = _free_port()
+	server = subprocess.Popen(
+		[sys.executable, os.path.abspath(__file__), "--serve", str(port), "--db-latency-ms", str(args.db_latency_ms)],
+		cwd=BACKEND_DIR,
+	)
+	try:
+		_wait_ready(port)
+		print(f"1 uvicorn worker, {args.concurrency} requests in flight, {args.seconds:.0f}s per variant")
+		for variant in args.variants.split(","):
+			r = asyncio.run(_drive(f"http://127.0.0.1:{port}", variant, args.concurrency, args.seconds))
+			print(
+				f"{variant:<11} {r['rps']:8.1f} req/s   p50 {r['p50_ms']:7.1f} ms   "
+				f"p95 {r['p95_ms']:7.1f} ms   errors {r['errors']}"
+			)
+	finally:
+		server.terminate()
+		server.wait(timeout=10)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,145 @@
+"""
+Compare the OCR planner against running every pass, on a saved benchmark set.
+
+The dataset is a directory of images, each with a sibling .txt file holding
+the expected text (e.g. page01.jpg + page01.txt). For every image the script
+runs the full sweep (image_to_data + all passes) and the planned run, picks
+the candidate the analyzer would pick and scores it against the expected text
+(character similarity, 1.0 = exact).
+
+Usage (from backend/, needs tesseract with the sqi model):
+	python scripts/bench_ocr_planner.py --dataset benchmarks/ocr [--learn]
+
+--learn records the full-sweep outcomes into ocr_pass_stats before planning,
+which is how the planner's win rates can be bootstrapped from the set.
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Any, Dict, List, Tuple
+
+# Ensure backend/ is on sys.path when running as a script
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if BACKEND_DIR not in sys.path:
+	sys.path.insert(0, BACKEND_DIR)
+
+from PIL import Image  # noqa: E402
+
+from app.database import SessionLocal, Base, engine  # noqa: E402
+from app import ocr_planner  # noqa: E402
+from app.routers import ocr  # noqa: E402
+from app.similarity import similarity_ratio  # noqa: E402
+
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp", ".webp")
+
+
+def _load_dataset(path: str) -> List[Tuple[str, str]]:
+	items = []
+	for name in sorted(os.listdir(path)):
+		stem, ext = os.path.splitext(name)
+		if ext.lower() not in IMAGE_EXTS:
+			continue
+		txt = os.path.join(path, stem + ".txt")
+		if not os.path.exists(txt):
+			print(f"  skip {name}: no {stem}.txt")
+			continue
+		with open(txt, encoding="utf-8") as f:
+			items.append((os.path.join(path, name), f.read()))
+	return items
+
+
+def _run(image_path: str, plan_mode: str, db, learn: bool) -> Dict[str, Any]:
+	"""plan_mode: "full" runs every pass, "planned" asks the planner."""
+	img = Image.open(image_path)
+	img.load()
+	t0 = time.monotonic()
+	calls = 1
+	deskewed = ocr._deskew_image(img)
+	ready = ocr._preprocess_for_ocr(deskewed)
+	data = ocr._extract_tokens_with_confidence(ready)
+	if plan_mode == "full" or data["avg_conf"] < ocr_planner.LOW_CONFIDENCE:
+		flipped = deskewed.rotate(180)
+		flipped_ready = ocr._preprocess_for_ocr(flipped)
+		flipped_data = ocr._extract_tokens_with_confidence(flipped_ready)
+		calls += 1
+		if flipped_data["avg_conf"] > data["avg_conf"]:
+			deskewed, ready, data = flipped, flipped_ready, flipped_data
+
+	passes = ocr._build_ocr_passes(ready, deskewed)
+	if plan_mode == "full":
+		chosen = passes
+		bucket = ocr_planner.bucket_for(data["layout"]["layout"], data["avg_conf"])
+	else:
+		plan = ocr_planner.plan_passes(db, data["avg_conf"], data["layout"]["layout"], [p.name for p in passes])
+		chosen = [p for p in passes if p.name in plan["passes"]]
+		bucket = plan["bucket"]
+
+	candidates = []
+	if data["text"].strip():
+		candidates.append((data["text"].strip(), ocr_planner.DATA_PASS))
+	ran = [ocr_planner.DATA_PASS]
+	for p in chosen:
+		try:
+			text = (p.fn(ocr.OCR_DEADLINE_SECONDS) or "").strip()
+		except Exception:
+			continue
+		ran.append(p.name)
+		if p.engine == "tesseract":
+			calls += 1
+		if text:
+			candidates.append((text, p.name))
+
+	best_text, winner = max(candidates, key=lambda c: ocr._readability_score(c[0])) if candidates else ("", None)
+	if learn and plan_mode == "full":
+		ocr_planner.record_outcome(db, bucket, ran, winner)
+	return {
+		"text": best_text,
+		"winner": winner,
+		"bucket": bucket,
+		"calls": calls,
+		"elapsed": time.monotonic() - t0,
+	}
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Benchmark the OCR planner against the full pass sweep.")
+	parser.add_argument("--dataset", required=True, help="Directory of images with sibling .txt ground truth")
+	parser.add_argument("--learn", action="store_true", help="Record full-sweep outcomes into ocr_pass_stats first")
+	args = parser.parse_args()
+
+	if not ocr.pytesseract:
+		print("pytesseract is not installed")
+		sys.exit(1)
+
+	items = _load_dataset(args.dataset)
+	if not items:
+		print("No images with ground truth found")
+		sys.exit(1)
+
+	ocr_planner.EXPLORE_RATE = 0.0  # deterministic plans
+	Base.metadata.create_all(bind=engine)
+	db = SessionLocal()
+	totals = {"full": {"acc": 0.0, "calls": 0, "time": 0.0}, "planned": {"acc": 0.0, "calls": 0, "time": 0.0}}
+	try:
+		for path, expected in items:
+			row = []
+			for mode in ("full", "planned"):
+				res = _run(path, mode, db, args.learn)
+				acc = similarity_ratio(ocr._norm_text(expected).lower(), ocr._norm_text(res["text"]).lower())
+				totals[mode]["acc"] += acc
+				totals[mode]["calls"] += res["calls"]
+				totals[mode]["time"] += res["elapsed"]
+				row.append(f"{mode}: acc={acc:.3f} calls={res['calls']} winner={res['winner']}")
+			print(f"{os.path.basename(path):<28} [{res['bucket']}] " + " | ".join(row))
+	finally:
+		db.close()
+
+	n = len(items)
+	print(f"\n{n} images")
+	for mode, t in totals.items():
+		print(f"  {mode:<8} accuracy={t['acc'] / n:.4f}  tesseract calls/image={t['calls'] / n:.2f}  time/image={t['time'] / n:.2f}s")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,177 @@
+"""
+Benchmark OCR preprocessing: previous PIL chain vs app/imaging.py.
+
+Fixtures are either a directory of images (with optional sibling .txt ground
+truth) or, by default, synthetic dictation pages rendered in several sizes
+(phone photo 12 MP, A4 scan, small crop) with known skew, uneven lighting
+and noise.
+
+Reported per fixture: preprocessing time for both chains, skew recovered by
+the projection-profile deskew (synthetic only) and, when tesseract is
+installed, OCR similarity to the ground truth for both outputs.
+
+Usage (from backend/):
+	python scripts/bench_ocr_preprocess.py [--dataset DIR] [--repeat 3]
+"""
+import argparse
+import os
+import sys
+import time
+from typing import List, Optional, Tuple
+
+# Ensure backend/ is on sys.path when running as a script
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if BACKEND_DIR not in sys.path:
+	sys.path.insert(0, BACKEND_DIR)
+
+import numpy as np  # noqa: E402
+from PIL import Image, ImageDraw, ImageEnhance, ImageFilter, ImageFont, ImageOps  # noqa: E402
+
+from app import imaging  # noqa: E402
+from app.similarity import similarity_ratio  # noqa: E402
+
+try:
+	import pytesseract
+	pytesseract.get_tesseract_version()
+except Exception:
+	pytesseract = None
+
+SAMPLE_TEXT = [
+	"Një ditë vere shkova me gjyshin në mal.",
+	"Dielli ndriçonte fushat dhe lumi rridhte qetë.",
+	"Fëmijët luanin në oborrin e shkollës së fshatit.",
+	"Mësuesja na tha të shkruajmë një hartim të shkurtër.",
+	"Çdo mëngjes pijmë çaj dhe hamë bukë me djathë.",
+]
+
+IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp", ".webp")
+
+
+# ---- Previous implementation (kept here only for comparison) ----
+
+def legacy_preprocess(img: Image.Image) -> Image.Image:
+	gray = img.convert("L")
+	w, h = gray.size
+	gray = gray.resize((int(w * 1.5), int(h * 1.5)))
+	gray = ImageEnhance.Contrast(gray).enhance(2.0)
+	gray = ImageOps.autocontrast(gray)
+	gray = gray.filter(ImageFilter.MedianFilter(size=3))
+	gray = gray.filter(ImageFilter.UnsharpMask(radius=2, percent=150, threshold=3))
+	bw = gray.point(lambda x: 255 if x > 135 else 0, mode="1")
+	return bw.convert("L")
+
+
+def new_preprocess(img: Image.Image) -> Image.Image:
+	img = imaging.downsample_for_ocr(img)
+	img, _ = imaging.deskew(img)
+	return imaging.binarize_for_ocr(img)
+
+
+# ---- Fixtures ----
+
+def _font(size: int):
+	try:
+		return ImageFont.load_default(size=size)
+	except TypeError:  # Pillow < 10.1
+		return ImageFont.load_default()
+
+
+def _synthetic_page(size: Tuple[int, int], skew: float, seed: int) -> Image.Image:
+	w, h = size
+	rng = np.random.default_rng(seed)
+	font_size = max(12, h // 30)
+	page = Image.new("L", (w, h), 255)
+	draw = ImageDraw.Draw(page)
+	y = font_size
+	line = 0
+	while y < h - 2 * font_size:
+		draw.text((font_size * 2, y), SAMPLE_TEXT[line % len(SAMPLE_TEXT)], fill=30, font=_font(font_size))
+		y += int(font_size * 1.8)
+		line += 1
+	page = page.rotate(skew, resample=Image.BICUBIC, expand=False, fillcolor=255)
+
+	# Uneven lighting (shadow from one side) + sensor noise, like a phone photo
+	arr = np.asarray(page, dtype=np.float32)
+	gradient = np.linspace(0.55, 1.0, w, dtype=np.float32)[None, :]
+	arr = arr * gradient + rng.normal(0, 8, size=arr.shape)
+	return Image.fromarray(np.clip(arr, 0, 255).astype(np.uint8)).convert("RGB")
+
+
+def _synthetic_fixtures() -> List[Tuple[str, Image.Image, Optional[str], Optional[float]]]:
+	text = "\n".join(SAMPLE_TEXT)
+	specs = [
+		("phone_12mp_skew3", (4000, 3000), 3.0),
+		("a4_scan_skew-1.5", (2480, 3508), -1.5),
+		("small_crop_flat", (900, 500), 0.0),
+	]
+	return [(name, _synthetic_page(size, skew, i), text, skew) for i, (name, size, skew) in enumerate(specs)]
+
+
+def _dataset_fixtures(path: str) -> List[Tuple[str, Image.Image, Optional[str], Optional[float]]]:
+	out = []
+	for name in sorted(os.listdir(path)):
+		stem, ext = os.path.splitext(name)
+		if ext.lower() not in IMAGE_EXTS:
+			continue
+		img = Image.open(os.path.join(path, name))
+		img.load()
+		txt_path = os.path.join(path, stem + ".txt")
+		text = open(txt_path, encoding="utf-8").read() if os.path.exists(txt_path) else None
+		out.append((name, img, text, None))
+	return out
+
+
+def _ocr_accuracy(img: Image.Image, expected: Optional[str]) -> Optional[float]:
+	if pytesseract is None or not expected:
+		return None
+	try:
+		text = pytesseract.image_to_string(img, lang="sqi", config="--oem 1 --psm 6")
+	except Exception:
+		text = pytesseract.image_to_string(img, config="--oem 1 --psm 6")
+	norm = lambda s: " ".join(s.lower().split())
+	return similarity_ratio(norm(expected), norm(text))
+
+
+def _time(fn, img: Image.Image, repeat: int) -> Tuple[float, Image.Image]:
+	best = float("inf")
+	out = None
+	for _ in range(repeat):
+		t0 = time.perf_counter()
+		out = fn(img)
+		best = min(best, time.perf_counter() - t0)
+	return best, out
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Benchmark OCR preprocessing chains.")
+	parser.add_argument("--dataset", help="Directory of fixture images (default: synthetic pages)")
+	parser.add_argument("--repeat", type=int, default=3)
+	args = parser.parse_args()
+
+	fixtures = _dataset_fixtures(args.dataset) if args.dataset else _synthetic_fixtures()
+	if not fixtures:
+		print("No fixture images found")
+		sys.exit(1)
+	if pytesseract is None:
+		print("(tesseract not available: timing and skew only)")
+
+	for name, img, expected, skew in fixtures:
+		old_t, old_img = _time(legacy_preprocess, img, args.repeat)
+		new_t, new_img = _time(new_preprocess, img, args.repeat)
+		line = (
+			f"{name:<22} {img.size[0]}x{img.size[1]:<6} "
+			f"legacy {old_t * 1000:8.1f} ms -> {old_img.size[0]}x{old_img.size[1]} | "
+			f"new {new_t * 1000:8.1f} ms -> {new_img.size[0]}x{new_img.size[1]} (x{old_t / new_t:.1f})"
+		)
+		if skew is not None:
+			angle, quarter_turns = imaging.estimate_skew(imaging.downsample_for_ocr(img))
+			line += f" | skew {skew:+.1f}° est {-angle:+.1f}°"
+		old_acc = _ocr_accuracy(old_img, expected)
+		new_acc = _ocr_accuracy(new_img, expected)
+		if old_acc is not None:
+			line += f" | ocr acc legacy {old_acc:.3f} new {new_acc:.3f}"
+		print(line)
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,252 @@
+"""
+Query plans and timings for the hot per-user queries, before and after
+migration m0002 (app/migrations/m0002_user_id_integer.py: integer user_id
+columns, composite indexes).
+
+Synthetic mode (default) builds two throwaway SQLite databases with the same
+generated rows: "legacy" (string user_id, single-column user_id indexes,
+leaderboard joined through CAST) and "current" (the models as they are).
+Each hot query is shown with its plan and mean time per execution.
+
+--live runs the current queries against DATABASE_URL instead (read-only),
+with EXPLAIN ANALYZE on PostgreSQL, e.g. before and after migrating.
+
+Usage (from backend/):
+	python scripts/bench_query_plans.py [--users 2000] [--attempts 200000] [--repeat 200]
+	python scripts/bench_query_plans.py --live [--repeat 50]
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Tuple
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if BACKEND_DIR not in sys.path:
+	sys.path.insert(0, BACKEND_DIR)
+
+
+# ---- Hot queries (as in the routers) ----
+
+def _queries(models, legacy: bool) -> Dict[str, Callable]:
+	"""name -> fn(user_id, ids) returning a statement; legacy uses the old string ids and CAST join."""
+	from sqlalchemy import String, case, cast, func, select
+
+	A, P, E, U, CP = models.Attempt, models.Progress, models.Exercise, models.User, models.CourseProgress
+	uid = (lambda u: str(u)) if legacy else (lambda u: u)
+
+	def leaderboard(u, ids):
+		stats = (
+			select(
+				A.user_id,
+				func.sum(case((A.score_delta > 0, A.score_delta), else_=0)).label("points"),
+				func.count(A.id).label("attempts"),
+			)
+			.group_by(A.user_id)
+			.subquery()
+		)
+		on = (cast(U.id, String) if legacy else U.id) == stats.c.user_id
+		return (
+			select(U.id, U.username, func.coalesce(stats.c.points, 0))
+			.outerjoin(stats, on)
+			.order_by(func.coalesce(stats.c.points, 0).desc())
+			.limit(50)
+		)
+
+	return {
+		# exercises.submit_answer
+		"progress by user+level": lambda u, ids: select(P).where(P.user_id == uid(u), P.level_id == ids["level_id"]),
+		"completed levels in course": lambda u, ids: select(func.count(P.id)).where(
+			P.user_id == uid(u), P.course_id == ids["course_id"], P.completed == True  # noqa: E712
+		),
+		# course_progression.calculate_course_progress
+		"course attempts": lambda u, ids: select(A).join(E, A.exercise_id == E.id).where(
+			A.user_id == uid(u), E.course_id == ids["course_id"]
+		),
+		# ai.get_smart_hints
+		"attempts on exercises": lambda u, ids: select(A).where(
+			A.user_id == uid(u), A.exercise_id.in_(ids["exercise_ids"])
+		),
+		# exercise deletes / per-exercise stats
+		"attempts of exercise": lambda u, ids: select(func.count(A.id)).where(A.exercise_id == ids["exercise_id"]),
+		# course_progression (unique constraint index)
+		"course progress row": lambda u, ids: select(CP).where(CP.user_id == u, CP.course_id == ids["course_id"]),
+		# leaderboard.get_leaderboard
+		"leaderboard": leaderboard,
+	}
+
+
+# ---- Synthetic databases ----
+
+def _legacy_metadata(models):
+	"""Copy of the schema with the pre-migration user_id columns and indexes."""
+	from sqlalchemy import Index, MetaData, String
+
+	md = MetaData()
+	for table in models.Base.metadata.sorted_tables:
+		table.to_metadata(md)
+	for name in ("attempts", "progress"):
+		table = md.tables[name]
+		for idx in list(table.indexes):
+			if idx.name.startswith(f"ix_{name}_user") or idx.name == "ix_attempts_exercise_id":
+				table.indexes.discard(idx)
+		table.c.user_id.type = String(64)
+		Index(f"ix_{name}_user_id", table.c.user_id)
+	for name in ("user_achievements", "user_daily_progress", "srs_cards", "chat_sessions"):
+		md.tables[name].c.user_id.type = String(50)
+	return md
+
+
+def _populate(engine, models, metadata, legacy: bool, users: int, attempts: int, seed: int) -> Dict[str, List[int]]:
+	from sqlalchemy import insert
+
+	rng = random.Random(seed)
+	metadata.create_all(engine)
+	t = metadata.tables
+	uid = (lambda u: str(u)) if legacy else (lambda u: u)
+	courses, levels_per_course, exercises_per_level = 20, 5, 10
+	with engine.begin() as conn:
+		conn.execute(insert(t["courses"]), [
+			{"id": c, "name": f"c{c}", "order_index": c, "category": "SPELLING", "required_score": 80}
+			for c in range(1, courses + 1)
+		])
+		levels, exercises = [], []
+		for c in range(1, courses + 1):
+			for lv in range(levels_per_course):
+				level_id = len(levels) + 1
+				levels.append({"id": level_id, "course_id": c, "name": f"l{level_id}", "order_index": lv, "required_score": 80})
+				for _ in range(exercises_per_level):
+					exercises.append({
+						"id": len(exercises) + 1, "category": "SPELLING", "course_id": c, "level_id": level_id,
+						"prompt": "p", "answer": "a", "points": 1, "order_index": 0,
+					})
+		conn.execute(insert(t["levels"]), levels)
+		conn.execute(insert(t["exercises"]), exercises)
+		conn.execute(insert(t["users"]), [
+			{"id": u, "username": f"u{u}", "email": f"u{u}@x", "password_hash": "x", "is_admin": False,
+			 "current_streak": 0, "longest_streak": 0, "total_achievements": 0}
+			for u in range(1, users + 1)
+		])
+		batch = []
+		for i in range(attempts):
+			ex = exercises[rng.randrange(len(exercises))]
+			batch.append({
+				"exercise_id": ex["id"], "user_id": uid(rng.randint(1, users)), "response": "r",
+				"is_correct": rng.random() < 0.7, "score_delta": 1,
+			})
+			if len(batch) == 10000:
+				conn.execute(insert(t["attempts"]), batch)
+				batch = []
+		if batch:
+			conn.execute(insert(t["attempts"]), batch)
+		progress, course_progress = [], []
+		for u in range(1, users + 1):
+			for lv in rng.sample(levels, 10):
+				progress.append({
+					"user_id": uid(u), "category": "SPELLING", "course_id": lv["course_id"], "level_id": lv["id"],
+					"points": 5, "errors": 1, "stars": 2, "completed": rng.random() < 0.5,
+				})
+			for c in rng.sample(range(1, courses + 1), 3):
+				course_progress.append({"user_id": u, "course_id": c, "is_completed": rng.random() < 0.3})
+		conn.execute(insert(t["progress"]), progress)
+		conn.execute(insert(t["course_progress"]), course_progress)
+		conn.exec_driver_sql("ANALYZE")
+	return {"users": list(range(1, users + 1)), "courses": list(range(1, courses + 1)), "exercises": [e["id"] for e in exercises], "levels": [lv["id"] for lv in levels]}
+
+
+# ---- Measurement ----
+
+def _params(rng: random.Random, ids: Dict[str, List[int]]) -> Tuple[int, Dict]:
+	return rng.choice(ids["users"]), {
+		"level_id": rng.choice(ids["levels"]),
+		"course_id": rng.choice(ids["courses"]),
+		"exercise_id": rng.choice(ids["exercises"]),
+		"exercise_ids": rng.sample(ids["exercises"], 10),
+	}
+
+
+def _plan(conn, stmt) -> List[str]:
+	from sqlalchemy import text
+
+	compiled = stmt.compile(conn, compile_kwargs={"literal_binds": True})
+	if conn.dialect.name == "postgresql":
+		return [r[0] for r in conn.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {compiled}"))]
+	return [r[-1] for r in conn.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))]
+
+
+def _run(engine, models, legacy: bool, ids: Dict[str, List[int]], repeat: int, seed: int) -> Dict[str, float]:
+	rng = random.Random(seed)
+	out: Dict[str, float] = {}
+	with engine.connect() as conn:
+		for name, build in _queries(models, legacy).items():
+			user, params = _params(rng, ids)
+			print(f"  {name}")
+			for line in _plan(conn, build(user, params)):
+				print(f"      {line}")
+			stmts = [build(*_params(rng, ids)) for _ in range(repeat)]
+			start = time.perf_counter()
+			for stmt in stmts:
+				conn.execute(stmt).all()
+			out[name] = (time.perf_counter() - start) * 1000 / repeat
+	return out
+
+
+def _ids_from_db(engine, models) -> Dict[str, List[int]]:
+	from sqlalchemy import select
+
+	with engine.connect() as conn:
+		def col(c):
+			return [r[0] for r in conn.execute(select(c).limit(10000))]
+		ids = {
+			"users": col(models.User.id),
+			"courses": col(models.Course.id),
+			"exercises": col(models.Exercise.id),
+			"levels": col(models.Level.id),
+		}
+	if not all(ids.values()) or len(ids["exercises"]) < 10:
+		raise SystemExit("--live needs users, courses, levels and at least 10 exercises in the database")
+	return ids
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Plans and timings for the hot per-user queries.")
+	parser.add_argument("--users", type=int, default=2000)
+	parser.add_argument("--attempts", type=int, default=200000)
+	parser.add_argument("--repeat", type=int, default=200, help="Executions per query (random parameters)")
+	parser.add_argument("--seed", type=int, default=7)
+	parser.add_argument("--live", action="store_true", help="Run the current queries against DATABASE_URL")
+	args = parser.parse_args()
+
+	if args.live:
+		from app import models
+		from app.database import engine
+		print(f"{engine.dialect.name}: current schema")
+		results = {"current": _run(engine, models, False, _ids_from_db(engine, models), args.repeat, args.seed)}
+	else:
+		from sqlalchemy import create_engine
+		tmpdir = tempfile.mkdtemp(prefix="bench_query_plans_")
+		# app.database connects at import; point it at a scratch file
+		os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tmpdir, 'app.db')}"
+		from app import models
+		results = {}
+		for variant in ("legacy", "current"):
+			legacy = variant == "legacy"
+			engine = create_engine(f"sqlite:///{os.path.join(tmpdir, variant + '.db')}")
+			metadata = _legacy_metadata(models) if legacy else models.Base.metadata
+			start = time.perf_counter()
+			ids = _populate(engine, models, metadata, legacy, args.users, args.attempts, args.seed)
+			print(f"\n{variant}: {args.users} users, {args.attempts} attempts (built in {time.perf_counter() - start:.1f}s)")
+			results[variant] = _run(engine, models, legacy, ids, args.repeat, args.seed)
+			engine.dispose()
+
+	print(f"\nmean ms per query ({args.repeat} runs)")
+	names = list(next(iter(results.values())))
+	print(f"{'query':<28}" + "".join(f"{v:>12}" for v in results))
+	for name in names:
+		print(f"{name:<28}" + "".join(f"{results[v][name]:12.3f}" for v in results))
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,159 @@
+"""
+Micro-benchmarks for app/similarity.py against the implementations it replaced.
+
+Usage (from backend/):
+	python scripts/bench_similarity.py [--words 5000] [--repeat 5]
+
+Word lists come from the local corpus (exercise prompts/answers) when the DB is
+reachable, otherwise from a synthetic Albanian-like vocabulary.
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import timeit
+from typing import List
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if BACKEND_DIR not in sys.path:
+	sys.path.insert(0, BACKEND_DIR)
+
+from app import similarity  # noqa: E402
+
+
+# ---- Previous implementations (kept here only for comparison) ----
+
+_OLD_ALBANIAN_CHARS = {
+	'ë': 'e', 'ç': 'c', 'rr': 'r', 'll': 'l', 'nj': 'n', 'gj': 'g',
+	'dh': 'd', 'th': 't', 'sh': 's', 'zh': 'z', 'xh': 'x'
+}
+
+
+def old_normalize_albanian(text: str) -> str:
+	text = text.lower().strip()
+	for alb_char, replacement in _OLD_ALBANIAN_CHARS.items():
+		text = text.replace(alb_char, replacement)
+	return text
+
+
+def old_character_similarity(text1: str, text2: str) -> float:
+	if len(text1) == len(text2):
+		return sum(c1 == c2 for c1, c2 in zip(text1, text2)) / len(text1)
+	shorter, longer = (text1, text2) if len(text1) < len(text2) else (text2, text1)
+	return sum(c in longer for c in shorter) / len(longer)
+
+
+def old_levenshtein(a: str, b: str, max_dist: int = 2) -> int:
+	if a == b:
+		return 0
+	if abs(len(a) - len(b)) > max_dist:
+		return max_dist + 1
+	previous = list(range(len(b) + 1))
+	for i, ca in enumerate(a, start=1):
+		current = [i]
+		min_row = current[0]
+		for j, cb in enumerate(b, start=1):
+			val = min(current[j - 1] + 1, previous[j] + 1, previous[j - 1] + (0 if ca == cb else 1))
+			current.append(val)
+			if val < min_row:
+				min_row = val
+		previous = current
+		if min_row > max_dist:
+			return max_dist + 1
+	return previous[-1]
+
+
+# ---- Data ----
+
+def _corpus_words(limit: int) -> List[str]:
+	try:
+		from app.database import SessionLocal
+		from app import models
+		db = SessionLocal()
+		try:
+			rows = db.query(models.Exercise.prompt, models.Exercise.answer).all()
+		finally:
+			db.close()
+		words = set()
+		for prompt, answer in rows:
+			for src in (prompt or "", answer or ""):
+				words.update(w.lower() for w in re.findall(r"[A-Za-zËÇëç]+", src) if len(w) > 1)
+		return sorted(words)[:limit]
+	except Exception:
+		return []
+
+
+def _synthetic_words(limit: int) -> List[str]:
+	rng = random.Random(7)
+	units = ["a", "b", "c", "ç", "d", "dh", "e", "ë", "f", "g", "gj", "h", "i", "j", "k", "l", "ll",
+		"m", "n", "nj", "o", "p", "q", "r", "rr", "s", "sh", "t", "th", "u", "v", "x", "xh", "y", "z", "zh"]
+	return ["".join(rng.choice(units) for _ in range(rng.randint(3, 8))) for _ in range(limit)]
+
+
+def _bench(label: str, fn, repeat: int) -> float:
+	best = min(timeit.repeat(fn, number=1, repeat=repeat))
+	print(f"  {label:<44} {best * 1000:9.2f} ms")
+	return best
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Benchmark similarity primitives.")
+	parser.add_argument("--words", type=int, default=5000)
+	parser.add_argument("--repeat", type=int, default=5)
+	args = parser.parse_args()
+
+	words = _corpus_words(args.words)
+	source = "corpus"
+	if len(words) < 100:
+		words = _synthetic_words(args.words)
+		source = "synthetic"
+	rng = random.Random(11)
+	queries = [rng.choice(words) + rng.choice(["", "e", "ë"]) for _ in range(50)]
+	pairs = list(zip(words, reversed(words)))[:2000]
+	sentences = [" ".join(rng.choice(words) for _ in range(12)) for _ in range(500)]
+
+	print(f"Words: {len(words)} ({source}), queries: {len(queries)}, pairs: {len(pairs)}")
+
+	print("\nAlbanian normalization (500 sentences)")
+	_bench("old dict-driven str.replace", lambda: [old_normalize_albanian(s) for s in sentences], args.repeat)
+	_bench("fold_albanian", lambda: [similarity.fold_albanian(s) for s in sentences], args.repeat)
+
+	print("\nCharacter similarity (pairs)")
+	_bench("old character_similarity (not a metric)", lambda: [old_character_similarity(a, b) for a, b in pairs], args.repeat)
+	_bench("similarity_ratio (Levenshtein)", lambda: [similarity.similarity_ratio(a, b) for a, b in pairs], args.repeat)
+	_bench("damerau_levenshtein", lambda: [similarity.damerau_levenshtein(a, b) for a, b in pairs], args.repeat)
+
+	print("\nBounded distance, each query vs whole lexicon (k=2)")
+	old = _bench("old ocr._levenshtein loop", lambda: [[old_levenshtein(q, w) for w in words] for q in queries], args.repeat)
+	banded = _bench("levenshtein(max_dist=2) loop", lambda: [[similarity.levenshtein(q, w, 2) for w in words] for q in queries], args.repeat)
+	batch = _bench("batch_levenshtein (NumPy)", lambda: [similarity.batch_levenshtein(q, words, 2) for q in queries], args.repeat)
+	print(f"  banded speedup x{old / banded:.1f}, batch speedup x{old / batch:.1f}")
+
+	print("\nAlignment (pairs)")
+	_bench("align", lambda: [similarity.align(a, b) for a, b in pairs[:500]], args.repeat)
+	_bench("align on graphemes", lambda: [similarity.align(similarity.graphemes(a), similarity.graphemes(b)) for a, b in pairs[:500]], args.repeat)
+
+	print("\nWord alignment vs positional comparison (dictation with dropped/extra words)")
+	for n in (40, 300, 2000):
+		expected = [rng.choice(words) for _ in range(n)]
+		recognized = []
+		for w in expected:
+			r = rng.random()
+			if r < 0.03:
+				continue  # dropped word
+			if r < 0.06:
+				recognized.append(rng.choice(words))  # extra word
+			recognized.append(w if r > 0.15 else w[:-1] or w)
+		positional = sum(
+			1 for i in range(max(n, len(recognized)))
+			if (expected[i] if i < n else "") != (recognized[i] if i < len(recognized) else "")
+		)
+		aligned = similarity.align_words(expected, recognized)
+		reported = sum(1 for op in aligned if op["op"] != "equal")
+		_bench(f"align_words, {n} words", lambda: similarity.align_words(expected, recognized), args.repeat)
+		print(f"    reported differences: positional {positional}, aligned {reported}")
+
+
+if __name__ == "__main__":
+	main()
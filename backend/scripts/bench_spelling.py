@@ -0,0 +1,135 @@
+"""
+Benchmark OCR spelling suggestions: previous bucket scan vs the SymSpell index (app/spelling.py).
+
+The lexicon is either a word list file (one word per line, optional frequency)
+or synthetic Albanian-looking words. Queries are lexicon words with 1–2 random
+edits, including ë/ç drops, doubled letters and first-letter errors.
+
+Reported per lexicon size: index build time, mean/p95 lookup latency and
+recall (share of queries whose source word is among the suggestions).
+
+Usage (from backend/):
+	python scripts/bench_spelling.py [--wordlist sq.txt] [--sizes 2000 20000 100000] [--queries 500]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+# Ensure backend/ is on sys.path when running as a script
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if BACKEND_DIR not in sys.path:
+	sys.path.insert(0, BACKEND_DIR)
+
+from app import lexicon  # noqa: E402
+from app.similarity import batch_levenshtein  # noqa: E402
+from app.spelling import SpellIndex  # noqa: E402
+
+LETTERS = "abcçdeëfghijklmnopqrstuvxyz"
+SYLLABLES = [
+	"sh", "ll", "rr", "nj", "gj", "dh", "th", "xh", "zh", "ka", "të", "në", "ma", "ri", "jo",
+	"ku", "de", "li", "bë", "ço", "mo", "pa", "ve", "ni", "sa", "ës", "ar", "or", "el", "im",
+]
+
+
+# ---- Previous implementation (kept here only for comparison) ----
+
+def legacy_suggest(token: str, buckets: Dict[Tuple[str, int], List[str]], max_suggestions: int = 5) -> List[str]:
+	t = token.lower()
+	candidates: List[str] = []
+	for ln in range(max(2, len(t) - 2), len(t) + 3):
+		candidates.extend(buckets.get((t[0], ln), []))
+	distances = batch_levenshtein(t, candidates, max_dist=2)
+	scored = sorted((d, c) for d, c in zip(distances, candidates) if d <= 2)
+	return [c for _, c in scored[:max_suggestions]]
+
+
+# ---- Fixtures ----
+
+def _synthetic_words(n: int, rng: random.Random) -> Dict[str, int]:
+	words: Dict[str, int] = {}
+	while len(words) < n:
+		w = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 5)))
+		words[w] = int(rng.paretovariate(1.2))
+	return words
+
+
+def _load_wordlist(path: str) -> Dict[str, int]:
+	with open(path, encoding="utf-8", errors="replace") as f:
+		words: Dict[str, int] = {}
+		for w, n in lexicon.parse_wordlist(f):
+			w = w.lower()
+			if len(w) >= 2:
+				words[w] = words.get(w, 0) + n
+	return words
+
+
+def _corrupt(word: str, rng: random.Random) -> str:
+	for _ in range(rng.choice((1, 1, 2))):
+		kind = rng.choice(("diacritic", "double", "sub", "del", "ins", "first"))
+		i = rng.randrange(len(word))
+		if kind == "diacritic" and ("ë" in word or "ç" in word):
+			word = word.replace("ë", "e", 1) if "ë" in word else word.replace("ç", "c", 1)
+		elif kind == "double":
+			word = word[:i] + word[i] + word[i:]
+		elif kind == "first":
+			word = rng.choice(LETTERS) + word[1:]
+		elif kind == "sub":
+			word = word[:i] + rng.choice(LETTERS) + word[i + 1:]
+		elif kind == "del" and len(word) > 3:
+			word = word[:i] + word[i + 1:]
+		else:
+			word = word[:i] + rng.choice(LETTERS) + word[i:]
+	return word
+
+
+def _run(name: str, fn: Callable[[str], List[str]], queries: List[Tuple[str, str]]) -> str:
+	times = []
+	hits = 0
+	for query, source in queries:
+		t0 = time.perf_counter()
+		out = fn(query)
+		times.append(time.perf_counter() - t0)
+		hits += source in out
+	times.sort()
+	mean = sum(times) / len(times) * 1000
+	p95 = times[int(len(times) * 0.95) - 1] * 1000
+	return f"{name:<8} mean {mean:7.3f} ms  p95 {p95:7.3f} ms  recall {hits / len(queries):.3f}"
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Benchmark spelling suggestion lookups.")
+	parser.add_argument("--wordlist", help="Word list file (default: synthetic words)")
+	parser.add_argument("--sizes", type=int, nargs="+", default=[2000, 20000, 100000])
+	parser.add_argument("--queries", type=int, default=500)
+	parser.add_argument("--seed", type=int, default=0)
+	args = parser.parse_args()
+
+	rng = random.Random(args.seed)
+	source = _load_wordlist(args.wordlist) if args.wordlist else _synthetic_words(max(args.sizes), rng)
+	all_words = list(source)
+
+	for size in args.sizes:
+		words = {w: source[w] for w in all_words[:size]}
+		buckets: Dict[Tuple[str, int], List[str]] = {}
+		for w in words:
+			buckets.setdefault((w[0], len(w)), []).append(w)
+
+		t0 = time.perf_counter()
+		index = SpellIndex(dict(words))
+		for w in words:
+			index.add(w)
+		build = time.perf_counter() - t0
+
+		sample = rng.sample(list(words), min(args.queries, len(words)))
+		queries = [(q, w) for w, q in ((w, _corrupt(w, rng)) for w in sample) if q not in words]
+
+		print(f"\n{len(words)} words, {len(queries)} queries (symspell build {build:.2f} s)")
+		print("  " + _run("legacy", lambda q: legacy_suggest(q, buckets), queries))
+		print("  " + _run("symspell", lambda q: [w for w, _, _ in index.lookup(q)], queries))
+
+
+if __name__ == "__main__":
+	main()
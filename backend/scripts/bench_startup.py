@@ -0,0 +1,181 @@
+"""
+Cold-start cost of one worker, each phase measured in a fresh interpreter:
+
+- import: `import app.main` (module imports + create_app; no DB connection)
+- startup: the app lifespan (connection check, migrations, OCR job workers,
+  STARTUP_WARMUP in the background)
+- first request: GET /health/db through the ASGI app
+- providers: what each optional provider (app/providers.py) costs when it is
+  first used, i.e. what the old import-time initialization added to startup
+
+The import must stay under --budget-ms (median) and must not load any of the
+heavy optional libraries (openai, anthropic, gTTS, ...); either violation
+exits with status 1, so the script can guard startup time in CI. The slowest
+modules come from `python -X importtime`.
+
+Runs against a scratch SQLite database unless --database-url is given.
+
+Usage (from backend/):
+	python scripts/bench_startup.py [--runs 5] [--budget-ms 1500] [--top 15]
+	python scripts/bench_startup.py --database-url postgresql://... --runs 3
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+# Ensure backend/ is on sys.path when running as a script
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if BACKEND_DIR not in sys.path:
+	sys.path.insert(0, BACKEND_DIR)
+
+# Must not be imported by `import app.main`: each is loaded by the first request that needs it
+HEAVY_MODULES = (
+	"openai",
+	"anthropic",
+	"gtts",
+	"speech_recognition",
+	"pydub",
+	"azure.cognitiveservices.speech",
+	"pytesseract",
+	"PIL",
+	"numpy",
+	"paddleocr",
+)
+
+
+# ---- child: one fresh interpreter ----
+
+def _child() -> None:
+	import asyncio
+
+	started = time.perf_counter()
+	from app.main import app
+	import_ms = (time.perf_counter() - started) * 1000
+	heavy = [m for m in HEAVY_MODULES if m in sys.modules]
+
+	async def _startup_and_first_request() -> Tuple[float, float]:
+		import httpx
+		start = time.perf_counter()
+		async with app.router.lifespan_context(app):
+			startup_ms = (time.perf_counter() - start) * 1000
+			start = time.perf_counter()
+			async with httpx.AsyncClient(app=app, base_url="http://bench") as client:
+				r = await client.get("/health/db")
+				r.raise_for_status()
+			first_ms = (time.perf_counter() - start) * 1000
+		return startup_ms, first_ms
+
+	startup_ms, first_ms = asyncio.run(_startup_and_first_request())
+
+	from app import providers
+	loads: Dict[str, float] = {}
+	for p in providers._PROVIDERS.values():
+		if p.installed and not p.loaded:
+			p.enabled = True  # measure the load even when its API key isn't configured
+			start = time.perf_counter()
+			if p.get() is not None:
+				loads[p.name] = (time.perf_counter() - start) * 1000
+	print(json.dumps({
+		"import_ms": import_ms,
+		"startup_ms": startup_ms,
+		"first_request_ms": first_ms,
+		"heavy_modules": heavy,
+		"provider_ms": loads,
+	}))
+
+
+# ---- parent ----
+
+def _run_child(env: Dict[str, str]) -> Dict:
+	out = subprocess.run(
+		[sys.executable, os.path.abspath(__file__), "--child"],
+		cwd=BACKEND_DIR, env=env, capture_output=True, text=True,
+	)
+	if out.returncode != 0:
+		sys.stderr.write(out.stderr)
+		raise SystemExit(f"child run failed with status {out.returncode}")
+	# Startup logs ([MIGRATE], [OCR JOBS], ...) go to stdout as well; the result is the last line
+	return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def _slowest_imports(env: Dict[str, str], top: int) -> List[Tuple[str, int]]:
+	"""Top-level and second-level modules by cumulative import time (µs), from -X importtime."""
+	out = subprocess.run(
+		[sys.executable, "-X", "importtime", "-c", "import app.main"],
+		cwd=BACKEND_DIR, env=env, capture_output=True, text=True,
+	)
+	rows = []
+	for line in out.stderr.splitlines():
+		if not line.startswith("import time:") or "|" not in line:
+			continue
+		_, cumulative, name = line[len("import time:"):].split("|")
+		if not cumulative.strip().isdigit():
+			continue  # header line
+		depth = (len(name) - len(name.lstrip(" "))) // 2
+		if depth <= 1:
+			rows.append((name.strip(), int(cumulative)))
+	rows.sort(key=lambda r: r[1], reverse=True)
+	return rows[:top]
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Measure worker cold start: imports, lifespan, first request, providers.")
+	parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to average over")
+	parser.add_argument("--budget-ms", type=float, default=1500.0, help="Fail when the median import exceeds this")
+	parser.add_argument("--top", type=int, default=15, help="Slowest imports to list")
+	parser.add_argument("--database-url", help="Database to start against (default: scratch SQLite)")
+	parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+	args = parser.parse_args()
+
+	if args.child:
+		_child()
+		return
+
+	env = dict(os.environ)
+	env["PYTHONPATH"] = BACKEND_DIR
+	scratch = None
+	if not args.database_url:
+		scratch = tempfile.mkdtemp(prefix="bench_startup_")
+		env["DATABASE_URL"] = f"sqlite:///{os.path.join(scratch, 'app.db')}"
+	else:
+		env["DATABASE_URL"] = args.database_url
+
+	results = [_run_child(env) for _ in range(args.runs)]
+	# The first run against a scratch database also applies every migration
+	print(f"{args.runs} fresh interpreters ({'scratch SQLite' if scratch else 'given database'})")
+	print(f"{'phase':<16}{'median ms':>12}{'min ms':>10}{'max ms':>10}")
+	for key, label in (("import_ms", "import"), ("startup_ms", "startup"), ("first_request_ms", "first request")):
+		values = [r[key] for r in results]
+		print(f"{label:<16}{statistics.median(values):12.1f}{min(values):10.1f}{max(values):10.1f}")
+
+	provider_ms = results[-1]["provider_ms"]
+	if provider_ms:
+		print("\nfirst use of each provider (deferred from startup)")
+		for name, ms in sorted(provider_ms.items(), key=lambda kv: -kv[1]):
+			print(f"  {name:<16}{ms:10.1f} ms")
+
+	print("\nslowest imports (cumulative, from -X importtime)")
+	for name, us in _slowest_imports(env, args.top):
+		print(f"  {name:<40}{us / 1000:10.1f} ms")
+
+	failures = []
+	median_import = statistics.median(r["import_ms"] for r in results)
+	if median_import > args.budget_ms:
+		failures.append(f"median import {median_import:.0f}ms exceeds the {args.budget_ms:.0f}ms budget")
+	heavy = sorted({m for r in results for m in r["heavy_modules"]})
+	if heavy:
+		failures.append(f"imported at startup: {', '.join(heavy)}")
+	if failures:
+		print("\nFAIL: " + "; ".join(failures))
+		raise SystemExit(1)
+	print(f"\nOK: median import {median_import:.0f}ms within {args.budget_ms:.0f}ms, no heavy optional modules imported")
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,158 @@
+"""
+Evaluate and calibrate the noisy-channel OCR corrector (app/ocr_correct.py).
+
+Pairs of OCR output and expected text come from ocr_text_pairs (logged by
+/api/ocr/analyze when expected_text is given and OCR_TEXT_PAIR_DAYS is set)
+or from a JSONL file with {"ocr_text": ..., "expected_text": ...} per line.
+A share of the pairs is held out: confusion counts are learned from the rest
+(plus the built-in priors), the held-out tokens are scored.
+
+Reported: top-1 word accuracy before/after correction, candidate coverage,
+expected calibration error (10 bins) at temperature 1 and at the fitted
+temperature, and the share of texts confident enough to skip the LLM with
+their accuracy. Set OCR_CORRECT_TEMPERATURE to the fitted value.
+
+Usage (from backend/):
+	python scripts/calibrate_ocr_corrector.py [--pairs pairs.jsonl] [--holdout 0.2]
+"""
+import argparse
+import json
+import math
+import os
+import random
+import sys
+from collections import Counter
+from typing import List, Optional, Tuple
+
+# Ensure backend/ is on sys.path when running as a script
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if BACKEND_DIR not in sys.path:
+	sys.path.insert(0, BACKEND_DIR)
+
+from app.database import SessionLocal  # noqa: E402
+from app import lexicon, migrate, models, ocr_correct  # noqa: E402
+from app.similarity import align  # noqa: E402
+
+TEMPERATURES = [0.25, 0.35, 0.5, 0.7, 0.85, 1.0, 1.2, 1.5, 2.0, 3.0, 4.0]
+
+# (log scores per candidate, index of the expected word or None, ocr word == expected)
+Sample = Tuple[List[Tuple[str, float]], Optional[int], bool]
+
+
+def _load_pairs(path: Optional[str], db) -> List[Tuple[str, str]]:
+	if path:
+		with open(path, encoding="utf-8") as f:
+			rows = [json.loads(line) for line in f if line.strip()]
+		return [(r["ocr_text"], r["expected_text"]) for r in rows]
+	return [(r.ocr_text, r.expected_text) for r in db.query(models.OcrTextPair).all()]
+
+
+def _samples(pairs, index, model) -> List[List[Sample]]:
+	"""Per text: one sample per aligned OCR word."""
+	texts = []
+	for ocr_text, expected_text in pairs:
+		samples: List[Sample] = []
+		prev = None
+		for op in align(ocr_correct._norm_words(expected_text), ocr_correct._norm_words(ocr_text)):
+			if op["op"] not in ("equal", "substitute") or len(op["b"]) < 2 or op["b"].isdigit():
+				prev = None
+				continue
+			expected, observed = op["a"], op["b"]
+			scored = ocr_correct.score_token(observed, prev, index, model)
+			words = [c for c, _ in scored]
+			samples.append((scored, words.index(expected) if expected in words else None, observed == expected))
+			prev = expected if expected in index.words else None
+		texts.append(samples)
+	return texts
+
+
+def _nll(texts: List[List[Sample]], t: float) -> float:
+	total, n = 0.0, 0
+	for samples in texts:
+		for scored, target, _ in samples:
+			if target is None:
+				continue
+			post = ocr_correct.posteriors(scored, t)
+			total -= math.log(max(post[target][1], 1e-12))
+			n += 1
+	return total / max(n, 1)
+
+
+def _report(texts: List[List[Sample]], t: float) -> str:
+	bins = [[0, 0.0, 0] for _ in range(10)]  # count, confidence sum, correct
+	correct = 0
+	n = 0
+	confident_texts = 0
+	confident_correct = 0
+	for samples in texts:
+		all_confident = True
+		all_correct = True
+		for scored, target, _ in samples:
+			post = ocr_correct.posteriors(scored, t)
+			best, p = post[0]
+			ok = target == 0
+			b = bins[min(int(p * 10), 9)]
+			b[0] += 1
+			b[1] += p
+			b[2] += ok
+			correct += ok
+			n += 1
+			all_confident &= p >= ocr_correct.CONFIDENCE
+			all_correct &= ok
+		if samples and all_confident:
+			confident_texts += 1
+			confident_correct += all_correct
+	ece = sum(abs(b[1] - b[2]) for b in bins if b[0]) / max(n, 1)
+	skip = confident_texts / max(len(texts), 1)
+	skip_acc = confident_correct / max(confident_texts, 1)
+	return (
+		f"T={t:<5} accuracy {correct / max(n, 1):.3f}  ECE {ece:.3f}  NLL {_nll(texts, t):.3f}  "
+		f"texts skipping LLM {skip:.1%} (all words right in {skip_acc:.1%})"
+	)
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Evaluate and calibrate the OCR noisy-channel corrector.")
+	parser.add_argument("--pairs", help="JSONL file with ocr_text/expected_text (default: ocr_text_pairs table)")
+	parser.add_argument("--holdout", type=float, default=0.2, help="Share of pairs held out for scoring")
+	parser.add_argument("--seed", type=int, default=0)
+	args = parser.parse_args()
+
+	migrate.upgrade()
+	db = SessionLocal()
+	try:
+		pairs = _load_pairs(args.pairs, db)
+		if not pairs:
+			print("No OCR/expected text pairs found")
+			sys.exit(1)
+		index = lexicon.get_lexicon(db)
+	finally:
+		db.close()
+
+	random.Random(args.seed).shuffle(pairs)
+	cut = max(1, int(len(pairs) * args.holdout))
+	test, train = pairs[:cut], pairs[cut:] or pairs[:cut]
+	counts: Counter = Counter()
+	for ocr_text, expected_text in train:
+		counts.update(ocr_correct.confusions_from_pair(ocr_text, expected_text))
+	model = ocr_correct.ConfusionModel(dict(counts))
+
+	texts = _samples(test, index, model)
+	samples = [s for text in texts for s in text]
+	if not samples:
+		print("No scorable words in the held-out pairs")
+		sys.exit(1)
+	raw_acc = sum(s[2] for s in samples) / len(samples)
+	coverage = sum(s[1] is not None for s in samples) / len(samples)
+	print(f"{len(train)} training pairs, {len(test)} held out, {len(samples)} words")
+	print(f"OCR word accuracy without correction {raw_acc:.3f}; expected word among candidates {coverage:.1%}")
+
+	best_t = min(TEMPERATURES, key=lambda t: _nll(texts, t))
+	print(_report(texts, 1.0))
+	if best_t != 1.0:
+		print(_report(texts, best_t))
+	print(f"\nRecommended: OCR_CORRECT_TEMPERATURE={best_t}")
+
+
+if __name__ == "__main__":
+	main()
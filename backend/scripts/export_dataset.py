@@ -1,19 +1,75 @@
+"""
+Export the ALBLingo dataset (courses, levels, exercises; optionally
+anonymized attempts, progress and users) from DATABASE_URL.
+
+Every table is streamed: a Core SELECT on a server-side cursor (yield_per
+--batch-size rows; a named cursor on PostgreSQL) is converted and written
+one batch at a time, so memory stays flat however large attempts grows.
+Each table has a fixed column list, so CSV headers need no scan of the rows.
+
+Tables are exported in parallel (--jobs), each on its own connection. On
+PostgreSQL they all read one snapshot (pg_export_snapshot, as pg_dump -j
+does), so the files are consistent with each other.
+
+Incremental mode (--incremental, into one stable --out directory) exports
+only what changed since the previous run, as append-only partitions
+<table>/part-NNNNN.<ext>. The high-water mark of each table is kept in
+manifest.json:
+- attempts (insert-only): the last id, plus the ids skipped below it, which
+  may belong to transactions still in flight and are re-checked next run
+- progress, course_progress: the last updated_at (the start of the run when
+  every row had NULL, as after migration m0005); each run re-reads
+  --overlap-seconds before it, so a row may appear in several partitions
+  (keep the last one per id)
+- courses, levels, exercises, users: a full snapshot partition, written
+  only when the SHA-256 of the table's rows changed (an empty partition when
+  the table became empty)
+The anonymization salt is kept in the directory (ANONYMIZATION_SALT.txt),
+so pseudonymous user ids stay stable across partitions. A partition is
+written under a .tmp name, renamed when complete and then recorded in
+manifest.json (replaced atomically), so an interrupted run is resumed by
+running the same command again: leftovers are removed and each table
+continues from its last recorded partition. Large tables are split every
+--partition-rows rows, which also bounds the work an interruption loses.
+
+Formats:
+- jsonl, csv: one text file per table
+- parquet, arrow (need pyarrow): typed columns, with low-cardinality text
+  (categories, pseudonymous user ids) as dictionary columns. Parquet is
+  zstd-compressed with row groups of --row-group-size rows; arrow writes
+  the Arrow IPC stream format (.arrows)
+
+Usage (from backend/):
+	python scripts/export_dataset.py [--out DIR] [--format jsonl|csv|parquet|arrow]
+	python scripts/export_dataset.py --include-attempts --include-progress --include-users --jobs 4
+	python scripts/export_dataset.py --incremental --out dataset_export/live --include-attempts --include-progress
+"""
 import argparse
 import csv
+import functools
+import hashlib
+import importlib.util
 import json
 import os
-import sys
 import secrets
-import hashlib
-from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 
 # Ensure backend/ is on sys.path when running as a script (python scripts/export_dataset.py)
 BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 if BACKEND_DIR not in sys.path:
 	sys.path.insert(0, BACKEND_DIR)
 
-from app.database import SessionLocal  # noqa: E402
+from sqlalchemy import case, create_engine, func, or_, select, text  # noqa: E402
+from sqlalchemy.engine import Connection, Engine  # noqa: E402
+from sqlalchemy.pool import NullPool  # noqa: E402
+
+from app.database import engine as app_engine  # noqa: E402
 from app import models  # noqa: E402
 
 
@@ -30,210 +86,531 @@ def _sha256_hex(value: str) -> str:
 
 
 def _user_pseudo(user_id: str, salt: str) -> str:
-	# stable within one export (salted)
+	# stable for one salt: one export, or every partition of an incremental export
 	return _sha256_hex(f"{salt}::user::{user_id}")[:16]
 
 
-def _write_jsonl(path: str, rows: Iterable[Dict[str, Any]]) -> int:
-	count = 0
-	with open(path, "w", encoding="utf-8") as f:
-		for r in rows:
-			f.write(json.dumps(r, ensure_ascii=False) + "\n")
-			count += 1
-	return count
-
-
-def _write_csv(path: str, rows: List[Dict[str, Any]]) -> int:
-	if not rows:
-		with open(path, "w", encoding="utf-8") as f:
-			f.write("")
-		return 0
-	fieldnames = sorted({k for r in rows for k in r.keys()})
-	with open(path, "w", encoding="utf-8", newline="") as f:
-		w = csv.DictWriter(f, fieldnames=fieldnames)
-		w.writeheader()
-		for r in rows:
-			w.writerow(r)
-	return len(rows)
-
-
-def main():
-	parser = argparse.ArgumentParser(description="Export ALBLingo dataset from the local DB.")
-	parser.add_argument("--out", default=f"dataset_export/{_now_slug()}", help="Output directory")
-	parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl", help="Export format")
-	parser.add_argument("--include-attempts", action="store_true", help="Include attempts (anonymized)")
-	parser.add_argument("--include-progress", action="store_true", help="Include progress and course_progress (anonymized)")
-	parser.add_argument("--include-users", action="store_true", help="Include users (PII excluded, user ids anonymized)")
-	parser.add_argument("--salt", default=None, help="Salt used for anonymization (stored in output; keep it private)")
-	args = parser.parse_args()
-
-	out_dir = os.path.abspath(args.out)
-	_ensure_dir(out_dir)
-
-	salt = args.salt or secrets.token_hex(16)
-	with open(os.path.join(out_dir, "ANONYMIZATION_SALT.txt"), "w", encoding="utf-8") as f:
-		f.write(salt + "\n")
-
-	db = SessionLocal()
+def _enum(value: Any) -> Optional[str]:
+	return value.value if value is not None else None
+
+
+# ============================================================================
+# TABLES
+# ============================================================================
+
+# Column types: int, float, bool, str, cat (text with few distinct values: a dictionary column in Arrow), ts
+class Table(NamedTuple):
+	name: str
+	columns: List[Tuple[str, str]]
+	query: Callable[[], Any]
+	# Full-export order
+	order: Callable[[], List[Any]]
+	# DB row -> output values in column order; the second argument pseudonymizes a user id
+	convert: Callable[[Any, Callable[[Any], str]], tuple]
+	# Incremental mode: ("append", id) for insert-only tables, ("updated", updated_at, id); None = snapshot
+	incremental: Optional[Tuple[Any, ...]] = None
+
+
+_C, _L, _E = models.Course, models.Level, models.Exercise
+_A, _P, _CP, _U = models.Attempt, models.Progress, models.CourseProgress, models.User
+
+COURSES = Table(
+	"courses",
+	[("id", "int"), ("name", "str"), ("description", "str"), ("order_index", "int"), ("category", "cat"),
+	 ("required_score", "int"), ("enabled", "bool"), ("parent_class_id", "int"), ("is_class", "bool")],
+	lambda: select(_C.id, _C.name, _C.description, _C.order_index, _C.category, _C.required_score, _C.enabled, _C.parent_class_id),
+	# Classes (parent_class_id = null) first, then sub-courses grouped by class
+	lambda: [case((_C.parent_class_id.is_(None), 0), else_=1), func.coalesce(_C.parent_class_id, 0), func.coalesce(_C.order_index, 0), _C.id],
+	lambda r, pseudo: (r.id, r.name, r.description, r.order_index, _enum(r.category), r.required_score, bool(r.enabled), r.parent_class_id, r.parent_class_id is None),
+)
+
+LEVELS = Table(
+	"levels",
+	[("id", "int"), ("course_id", "int"), ("name", "str"), ("description", "str"), ("order_index", "int"),
+	 ("required_score", "int"), ("enabled", "bool")],
+	lambda: select(_L.id, _L.course_id, _L.name, _L.description, _L.order_index, _L.required_score, _L.enabled),
+	lambda: [_L.course_id, _L.order_index],
+	lambda r, pseudo: (r.id, r.course_id, r.name, r.description, r.order_index, r.required_score, bool(r.enabled)),
+)
+
+EXERCISES = Table(
+	"exercises",
+	[("id", "int"), ("course_id", "int"), ("level_id", "int"), ("order_index", "int"), ("category", "cat"),
+	 ("prompt", "str"), ("answer", "str"), ("data", "str"), ("rule", "cat"), ("points", "int"), ("enabled", "bool")],
+	lambda: select(_E.id, _E.course_id, _E.level_id, _E.order_index, _E.category, _E.prompt, _E.answer, _E.data, _E.rule, _E.points, _E.enabled),
+	lambda: [_E.level_id, _E.order_index],
+	lambda r, pseudo: (r.id, r.course_id, r.level_id, r.order_index, _enum(r.category), r.prompt, r.answer, r.data, r.rule, r.points, bool(r.enabled)),
+)
+
+ATTEMPTS = Table(
+	"attempts",
+	[("id", "int"), ("user_id", "cat"), ("exercise_id", "int"), ("response", "str"), ("is_correct", "bool"), ("score_delta", "int")],
+	lambda: select(_A.id, _A.user_id, _A.exercise_id, _A.response, _A.is_correct, _A.score_delta),
+	lambda: [_A.id],
+	lambda r, pseudo: (r.id, pseudo(r.user_id), r.exercise_id, r.response, bool(r.is_correct), r.score_delta),
+	("append", _A.id),
+)
+
+PROGRESS = Table(
+	"progress",
+	[("id", "int"), ("user_id", "cat"), ("category", "cat"), ("course_id", "int"), ("level_id", "int"),
+	 ("points", "int"), ("errors", "int"), ("stars", "int"), ("completed", "bool"), ("updated_at", "ts")],
+	lambda: select(_P.id, _P.user_id, _P.category, _P.course_id, _P.level_id, _P.points, _P.errors, _P.stars, _P.completed, _P.updated_at),
+	lambda: [_P.user_id, _P.level_id],
+	lambda r, pseudo: (r.id, pseudo(r.user_id), _enum(r.category), r.course_id, r.level_id, r.points, r.errors, r.stars, bool(r.completed), r.updated_at),
+	("updated", _P.updated_at, _P.id),
+)
+
+COURSE_PROGRESS = Table(
+	"course_progress",
+	[("id", "int"), ("user_id", "cat"), ("course_id", "int"), ("accuracy_percentage", "float"), ("completed_exercises", "int"),
+	 ("total_exercises", "int"), ("correct_answers", "int"), ("total_points", "int"), ("is_completed", "bool"), ("is_unlocked", "bool"),
+	 ("updated_at", "ts")],
+	lambda: select(
+		_CP.id, _CP.user_id, _CP.course_id, _CP.accuracy_percentage, _CP.completed_exercises, _CP.total_exercises,
+		_CP.correct_answers, _CP.total_points, _CP.is_completed, _CP.is_unlocked, _CP.updated_at,
+	),
+	lambda: [_CP.user_id, _CP.course_id],
+	lambda r, pseudo: (
+		r.id, pseudo(r.user_id), r.course_id, r.accuracy_percentage, r.completed_exercises, r.total_exercises,
+		r.correct_answers, r.total_points, bool(r.is_completed), bool(r.is_unlocked), r.updated_at,
+	),
+	("updated", _CP.updated_at, _CP.id),
+)
+
+# PII (username, email, address, ...) is never selected
+USERS = Table(
+	"users",
+	[("user_id", "str"), ("age", "int"), ("is_active", "bool"), ("is_admin", "bool"), ("created_at", "ts")],
+	lambda: select(_U.id, _U.age, _U.is_active, _U.is_admin, _U.created_at),
+	lambda: [_U.id],
+	lambda r, pseudo: (pseudo(r.id), r.age, bool(r.is_active), bool(r.is_admin), r.created_at),
+)
+
+
+# ============================================================================
+# WRITERS
+# ============================================================================
+
+def _plain(value: Any) -> Any:
+	return value.isoformat() if isinstance(value, datetime) else value
+
+
+class _JsonlWriter:
+	def __init__(self, path: str, columns: List[Tuple[str, str]]):
+		self.names = [name for name, _ in columns]
+		self.f = open(path, "w", encoding="utf-8")
+
+	def write(self, rows: Sequence[tuple]) -> None:
+		self.f.writelines(json.dumps(dict(zip(self.names, map(_plain, r))), ensure_ascii=False) + "\n" for r in rows)
+
+	def close(self) -> None:
+		self.f.close()
+
+
+class _CsvWriter:
+	def __init__(self, path: str, columns: List[Tuple[str, str]]):
+		self.f = open(path, "w", encoding="utf-8", newline="")
+		self.w = csv.writer(self.f)
+		self.w.writerow([name for name, _ in columns])
+
+	def write(self, rows: Sequence[tuple]) -> None:
+		self.w.writerows([_plain(v) for v in r] for r in rows)
+
+	def close(self) -> None:
+		self.f.close()
+
+
+class _ArrowWriter:
+	"""Parquet or Arrow IPC stream; text columns typed "cat" are dictionary-encoded."""
+
+	def __init__(self, path: str, columns: List[Tuple[str, str]], row_group_size: int, parquet: bool):
+		import pyarrow as pa
+
+		self.pa = pa
+		types = {
+			"int": pa.int64(), "float": pa.float64(), "bool": pa.bool_(), "str": pa.string(),
+			"cat": pa.dictionary(pa.int32(), pa.string()), "ts": pa.timestamp("us"),
+		}
+		self.kinds = [kind for _, kind in columns]
+		self.schema = pa.schema([pa.field(name, types[kind]) for name, kind in columns])
+		self.row_group_size = row_group_size
+		self.pending: List[Any] = []
+		self.pending_rows = 0
+		if parquet:
+			import pyarrow.parquet as pq
+			self.writer = pq.ParquetWriter(path, self.schema, compression="zstd")
+			self.sink = None
+		else:
+			self.sink = pa.OSFile(path, "wb")
+			# The stream format (unlike the file format) allows a new dictionary per batch
+			self.writer = pa.ipc.new_stream(self.sink, self.schema)
+		self.parquet = parquet
+
+	def _batch(self, rows: Sequence[tuple]):
+		pa = self.pa
+		arrays = []
+		for values, kind, field in zip(zip(*rows), self.kinds, self.schema):
+			if kind == "cat":
+				arrays.append(pa.array(values, type=pa.string()).dictionary_encode())
+			else:
+				arrays.append(pa.array(values, type=field.type))
+		return pa.RecordBatch.from_arrays(arrays, schema=self.schema)
+
+	def write(self, rows: Sequence[tuple]) -> None:
+		if not rows:
+			return
+		batch = self._batch(rows)
+		if not self.parquet:
+			self.writer.write_batch(batch)
+			return
+		# Parquet writes one row group per call: collect batches up to --row-group-size rows
+		self.pending.append(batch)
+		self.pending_rows += batch.num_rows
+		if self.pending_rows >= self.row_group_size:
+			self._flush()
+
+	def _flush(self) -> None:
+		if self.pending:
+			self.writer.write_table(self.pa.Table.from_batches(self.pending, schema=self.schema), row_group_size=self.pending_rows)
+			self.pending, self.pending_rows = [], 0
+
+	def close(self) -> None:
+		if self.parquet:
+			self._flush()
+		self.writer.close()
+		if self.sink is not None:
+			self.sink.close()
+
+
+_SUFFIX = {"jsonl": "jsonl", "csv": "csv", "parquet": "parquet", "arrow": "arrows"}
+
+
+def _open_writer(fmt: str, path: str, table: Table, args):
+	if fmt == "jsonl":
+		return _JsonlWriter(path, table.columns)
+	if fmt == "csv":
+		return _CsvWriter(path, table.columns)
+	return _ArrowWriter(path, table.columns, args.row_group_size, parquet=fmt == "parquet")
+
+
+# ============================================================================
+# EXPORT
+# ============================================================================
+
+@contextmanager
+def _connect(engine: Engine, snapshot: Optional[str]) -> Iterator[Connection]:
+	with engine.connect() as conn:
+		if snapshot:
+			# Must be the first statement of the transaction
+			conn = conn.execution_options(isolation_level="REPEATABLE READ")
+			conn.execute(text("SET TRANSACTION SNAPSHOT :snapshot"), {"snapshot": snapshot})
+		yield conn
+
+
+def _stream(conn: Connection, stmt, args) -> Iterator[Sequence[Any]]:
+	# yield_per: server-side cursor, fetched and written --batch-size rows at a time
+	return conn.execution_options(yield_per=args.batch_size).execute(stmt).partitions()
+
+
+def _log(message: str) -> None:
+	# One write per line: tables finish on several threads
+	print(message + "\n", end="")
+
+
+def _export_table(engine: Engine, table: Table, out_dir: str, args, pseudo: Callable[[Any], str], snapshot: Optional[str]) -> Dict[str, Any]:
+	start = time.perf_counter()
+	path = os.path.join(out_dir, f"{table.name}.{_SUFFIX[args.format]}")
+	writer = _open_writer(args.format, path, table, args)
+	rows = 0
 	try:
-		# COURSES (includes 'classes' as those with parent_class_id == None)
-		courses = db.query(models.Course).all()
-		courses = sorted(
-			courses,
-			key=lambda c: (0 if c.parent_class_id is None else 1, c.parent_class_id or 0, c.order_index or 0, c.id),
-		)
-		course_rows: List[Dict[str, Any]] = []
-		for c in courses:
-			course_rows.append({
-				"id": c.id,
-				"name": c.name,
-				"description": c.description,
-				"order_index": c.order_index,
-				"category": c.category.value if c.category else None,
-				"required_score": c.required_score,
-				"enabled": bool(c.enabled),
-				"parent_class_id": c.parent_class_id,
-				"is_class": c.parent_class_id is None,
-			})
-
-		# LEVELS
-		levels = db.query(models.Level).order_by(models.Level.course_id.asc(), models.Level.order_index.asc()).all()
-		level_rows: List[Dict[str, Any]] = []
-		for l in levels:
-			level_rows.append({
-				"id": l.id,
-				"course_id": l.course_id,
-				"name": l.name,
-				"description": l.description,
-				"order_index": l.order_index,
-				"required_score": l.required_score,
-				"enabled": bool(l.enabled),
-			})
-
-		# EXERCISES
-		exercises = db.query(models.Exercise).order_by(models.Exercise.level_id.asc(), models.Exercise.order_index.asc()).all()
-		ex_rows: List[Dict[str, Any]] = []
-		for e in exercises:
-			ex_rows.append({
-				"id": e.id,
-				"course_id": e.course_id,
-				"level_id": e.level_id,
-				"order_index": e.order_index,
-				"category": e.category.value if e.category else None,
-				"prompt": e.prompt,
-				"answer": e.answer,
-				"data": e.data,
-				"rule": e.rule,
-				"points": e.points,
-				"enabled": bool(e.enabled),
+		with _connect(engine, snapshot) as conn:
+			for part in _stream(conn, table.query().order_by(*table.order()), args):
+				writer.write([table.convert(r, pseudo) for r in part])
+				rows += len(part)
+	finally:
+		writer.close()
+	seconds = time.perf_counter() - start
+	_log(f"  {table.name}: {rows} rows in {seconds:.1f}s")
+	return {"rows": rows, "path": os.path.basename(path), "columns": [name for name, _ in table.columns], "seconds": round(seconds, 2)}
+
+
+def _run_tables(engine: Engine, tables: List[Table], args, export: Callable[[Table, Optional[str]], Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+	"""export(table, snapshot) for every table, --jobs at a time."""
+	snapshot_conn = None
+	snapshot = None
+	if engine.dialect.name == "postgresql" and args.jobs > 1:
+		# Held open until every table is read: the workers import its snapshot
+		snapshot_conn = engine.connect().execution_options(isolation_level="REPEATABLE READ")
+		snapshot = snapshot_conn.execute(text("SELECT pg_export_snapshot()")).scalar()
+	try:
+		with ThreadPoolExecutor(max_workers=max(1, min(args.jobs, len(tables))), thread_name_prefix="export") as pool:
+			futures = {t.name: pool.submit(export, t, snapshot) for t in tables}
+			return {name: f.result() for name, f in futures.items()}
+	finally:
+		if snapshot_conn is not None:
+			snapshot_conn.close()
+
+
+# ============================================================================
+# INCREMENTAL
+# ============================================================================
+
+_MANIFEST = "manifest.json"
+_SALT_FILE = "ANONYMIZATION_SALT.txt"
+# Skipped attempt ids re-checked on every run until they show up. Transactions still in flight
+# hold ids near the top, so the newest are kept; rolled-back ids age out
+_MAX_GAPS = 1000
+
+
+class _Manifest:
+	"""manifest.json of an incremental export; rewritten atomically after every partition."""
+
+	def __init__(self, out_dir: str):
+		self.path = os.path.join(out_dir, _MANIFEST)
+		self.lock = threading.Lock()
+		self.data: Dict[str, Any] = {}
+		if os.path.exists(self.path):
+			with open(self.path, encoding="utf-8") as f:
+				self.data = json.load(f)
+		self.data.setdefault("tables", {})
+
+	def table(self, table: Table) -> Dict[str, Any]:
+		with self.lock:
+			return self.data["tables"].setdefault(table.name, {
+				"strategy": table.incremental[0] if table.incremental else "snapshot",
+				"columns": [name for name, _ in table.columns],
+				"rows": 0,
+				"watermark": None,
+				"partitions": [],
 			})
 
-		user_map: Dict[str, str] = {}
-		def pseudo(uid: Any) -> str:
-			uid_str = str(uid)
-			if uid_str not in user_map:
-				user_map[uid_str] = _user_pseudo(uid_str, salt)
-			return user_map[uid_str]
-
-		# ATTEMPTS (anonymized)
-		attempt_rows: List[Dict[str, Any]] = []
-		if args.include_attempts:
-			attempts = db.query(models.Attempt).order_by(models.Attempt.id.asc()).all()
-			for a in attempts:
-				attempt_rows.append({
-					"id": a.id,
-					"user_id": pseudo(a.user_id),
-					"exercise_id": a.exercise_id,
-					"response": a.response,
-					"is_correct": bool(a.is_correct),
-					"score_delta": a.score_delta,
-				})
-
-		# PROGRESS + COURSE_PROGRESS (anonymized, coarse)
-		progress_rows: List[Dict[str, Any]] = []
-		course_progress_rows: List[Dict[str, Any]] = []
-		if args.include_progress:
-			progress = db.query(models.Progress).order_by(models.Progress.user_id.asc(), models.Progress.level_id.asc()).all()
-			for p in progress:
-				progress_rows.append({
-					"id": p.id,
-					"user_id": pseudo(p.user_id),
-					"category": p.category.value if p.category else None,
-					"course_id": p.course_id,
-					"level_id": p.level_id,
-					"points": p.points,
-					"errors": p.errors,
-					"stars": p.stars,
-					"completed": bool(p.completed),
-				})
-
-			cp = db.query(models.CourseProgress).order_by(models.CourseProgress.user_id.asc(), models.CourseProgress.course_id.asc()).all()
-			for row in cp:
-				course_progress_rows.append({
-					"id": row.id,
-					"user_id": pseudo(row.user_id),
-					"course_id": row.course_id,
-					"accuracy_percentage": row.accuracy_percentage,
-					"completed_exercises": row.completed_exercises,
-					"total_exercises": row.total_exercises,
-					"correct_answers": row.correct_answers,
-					"total_points": row.total_points,
-					"is_completed": bool(row.is_completed),
-					"is_unlocked": bool(row.is_unlocked),
-				})
-
-		# USERS (PII excluded, anonymized)
-		user_rows: List[Dict[str, Any]] = []
-		if args.include_users:
-			users = db.query(models.User).order_by(models.User.id.asc()).all()
-			for u in users:
-				user_rows.append({
-					"user_id": pseudo(u.id),
-					"age": u.age,
-					"is_active": bool(u.is_active),
-					"is_admin": bool(u.is_admin),
-					"created_at": u.created_at.isoformat() if u.created_at else None,
-				})
-
-		# Write files
-		manifest = {
-			"generated_at_utc": datetime.utcnow().isoformat() + "Z",
-			"database": "sqlite:///./dev.db (default)",
-			"format": args.format,
-			"tables": {},
-			"privacy": {
-				"users_included": args.include_users,
-				"attempts_included": args.include_attempts,
-				"progress_included": args.include_progress,
-				"user_ids_anonymized": True,
-				"note": "Keep ANONYMIZATION_SALT.txt private if sharing datasets publicly.",
-			},
-		}
-
-		def write_table(name: str, rows: List[Dict[str, Any]]):
-			if args.format == "jsonl":
-				path = os.path.join(out_dir, f"{name}.jsonl")
-				n = _write_jsonl(path, rows)
-			else:
-				path = os.path.join(out_dir, f"{name}.csv")
-				n = _write_csv(path, rows)
-			manifest["tables"][name] = {"rows": n, "path": os.path.basename(path)}
-
-		write_table("courses", course_rows)
-		write_table("levels", level_rows)
-		write_table("exercises", ex_rows)
-		if args.include_attempts:
-			write_table("attempts", attempt_rows)
-		if args.include_progress:
-			write_table("progress", progress_rows)
-			write_table("course_progress", course_progress_rows)
-		if args.include_users:
-			write_table("users", user_rows)
-
-		with open(os.path.join(out_dir, "manifest.json"), "w", encoding="utf-8") as f:
-			json.dump(manifest, f, ensure_ascii=False, indent=2)
-
-		readme = """\
+	def add_partition(self, name: str, partition: Dict[str, Any], watermark: Dict[str, Any]) -> None:
+		with self.lock:
+			state = self.data["tables"][name]
+			state["partitions"].append(partition)
+			state["rows"] += partition["rows"]
+			state["watermark"] = watermark
+			self.save()
+
+	def set_watermark(self, name: str, watermark: Dict[str, Any]) -> None:
+		with self.lock:
+			self.data["tables"][name]["watermark"] = watermark
+			self.save()
+
+	def save(self) -> None:
+		tmp = self.path + ".tmp"
+		with open(tmp, "w", encoding="utf-8") as f:
+			json.dump(self.data, f, ensure_ascii=False, indent=2)
+			f.flush()
+			os.fsync(f.fileno())
+		os.replace(tmp, self.path)
+
+
+def _remove_leftovers(out_dir: str, manifest: _Manifest) -> None:
+	"""Delete .tmp files and partitions an interrupted run wrote but never recorded."""
+	recorded = {p["path"] for t in manifest.data["tables"].values() for p in t["partitions"]}
+	for name in os.listdir(out_dir):
+		table_dir = os.path.join(out_dir, name)
+		if name.endswith(".tmp"):
+			os.remove(table_dir)
+		elif os.path.isdir(table_dir):
+			for file in os.listdir(table_dir):
+				rel = f"{name}/{file}"
+				if file.endswith(".tmp") or (file.startswith("part-") and rel not in recorded):
+					_log(f"  removing {rel} (left by an interrupted run)")
+					os.remove(os.path.join(table_dir, file))
+
+
+def _load_salt(out_dir: str, given: Optional[str], manifest: _Manifest) -> str:
+	"""The directory's salt; created on the first run. Pseudonyms must not change between partitions."""
+	path = os.path.join(out_dir, _SALT_FILE)
+	if os.path.exists(path):
+		with open(path, encoding="utf-8") as f:
+			salt = f.read().strip()
+		if given and given != salt:
+			raise SystemExit(f"--salt differs from {path}: pseudonymous user ids would change between partitions")
+		return salt
+	if any(t["partitions"] for t in manifest.data["tables"].values()):
+		raise SystemExit(f"{path} is missing but partitions exist: restore it, or export into a new directory")
+	salt = given or secrets.token_hex(16)
+	with open(path, "w", encoding="utf-8") as f:
+		f.write(salt + "\n")
+	return salt
+
+
+class _TableExport:
+	"""One table's run in incremental mode: streams the new rows into partitions."""
+
+	def __init__(self, table: Table, out_dir: str, args, manifest: _Manifest, pseudo: Callable[[Any], str]):
+		self.table = table
+		self.out_dir = out_dir
+		self.args = args
+		self.manifest = manifest
+		self.pseudo = pseudo
+		self.state = manifest.table(table)
+		self.strategy = self.state["strategy"]
+		self.watermark = dict(self.state["watermark"] or {})
+		self.writer = None
+		self.path = ""
+		self.rows = 0
+		self.written = 0
+		self.partitions = 0
+
+	def _query(self):
+		stmt = self.table.query()
+		wm = self.watermark
+		if self.strategy == "append":
+			key = self.table.incremental[1]
+			cond = key > wm.get("id", 0)
+			if wm.get("gaps"):
+				cond = or_(cond, key.in_(wm["gaps"]))
+			return stmt.where(cond).order_by(key)
+		if self.strategy == "updated":
+			updated_at, key = self.table.incremental[1:]
+			if wm.get("updated_at"):
+				since = datetime.fromisoformat(wm["updated_at"]) - timedelta(seconds=self.args.overlap_seconds)
+				stmt = stmt.where(updated_at >= since)
+			# NULLs (rows not written since the column was added) first, so a run cut short
+			# before the watermark moves past them reads them again
+			return stmt.order_by(updated_at.asc().nulls_first(), key)
+		return stmt.order_by(*self.table.order())
+
+	def _track(self, part: Sequence[Any]) -> None:
+		"""Advance the in-memory watermark over rows about to be written."""
+		wm = self.watermark
+		if self.strategy == "append":
+			last = wm.get("id", 0)
+			gaps = set(wm.get("gaps", []))
+			for r in part:
+				gaps.discard(r.id)
+				if r.id > last:
+					gaps.update(range(max(last + 1, r.id - _MAX_GAPS), r.id))
+					last = r.id
+			wm["id"] = last
+			wm["gaps"] = sorted(gaps)[-_MAX_GAPS:]
+		elif self.strategy == "updated":
+			latest = max((r.updated_at for r in part if r.updated_at is not None), default=None)
+			if latest is not None and (not wm.get("updated_at") or latest.isoformat() > wm["updated_at"]):
+				wm["updated_at"] = latest.isoformat()
+
+	def _open(self) -> None:
+		number = len(self.state["partitions"]) + 1
+		self.path = f"{self.table.name}/part-{number:05d}.{_SUFFIX[self.args.format]}"
+		os.makedirs(os.path.join(self.out_dir, self.table.name), exist_ok=True)
+		self.writer = _open_writer(self.args.format, os.path.join(self.out_dir, self.path + ".tmp"), self.table, self.args)
+		self.rows = 0
+
+	def _commit(self) -> None:
+		self.writer.close()
+		self.writer = None
+		os.replace(os.path.join(self.out_dir, self.path + ".tmp"), os.path.join(self.out_dir, self.path))
+		watermark = dict(self.watermark)
+		partition = {"path": self.path, "rows": self.rows, "exported_at": datetime.utcnow().isoformat() + "Z", "watermark": watermark}
+		self.manifest.add_partition(self.table.name, partition, watermark)
+		self.written += self.rows
+		self.partitions += 1
+
+	def _discard(self) -> None:
+		self.writer.close()
+		self.writer = None
+		os.remove(os.path.join(self.out_dir, self.path + ".tmp"))
+
+	def run(self, engine: Engine, snapshot: Optional[str]) -> Dict[str, Any]:
+		start = time.perf_counter()
+		# Before the query: rows updated after this are read again by the next run
+		started_at = datetime.utcnow()
+		digest = hashlib.sha256() if self.strategy == "snapshot" else None
+		try:
+			with _connect(engine, snapshot) as conn:
+				for part in _stream(conn, self._query(), self.args):
+					out = [self.table.convert(r, self.pseudo) for r in part]
+					if digest is not None:
+						for row in out:
+							digest.update(json.dumps(row, default=str, ensure_ascii=False).encode("utf-8"))
+					else:
+						self._track(part)
+					if self.writer is None:
+						self._open()
+					self.writer.write(out)
+					self.rows += len(out)
+					# Snapshots stay one partition: only a complete one replaces the previous
+					if digest is None and self.rows >= self.args.partition_rows:
+						self._commit()
+			if self.strategy == "updated" and not self.watermark.get("updated_at"):
+				# Every row read had a NULL updated_at (or there were none): the whole table up
+				# to the start of this run is exported, don't scan it again next time
+				self.watermark["updated_at"] = started_at.isoformat()
+				if self.writer is None:
+					self.manifest.set_watermark(self.table.name, dict(self.watermark))
+			if digest is not None and self.writer is None and digest.hexdigest() != self.watermark.get("sha256"):
+				self._open()  # the table became empty: an empty partition replaces the last one
+			if self.writer is not None:
+				if digest is not None and digest.hexdigest() == self.watermark.get("sha256"):
+					self._discard()
+				else:
+					if digest is not None:
+						self.watermark = {"sha256": digest.hexdigest()}
+					self._commit()
+		finally:
+			if self.writer is not None:
+				self.writer.close()
+		seconds = time.perf_counter() - start
+		_log(f"  {self.table.name}: {self.written} rows in {self.partitions} new partition(s) ({self.strategy}) in {seconds:.1f}s")
+		return {"rows": self.written, "partitions": self.partitions, "seconds": round(seconds, 2)}
+
+
+def _export_incremental(engine: Engine, tables: List[Table], out_dir: str, args) -> None:
+	manifest = _Manifest(out_dir)
+	if manifest.data.get("format", args.format) != args.format:
+		raise SystemExit(f"{out_dir} holds a {manifest.data['format']} export; use --format {manifest.data['format']} or a new directory")
+	_remove_leftovers(out_dir, manifest)
+	salt = _load_salt(out_dir, args.salt, manifest)
+
+	@functools.lru_cache(maxsize=65536)
+	def pseudo(uid: Any) -> str:
+		return _user_pseudo(str(uid), salt)
+
+	manifest.data.update({
+		"mode": "incremental",
+		"format": args.format,
+		"database": _database_label(),
+		# Lets consumers check that partitions share a salt without revealing it
+		"salt_sha256": _sha256_hex(salt)[:16],
+	})
+	manifest.data.setdefault("privacy", _privacy(args, incremental=True))
+	manifest.save()
+	for t in tables:
+		manifest.table(t)
+
+	runs = _run_tables(engine, tables, args, lambda t, snapshot: _TableExport(t, out_dir, args, manifest, pseudo).run(engine, snapshot))
+	manifest.data["last_run_utc"] = datetime.utcnow().isoformat() + "Z"
+	manifest.data["last_run"] = runs
+	manifest.save()
+	_write_readme(out_dir, incremental=True)
+
+
+# ============================================================================
+# OUTPUT DIRECTORY
+# ============================================================================
+
+def _database_label() -> str:
+	return app_engine.url.render_as_string(hide_password=True)
+
+
+def _privacy(args, incremental: bool = False) -> Dict[str, Any]:
+	return {
+		"users_included": args.include_users,
+		"attempts_included": args.include_attempts,
+		"progress_included": args.include_progress,
+		"user_ids_anonymized": True,
+		"note": "Keep ANONYMIZATION_SALT.txt private if sharing datasets publicly."
+		+ (" Every run of this directory reuses it." if incremental else ""),
+	}
+
+
+def _write_readme(out_dir: str, incremental: bool = False) -> None:
+	readme = """\
 ALBLingo Dataset Export
 
 This folder was generated by backend/scripts/export_dataset.py.
@@ -248,17 +625,89 @@ Files:
 
 Notes:
 - Token ANONYMIZATION_SALT.txt is required to reproduce the same pseudonyms. Keep it private.
+- manifest.json lists each file's columns and row count.
 """
-		with open(os.path.join(out_dir, "README.txt"), "w", encoding="utf-8") as f:
-			f.write(readme)
+	if incremental:
+		readme += """\
+- Incremental export: each table is a folder of partitions (part-00001, part-00002, ...),
+  listed in manifest.json in order.
+  - attempts: every partition holds only new rows; concatenate them.
+  - progress, course_progress: changed rows; a row can appear in several partitions,
+    keep the one from the latest partition per id.
+  - courses, levels, exercises, users: each partition is a full snapshot; use the latest.
+"""
+	with open(os.path.join(out_dir, "README.txt"), "w", encoding="utf-8") as f:
+		f.write(readme)
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Export ALBLingo dataset from the local DB.")
+	parser.add_argument("--out", default=None, help="Output directory (default: dataset_export/<timestamp>, or dataset_export/incremental)")
+	parser.add_argument("--format", choices=["jsonl", "csv", "parquet", "arrow"], default="jsonl", help="Export format (parquet/arrow need pyarrow)")
+	parser.add_argument("--include-attempts", action="store_true", help="Include attempts (anonymized)")
+	parser.add_argument("--include-progress", action="store_true", help="Include progress and course_progress (anonymized)")
+	parser.add_argument("--include-users", action="store_true", help="Include users (PII excluded, user ids anonymized)")
+	parser.add_argument("--salt", default=None, help="Salt used for anonymization (stored in output; keep it private)")
+	parser.add_argument("--jobs", type=int, default=4, help="Tables exported in parallel, one connection each")
+	parser.add_argument("--batch-size", type=int, default=5000, help="Rows fetched and written per batch")
+	parser.add_argument("--row-group-size", type=int, default=100000, help="Rows per Parquet row group")
+	parser.add_argument("--incremental", action="store_true", help="Export only changes since the last run of --out, as new partitions")
+	parser.add_argument("--partition-rows", type=int, default=1000000, help="Incremental: start a new partition after this many rows")
+	parser.add_argument("--overlap-seconds", type=float, default=300.0, help="Incremental: re-read rows updated this long before the last mark")
+	args = parser.parse_args()
 
-		print("✅ Dataset export completed.")
-		print("Output:", out_dir)
-		print("Manifest:", os.path.join(out_dir, "manifest.json"))
+	if args.format in ("parquet", "arrow"):
+		if importlib.util.find_spec("pyarrow") is None:
+			parser.error(f"--format {args.format} needs pyarrow (pip install pyarrow)")
+
+	out_dir = os.path.abspath(args.out or ("dataset_export/incremental" if args.incremental else f"dataset_export/{_now_slug()}"))
+	_ensure_dir(out_dir)
+
+	tables = [COURSES, LEVELS, EXERCISES]
+	if args.include_attempts:
+		tables.append(ATTEMPTS)
+	if args.include_progress:
+		tables += [PROGRESS, COURSE_PROGRESS]
+	if args.include_users:
+		tables.append(USERS)
+
+	# Own unpooled engine: --jobs connections at once regardless of the app's pool size
+	connect_args = {"check_same_thread": False} if app_engine.dialect.name == "sqlite" else {}
+	engine = create_engine(app_engine.url, poolclass=NullPool, connect_args=connect_args)
+
+	start = time.perf_counter()
+	mode = "incremental, " if args.incremental else ""
+	print(f"Exporting {len(tables)} tables ({mode}{args.format}, {min(args.jobs, len(tables))} at a time) to {out_dir}")
+	try:
+		if args.incremental:
+			_export_incremental(engine, tables, out_dir, args)
+		else:
+			salt = args.salt or secrets.token_hex(16)
+			with open(os.path.join(out_dir, _SALT_FILE), "w", encoding="utf-8") as f:
+				f.write(salt + "\n")
+
+			@functools.lru_cache(maxsize=65536)
+			def pseudo(uid: Any) -> str:
+				return _user_pseudo(str(uid), salt)
+
+			table_info = _run_tables(engine, tables, args, lambda t, snapshot: _export_table(engine, t, out_dir, args, pseudo, snapshot))
+			manifest = {
+				"generated_at_utc": datetime.utcnow().isoformat() + "Z",
+				"database": _database_label(),
+				"format": args.format,
+				"tables": table_info,
+				"privacy": _privacy(args),
+			}
+			with open(os.path.join(out_dir, _MANIFEST), "w", encoding="utf-8") as f:
+				json.dump(manifest, f, ensure_ascii=False, indent=2)
+			_write_readme(out_dir)
 	finally:
-		db.close()
+		engine.dispose()
+
+	print(f"✅ Dataset export completed in {time.perf_counter() - start:.1f}s.")
+	print("Output:", out_dir)
+	print("Manifest:", os.path.join(out_dir, _MANIFEST))
 
 
 if __name__ == "__main__":
 	main()
-
@@ -0,0 +1,57 @@
+"""
+Import an external Albanian word list into lexicon_words (external_count).
+
+Supported formats:
+- plain: one word per line
+- freq: "word count" or "count word" per line (e.g. frequency lists)
+- hunspell: .dic file (entry count on the first line, "word/FLAGS" entries)
+- auto (default): detected per line
+
+Usage (from backend/):
+	python scripts/import_wordlist.py sq_AL.dic --format hunspell --source hunspell-sq
+	python scripts/import_wordlist.py --rebuild-corpus   # recount corpus words only
+"""
+import argparse
+import os
+import sys
+
+# Ensure backend/ is on sys.path when running as a script
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if BACKEND_DIR not in sys.path:
+	sys.path.insert(0, BACKEND_DIR)
+
+from app.database import SessionLocal  # noqa: E402
+from app import lexicon, migrate  # noqa: E402
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Import a word list into the OCR lexicon.")
+	parser.add_argument("path", nargs="?", help="Word list file")
+	parser.add_argument("--format", choices=["auto", "plain", "freq", "hunspell"], default="auto")
+	parser.add_argument("--source", help="Source label stored with new words (default: file name)")
+	parser.add_argument("--encoding", default="utf-8")
+	parser.add_argument("--rebuild-corpus", action="store_true", help="Recount corpus words from exercises")
+	args = parser.parse_args()
+
+	if not args.path and not args.rebuild_corpus:
+		parser.error("give a word list path and/or --rebuild-corpus")
+
+	migrate.upgrade()
+	db = SessionLocal()
+	try:
+		if args.rebuild_corpus:
+			print(f"Corpus words: {lexicon.rebuild_from_corpus(db)}")
+		if args.path:
+			source = args.source or os.path.basename(args.path)
+			with open(args.path, encoding=args.encoding, errors="replace") as f:
+				result = lexicon.import_words(db, lexicon.parse_wordlist(f, args.format), source)
+			print(
+				f"Imported {result['words']} words from {args.path}: "
+				f"{result['added']} new, {result['updated']} updated, {result['skipped']} skipped"
+			)
+	finally:
+		db.close()
+
+
+if __name__ == "__main__":
+	main()
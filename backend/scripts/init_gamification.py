@@ -8,15 +8,15 @@ import os
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
-from app.database import SessionLocal, engine, Base
-from app import models
+from app.database import SessionLocal
+from app import migrate, models
 
 
 def init_tables():
-	"""Create all tables (including new gamification tables)"""
-	print("Creating database tables...")
-	Base.metadata.create_all(bind=engine)
-	print("✅ Tables created.")
+	"""Apply pending schema migrations (creates the gamification tables)"""
+	print("Migrating database schema...")
+	migrate.upgrade()
+	print("✅ Tables ready.")
 
 
 def seed_achievements():
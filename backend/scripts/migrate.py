@@ -0,0 +1,40 @@
+"""
+Schema migrations (app/migrate.py) from the command line, e.g. as a deploy
+step with MIGRATE_ON_STARTUP=false on the web service.
+
+Usage (from backend/, against DATABASE_URL):
+	python scripts/migrate.py status
+	python scripts/migrate.py upgrade [--target 2]
+"""
+import argparse
+import os
+import sys
+
+# Ensure backend/ is on sys.path when running as a script
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if BACKEND_DIR not in sys.path:
+	sys.path.insert(0, BACKEND_DIR)
+
+from app import migrate  # noqa: E402
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Apply or list schema migrations.")
+	sub = parser.add_subparsers(dest="command", required=True)
+	sub.add_parser("status", help="List migrations and when they were applied")
+	up = sub.add_parser("upgrade", help="Apply pending migrations")
+	up.add_argument("--target", type=int, help="Stop after this version")
+	args = parser.parse_args()
+
+	if args.command == "status":
+		for row in migrate.status():
+			applied = row["applied_at"].strftime("%Y-%m-%d %H:%M:%S") if row["applied_at"] else "pending"
+			print(f"{row['version']:04d}  {applied:<19}  {row['name']}: {row['description']}")
+		return
+
+	applied = migrate.upgrade(target=args.target)
+	print(f"Applied {len(applied)} migration(s)" + (f": {', '.join(f'{v:04d}' for v in applied)}" if applied else ""))
+
+
+if __name__ == "__main__":
+	main()
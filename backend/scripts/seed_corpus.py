@@ -0,0 +1,68 @@
+"""
+Load the exercise corpus (app/corpus_data/klasa_<n>.json, see app/corpus.py)
+into DATABASE_URL, or only validate the files.
+
+Re-running is cheap: exercises whose content hash is unchanged are skipped,
+so only edited, added or removed exercises are written.
+
+Usage (from backend/):
+	python scripts/seed_corpus.py                  # all classes
+	python scripts/seed_corpus.py --classes 1 3    # only these
+	python scripts/seed_corpus.py --dry-run        # report the changes, roll back
+	python scripts/seed_corpus.py --check          # validate the files, no database
+"""
+import argparse
+import os
+import sys
+
+# Ensure backend/ is on sys.path when running as a script
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if BACKEND_DIR not in sys.path:
+	sys.path.insert(0, BACKEND_DIR)
+
+from app import corpus  # noqa: E402
+
+
+def main():
+	parser = argparse.ArgumentParser(description="Load or validate the exercise corpus files.")
+	parser.add_argument("--classes", type=int, nargs="+", help="Class numbers to load (default: every corpus file)")
+	parser.add_argument("--dry-run", action="store_true", help="Compute the changes, then roll back")
+	parser.add_argument("--check", action="store_true", help="Only validate the files")
+	args = parser.parse_args()
+
+	try:
+		docs = corpus.read_corpus(args.classes)
+	except ValueError as e:
+		print(e)
+		raise SystemExit(1)
+	if args.check:
+		exercises = sum(
+			len(level.get("exercises", []))
+			for doc in docs.values()
+			for level in doc.get("levels", []) + [lv for c in doc["courses"] for lv in c["levels"]]
+		)
+		print(f"OK: {len(docs)} class file(s), {exercises} exercises in {corpus.CORPUS_DIR}")
+		return
+
+	from app import content_cache, lexicon, stats
+	from app.database import SessionLocal
+
+	# Same session hooks as the app, for the ORM writes of courses and levels
+	lexicon.install_hooks()
+	content_cache.install_hooks()
+	stats.install_hooks()
+	corpus.install_hooks()
+	db = SessionLocal()
+	try:
+		results = corpus.load(db, list(docs), dry_run=args.dry_run)
+	finally:
+		db.close()
+	total = {k: sum(r[k] for r in results) for k in ("inserted", "updated", "disabled", "unchanged")}
+	print(
+		f"{'Would write' if args.dry_run else 'Done'}: {total['inserted']} inserted, {total['updated']} updated, "
+		f"{total['disabled']} disabled, {total['unchanged']} unchanged"
+	)
+
+
+if __name__ == "__main__":
+	main()
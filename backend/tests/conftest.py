@@ -0,0 +1,50 @@
+"""
+Shared fixtures. The app reads DATABASE_URL and STT_BACKEND at import, so
+they are pointed at a throwaway SQLite file and the stub recognizer before
+anything from app/ is imported.
+"""
+import os
+import sys
+import tempfile
+
+_TMP = tempfile.mkdtemp(prefix="alblingo-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_TMP, 'test.db')}"
+os.environ["STT_BACKEND"] = "stub"
+
+BACKEND_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if BACKEND_DIR not in sys.path:
+	sys.path.insert(0, BACKEND_DIR)
+
+import pytest  # noqa: E402
+
+from app import lexicon, migrate, models  # noqa: E402
+from app.database import SessionLocal  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def migrated():
+	"""The test database at the latest migration, with the lexicon hooks installed."""
+	migrate.upgrade()
+	lexicon.install_hooks()
+
+
+@pytest.fixture
+def db(migrated):
+	session = SessionLocal()
+	try:
+		yield session
+	finally:
+		session.rollback()
+		session.close()
+
+
+@pytest.fixture
+def level(db):
+	"""A course with one level, for exercises."""
+	course = models.Course(name="Klasa test", category=models.CategoryEnum.LISTEN_WRITE, order_index=0, required_score=80)
+	db.add(course)
+	db.flush()
+	lvl = models.Level(course_id=course.id, name="Niveli 1", order_index=0, required_score=80)
+	db.add(lvl)
+	db.commit()
+	return lvl
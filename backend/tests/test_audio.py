@@ -0,0 +1,51 @@
+"""Pronunciation endpoints with the stub recognizer (STT_BACKEND=stub echoes the hint text)."""
+import io
+import wave
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+def _wav(seconds: float = 0.5) -> bytes:
+	buf = io.BytesIO()
+	with wave.open(buf, "wb") as w:
+		w.setnchannels(1)
+		w.setsampwidth(2)
+		w.setframerate(16000)
+		w.writeframes(b"\0\0" * int(16000 * seconds))
+	return buf.getvalue()
+
+
+@pytest.fixture(scope="module")
+def client(migrated):
+	with TestClient(app) as c:
+		yield c
+
+
+def test_pronunciation_check(client):
+	r = client.post("/api/pronunciation-check", params={"target_text": "shtëpia"}, files={"audio_file": ("a.wav", _wav(), "audio/wav")})
+	assert r.status_code == 200
+	body = r.json()
+	assert body["recognizer"] == "stub"
+	assert body["spoken_text"] == "shtëpia"
+	assert body["similarity_score"] == 1.0
+	assert body["is_correct"] is True
+
+
+def test_pronunciation_check_rejects_empty_upload(client):
+	r = client.post("/api/pronunciation-check", params={"target_text": "shtëpia"}, files={"audio_file": ("a.wav", b"", "audio/wav")})
+	assert r.status_code == 400
+
+
+def test_batch_reports_bad_clips_per_result(client):
+	r = client.post(
+		"/api/pronunciation-check/batch",
+		data={"target_texts": ["mali", "deti"]},
+		files=[("audio_files", ("a.wav", _wav(), "audio/wav")), ("audio_files", ("b.wav", b"", "audio/wav"))],
+	)
+	assert r.status_code == 200
+	results = r.json()["results"]
+	assert results[0]["spoken_text"] == "mali"
+	assert results[1]["status_code"] == 400
@@ -0,0 +1,67 @@
+"""The session hooks keep lexicon counts and lexicon_version in step with exercise writes."""
+from app import lexicon, models
+
+
+def _count(db, word):
+	row = db.query(models.LexiconWord).filter(models.LexiconWord.word == word).one_or_none()
+	return None if row is None else row.corpus_count
+
+
+def _version(db):
+	return db.query(models.LexiconVersion.version).filter(models.LexiconVersion.id == 1).scalar()
+
+
+def _exercise(level, prompt, answer):
+	return models.Exercise(
+		category=models.CategoryEnum.LISTEN_WRITE, course_id=level.course_id, level_id=level.id,
+		prompt=prompt, answer=answer, points=1, enabled=True, order_index=0,
+	)
+
+
+def test_create_update_delete_move_counts_and_version(db, level):
+	start = _version(db)
+	ex = _exercise(level, "Shkruaj qytezë", "qytezë kodrinore")
+	db.add(ex)
+	db.commit()
+	assert _count(db, "qytezë") == 2
+	assert _count(db, "kodrinore") == 1
+	created = _version(db)
+	assert created > start
+
+	ex.answer = "qytezë malore"
+	db.commit()
+	assert _count(db, "kodrinore") == 0  # tombstone, so workers see the removal
+	assert _count(db, "malore") == 1
+	assert _count(db, "qytezë") == 2
+	updated = _version(db)
+	assert updated > created
+
+	db.query(models.Exercise).filter(models.Exercise.id == ex.id).delete(synchronize_session=False)
+	db.commit()
+	assert _count(db, "qytezë") == 0
+	assert _count(db, "malore") == 0
+	assert _version(db) > updated
+
+
+def test_disabling_an_exercise_removes_its_words(db, level):
+	ex = _exercise(level, "fjalë", "lumturisht")
+	db.add(ex)
+	db.commit()
+	assert _count(db, "lumturisht") == 1
+	ex.enabled = False
+	db.commit()
+	assert _count(db, "lumturisht") == 0
+
+
+def test_sync_swaps_in_a_new_index(db, level, monkeypatch):
+	monkeypatch.setattr(lexicon, "LEXICON_SYNC_SECONDS", 0)
+	before = lexicon.get_lexicon(db)
+	db.add(_exercise(level, "shkrimtari", "shkrimtari"))
+	db.commit()
+	after = lexicon.get_lexicon(db)
+	assert "shkrimtari" in after.words
+	assert after.version == _version(db)
+	# The index requests were reading is left as it was
+	assert after is not before
+	assert "shkrimtari" not in before.words
+	assert not before.spelling.lookup("shkrimtar")
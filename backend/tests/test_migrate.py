@@ -0,0 +1,114 @@
+"""app/migrate.py on a database created before the migrations existed (string user ids, no later columns)."""
+import pytest
+from sqlalchemy import Index, MetaData, String, create_engine, inspect, text
+
+from app import migrate, models
+
+# Columns and tables added by m0004-m0006, removed to get the baseline schema back
+_LATER_COLUMNS = {
+	"exercises": ["content_hash"],
+	"progress": ["updated_at"],
+	"lexicon_words": ["version"],
+	"lexicon_bigrams": ["version"],
+}
+
+_COUNTED = ("users", "courses", "levels", "exercises", "attempts", "progress", "srs_cards", "lexicon_words")
+
+
+def _baseline_schema(engine) -> None:
+	md = MetaData()
+	for table in models.Base.metadata.sorted_tables:
+		if table.name not in ("lexicon_version", "schema_migrations"):
+			table.to_metadata(md)
+	for name in ("attempts", "progress"):
+		table = md.tables[name]
+		for idx in list(table.indexes):
+			if "user_id" in idx.columns or idx.name == "ix_attempts_exercise_id":
+				table.indexes.discard(idx)
+		table.c.user_id.type = String(64)
+		Index(f"ix_{name}_user_id", table.c.user_id)
+	for name in ("user_achievements", "user_daily_progress", "srs_cards", "chat_sessions"):
+		md.tables[name].c.user_id.type = String(50)
+	md.create_all(engine)
+
+	with engine.begin() as conn:
+		for table, columns in _LATER_COLUMNS.items():
+			for idx in inspect(conn).get_indexes(table):
+				if set(idx["column_names"]) & set(columns):
+					conn.execute(text(f"DROP INDEX {idx['name']}"))
+			for column in columns:
+				conn.execute(text(f"ALTER TABLE {table} DROP COLUMN {column}"))
+
+
+def _populate(engine) -> None:
+	with engine.begin() as conn:
+		for uid in (1, 2):
+			conn.execute(text(
+				"INSERT INTO users (id, username, email, is_active, is_admin, password_hash, current_streak, longest_streak, total_achievements) "
+				"VALUES (:id, :name, :email, 1, 0, 'x', 0, 0, 0)"
+			), {"id": uid, "name": f"nxenes{uid}", "email": f"nxenes{uid}@example.com"})
+		conn.execute(text("INSERT INTO courses (id, name, order_index, category, required_score, enabled) VALUES (1, 'Klasa 5', 0, 'LISTEN_WRITE', 80, 1)"))
+		conn.execute(text("INSERT INTO levels (id, course_id, name, order_index, required_score, enabled) VALUES (1, 1, 'Niveli 1', 0, 80, 1)"))
+		for eid in (1, 2, 3):
+			conn.execute(text(
+				"INSERT INTO exercises (id, category, course_id, level_id, prompt, answer, points, enabled, order_index) "
+				"VALUES (:id, 'LISTEN_WRITE', 1, 1, 'Shkruaj', :answer, 1, 1, :id)"
+			), {"id": eid, "answer": f"fjala{eid}"})
+		for aid in range(1, 7):
+			conn.execute(text(
+				"INSERT INTO attempts (id, exercise_id, user_id, response, is_correct, score_delta) VALUES (:id, :ex, :uid, 'x', 1, 1)"
+			), {"id": aid, "ex": aid % 3 + 1, "uid": str(aid % 2 + 1)})
+		for pid, uid in ((1, "1"), (2, "2")):
+			conn.execute(text(
+				"INSERT INTO progress (id, user_id, category, course_id, level_id, points, errors, stars, completed) "
+				"VALUES (:id, :uid, 'LISTEN_WRITE', 1, 1, 3, 0, 1, 0)"
+			), {"id": pid, "uid": uid})
+		conn.execute(text("INSERT INTO lexicon_words (id, word, corpus_count, external_count, source, updated_at) VALUES (1, 'fjala', 3, 0, 'corpus', CURRENT_TIMESTAMP)"))
+
+
+def _counts(engine):
+	with engine.connect() as conn:
+		return {t: conn.execute(text(f"SELECT COUNT(*) FROM {t}")).scalar() for t in _COUNTED}
+
+
+@pytest.fixture
+def baseline(tmp_path):
+	engine = create_engine(f"sqlite:///{tmp_path / 'baseline.db'}")
+	_baseline_schema(engine)
+	_populate(engine)
+	yield engine
+	engine.dispose()
+
+
+def _user_id_type(engine, table):
+	return {c["name"]: c["type"] for c in inspect(engine).get_columns(table)}["user_id"].python_type
+
+
+def test_upgrade_twice_keeps_rows(baseline):
+	before = _counts(baseline)
+	assert _user_id_type(baseline, "attempts") is str
+
+	applied = migrate.upgrade(baseline)
+	assert applied == [m.version for m in migrate.discover()]
+	assert _counts(baseline) == before
+	assert _user_id_type(baseline, "attempts") is int
+	assert _user_id_type(baseline, "progress") is int
+	assert "updated_at" in {c["name"] for c in inspect(baseline).get_columns("progress")}
+
+	assert migrate.upgrade(baseline) == []
+	assert _counts(baseline) == before
+
+
+def test_migrations_are_idempotent(baseline):
+	migrate.upgrade(baseline)
+	before = _counts(baseline)
+	with baseline.begin() as conn:
+		user_ids = conn.execute(text("SELECT user_id FROM attempts ORDER BY id")).scalars().all()
+		conn.execute(text("DELETE FROM schema_migrations"))
+
+	# Every migration again, over the schema it already produced
+	migrate.upgrade(baseline)
+	assert _counts(baseline) == before
+	with baseline.connect() as conn:
+		assert conn.execute(text("SELECT user_id FROM attempts ORDER BY id")).scalars().all() == user_ids
+		assert conn.execute(text("SELECT COUNT(*) FROM lexicon_version")).scalar() == 1